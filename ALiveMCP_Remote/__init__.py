@@ -9,8 +9,10 @@ License: GPL-3.0
 
 __version__ = "1.2.1"
 
+import itertools
 import socket  # noqa: F401 - re-exported so tests can patch ALiveMCP_Remote.socket
-import threading
+import threading  # noqa: F401 - re-exported so tests can patch ALiveMCP_Remote.threading
+import time
 import traceback
 
 import Live
@@ -20,9 +22,23 @@ try:
 except ImportError:
     import queue  # Python 3
 
-from .constants import MAX_COMMANDS_PER_TICK, PORT
+from .backpressure import Backpressure
+from .constants import (
+    MAX_COMMANDS_PER_TICK,
+    MAX_QUEUED_COMMANDS,
+    PORT,
+    UDP_CONTROL_ENABLED,
+    UDP_CONTROL_PORT,
+)
+from .dispatch import build_dispatch_table, unknown_action_response
+from .jobs import ChunkedJob, JobsMixin
 from .liveapi_tools import LiveAPITools
+from .local_transports import LocalTransportsMixin
+from .mirror import MIRRORED_TOOLS, PropertyMirror
+from .profiling import PROFILING_ACTIONS, ProfilingMixin
 from .socket_server import SocketServerMixin
+from .tracing import TRACING_ACTIONS, TracingMixin
+from .udp_control import UdpControlMixin
 
 # Per-action parameter aliases for backward compatibility.
 # When a client sends the legacy key, it is translated to the canonical key
@@ -42,14 +58,25 @@ PARAM_ALIASES = {
 }
 
 
-class ALiveMCP(SocketServerMixin):
+# Actions implemented as methods of ALiveMCP itself rather than LiveAPITools
+SCRIPT_ACTIONS = ("ping", "health_check", "get_tool_schemas") + PROFILING_ACTIONS + TRACING_ACTIONS
+
+
+class ALiveMCP(
+    SocketServerMixin,
+    LocalTransportsMixin,
+    UdpControlMixin,
+    ProfilingMixin,
+    TracingMixin,
+    JobsMixin,
+):
     """
     Main Remote Script class loaded by Ableton Live
 
     Uses a queue-based approach to ensure thread safety:
-    1. Socket threads receive commands and add them to command_queue
+    1. Socket threads receive commands and add them to the bounded command_queue
     2. update_display() (main thread) processes commands from queue
-    3. Results are put in response_queue for socket threads to retrieve
+    3. Results are put on the originating connection's response channel
     """
 
     def __init__(self, c_instance):
@@ -63,17 +90,28 @@ class ALiveMCP(SocketServerMixin):
         self.song = c_instance.song()
 
         self.tools = LiveAPITools(self.song, self.c_instance)
-
-        self.command_queue = queue.Queue()
-        self.response_queues = {}
-        self.request_counter = 0
-        self.request_lock = threading.Lock()
+        self.rebuild_dispatch_table()
+        self.mirror = PropertyMirror(
+            MIRRORED_TOOLS, [name for name, entry in self.dispatch_table.items() if entry.read_only]
+        )
+
+        self.command_queue = queue.Queue(maxsize=MAX_QUEUED_COMMANDS)
+        # next() on itertools.count is atomic under the GIL, so socket threads
+        # can draw request IDs without taking a lock.
+        self.request_ids = itertools.count()
+        self.backpressure = Backpressure()
+        self.init_udp_control()
+        self.init_tracing()
+        self.init_jobs()
 
         self.socket_server = None
         self.socket_thread = None
         self.running = False
 
         self.start_socket_server()
+        self.start_local_transports()
+        if UDP_CONTROL_ENABLED:
+            self.start_udp_control(UDP_CONTROL_PORT)
 
         self.log("ALiveMCP Remote Script initialized (Queue-based, Thread-Safe)")
         self.log("Socket server listening on port " + str(PORT))
@@ -82,69 +120,104 @@ class ALiveMCP(SocketServerMixin):
         """Log message to Ableton's Log.txt"""
         self.c_instance.log_message("[ALiveMCP] " + str(message))
 
+    def rebuild_dispatch_table(self):
+        """Resolve every registered action to its handler (done once at startup)"""
+        self.dispatch_table = build_dispatch_table(
+            self, self.tools, self.tools.get_available_tools(), SCRIPT_ACTIONS, PARAM_ALIASES
+        )
+
     def _process_command(self, command):
         """
         Process a JSON command and return JSON response.
         THIS RUNS IN THE MAIN THREAD (called from update_display).
 
-        Uses getattr-based dispatch: action names map directly to method names
-        on self.tools, and all remaining command keys are passed as **kwargs.
+        Looks the action up in the dispatch table built at startup; all
+        remaining command keys are passed to its handler as **kwargs.
         """
         try:
             action = command.get("action", "")
+            entry = self.dispatch_table.get(action)
+            if entry is None:
+                return unknown_action_response(action, self.dispatch_table)
 
-            if action == "ping":
-                return {
-                    "ok": True,
-                    "message": "pong (queue-based, thread-safe)",
-                    "script": "ALiveMCP_Remote",
-                    "version": __version__,
-                }
-
-            if action == "health_check":
-                return {
-                    "ok": True,
-                    "message": "ALiveMCP Remote Script running (thread-safe)",
-                    "version": __version__,
-                    "tool_count": len(self.tools.get_available_tools()),
-                    "ableton_version": str(Live.Application.get_application().get_major_version()),
-                    "queue_size": self.command_queue.qsize(),
-                }
-
-            method = getattr(self.tools, action, None)
-            if method is None:
-                return {
-                    "ok": False,
-                    "error": "Unknown action: " + action,
-                    "available_actions": self.tools.get_available_tools(),
-                }
-
-            params = {k: v for k, v in command.items() if k != "action"}
-            action_aliases = PARAM_ALIASES.get(action, {})
-            params = {action_aliases.get(k, k): v for k, v in params.items()}
-            return method(**params)
+            params = dict(command)
+            del params["action"]
+            return entry.call(params)
 
         except Exception as e:
             self.log("ERROR processing command: " + str(e))
             self.log(traceback.format_exc())
             return {"ok": False, "error": str(e), "traceback": traceback.format_exc()}
 
+    def ping(self):
+        """Check that the Remote Script is reachable"""
+        return {
+            "ok": True,
+            "message": "pong (queue-based, thread-safe)",
+            "script": "ALiveMCP_Remote",
+            "version": __version__,
+        }
+
+    def health_check(self):
+        """Report script status, queue depth and transport counters"""
+        return {
+            "ok": True,
+            "message": "ALiveMCP Remote Script running (thread-safe)",
+            "version": __version__,
+            "tool_count": len(self.tools.get_available_tools()),
+            "ableton_version": str(Live.Application.get_application().get_major_version()),
+            "queue_size": self.command_queue.qsize(),
+            "backpressure": self.backpressure.snapshot(),
+            "udp_control": dict(self.udp_stats),
+            "mirror": self.mirror.snapshot(),
+            "jobs": len(self.jobs),
+        }
+
+    def get_tool_schemas(self, names=None):
+        """
+        Get parameter schemas as MCP tool descriptions
+
+        Args:
+            names: Actions to describe (default: all)
+        """
+        try:
+            table = self.dispatch_table
+            wanted = list(table) if names is None else names
+            return {
+                "ok": True,
+                "tools": [table[name].description() for name in wanted if name in table],
+                "unknown": [name for name in wanted if name not in table],
+            }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
     def update_display(self):
         """
         Called by Ableton Live on each tick to update displays.
         RUNS IN MAIN THREAD - safe to call LiveAPI here.
 
-        Processes commands from the queue to ensure thread safety.
+        Applies pending UDP control values, processes commands from the
+        queue to ensure thread safety, advances chunked jobs by one chunk,
+        then refreshes the read-only mirror.
         """
+        self.apply_pending_controls()
+
         commands_processed = 0
 
         while commands_processed < MAX_COMMANDS_PER_TICK:
             try:
-                request_id, command = self.command_queue.get_nowait()
-                response = self._process_command(command)
-
-                if request_id in self.response_queues:
-                    self.response_queues[request_id].put(response)
+                request_id, command, channel = self.command_queue.get_nowait()
+                started = time.perf_counter()
+                response = self.run_command(command)
+                self.tracer.executed(request_id, started, time.perf_counter())
+                action = command.get("action")
+                if isinstance(action, str):
+                    self.mirror.executed(action)
+
+                if isinstance(response, ChunkedJob):
+                    self.start_job(request_id, response, channel)
+                elif channel is not None:
+                    channel.put((request_id, response))
 
                 commands_processed += 1
 
@@ -154,6 +227,9 @@ class ALiveMCP(SocketServerMixin):
                 self.log("Error in update_display: " + str(e))
                 break
 
+        self.run_jobs()
+        self.mirror.refresh(self.dispatch_table)
+
     def connect_script_instances(self, instanciated_scripts):
         """Required by Ableton's Remote Script API"""
         pass
@@ -181,6 +257,12 @@ class ALiveMCP(SocketServerMixin):
             except Exception:
                 pass
 
+        self.stop_local_transports()
+        self.stop_udp_control()
+        self.stop_profiling()
+        self.tracer.stop()
+        self.tools.close_arrangement_index()
+
         self.log("ALiveMCP Remote Script stopped")
 
 
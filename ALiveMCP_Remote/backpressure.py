@@ -0,0 +1,73 @@
+"""
+Admission control and load-shedding counters for the command queue.
+"""
+
+import threading
+
+from .constants import (
+    MAX_COMMANDS_PER_TICK,
+    MAX_PENDING_PER_CLIENT,
+    MAX_QUEUED_COMMANDS,
+    TICK_INTERVAL_MS,
+)
+
+
+class Backpressure:
+    """
+    Tracks how often commands are shed or client reads are paused.
+
+    The global limit is enforced by the bounded command_queue itself; this
+    class only records what happened so health_check can report it, and
+    builds the "overloaded" response sent back to rejected clients.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.shed_overloaded = 0
+        self.paused_reads = 0
+        self.peak_queue_size = 0
+        self.active_clients = 0
+
+    def retry_after_ms(self, queue_size):
+        """Estimate how long the main thread needs to drain queue_size commands"""
+        ticks = max(1, -(-queue_size // MAX_COMMANDS_PER_TICK))
+        return int(round(ticks * TICK_INTERVAL_MS))
+
+    def overloaded_response(self, queue_size):
+        """Record a shed command and build the response sent to its client"""
+        with self.lock:
+            self.shed_overloaded += 1
+        return {
+            "ok": False,
+            "error": "overloaded",
+            "retry_after_ms": self.retry_after_ms(queue_size),
+        }
+
+    def record_queue_size(self, queue_size):
+        with self.lock:
+            if queue_size > self.peak_queue_size:
+                self.peak_queue_size = queue_size
+
+    def record_paused_read(self):
+        with self.lock:
+            self.paused_reads += 1
+
+    def client_connected(self):
+        with self.lock:
+            self.active_clients += 1
+
+    def client_disconnected(self):
+        with self.lock:
+            self.active_clients -= 1
+
+    def snapshot(self):
+        """Return the shedding counters and configured limits as a dict"""
+        with self.lock:
+            return {
+                "max_queued_commands": MAX_QUEUED_COMMANDS,
+                "max_pending_per_client": MAX_PENDING_PER_CLIENT,
+                "active_clients": self.active_clients,
+                "shed_overloaded": self.shed_overloaded,
+                "paused_reads": self.paused_reads,
+                "peak_queue_size": self.peak_queue_size,
+            }
@@ -5,6 +5,9 @@ Centralising these here means socket_server.py and __init__.py stay in sync
 without magic numbers scattered across files.
 """
 
+import os
+import tempfile
+
 PORT = 9004
 
 # How long a client socket waits before timing out an idle connection.
@@ -17,3 +20,96 @@ RESPONSE_TIMEOUT_SECONDS = 25.0
 # Maximum commands processed per update_display() tick (~60 Hz).
 # Keeping this low prevents one busy client from starving the main thread.
 MAX_COMMANDS_PER_TICK = 5
+
+# Nominal interval between update_display() ticks, used for retry estimates.
+TICK_INTERVAL_MS = 1000.0 / 60
+
+# Upper bound on commands waiting for the main thread across all clients.
+# When the queue is full new commands are rejected with an "overloaded"
+# response instead of growing memory inside Live's process.
+MAX_QUEUED_COMMANDS = 256
+
+# Maximum commands a single connection may have queued or awaiting a reply.
+# A connection at its quota is not read from until its responses drain, so
+# TCP flow control pushes back on the client.
+MAX_PENDING_PER_CLIENT = 16
+
+# ---------------------------------------------------------------------------
+# Same-host transports (both disabled by default)
+# ---------------------------------------------------------------------------
+
+# Optional AF_UNIX listener served alongside TCP. Skips the loopback TCP stack
+# for clients on the same machine. Ignored where AF_UNIX is unavailable.
+UNIX_SOCKET_ENABLED = False
+UNIX_SOCKET_PATH = os.path.join(tempfile.gettempdir(), "alivemcp.sock")
+
+# Optional shared-memory transport: a file-backed mmap holding a request ring
+# (client → script) and a response ring (script → client), for high-rate
+# streaming clients. Supports one attached client at a time.
+SHM_TRANSPORT_ENABLED = False
+SHM_PATH = os.path.join(tempfile.gettempdir(), "alivemcp.shm")
+SHM_RING_BYTES = 1 << 20
+
+# How long the shared-memory poller sleeps once a ring has been idle for a
+# while. Lower values cut latency at the cost of more wake-ups.
+SHM_POLL_INTERVAL_SECONDS = 0.0005
+
+# How long stop_local_transports() waits for the shared-memory threads to
+# exit before unmapping the file. A thread still running after this keeps
+# the mapping alive instead of touching a closed one.
+SHM_STOP_TIMEOUT_SECONDS = 2.0
+
+# Optional fire-and-forget UDP listener for continuous controls (faders,
+# macro knobs, crossfader). Accepts JSON or OSC; see udp_control.py.
+UDP_CONTROL_ENABLED = False
+UDP_CONTROL_PORT = 9005
+
+# ---------------------------------------------------------------------------
+# Profiling (profile_start / profile_stop)
+# ---------------------------------------------------------------------------
+
+# Profiles are written to <project folder>/<PROFILE_DIR_NAME>, or to the temp
+# directory when the set has not been saved yet.
+PROFILE_DIR_NAME = "alivemcp-profiles"
+
+# Default stack sampling interval for mode="sampling".
+PROFILE_SAMPLE_INTERVAL_MS = 5.0
+
+# Sampling stops collecting after this many samples (about 17 minutes at 5 ms)
+# so a forgotten session cannot grow without bound.
+PROFILE_MAX_SAMPLES = 200000
+
+# ---------------------------------------------------------------------------
+# Command tracing (get_recent_traces) and the slow-command log
+# ---------------------------------------------------------------------------
+
+# Trace records kept in memory for get_recent_traces.
+TRACE_BUFFER_SIZE = 512
+
+# Commands whose main-thread execution takes at least this long are appended
+# to SLOW_COMMAND_LOG_PATH as JSON lines. One tick at 60 Hz is ~16.7 ms.
+SLOW_COMMAND_THRESHOLD_MS = 10.0
+SLOW_COMMAND_LOG_PATH = os.path.join(tempfile.gettempdir(), "alivemcp-slow-commands.jsonl")
+
+# The slow-command log is rotated to <path>.1 once it grows past this size.
+SLOW_COMMAND_LOG_MAX_BYTES = 5 * 1024 * 1024
+
+# ---------------------------------------------------------------------------
+# Read-only fast path (mirror.py)
+# ---------------------------------------------------------------------------
+
+# A mirrored getter is refreshed every tick for this long after it was last
+# read, then dropped until a client reads it again.
+MIRROR_HOT_SECONDS = 2.0
+
+# Mirrored replies older than this are not served; the command is queued
+# instead. Normally the copy is at most one tick (~16.7 ms) old.
+MIRROR_MAX_AGE_MS = 100.0
+
+# ---------------------------------------------------------------------------
+# Chunked jobs (jobs.py)
+# ---------------------------------------------------------------------------
+
+# Items (e.g. clips) a long-running command handles per tick. Larger batches
+# are spread over several ticks and answered when the last chunk is done.
+JOB_ITEMS_PER_TICK = 64
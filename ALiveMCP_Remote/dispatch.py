@@ -0,0 +1,143 @@
+"""
+Table-driven command dispatch.
+
+build_dispatch_table() runs once at startup and maps every registered action
+to a DispatchEntry holding the bound handler, the action's legacy parameter
+aliases, its parameter schema (tools/schemas.py) and the validator compiled
+from it. The socket thread validates each command with entry.check() before
+queueing it, and _process_command costs one dict lookup per command instead
+of a getattr walk over the LiveAPITools MRO.
+
+Each entry also carries flags derived from the action name, for clients and
+schedulers that treat commands differently:
+
+  read_only    never changes the set (get_*, is_*, browse_*, query_*, ping, ...)
+  idempotent   repeating it has no further effect (reads, set_*, stop_*, ...)
+  priority     PRIORITY_TRANSPORT for playback and launching,
+               PRIORITY_WRITE for other changes, PRIORITY_READ for reads
+"""
+
+import difflib
+
+from .tools.schemas import tool_description, tool_schema
+from .tools.validators import compile_validator
+
+PRIORITY_TRANSPORT = 0
+PRIORITY_WRITE = 1
+PRIORITY_READ = 2
+
+READ_ONLY_PREFIXES = ("get_", "is_", "browse_", "query_")
+READ_ONLY_ACTIONS = ("ping", "health_check", "get_tool_schemas", "get_recent_traces")
+
+IDEMPOTENT_PREFIXES = (
+    "set_", "rename_", "show_", "hide_", "focus_", "scroll_view_", "arm_", "solo_", "mute_",
+    "select_", "deselect_", "jump_to_", "clear_", "freeze_", "unfreeze_", "stop_",
+)  # fmt: skip
+IDEMPOTENT_ACTIONS = ("start_playback", "continue_playing")
+
+TRANSPORT_PREFIXES = ("launch_", "stop_", "jump_")
+TRANSPORT_ACTIONS = (
+    "start_playback", "continue_playing", "start_recording", "trigger_session_record",
+    "tap_tempo", "nudge_up", "nudge_down",
+)  # fmt: skip
+
+# Suggestions returned for an unknown action
+MAX_SUGGESTIONS = 3
+
+
+def action_flags(name):
+    """(read_only, idempotent, priority) for an action name"""
+    read_only = name in READ_ONLY_ACTIONS or name.startswith(READ_ONLY_PREFIXES)
+    idempotent = read_only or name in IDEMPOTENT_ACTIONS or name.startswith(IDEMPOTENT_PREFIXES)
+    if name in TRANSPORT_ACTIONS or name.startswith(TRANSPORT_PREFIXES):
+        priority = PRIORITY_TRANSPORT
+    elif read_only:
+        priority = PRIORITY_READ
+    else:
+        priority = PRIORITY_WRITE
+    return read_only, idempotent, priority
+
+
+class DispatchEntry:
+    """One action: its handler, parameter schema and validator, and flags"""
+
+    __slots__ = (
+        "name",
+        "handler",
+        "aliases",
+        "schema",
+        "validate",
+        "accepted",
+        "read_only",
+        "idempotent",
+        "priority",
+    )
+
+    def __init__(self, name, handler, aliases=None):
+        self.name = name
+        self.handler = handler
+        self.aliases = aliases or {}
+        self.read_only, self.idempotent, self.priority = action_flags(name)
+        self.schema = tool_schema(name, handler)
+        self.validate = compile_validator(name, self.schema, self.aliases)
+        self.accepted = sorted(self.schema["properties"])
+
+    def check(self, params):
+        """
+        Validate and coerce params in place (see compile_validator). Returns
+        None when they are acceptable, otherwise the error reply.
+        """
+        error = self.validate(params)
+        if error is None:
+            return None
+        return {"ok": False, "error": error, "parameters": self.accepted}
+
+    def call(self, params):
+        """
+        Apply aliases and run the handler. Commands from clients were already
+        checked on the socket thread; a direct call that does not match the
+        signature is reported by name when the handler raises TypeError.
+        """
+        if self.aliases:
+            for legacy, canonical in self.aliases.items():
+                if legacy in params:
+                    params[canonical] = params.pop(legacy)
+        try:
+            return self.handler(**params)
+        except TypeError:
+            rejected = self.check(dict(params))
+            if rejected is None:
+                raise
+            return rejected
+
+    def description(self):
+        """MCP-style tool description: name, description, inputSchema"""
+        return tool_description(self.name, self.handler, self.schema, self.aliases)
+
+
+def build_dispatch_table(script, tools, tool_names, script_actions, aliases):
+    """
+    Map each name in tool_names to a DispatchEntry. Names in script_actions
+    are methods of the script itself; the rest are LiveAPITools methods.
+    Registered names without an implementation are logged and left out.
+    """
+    table = {}
+    for name in tool_names:
+        owner = script if name in script_actions else tools
+        handler = getattr(owner, name, None)
+        if handler is None:
+            script.log("No handler for registered action: " + name)
+            continue
+        table[name] = DispatchEntry(name, handler, aliases.get(name))
+    return table
+
+
+def unknown_action_response(action, table):
+    """Error reply for an action that is not in the table, with close matches"""
+    suggestions = difflib.get_close_matches(str(action), table, MAX_SUGGESTIONS, 0.6)
+    return {
+        "ok": False,
+        "error": "Unknown action: " + str(action),
+        "did_you_mean": suggestions,
+        "tool_count": len(table),
+    }
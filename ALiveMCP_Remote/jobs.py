@@ -0,0 +1,81 @@
+"""
+Chunked jobs: commands whose work is spread over several ticks.
+
+A tool that may touch more objects than fit comfortably in one
+update_display() tick builds its work with run_chunked(). When everything
+fits in one chunk the work is done at once and the reply returned as usual;
+otherwise run_chunked() returns a ChunkedJob instead of a reply. The script
+keeps the job together with the command's request ID and response channel
+and advances it by one chunk per tick (JobsMixin.run_jobs()), sending the
+reply once the last chunk is done. Other commands keep being processed
+between chunks, so a large job never holds up the rest of the set.
+
+Items are processed in order and each is handled independently, so a job
+that fails half way reports what it changed.
+"""
+
+from .constants import JOB_ITEMS_PER_TICK
+
+
+class ChunkedJob:
+    """apply(item) for each item, JOB_ITEMS_PER_TICK at a time, then finish(results)"""
+
+    def __init__(self, items, apply, finish, chunk_size=JOB_ITEMS_PER_TICK):
+        self.items = items
+        self.apply = apply
+        self.finish = finish
+        self.chunk_size = max(1, int(chunk_size))
+        self.position = 0
+        self.results = []
+
+    def step(self):
+        """Process the next chunk; returns the reply after the last one, else None"""
+        end = min(self.position + self.chunk_size, len(self.items))
+        for index in range(self.position, end):
+            self.results.append(self.apply(self.items[index]))
+        self.position = end
+        if end < len(self.items):
+            return None
+        return self.finish(self.results)
+
+    def run(self):
+        """Process every remaining item now and return the reply"""
+        reply = self.step()
+        while reply is None:
+            reply = self.step()
+        return reply
+
+
+def run_chunked(items, apply, finish, chunk_size=JOB_ITEMS_PER_TICK):
+    """The reply when items fit in one chunk, otherwise a ChunkedJob for the script to run"""
+    job = ChunkedJob(items, apply, finish, chunk_size)
+    if len(items) <= job.chunk_size:
+        return job.run()
+    return job
+
+
+class JobsMixin:
+    """Runs the ChunkedJobs that commands return, one chunk per job per tick"""
+
+    def init_jobs(self):
+        # [(request_id, job, channel)], in the order the commands ran
+        self.jobs = []
+
+    def start_job(self, request_id, job, channel):
+        """Keep a job returned by a command; its reply is sent when it finishes"""
+        self.jobs.append((request_id, job, channel))
+
+    def run_jobs(self):
+        """Advance every job by one chunk, replying to those that finish"""
+        for pending in list(self.jobs):
+            request_id, job, channel = pending
+            try:
+                reply = job.step()
+            except Exception as e:
+                self.log("Error in chunked job: " + str(e))
+                reply = {"ok": False, "error": str(e)}
+            if reply is None:
+                continue
+            self.jobs.remove(pending)
+            if channel is not None:
+                channel.put((request_id, reply))
@@ -0,0 +1,179 @@
+"""
+Optional same-host transports: an AF_UNIX listener and a shared-memory ring.
+
+Both feed the same command_queue, backpressure and response-channel
+machinery as TCP (see SocketServerMixin); only the byte transport differs.
+"""
+
+import os
+import socket
+import stat
+import threading
+import time
+import traceback
+
+from .constants import (
+    SHM_PATH,
+    SHM_POLL_INTERVAL_SECONDS,
+    SHM_RING_BYTES,
+    SHM_STOP_TIMEOUT_SECONDS,
+    SHM_TRANSPORT_ENABLED,
+    SOCKET_TIMEOUT_SECONDS,
+    UNIX_SOCKET_ENABLED,
+    UNIX_SOCKET_PATH,
+)
+from .shm_ring import create_shm_file
+
+# Empty polls of the request ring before the poller starts sleeping between
+# checks. Keeps latency low during bursts without spinning while idle.
+SHM_SPIN_POLLS = 200
+
+
+class _RingSink:
+    """Adapts a response ring to the sendall() interface _client_writer expects."""
+
+    trace_label = "shm"
+
+    def __init__(self, server, ring, stop):
+        self.server = server
+        self.ring = ring
+        self.stop = stop
+
+    def sendall(self, data):
+        data = data.rstrip(b"\n")
+        if len(data) > self.ring.max_record:
+            data = b'{"ok": false, "error": "Response too large for shared-memory ring"}'
+
+        deadline = time.monotonic() + SOCKET_TIMEOUT_SECONDS
+        while not self.ring.write(data):
+            if not self.server.running or self.stop.is_set() or time.monotonic() > deadline:
+                raise OSError("shared-memory client is not reading responses")
+            time.sleep(SHM_POLL_INTERVAL_SECONDS)
+
+
+class LocalTransportsMixin:
+    """
+    Starts and stops the optional AF_UNIX and shared-memory transports.
+    Requires SocketServerMixin for _socket_listener, _start_writer,
+    _stop_writer, _acquire_slot and _submit_message.
+    """
+
+    unix_server = None
+    shm_buffer = None
+    shm_thread = None
+
+    def start_local_transports(self):
+        """Start whichever same-host transports are enabled in constants.py"""
+        if UNIX_SOCKET_ENABLED:
+            self.start_unix_server(UNIX_SOCKET_PATH)
+        if SHM_TRANSPORT_ENABLED:
+            self.start_shm_transport(SHM_PATH, SHM_RING_BYTES)
+
+    def start_unix_server(self, path):
+        """Listen on an AF_UNIX socket at path, served by _socket_listener"""
+        if not hasattr(socket, "AF_UNIX"):
+            self.log("AF_UNIX not supported on this platform; Unix socket disabled")
+            return
+
+        try:
+            if os.path.exists(path) and stat.S_ISSOCK(os.stat(path).st_mode):
+                os.unlink(path)
+
+            self.unix_server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.unix_server.bind(path)
+            os.chmod(path, 0o600)
+            self.unix_server.listen(5)
+            self.unix_socket_path = path
+
+            thread = threading.Thread(target=self._socket_listener, args=(self.unix_server,))
+            thread.daemon = True
+            thread.start()
+
+            self.log("Unix socket server listening on " + path)
+        except Exception as e:
+            self.log("ERROR starting Unix socket server: " + str(e))
+            self.log(traceback.format_exc())
+            if self.unix_server is not None:
+                self.unix_server.close()
+                self.unix_server = None
+
+    def start_shm_transport(self, path, ring_bytes):
+        """Create the shared-memory file at path and start polling it"""
+        try:
+            self.shm_buffer, requests, responses = create_shm_file(path, ring_bytes)
+            self.shm_path = path
+            self.shm_stop = threading.Event()
+
+            self.shm_thread = threading.Thread(
+                target=self._shm_reader, args=(requests, responses, self.shm_stop)
+            )
+            self.shm_thread.daemon = True
+            self.shm_thread.start()
+
+            self.log("Shared-memory transport ready at " + path)
+        except Exception as e:
+            self.log("ERROR starting shared-memory transport: " + str(e))
+            self.log(traceback.format_exc())
+
+    def _shm_reader(self, requests, responses, stop):
+        """
+        Poll the request ring and submit each record as a command (runs in its
+        own thread) until the script stops or stop is set. Replies go to the
+        response ring via the usual writer.
+        """
+        outbox, channel, slots, writer = self._start_writer(_RingSink(self, responses, stop))
+        idle_polls = 0
+
+        try:
+            while self.running and not stop.is_set():
+                try:
+                    record = requests.read()
+                except ValueError as e:
+                    self.log("Shared-memory transport: " + str(e))
+                    continue
+                if record is None:
+                    idle_polls += 1
+                    if idle_polls > SHM_SPIN_POLLS:
+                        time.sleep(SHM_POLL_INTERVAL_SECONDS)
+                    continue
+
+                idle_polls = 0
+                if not self._acquire_slot(slots):
+                    continue
+                try:
+                    message = record.decode("utf-8")
+                except UnicodeDecodeError as e:
+                    # Answered like bad JSON, so the slot is released and polling goes on
+                    outbox.put((None, {"ok": False, "error": str(e)}))
+                    continue
+                outbox.put(self._submit_message(message, channel))
+        except Exception as e:
+            if self.running:
+                self.log("Shared-memory transport error: " + str(e))
+        finally:
+            self._stop_writer(outbox, writer)
+
+    def stop_local_transports(self):
+        """Close the same-host transports and remove their filesystem entries"""
+        if self.unix_server is not None:
+            try:
+                self.unix_server.close()
+                os.unlink(self.unix_socket_path)
+            except Exception:
+                pass
+            self.unix_server = None
+
+        if self.shm_buffer is not None:
+            # The ring threads read and write the mapping; stop them before closing it
+            self.shm_stop.set()
+            self.shm_thread.join(SHM_STOP_TIMEOUT_SECONDS)
+            try:
+                if self.shm_thread.is_alive():
+                    self.log("Shared-memory thread still running; leaving the mapping open")
+                else:
+                    self.shm_buffer.close()
+                os.unlink(self.shm_path)
+            except Exception:
+                pass
+            self.shm_buffer = None
+            self.shm_thread = None
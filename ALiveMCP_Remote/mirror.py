@@ -0,0 +1,132 @@
+"""
+Read-only fast path: a mirror of cheap song-level getters.
+
+The getters listed in MIRRORED_TOOLS take no parameters
+and only read song state. Once one of them has been read, update_display()
+re-runs it at the end of every tick for the next MIRROR_HOT_SECONDS and keeps
+the reply. The socket thread then answers that action from the copy
+immediately instead of queueing it behind other commands. A reply served
+this way carries mirror_age_ms, the time since the copy was taken.
+
+The mirror is bypassed, and the command queued as usual, while:
+
+  - any write (an action that is not read-only) is queued or has run since
+    the last refresh, so a client always reads its own writes
+  - the copy is older than MIRROR_MAX_AGE_MS, e.g. because Live stopped
+    ticking
+  - the getter has not been read recently or last returned an error
+"""
+
+import threading
+import time
+
+from .constants import MIRROR_HOT_SECONDS, MIRROR_MAX_AGE_MS
+
+# Parameterless getters of song-level state that the socket thread may answer
+# from the mirror instead of queueing them
+MIRRORED_TOOLS = [
+    "get_session_info",
+    "get_current_time",
+    "get_session_automation_record",
+    "get_session_record",
+    "get_groove_amount",
+    "get_can_jump_to_next_cue",
+    "get_can_jump_to_prev_cue",
+    "get_loop_enabled",
+    "get_master_track_info",
+    "get_return_track_count",
+    "get_crossfader_position",
+    "get_metronome_volume",
+    "get_arrangement_overdub",
+    "get_signature_numerator",
+    "get_signature_denominator",
+]
+
+
+class PropertyMirror:
+    """Per-tick copies of getter replies, shared by the main and socket threads"""
+
+    def __init__(self, actions, read_only, max_age_ms=MIRROR_MAX_AGE_MS):
+        self.actions = frozenset(actions)
+        self.read_only = frozenset(read_only)
+        self.max_age = max_age_ms / 1000.0
+        # (time taken, {action: reply}); replaced as a whole, never mutated
+        self.state = (0.0, {})
+        # Every key exists up front, so socket threads only ever assign
+        self.last_read = dict.fromkeys(self.actions, float("-inf"))
+        self.lock = threading.Lock()
+        self.pending_writes = 0
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    # -- socket threads --------------------------------------------------------
+
+    def read(self, action):
+        """A copy of the mirrored reply for action, or None to queue it instead"""
+        if action not in self.actions:
+            return None
+        now = time.perf_counter()
+        self.last_read[action] = now
+        # Check writes before taking the state: the main thread sets dirty
+        # before it releases a write, and installs a new state before clearing it
+        if self.pending_writes or self.dirty:
+            self.misses += 1
+            return None
+        taken_at, replies = self.state
+        reply = replies.get(action)
+        if reply is None or now - taken_at > self.max_age:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return dict(reply, mirror_age_ms=round((now - taken_at) * 1000.0, 3))
+
+    def write_submitted(self, action):
+        """Called before a command is put on the queue"""
+        if action not in self.read_only:
+            with self.lock:
+                self.pending_writes += 1
+
+    def write_withdrawn(self, action):
+        """Called when a command could not be queued after all"""
+        if action not in self.read_only:
+            with self.lock:
+                self.pending_writes -= 1
+
+    # -- main thread -----------------------------------------------------------
+
+    def executed(self, action):
+        """Called by update_display() after running a queued command"""
+        if action not in self.read_only:
+            self.dirty = True
+            with self.lock:
+                # Commands put on the queue directly were never counted
+                if self.pending_writes > 0:
+                    self.pending_writes -= 1
+
+    def refresh(self, table):
+        """Re-run every recently read getter (end of each tick)"""
+        now = time.perf_counter()
+        replies = {}
+        for action, last_read in list(self.last_read.items()):
+            if now - last_read > MIRROR_HOT_SECONDS:
+                continue
+            try:
+                reply = table[action].handler()
+            except Exception:
+                continue
+            if isinstance(reply, dict) and reply.get("ok"):
+                replies[action] = reply
+        self.state = (now, replies)
+        self.dirty = False
+
+    def snapshot(self):
+        """Counters for health_check"""
+        taken_at, replies = self.state
+        return {
+            "mirrored": sorted(replies),
+            "hits": self.hits,
+            "misses": self.misses,
+            "pending_writes": self.pending_writes,
+            "max_age_ms": self.max_age * 1000.0,
+        }
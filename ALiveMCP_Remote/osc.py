@@ -0,0 +1,64 @@
+"""
+Minimal OSC 1.0 decoder for the UDP control stream.
+
+Only what fader/knob streams need: messages and (nested) bundles carrying
+int32, float32, float64, int64, string, True/False/Nil arguments. Bundle
+time tags are ignored — every value is applied on the next tick.
+"""
+
+import struct
+
+
+def _read_string(data, offset):
+    end = data.index(b"\0", offset)
+    text = data[offset:end].decode("utf-8")
+    # Strings are null-terminated and padded to a multiple of 4 bytes
+    return text, (end + 4) & ~3
+
+
+def parse_osc_message(data):
+    """Decode one OSC message; returns (address, [args])"""
+    address, offset = _read_string(data, 0)
+    if offset >= len(data):
+        return address, []
+
+    tags, offset = _read_string(data, offset)
+    if not tags.startswith(","):
+        raise ValueError("Missing OSC type tag string")
+
+    args = []
+    for tag in tags[1:]:
+        if tag == "f":
+            args.append(struct.unpack_from(">f", data, offset)[0])
+            offset += 4
+        elif tag == "i":
+            args.append(struct.unpack_from(">i", data, offset)[0])
+            offset += 4
+        elif tag == "d":
+            args.append(struct.unpack_from(">d", data, offset)[0])
+            offset += 8
+        elif tag == "h":
+            args.append(struct.unpack_from(">q", data, offset)[0])
+            offset += 8
+        elif tag == "s":
+            value, offset = _read_string(data, offset)
+            args.append(value)
+        elif tag in "TFN":
+            args.append({"T": True, "F": False, "N": None}[tag])
+        else:
+            raise ValueError("Unsupported OSC type tag: " + tag)
+    return address, args
+
+
+def parse_osc_packet(data):
+    """Decode an OSC packet (message or bundle) into a flat list of (address, args)"""
+    if data.startswith(b"#bundle\0"):
+        messages = []
+        offset = 16  # "#bundle\0" + 8-byte time tag
+        while offset + 4 <= len(data):
+            (size,) = struct.unpack_from(">i", data, offset)
+            offset += 4
+            messages.extend(parse_osc_packet(data[offset : offset + size]))
+            offset += size
+        return messages
+    return [parse_osc_message(data)]
@@ -0,0 +1,229 @@
+"""
+Opt-in profiling of the main thread, for diagnosing stutter in a live set.
+
+profile_start begins a session in one of two modes:
+
+  cprofile   Wraps each command run by update_display() in cProfile. Exact
+             call counts and times per function, at some cost per command.
+  sampling   A background thread reads the main thread's Python stack via
+             sys._current_frames() every interval_ms. Nothing runs on the
+             main thread, so it is safe to leave on during a show.
+
+profile_stop ends the session and writes the result to the project folder
+(or the temp directory if the set has not been saved yet):
+
+  alivemcp-profiles/<timestamp>-cprofile.pstats    load with pstats/snakeviz
+  alivemcp-profiles/<timestamp>-sampling.collapsed one "a;b;c count" line per
+                                                   stack, for flamegraph.pl
+                                                   or speedscope
+"""
+
+import collections
+import cProfile
+import os
+import pstats
+import sys
+import tempfile
+import threading
+import time
+
+from .constants import PROFILE_DIR_NAME, PROFILE_MAX_SAMPLES, PROFILE_SAMPLE_INTERVAL_MS
+
+PROFILE_MODES = ("cprofile", "sampling")
+
+# Actions that control profiling; never profiled themselves
+PROFILING_ACTIONS = ("profile_start", "profile_stop")
+
+# Samples are rooted at this frame; anything outside it is the script idling
+TICK_FUNCTION = "update_display"
+
+
+def frame_label(code):
+    """'function (file.py:line)' for one stack frame"""
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def collapse_stack(frame, root=TICK_FUNCTION):
+    """
+    Render a frame's stack, outermost first, as 'a;b;c', starting at the
+    innermost frame named root. Returns None when root is not on the stack.
+    """
+    labels = []
+    while frame is not None:
+        labels.append(frame_label(frame.f_code))
+        if frame.f_code.co_name == root:
+            return ";".join(reversed(labels))
+        frame = frame.f_back
+    return None
+
+
+class SamplingSession:
+    """Samples one thread's stack on a background thread"""
+
+    mode = "sampling"
+
+    def __init__(self, thread_id, interval_ms=PROFILE_SAMPLE_INTERVAL_MS):
+        self.thread_id = thread_id
+        self.interval = max(0.001, interval_ms / 1000.0)
+        self.stacks = collections.Counter()
+        self.idle_samples = 0
+        self.commands = 0
+        self.started = time.time()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample_loop, daemon=True)
+        self._thread.start()
+
+    def _sample_loop(self):
+        samples = 0
+        while not self._stop.wait(self.interval) and samples < PROFILE_MAX_SAMPLES:
+            frame = sys._current_frames().get(self.thread_id)
+            stack = collapse_stack(frame) if frame is not None else None
+            if stack is None:
+                self.idle_samples += 1
+            else:
+                self.stacks[stack] += 1
+            samples += 1
+
+    def run(self, func, *args):
+        self.commands += 1
+        return func(*args)
+
+    def cancel(self):
+        self._stop.set()
+        self._thread.join()
+
+    def finish(self, path_base):
+        self.cancel()
+        path = path_base + ".collapsed"
+        with open(path, "w") as f:
+            for stack, count in sorted(self.stacks.items()):
+                f.write(stack + " " + str(count) + "\n")
+
+        leaves = collections.Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+        return {
+            "files": [path],
+            "samples": sum(self.stacks.values()),
+            "idle_samples": self.idle_samples,
+            "interval_ms": self.interval * 1000.0,
+            "top": [{"function": name, "samples": n} for name, n in leaves.most_common(10)],
+        }
+
+
+class CProfileSession:
+    """Deterministic profile of every command run while the session is active"""
+
+    mode = "cprofile"
+
+    def __init__(self):
+        self.profiler = cProfile.Profile()
+        self.commands = 0
+        self.started = time.time()
+
+    def run(self, func, *args):
+        self.commands += 1
+        return self.profiler.runcall(func, *args)
+
+    def cancel(self):
+        pass
+
+    def finish(self, path_base):
+        path = path_base + ".pstats"
+        self.profiler.dump_stats(path)
+
+        stats = pstats.Stats(self.profiler).stats
+        ranked = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)[:10]
+        top = [
+            {
+                "function": f"{name} ({os.path.basename(filename)}:{line})",
+                "calls": calls,
+                "self_ms": round(self_time * 1000, 3),
+                "total_ms": round(total_time * 1000, 3),
+            }
+            for (filename, line, name), (_, calls, self_time, total_time, _) in ranked
+        ]
+        return {"files": [path], "top": top}
+
+
+class ProfilingMixin:
+    """
+    profile_start / profile_stop actions and the hook update_display() uses
+    to run commands under the active session.
+    Subclasses must provide self.song and self.log().
+    """
+
+    profile_session = None
+
+    def run_command(self, command):
+        """Process one command, under the profiler while a session is active"""
+        session = self.profile_session
+        if session is None or command.get("action") in PROFILING_ACTIONS:
+            return self._process_command(command)
+        return session.run(self._process_command, command)
+
+    def profile_start(self, mode="sampling", interval_ms=PROFILE_SAMPLE_INTERVAL_MS):
+        """Start profiling the main thread (mode: 'sampling' or 'cprofile')"""
+        try:
+            if self.profile_session is not None:
+                return {
+                    "ok": False,
+                    "error": "Profiling already active (" + self.profile_session.mode + ")",
+                }
+            if mode not in PROFILE_MODES:
+                return {"ok": False, "error": "mode must be one of: " + ", ".join(PROFILE_MODES)}
+
+            if mode == "cprofile":
+                self.profile_session = CProfileSession()
+            else:
+                # profile_start runs on the main thread, so this is the thread to sample
+                self.profile_session = SamplingSession(threading.get_ident(), float(interval_ms))
+
+            self.log("Profiling started (" + mode + ")")
+            return {"ok": True, "mode": mode, "output_dir": self._profile_dir()}
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def profile_stop(self):
+        """Stop profiling and write the .pstats / .collapsed file"""
+        try:
+            session = self.profile_session
+            if session is None:
+                return {"ok": False, "error": "Profiling is not active"}
+            self.profile_session = None
+
+            directory = self._profile_dir()
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+            stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(session.started))
+            result = session.finish(os.path.join(directory, stamp + "-" + session.mode))
+
+            result.update(
+                {
+                    "ok": True,
+                    "mode": session.mode,
+                    "commands": session.commands,
+                    "duration_s": round(time.time() - session.started, 3),
+                }
+            )
+            self.log("Profiling stopped; wrote " + ", ".join(result["files"]))
+            return result
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def stop_profiling(self):
+        """Discard any active session when the script unloads"""
+        session, self.profile_session = self.profile_session, None
+        if session is not None:
+            session.cancel()
+
+    def _profile_dir(self):
+        """<project folder>/alivemcp-profiles, or the temp directory for unsaved sets"""
+        root = None
+        try:
+            root = self.song.project_root_folder
+        except Exception:
+            pass
+        if not isinstance(root, str) or not root:
+            root = tempfile.gettempdir()
+        return os.path.join(root, PROFILE_DIR_NAME)
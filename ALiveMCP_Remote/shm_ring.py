@@ -0,0 +1,128 @@
+"""
+Single-producer/single-consumer byte rings in a shared mmap file.
+
+File layout (all integers little-endian):
+
+    0     file header: magic b"AMCPSHM1", u32 version, u32 ring_bytes
+    64    request ring   (client writes, script reads)
+    ...   response ring  (script writes, client reads)
+
+Each ring has a 128-byte header — the producer's u64 head at +0 and the
+consumer's u64 tail at +64, on separate cache lines — followed by ring_bytes
+of data. head and tail only ever grow; the data offset is value % ring_bytes.
+Records are a u32 length followed by that many bytes of UTF-8 JSON and may
+wrap around the end of the data area. The producer copies the record before
+publishing the new head, so the consumer never sees a partial record.
+
+The client side of this layout lives in examples/shm_client.py; keep the two
+in sync when changing it.
+"""
+
+import mmap
+import os
+import struct
+
+MAGIC = b"AMCPSHM1"
+VERSION = 1
+FILE_HEADER_BYTES = 64
+RING_HEADER_BYTES = 128
+LENGTH_PREFIX = struct.Struct("<I")
+COUNTER = struct.Struct("<Q")
+HEADER = struct.Struct("<8sII")
+
+
+class ShmRing:
+    """One direction of the shared-memory transport."""
+
+    def __init__(self, buf, offset, capacity):
+        self.buf = buf
+        self.head_at = offset
+        self.tail_at = offset + 64
+        self.data_at = offset + RING_HEADER_BYTES
+        self.capacity = capacity
+        self.max_record = capacity - LENGTH_PREFIX.size
+
+    def _get(self, at):
+        return COUNTER.unpack_from(self.buf, at)[0]
+
+    def _copy_in(self, position, data):
+        start = position % self.capacity
+        first = min(len(data), self.capacity - start)
+        self.buf[self.data_at + start : self.data_at + start + first] = data[:first]
+        if first < len(data):
+            self.buf[self.data_at : self.data_at + len(data) - first] = data[first:]
+
+    def _copy_out(self, position, size):
+        start = position % self.capacity
+        first = min(size, self.capacity - start)
+        data = self.buf[self.data_at + start : self.data_at + start + first]
+        if first < size:
+            data += self.buf[self.data_at : self.data_at + size - first]
+        return data
+
+    def write(self, payload):
+        """
+        Append one record. Returns False if the ring does not currently have
+        room (the consumer is behind); raises ValueError if it never will.
+        """
+        if len(payload) > self.max_record:
+            raise ValueError("record larger than ring capacity")
+
+        head = self._get(self.head_at)
+        needed = LENGTH_PREFIX.size + len(payload)
+        if needed > self.capacity - (head - self._get(self.tail_at)):
+            return False
+
+        self._copy_in(head, LENGTH_PREFIX.pack(len(payload)))
+        self._copy_in(head + LENGTH_PREFIX.size, payload)
+        COUNTER.pack_into(self.buf, self.head_at, head + needed)
+        return True
+
+    def read(self):
+        """
+        Pop the oldest record, or return None if the ring is empty. A length
+        prefix that cannot be right (larger than the ring or than what was
+        published) means the ring is corrupt: everything pending is discarded
+        and ValueError raised.
+        """
+        tail = self._get(self.tail_at)
+        head = self._get(self.head_at)
+        if tail == head:
+            return None
+
+        (size,) = LENGTH_PREFIX.unpack(self._copy_out(tail, LENGTH_PREFIX.size))
+        if size > self.max_record or LENGTH_PREFIX.size + size > head - tail:
+            COUNTER.pack_into(self.buf, self.tail_at, head)
+            raise ValueError("corrupt record length " + str(size) + "; ring discarded")
+        payload = self._copy_out(tail + LENGTH_PREFIX.size, size)
+        COUNTER.pack_into(self.buf, self.tail_at, tail + LENGTH_PREFIX.size + size)
+        return payload
+
+
+def create_shm_file(path, ring_bytes):
+    """
+    Create a fresh, zeroed transport file and map it.
+
+    Any existing file is unlinked first so a client still attached to a
+    previous session keeps its own mapping instead of seeing it zeroed. The
+    file is readable and writable by the owner only (0o600, like the AF_UNIX
+    socket), since anyone who can open it can send commands.
+
+    Returns (mmap, request_ring, response_ring).
+    """
+    if os.path.exists(path):
+        os.unlink(path)
+
+    size = FILE_HEADER_BYTES + 2 * (RING_HEADER_BYTES + ring_bytes)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_EXCL, 0o600)
+    # The mode passed to open() is reduced by the umask but never widened;
+    # set it explicitly so the file is owner-only whatever the umask
+    os.fchmod(fd, 0o600)
+    with os.fdopen(fd, "w+b") as f:
+        f.truncate(size)
+        buf = mmap.mmap(f.fileno(), size)
+
+    HEADER.pack_into(buf, 0, MAGIC, VERSION, ring_bytes)
+    requests = ShmRing(buf, FILE_HEADER_BYTES, ring_bytes)
+    responses = ShmRing(buf, FILE_HEADER_BYTES + RING_HEADER_BYTES + ring_bytes, ring_bytes)
+    return buf, requests, responses
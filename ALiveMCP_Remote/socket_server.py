@@ -5,6 +5,7 @@ TCP socket server mixin for receiving and dispatching commands from clients.
 import json
 import socket
 import threading
+import time
 import traceback
 
 try:
@@ -12,40 +13,57 @@ try:
 except ImportError:
     import queue  # Python 3
 
-from .constants import PORT, RESPONSE_TIMEOUT_SECONDS, SOCKET_TIMEOUT_SECONDS
+from .constants import (
+    MAX_PENDING_PER_CLIENT,
+    PORT,
+    RESPONSE_TIMEOUT_SECONDS,
+    SOCKET_TIMEOUT_SECONDS,
+)
+from .dispatch import unknown_action_response
+from .tracing import client_label
 
 
 class SocketServerMixin:
     """
     Manages the TCP socket server lifecycle and per-client I/O.
     Subclasses must provide: self.running, self.command_queue,
-    self.response_queues, self.request_counter, self.request_lock, self.log().
+    self.request_ids, self.dispatch_table, self.mirror, self.backpressure,
+    self.tracer, self.log().
     """
 
-    def start_socket_server(self):
-        """Start the socket server in a background thread"""
+    def start_socket_server(self, port=PORT):
+        """Start the socket server on 127.0.0.1:port in a background thread"""
         try:
             self.running = True
             self.socket_server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket_server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.socket_server.bind(("127.0.0.1", PORT))
+            self.socket_server.bind(("127.0.0.1", port))
             self.socket_server.listen(5)
 
             self.socket_thread = threading.Thread(target=self._socket_listener)
             self.socket_thread.daemon = True
             self.socket_thread.start()
 
-            self.log("Socket server started successfully on port " + str(PORT))
+            self.log("Socket server started successfully on port " + str(port))
         except Exception as e:
             self.log("ERROR starting socket server: " + str(e))
             self.log(traceback.format_exc())
 
-    def _socket_listener(self):
-        """Background thread that listens for client connections"""
+    def _socket_listener(self, server_socket=None):
+        """
+        Background thread that listens for client connections.
+        Serves self.socket_server unless another listening socket is given.
+        """
+        if server_socket is None:
+            server_socket = self.socket_server
+
         while self.running:
             try:
-                client_socket, address = self.socket_server.accept()
+                client_socket, address = server_socket.accept()
                 self.log("Client connected from " + str(address))
+                if client_socket.family == socket.AF_INET:
+                    # Pipelined replies are small; don't let Nagle hold them back
+                    client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
                 client_thread = threading.Thread(
                     target=self._handle_client, args=(client_socket,), daemon=True
@@ -60,10 +78,18 @@ class SocketServerMixin:
         """
         Handle commands from a connected client (runs in socket thread).
 
-        Receives commands from the socket, puts them in command_queue,
-        waits for a response from response_queue, and sends it back.
+        Reads newline-delimited commands and submits them to command_queue
+        without waiting for earlier replies, so a client may pipeline up to
+        MAX_PENDING_PER_CLIENT commands. A companion writer thread sends the
+        responses back in request order. Once a client is at its quota this
+        thread stops reading from the socket until a response has been sent.
+
+        All of the connection's responses arrive on a single response channel
+        (a SimpleQueue created once per connection), so no per-request queue
+        or shared lookup table is needed.
         """
         buffer = ""
+        outbox, channel, slots, writer = self._start_writer(client_socket)
 
         try:
             client_socket.settimeout(SOCKET_TIMEOUT_SECONDS)
@@ -80,40 +106,8 @@ class SocketServerMixin:
                         message, buffer = buffer.split("\n", 1)
                         message = message.strip()
 
-                        if message:
-                            with self.request_lock:
-                                request_id = self.request_counter
-                                self.request_counter += 1
-                                self.response_queues[request_id] = queue.Queue()
-
-                            try:
-                                command = json.loads(message)
-                                self.command_queue.put((request_id, command))
-
-                                try:
-                                    response = self.response_queues[request_id].get(
-                                        timeout=RESPONSE_TIMEOUT_SECONDS
-                                    )
-                                except queue.Empty:
-                                    response = {
-                                        "ok": False,
-                                        "error": "Command processing timeout - main thread may be busy",
-                                    }
-
-                                with self.request_lock:
-                                    if request_id in self.response_queues:
-                                        del self.response_queues[request_id]
-
-                                client_socket.sendall((json.dumps(response) + "\n").encode("utf-8"))
-
-                            except Exception as e:
-                                error_resp = {"ok": False, "error": str(e)}
-                                try:
-                                    client_socket.sendall(
-                                        (json.dumps(error_resp) + "\n").encode("utf-8")
-                                    )
-                                except Exception:
-                                    pass
+                        if message and self._acquire_slot(slots):
+                            outbox.put(self._submit_message(message, channel))
 
                 except socket.timeout:
                     continue
@@ -124,7 +118,157 @@ class SocketServerMixin:
         except Exception as e:
             self.log("Client handler error: " + str(e))
         finally:
+            self._stop_writer(outbox, writer)
             try:
                 client_socket.close()
             except Exception:
                 pass
+
+    def _start_writer(self, sink):
+        """
+        Set up the per-connection state shared by every transport: an outbox
+        of pending replies in request order, the response channel the main
+        thread answers on, and the semaphore enforcing MAX_PENDING_PER_CLIENT.
+        Starts the writer thread that sends replies to sink (any object with
+        a sendall(bytes) method).
+
+        Returns (outbox, channel, slots, writer).
+        """
+        outbox = queue.SimpleQueue()
+        channel = queue.SimpleQueue()
+        slots = threading.BoundedSemaphore(MAX_PENDING_PER_CLIENT)
+        writer = threading.Thread(
+            target=self._client_writer, args=(sink, outbox, channel, slots), daemon=True
+        )
+        writer.start()
+        self.tracer.ensure_started()
+        self.backpressure.client_connected()
+        return outbox, channel, slots, writer
+
+    def _stop_writer(self, outbox, writer):
+        """Let the writer flush outstanding replies, then wait for it to exit"""
+        outbox.put(None)
+        writer.join()
+        self.backpressure.client_disconnected()
+
+    def _acquire_slot(self, slots):
+        """
+        Reserve one of the client's pending-command slots, blocking (and so
+        pausing socket reads) while the client is over quota.
+        Returns False if the server shuts down while waiting.
+        """
+        if slots.acquire(False):
+            return True
+
+        self.backpressure.record_paused_read()
+        while self.running:
+            if slots.acquire(True, 0.5):
+                return True
+        return False
+
+    def _submit_message(self, message, channel):
+        """
+        Parse one message and put it on command_queue, tagged with the
+        channel the main thread should answer on.
+
+        Returns an outbox entry (request_id, response). response is already
+        filled in when the message was answered without queueing (bad JSON,
+        an unknown action, invalid parameters, a mirrored getter, or the
+        global queue is full); otherwise it is None and the
+        writer waits for the main thread to produce it.
+        """
+        try:
+            command = json.loads(message)
+        except ValueError as e:
+            return None, {"ok": False, "error": str(e)}
+
+        request_id = next(self.request_ids)
+        queued_at = time.perf_counter()
+
+        # Unknown actions, bad parameters and mirrored getters are answered
+        # here, so they never take a main-thread slot. Valid parameters are
+        # coerced in place.
+        action = command.get("action") if isinstance(command, dict) else None
+        if isinstance(action, str):
+            entry = self.dispatch_table.get(action)
+            if entry is None:
+                answer = unknown_action_response(action, self.dispatch_table)
+            else:
+                answer = entry.check(command) or self.mirror.read(action)
+            if answer is not None:
+                self.tracer.submitted(request_id, command, queued_at)
+                return request_id, answer
+            self.mirror.write_submitted(action)
+
+        try:
+            self.command_queue.put_nowait((request_id, command, channel))
+        except queue.Full:
+            if isinstance(action, str):
+                self.mirror.write_withdrawn(action)
+            self.tracer.submitted(request_id, command, queued_at)
+            return request_id, self.backpressure.overloaded_response(self.command_queue.qsize())
+
+        self.tracer.submitted(request_id, command, queued_at)
+        self.backpressure.record_queue_size(self.command_queue.qsize())
+        return request_id, None
+
+    def _await_response(self, request_id, channel, early):
+        """
+        Wait for the main thread to answer request_id on channel.
+
+        Chunked jobs reply on a later tick, so commands pipelined after one
+        can be answered first; those newer replies are kept in early (one
+        dict per writer) until their turn. Responses to requests that
+        already timed out may still arrive later; they carry an older
+        request_id and are discarded.
+        """
+        if request_id in early:
+            return early.pop(request_id)
+        deadline = time.monotonic() + RESPONSE_TIMEOUT_SECONDS
+
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining <= 0:
+                    raise queue.Empty
+                answered_id, response = channel.get(timeout=remaining)
+            except queue.Empty:
+                return {
+                    "ok": False,
+                    "error": "Command processing timeout - main thread may be busy",
+                }
+            if answered_id == request_id:
+                return response
+            if answered_id > request_id:
+                early[answered_id] = response
+
+    def _client_writer(self, client_socket, outbox, channel, slots):
+        """
+        Send responses for one client in request order (runs in its own thread).
+
+        Keeps draining the outbox after a send failure so the reader thread
+        never blocks forever on a pending-command slot.
+        """
+        connected = True
+        client = client_label(client_socket)
+        early = {}
+
+        while True:
+            entry = outbox.get()
+            if entry is None:
+                break
+
+            request_id, response = entry
+            if response is None:
+                response = self._await_response(request_id, channel, early)
+
+            data = (json.dumps(response) + "\n").encode("utf-8")
+            self.tracer.sent(request_id, client, response, len(data))
+            if connected:
+                try:
+                    client_socket.sendall(data)
+                except Exception as e:
+                    self.log("Send error: " + str(e))
+                    connected = False
+
+            slots.release()
@@ -3,9 +3,10 @@ Project, arrangement, view/navigation, loop/locator, browser, and color utilitie
 """
 
 from .arrangement_browser import ArrangementBrowserMixin
+from .arrangement_index import ArrangementIndexMixin
 
 
-class ArrangementMixin(ArrangementBrowserMixin):
+class ArrangementMixin(ArrangementBrowserMixin, ArrangementIndexMixin):
     # ========================================================================
     # PROJECT & ARRANGEMENT
     # ========================================================================
@@ -0,0 +1,225 @@
+"""
+Arrangement timeline index: range queries over every track's arrangement
+clips and the song's locators without re-reading the whole arrangement.
+
+Each track's clips are kept sorted by start time, with the track's longest
+clip length, so the clips overlapping [time_from, time_to) are found by
+bisecting the starts between time_from - longest and time_to. Locators are
+kept sorted by time.
+
+The index is built on the first query. After that it follows Live's
+listeners, which only mark parts of it stale:
+
+  - a track's arrangement_clips listener marks that track stale
+  - the song's tracks listener marks every track stale (indices shift)
+  - the song's cue_points listener marks the locators stale
+
+Stale parts are rebuilt by the next query, on the main thread like every
+command, so a burst of edits costs one rebuild. Edits that keep a track's
+clip list (trimming or moving a clip in place) may not fire a listener;
+query_arrangement(refresh=True) rebuilds everything. Clip names, colours
+and mute states are read when a clip is returned, so they are always
+current. Anything that cannot be listened to (group tracks have no
+arrangement_clips listener) is rebuilt by every query.
+"""
+
+import bisect
+
+
+def _listen(subject, prop, callback):
+    """Add a LOM listener; returns a function that removes it, or None if unsupported"""
+    add = getattr(subject, "add_" + prop + "_listener", None)
+    if add is None:
+        return None
+    try:
+        add(callback)
+    except Exception:
+        # e.g. group tracks, which have no arrangement clips of their own
+        return None
+    return lambda: getattr(subject, "remove_" + prop + "_listener")(callback)
+
+
+class ArrangementIndex:
+    """Per-track interval lists of arrangement clips, plus locators, kept fresh by listeners"""
+
+    def __init__(self, song):
+        self.song = song
+        # Per track: (starts, [(start, end, clip_index, clip)], longest), or None when stale
+        self.tracks = None
+        self.locators = None
+        self.removers = []
+        # What the listeners cover; anything they do not is rebuilt on every query
+        self.tracks_watched = False
+        self.cues_watched = False
+        self.unwatched = []
+        self.rebuilds = 0
+
+    def _track_changed(self, track_index):
+        if self.tracks is not None and track_index < len(self.tracks):
+            self.tracks[track_index] = None
+
+    def _tracks_changed(self):
+        self.tracks = None
+
+    def _cue_points_changed(self):
+        self.locators = None
+
+    def _attach(self):
+        """Listen to the song and every track, and mark everything stale"""
+        self.close()
+        self.tracks_watched = self._listen(self.song, "tracks", self._tracks_changed)
+        self.cues_watched = self._listen(self.song, "cue_points", self._cue_points_changed)
+        tracks = self.song.tracks
+        self.unwatched = [
+            index
+            for index, track in enumerate(tracks)
+            if not self._listen(
+                track, "arrangement_clips", lambda index=index: self._track_changed(index)
+            )
+        ]
+        self.tracks = [None] * len(tracks)
+
+    def _listen(self, subject, prop, callback):
+        remover = _listen(subject, prop, callback)
+        if remover is not None:
+            self.removers.append(remover)
+        return remover is not None
+
+    def close(self):
+        """Remove every listener; the index rebuilds from scratch if used again"""
+        for remover in self.removers:
+            try:
+                remover()
+            except Exception:
+                pass
+        self.removers = []
+        self.tracks = None
+        self.locators = None
+
+    @property
+    def listening(self):
+        return self.tracks_watched and self.cues_watched and not self.unwatched
+
+    def refresh(self, force=False):
+        """Rebuild whatever is stale (everything when force); returns the tracks rebuilt"""
+        if force or self.tracks is None or not self.tracks_watched:
+            self._attach()
+        for index in self.unwatched:
+            self.tracks[index] = None
+        if not self.cues_watched:
+            self.locators = None
+
+        rebuilt = 0
+        tracks = self.song.tracks
+        for index, entry in enumerate(self.tracks):
+            if entry is None:
+                self.tracks[index] = self._build_track(tracks[index])
+                rebuilt += 1
+        if self.locators is None:
+            self.locators = self._build_locators()
+        self.rebuilds += rebuilt
+        return rebuilt
+
+    def _build_track(self, track):
+        try:
+            clips = list(track.arrangement_clips)
+        except Exception:
+            clips = []
+        entries = sorted(
+            (float(clip.start_time), float(clip.end_time), clip_index, clip)
+            for clip_index, clip in enumerate(clips)
+        )
+        longest = max((end - start for start, end, _, _ in entries), default=0.0)
+        return [entry[0] for entry in entries], entries, longest
+
+    def _build_locators(self):
+        cues = getattr(self.song, "cue_points", None) or []
+        return sorted(
+            (float(cue.time), index, str(getattr(cue, "name", "")))
+            for index, cue in enumerate(cues)
+        )
+
+    def clips(self, track_index, time_from, time_to):
+        """[(start, end, clip_index, clip)] of one track overlapping [time_from, time_to)"""
+        starts, entries, longest = self.tracks[track_index]
+        low = bisect.bisect_right(starts, time_from - longest)
+        high = bisect.bisect_left(starts, time_to)
+        return [entry for entry in entries[low:high] if entry[1] > time_from]
+
+    def locators_between(self, time_from, time_to):
+        low = bisect.bisect_left(self.locators, (time_from,))
+        high = bisect.bisect_left(self.locators, (time_to,))
+        return self.locators[low:high]
+
+
+class ArrangementIndexMixin:
+    def _arrangement(self):
+        index = getattr(self, "_arrangement_index", None)
+        if index is None:
+            index = self._arrangement_index = ArrangementIndex(self.song)
+        return index
+
+    def close_arrangement_index(self):
+        """Detach the arrangement index listeners (called when the script unloads)"""
+        index = getattr(self, "_arrangement_index", None)
+        if index is not None:
+            index.close()
+
+    def query_arrangement(self, time_from, time_to, tracks=None, refresh=False):
+        """
+        Get the arrangement clips and locators overlapping a time window
+
+        Args:
+            time_from: Window start in beats
+            time_to: Window end in beats (exclusive)
+            tracks: Track indices to search (default: all)
+            refresh: Rebuild the whole index first, e.g. after trimming clips
+        """
+        try:
+            if time_to <= time_from:
+                return {"ok": False, "error": "time_to must be greater than time_from"}
+            index = self._arrangement()
+            rebuilt = index.refresh(force=refresh)
+            count = len(index.tracks)
+            if tracks is None:
+                tracks = range(count)
+            else:
+                invalid = [
+                    t
+                    for t in tracks
+                    if isinstance(t, bool) or not isinstance(t, int) or not 0 <= t < count
+                ]
+                if invalid:
+                    return {"ok": False, "error": "Invalid track index(es): " + str(invalid)}
+
+            clips = []
+            for track_index in tracks:
+                for start, end, clip_index, clip in index.clips(track_index, time_from, time_to):
+                    clips.append(
+                        {
+                            "track_index": track_index,
+                            "clip_index": clip_index,
+                            "name": str(clip.name),
+                            "start_time": start,
+                            "end_time": end,
+                            "is_midi_clip": bool(clip.is_midi_clip),
+                            "muted": bool(clip.muted),
+                            "color": int(clip.color),
+                        }
+                    )
+            locators = [
+                {"index": cue_index, "time": time, "name": name}
+                for time, cue_index, name in index.locators_between(time_from, time_to)
+            ]
+            return {
+                "ok": True,
+                "time_from": float(time_from),
+                "time_to": float(time_to),
+                "clips": clips,
+                "clip_count": len(clips),
+                "locators": locators,
+                "rebuilt_tracks": rebuilt,
+                "listening": index.listening,
+            }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
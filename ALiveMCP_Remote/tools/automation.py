@@ -1,27 +1,46 @@
 """
 Clip automation envelope operations.
+
+Every tool targets either a device parameter (device_index/param_index) or a
+param_ref naming a parameter on the clip's track, mixer included: "volume",
+"pan", "sends/1", "track/2/volume" (see param_refs.resolve_clip_parameter).
 """
 
+from .automation_curves import AutomationCurvesMixin
+from .automation_write import AutomationWriteMixin
+
 
-class AutomationMixin:
+class AutomationMixin(AutomationCurvesMixin, AutomationWriteMixin):
     # ========================================================================
-    # CLIP AUTOMATION ENVELOPES (6 tools)
+    # CLIP AUTOMATION ENVELOPES (7 tools)
     # ========================================================================
 
-    def get_clip_automation_envelope(self, track_index, clip_index, device_index, param_index):
-        """Get automation envelope for a device parameter in a clip"""
-        try:
-            track = self.song.tracks[track_index]
-            clip_slot = track.clip_slots[clip_index]
-
-            if not clip_slot.has_clip:
-                return {"ok": False, "error": "No clip in slot"}
-
-            clip = clip_slot.clip
+    def _device_name(self, track_index, device_index):
+        """Name of the target device, or None for a param_ref target"""
+        if device_index is None:
+            return None
+        return str(self.song.tracks[track_index].devices[device_index].name)
 
-            # Get the device parameter
-            device = track.devices[device_index]
-            param = device.parameters[param_index]
+    def get_clip_automation_envelope(
+        self, track_index, clip_index, device_index=None, param_index=None, param_ref=None
+    ):
+        """
+        Get automation envelope for a device or mixer parameter in a clip
+
+        Args:
+            track_index: Track index
+            clip_index: Clip slot index
+            device_index: Device of the parameter (with param_index)
+            param_index: Parameter index on the device
+            param_ref: Instead of device/param: "volume", "pan", "sends/1", "device/0/param/3"
+        """
+        try:
+            try:
+                clip, param = self._envelope_target(
+                    track_index, clip_index, device_index, param_index, param_ref
+                )
+            except ValueError as e:
+                return {"ok": False, "error": str(e)}
 
             # Get automation envelope for this parameter
             if hasattr(clip, "automation_envelope"):
@@ -32,7 +51,7 @@ class AutomationMixin:
                         "ok": True,
                         "has_envelope": True,
                         "parameter_name": str(param.name),
-                        "device_name": str(device.name),
+                        "device_name": self._device_name(track_index, device_index),
                     }
                 else:
                     return {
@@ -46,20 +65,26 @@ class AutomationMixin:
         except Exception as e:
             return {"ok": False, "error": str(e)}
 
-    def create_automation_envelope(self, track_index, clip_index, device_index, param_index):
-        """Create automation envelope for a device parameter"""
+    def create_automation_envelope(
+        self, track_index, clip_index, device_index=None, param_index=None, param_ref=None
+    ):
+        """
+        Create automation envelope for a device or mixer parameter
+
+        Args:
+            track_index: Track index
+            clip_index: Clip slot index
+            device_index: Device of the parameter (with param_index)
+            param_index: Parameter index on the device
+            param_ref: Instead of device/param: "volume", "pan", "sends/1", "device/0/param/3"
+        """
         try:
-            track = self.song.tracks[track_index]
-            clip_slot = track.clip_slots[clip_index]
-
-            if not clip_slot.has_clip:
-                return {"ok": False, "error": "No clip in slot"}
-
-            clip = clip_slot.clip
-
-            # Get the device parameter
-            device = track.devices[device_index]
-            param = device.parameters[param_index]
+            try:
+                clip, param = self._envelope_target(
+                    track_index, clip_index, device_index, param_index, param_ref
+                )
+            except ValueError as e:
+                return {"ok": False, "error": str(e)}
 
             # Create automation envelope
             if hasattr(clip, "create_automation_envelope"):
@@ -67,7 +92,7 @@ class AutomationMixin:
                 return {
                     "ok": True,
                     "parameter_name": str(param.name),
-                    "device_name": str(device.name),
+                    "device_name": self._device_name(track_index, device_index),
                     "message": "Automation envelope created",
                 }
             else:
@@ -75,20 +100,26 @@ class AutomationMixin:
         except Exception as e:
             return {"ok": False, "error": str(e)}
 
-    def clear_automation_envelope(self, track_index, clip_index, device_index, param_index):
-        """Clear automation envelope for a device parameter"""
+    def clear_automation_envelope(
+        self, track_index, clip_index, device_index=None, param_index=None, param_ref=None
+    ):
+        """
+        Clear automation envelope for a device or mixer parameter
+
+        Args:
+            track_index: Track index
+            clip_index: Clip slot index
+            device_index: Device of the parameter (with param_index)
+            param_index: Parameter index on the device
+            param_ref: Instead of device/param: "volume", "pan", "sends/1", "device/0/param/3"
+        """
         try:
-            track = self.song.tracks[track_index]
-            clip_slot = track.clip_slots[clip_index]
-
-            if not clip_slot.has_clip:
-                return {"ok": False, "error": "No clip in slot"}
-
-            clip = clip_slot.clip
-
-            # Get the device parameter
-            device = track.devices[device_index]
-            param = device.parameters[param_index]
+            try:
+                clip, param = self._envelope_target(
+                    track_index, clip_index, device_index, param_index, param_ref
+                )
+            except ValueError as e:
+                return {"ok": False, "error": str(e)}
 
             # Clear automation envelope
             if hasattr(clip, "clear_envelope"):
@@ -104,29 +135,45 @@ class AutomationMixin:
             return {"ok": False, "error": str(e)}
 
     def insert_automation_step(
-        self, track_index, clip_index, device_index, param_index, time, value
+        self,
+        track_index,
+        clip_index,
+        time,
+        value,
+        device_index=None,
+        param_index=None,
+        param_ref=None,
+        length=0.0,
     ):
-        """Insert automation step/breakpoint at specific time"""
+        """
+        Insert automation step/breakpoint at specific time
+
+        Args:
+            track_index: Track index
+            clip_index: Clip slot index
+            time: Step start in beats
+            value: Parameter value
+            device_index: Device of the parameter (with param_index)
+            param_index: Parameter index on the device
+            param_ref: Instead of device/param: "volume", "pan", "sends/1", "device/0/param/3"
+            length: Beats to hold value for (0 inserts a single breakpoint)
+        """
         try:
-            track = self.song.tracks[track_index]
-            clip_slot = track.clip_slots[clip_index]
-
-            if not clip_slot.has_clip:
-                return {"ok": False, "error": "No clip in slot"}
-
-            clip = clip_slot.clip
-
-            # Get the device parameter and envelope
-            device = track.devices[device_index]
-            param = device.parameters[param_index]
+            try:
+                clip, param = self._envelope_target(
+                    track_index, clip_index, device_index, param_index, param_ref
+                )
+            except ValueError as e:
+                return {"ok": False, "error": str(e)}
 
             if hasattr(clip, "automation_envelope"):
                 envelope = clip.automation_envelope(param)
                 if envelope and hasattr(envelope, "insert_step"):
-                    envelope.insert_step(float(time), float(value))
+                    envelope.insert_step(float(time), float(length), float(value))
                     return {
                         "ok": True,
                         "time": float(time),
+                        "length": float(length),
                         "value": float(value),
                         "parameter_name": str(param.name),
                         "message": "Automation step inserted",
@@ -138,20 +185,27 @@ class AutomationMixin:
         except Exception as e:
             return {"ok": False, "error": str(e)}
 
-    def remove_automation_step(self, track_index, clip_index, device_index, param_index, time):
-        """Remove automation step/breakpoint at specific time"""
+    def remove_automation_step(
+        self, track_index, clip_index, time, device_index=None, param_index=None, param_ref=None
+    ):
+        """
+        Remove automation step/breakpoint at specific time
+
+        Args:
+            track_index: Track index
+            clip_index: Clip slot index
+            time: Time of the step in beats
+            device_index: Device of the parameter (with param_index)
+            param_index: Parameter index on the device
+            param_ref: Instead of device/param: "volume", "pan", "sends/1", "device/0/param/3"
+        """
         try:
-            track = self.song.tracks[track_index]
-            clip_slot = track.clip_slots[clip_index]
-
-            if not clip_slot.has_clip:
-                return {"ok": False, "error": "No clip in slot"}
-
-            clip = clip_slot.clip
-
-            # Get the device parameter and envelope
-            device = track.devices[device_index]
-            param = device.parameters[param_index]
+            try:
+                clip, param = self._envelope_target(
+                    track_index, clip_index, device_index, param_index, param_ref
+                )
+            except ValueError as e:
+                return {"ok": False, "error": str(e)}
 
             if hasattr(clip, "automation_envelope"):
                 envelope = clip.automation_envelope(param)
@@ -169,41 +223,3 @@ class AutomationMixin:
                 return {"ok": False, "error": "automation_envelope not available"}
         except Exception as e:
             return {"ok": False, "error": str(e)}
-
-    def get_automation_envelope_values(self, track_index, clip_index, device_index, param_index):
-        """Get all automation envelope values for a parameter"""
-        try:
-            track = self.song.tracks[track_index]
-            clip_slot = track.clip_slots[clip_index]
-
-            if not clip_slot.has_clip:
-                return {"ok": False, "error": "No clip in slot"}
-
-            clip = clip_slot.clip
-
-            # Get the device parameter and envelope
-            device = track.devices[device_index]
-            param = device.parameters[param_index]
-
-            if hasattr(clip, "automation_envelope"):
-                envelope = clip.automation_envelope(param)
-                if envelope:
-                    # Get envelope value at different time points
-                    # Note: Full implementation would iterate through all steps
-                    return {
-                        "ok": True,
-                        "parameter_name": str(param.name),
-                        "has_envelope": True,
-                        "message": "Use insert_step/remove_step to modify automation",
-                    }
-                else:
-                    return {
-                        "ok": True,
-                        "parameter_name": str(param.name),
-                        "has_envelope": False,
-                        "message": "No automation envelope for this parameter",
-                    }
-            else:
-                return {"ok": False, "error": "automation_envelope not available"}
-        except Exception as e:
-            return {"ok": False, "error": str(e)}
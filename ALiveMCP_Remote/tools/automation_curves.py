@@ -0,0 +1,131 @@
+"""
+Reading clip automation envelopes as time/value arrays.
+
+The LOM has no call that lists an envelope's breakpoints, only
+value_at_time(), so envelopes are read by sampling: one pass over evenly
+spaced times, limited to a point budget. "breakpoints" mode then drops every
+sample that lies on a straight line between its neighbours, which recovers
+the envelope's corners to within the sampling resolution.
+
+Targets are a device parameter (device_index/param_index) or a parameter
+reference on the clip's track (param_ref, see param_refs.py), so mixer
+volume, panning and sends can be read too.
+"""
+
+from .param_refs import resolve_clip_parameter
+
+DEFAULT_ENVELOPE_POINTS = 256
+MAX_ENVELOPE_POINTS = 4096
+
+ENVELOPE_MODES = ("samples", "breakpoints")
+
+
+def sample_times(start, end, resolution, max_points):
+    """Evenly spaced times from start to end inclusive, at most max_points of them"""
+    max_points = max(2, min(int(max_points), MAX_ENVELOPE_POINTS))
+    span = end - start
+    if span <= 0:
+        return [start]
+    if resolution is None or span / resolution + 1 > max_points:
+        resolution = span / (max_points - 1)
+    count = int(span / resolution + 1e-9) + 1
+    return [round(start + i * resolution, 9) for i in range(count)]
+
+
+def breakpoints(times, values, tolerance=1e-6):
+    """The samples where the curve changes slope, plus the first and last"""
+    if len(times) < 3:
+        return list(times), list(values)
+    keep_t, keep_v = [times[0]], [values[0]]
+    for i in range(1, len(times) - 1):
+        before = (values[i] - values[i - 1]) / (times[i] - times[i - 1])
+        after = (values[i + 1] - values[i]) / (times[i + 1] - times[i])
+        if abs(after - before) > tolerance:
+            keep_t.append(times[i])
+            keep_v.append(values[i])
+    keep_t.append(times[-1])
+    keep_v.append(values[-1])
+    return keep_t, keep_v
+
+
+class AutomationCurvesMixin:
+    def _envelope_target(self, track_index, clip_index, device_index, param_index, param_ref):
+        """(clip, parameter) for a clip envelope; raises ValueError when it cannot be resolved"""
+        track = self.song.tracks[track_index]
+        clip_slot = track.clip_slots[clip_index]
+        if not clip_slot.has_clip:
+            raise ValueError("No clip in slot")
+        if param_ref is not None:
+            return clip_slot.clip, resolve_clip_parameter(self.song, track_index, param_ref)
+        if device_index is None or param_index is None:
+            raise ValueError("Give device_index and param_index, or param_ref")
+        return clip_slot.clip, track.devices[device_index].parameters[param_index]
+
+    def get_automation_envelope_values(
+        self,
+        track_index,
+        clip_index,
+        device_index=None,
+        param_index=None,
+        param_ref=None,
+        mode="samples",
+        time_range=None,
+        resolution=None,
+        max_points=DEFAULT_ENVELOPE_POINTS,
+    ):
+        """
+        Get a clip automation envelope as time/value arrays
+
+        Args:
+            track_index: Track index
+            clip_index: Clip slot index
+            device_index: Device of the parameter (with param_index)
+            param_index: Parameter index on the device
+            param_ref: Instead of device/param: "volume", "pan", "sends/1", "device/0/param/3"
+            mode: samples (evenly spaced) or breakpoints (corners only)
+            time_range: [start, end] in beats (default: the whole clip)
+            resolution: Beats between samples (default: spread max_points over the range)
+            max_points: Most samples to take (up to 4096)
+        """
+        try:
+            if mode not in ENVELOPE_MODES:
+                return {"ok": False, "error": "mode must be one of: " + ", ".join(ENVELOPE_MODES)}
+            if resolution is not None and resolution <= 0:
+                return {"ok": False, "error": "resolution must be greater than 0"}
+            try:
+                clip, param = self._envelope_target(
+                    track_index, clip_index, device_index, param_index, param_ref
+                )
+            except ValueError as e:
+                return {"ok": False, "error": str(e)}
+
+            if not hasattr(clip, "automation_envelope"):
+                return {"ok": False, "error": "automation_envelope not available"}
+            envelope = clip.automation_envelope(param)
+            if not envelope:
+                return {
+                    "ok": True,
+                    "parameter_name": str(param.name),
+                    "has_envelope": False,
+                    "message": "No automation envelope for this parameter",
+                }
+
+            start, end = (0.0, float(clip.length)) if time_range is None else time_range
+            times = sample_times(float(start), float(end), resolution, max_points)
+            value_at_time = envelope.value_at_time
+            values = [float(value_at_time(t)) for t in times]
+            if mode == "breakpoints":
+                times, values = breakpoints(times, values)
+            return {
+                "ok": True,
+                "parameter_name": str(param.name),
+                "has_envelope": True,
+                "mode": mode,
+                "time_range": [float(start), float(end)],
+                "resolution": times[1] - times[0] if len(times) > 1 and mode == "samples" else None,
+                "times": times,
+                "values": values,
+                "point_count": len(times),
+            }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
@@ -0,0 +1,207 @@
+"""
+Writing a whole automation curve to a clip envelope in one command.
+
+The curve is given as times/values arrays or generated in the script from
+a shape spec. The target range is cleared with one insert_step() over it,
+then every point is written with insert_step(), as a chunked job when there
+are more points than fit in one tick. Everything is validated before the
+first write, so a rejected curve leaves the envelope untouched.
+"""
+
+import math
+import random
+
+from ..jobs import run_chunked
+from .automation_curves import MAX_ENVELOPE_POINTS, sample_times
+from .schemas import BEATS, NUMBER
+from .validators import compile_param
+
+# Beats between generated points when no resolution is given (a 16th note)
+DEFAULT_CURVE_RESOLUTION = 0.25
+
+_LEVELS = {"type": "array", "items": NUMBER, "minItems": 1}
+_SEED = {"type": "integer"}
+
+# Defaults that stand for the target parameter's own range
+PARAM_MIN = "min"
+PARAM_MAX = "max"
+
+# shape type: {parameter: (schema, default)}; a default of None means required
+CURVE_SHAPES = {
+    "sine": {
+        "low": (NUMBER, PARAM_MIN),
+        "high": (NUMBER, PARAM_MAX),
+        "cycles": (BEATS, 1.0),
+        "phase": (NUMBER, 0.0),
+    },
+    "ramp": {"start_value": (NUMBER, PARAM_MIN), "end_value": (NUMBER, PARAM_MAX)},
+    "steps": {"levels": (_LEVELS, None)},
+    "random": {"low": (NUMBER, PARAM_MIN), "high": (NUMBER, PARAM_MAX), "seed": (_SEED, 0)},
+}
+
+_CHECKS = {
+    shape: {name: compile_param(spec) for name, (spec, _) in params.items()}
+    for shape, params in CURVE_SHAPES.items()
+}
+
+
+def compile_shape(shape, minimum, maximum):
+    """(type, {param: value}) with defaults filled in; raises ValueError for a bad spec"""
+    if not isinstance(shape, dict) or shape.get("type") not in CURVE_SHAPES:
+        raise ValueError("shape type must be one of: " + ", ".join(CURVE_SHAPES))
+    kind, declared = shape["type"], CURVE_SHAPES[shape["type"]]
+    unknown = sorted(set(shape) - set(declared) - {"type"})
+    if unknown:
+        raise ValueError("unexpected parameter(s) for " + kind + ": " + ", ".join(unknown))
+    params = {}
+    for name, (_, default) in declared.items():
+        if name in shape:
+            try:
+                params[name] = _CHECKS[kind][name](shape[name])
+            except ValueError as e:
+                raise ValueError("shape: invalid " + name + ": " + str(e))
+        elif default is None:
+            raise ValueError(kind + " shape requires " + name)
+        else:
+            params[name] = {PARAM_MIN: minimum, PARAM_MAX: maximum}.get(default, default)
+    return kind, params
+
+
+def shape_points(kind, params, start, end, resolution):
+    """(times, values, hold) for a compiled shape over [start, end]"""
+    if kind == "steps":
+        levels = params["levels"]
+        width = (end - start) / len(levels)
+        return [start + i * width for i in range(len(levels))], [float(v) for v in levels], True
+    times = sample_times(start, end, resolution, MAX_ENVELOPE_POINTS)
+    span = (end - start) or 1.0
+    if kind == "sine":
+        low, high = params["low"], params["high"]
+        turns = [params["cycles"] * (t - start) / span + params["phase"] for t in times]
+        values = [low + (high - low) * (0.5 + 0.5 * math.sin(2 * math.pi * x)) for x in turns]
+    elif kind == "ramp":
+        first, last = params["start_value"], params["end_value"]
+        values = [first + (last - first) * (t - start) / span for t in times]
+    else:
+        rng = random.Random(params["seed"])
+        values = [rng.uniform(params["low"], params["high"]) for _ in times]
+    return times, values, False
+
+
+def check_points(times, values, start, end, minimum, maximum):
+    """Raise ValueError unless times ascend within [start, end] and values fit the parameter"""
+    if len(times) != len(values) or not times:
+        raise ValueError("times and values must be non-empty and the same length")
+    for i, t in enumerate(times):
+        if not start <= t <= end or (i and t < times[i - 1]):
+            raise ValueError("times must ascend within the time range; times[" + str(i) + "]")
+    for i, v in enumerate(values):
+        if not minimum - 1e-9 <= v <= maximum + 1e-9:
+            raise ValueError(
+                "values[" + str(i) + "] = " + str(v) + " is outside the parameter range ["
+                + str(minimum) + ", " + str(maximum) + "]"
+            )  # fmt: skip
+
+
+def curve_steps(times, values, end, hold):
+    """insert_step() arguments: (time, length, value) per point"""
+    if not hold:
+        # Zero-length steps are breakpoints; Live ramps linearly between them
+        return [(t, 0.0, v) for t, v in zip(times, values)]
+    ends = times[1:] + [end]
+    return [(t, following - t, v) for t, following, v in zip(times, ends, values)]
+
+
+class AutomationWriteMixin:
+    def write_automation_curve(
+        self,
+        track_index,
+        clip_index,
+        device_index=None,
+        param_index=None,
+        param_ref=None,
+        times=None,
+        values=None,
+        shape=None,
+        time_range=None,
+        resolution=None,
+        hold=False,
+    ):
+        """
+        Write a whole automation curve to a clip envelope, replacing the target range
+
+        Args:
+            track_index: Track index
+            clip_index: Clip slot index
+            device_index: Device of the parameter (with param_index)
+            param_index: Parameter index on the device
+            param_ref: Instead of device/param: "volume", "pan", "sends/1", "device/0/param/3"
+            times: Point times in beats, ascending (with values)
+            values: Parameter value at each time
+            shape: Instead of times/values: {"type": "sine" | "ramp" | "steps" | "random", ...}
+            time_range: [start, end] to clear and fill (default: the points' span, or the clip)
+            resolution: Beats between generated shape points (default 0.25)
+            hold: Hold each value until the next point instead of ramping to it
+        """
+        try:
+            if (shape is None) == (times is None and values is None):
+                return {"ok": False, "error": "Give either times and values, or shape"}
+            if resolution is not None and resolution <= 0:
+                return {"ok": False, "error": "resolution must be greater than 0"}
+            try:
+                # _envelope_target comes from AutomationCurvesMixin
+                clip, param = self._envelope_target(
+                    track_index, clip_index, device_index, param_index, param_ref
+                )
+                minimum, maximum = float(param.min), float(param.max)
+                if time_range is not None:
+                    start, end = float(time_range[0]), float(time_range[1])
+                elif shape is not None:
+                    start, end = 0.0, float(clip.length)
+                elif times:
+                    start, end = float(times[0]), float(times[-1])
+                else:
+                    start = end = 0.0
+                if end < start:
+                    raise ValueError("Invalid time_range: " + str([start, end]))
+                if shape is not None:
+                    kind, params = compile_shape(shape, minimum, maximum)
+                    times, values, held = shape_points(
+                        kind, params, start, end, resolution or DEFAULT_CURVE_RESOLUTION
+                    )
+                    hold = hold or held
+                times = [float(t) for t in times or ()]
+                values = [float(v) for v in values or ()]
+                check_points(times, values, start, end, minimum, maximum)
+            except (TypeError, ValueError) as e:
+                return {"ok": False, "error": str(e)}
+
+            if not hasattr(clip, "automation_envelope"):
+                return {"ok": False, "error": "automation_envelope not available"}
+            envelope = clip.automation_envelope(param)
+            created = not envelope
+            if created:
+                if not hasattr(clip, "create_automation_envelope"):
+                    return {"ok": False, "error": "create_automation_envelope not available"}
+                envelope = clip.create_automation_envelope(param)
+
+            # Clear the range to the last value, so any gap after the last point stays flat
+            envelope.insert_step(start, end - start, values[-1])
+            insert_step = envelope.insert_step
+
+            def write(step):
+                insert_step(*step)
+
+            def finish(results):
+                return {
+                    "ok": True,
+                    "parameter_name": str(param.name),
+                    "created_envelope": created,
+                    "time_range": [start, end],
+                    "hold": hold,
+                    "point_count": len(results),
+                }
+
+            return run_chunked(curve_steps(times, values, end, hold), write, finish)
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
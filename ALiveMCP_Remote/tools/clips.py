@@ -1,11 +1,22 @@
 """
-Clip operations, extras, color, annotations, fades, RAM mode, and follow actions.
+Clip operations, extras, color, annotations, fades, RAM mode, follow actions,
+the clip grid, batch launching and bulk property edits.
 """
 
+from .clips_bulk import ClipsBulkMixin
 from .clips_core import ClipsCoreMixin
 from .clips_extras import ClipsExtrasMixin
+from .clips_grid import ClipGridMixin
+from .clips_launch import ClipLaunchMixin
 from .clips_properties import ClipsPropertiesMixin
 
 
-class ClipsMixin(ClipsCoreMixin, ClipsPropertiesMixin, ClipsExtrasMixin):
+class ClipsMixin(
+    ClipsCoreMixin,
+    ClipsPropertiesMixin,
+    ClipsExtrasMixin,
+    ClipGridMixin,
+    ClipLaunchMixin,
+    ClipsBulkMixin,
+):
     pass
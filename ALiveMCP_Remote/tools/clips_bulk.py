@@ -0,0 +1,166 @@
+"""
+Bulk clip property editing: one command for many clips.
+"""
+
+import fnmatch
+
+from ..jobs import run_chunked
+from .schemas import BEATS, BOOLEAN, NUMBER, PARAM_SCHEMAS, STRING, UNIT
+from .validators import compile_param
+
+# Clip properties set_clip_properties_bulk can set, with their schemas
+BULK_PROPERTIES = {
+    "name": STRING,
+    "annotation": STRING,
+    "looping": BOOLEAN,
+    "muted": BOOLEAN,
+    "warping": BOOLEAN,
+    "ram_mode": BOOLEAN,
+    "loop_start": NUMBER,
+    "loop_end": NUMBER,
+    "start_marker": NUMBER,
+    "end_marker": NUMBER,
+    "gain": UNIT,
+    "pitch_coarse": PARAM_SCHEMAS["semitones"],
+    "pitch_fine": {"type": "integer", "minimum": -50, "maximum": 49},
+    "signature_numerator": PARAM_SCHEMAS["numerator"],
+    "signature_denominator": PARAM_SCHEMAS["denominator"],
+    "color_index": PARAM_SCHEMAS["color_index"],
+    "fade_in_time": BEATS,
+    "fade_out_time": BEATS,
+}
+
+_COERCE = {prop: compile_param(spec) for prop, spec in BULK_PROPERTIES.items()}
+
+SELECTOR_KEYS = ("slots", "track_index", "scene_index", "name")
+
+# (end, start): when a clip's region moves past its current end, the end has
+# to be set first or Live rejects the new start
+_REGION_PAIRS = (("loop_end", "loop_start"), ("end_marker", "start_marker"))
+
+
+def _coerce_properties(properties):
+    """[(name, value)] in BULK_PROPERTIES order; raises ValueError on the first bad one"""
+    unknown = sorted(set(properties) - set(BULK_PROPERTIES))
+    if unknown:
+        raise ValueError(
+            "Unknown clip propert(ies): "
+            + ", ".join(map(str, unknown))
+            + ". Valid: "
+            + ", ".join(BULK_PROPERTIES)
+        )
+    changes = []
+    for prop in BULK_PROPERTIES:
+        if prop in properties:
+            try:
+                changes.append((prop, _COERCE[prop](properties[prop])))
+            except ValueError as e:
+                raise ValueError("Invalid " + prop + ": " + str(e))
+    return changes
+
+
+def _ordered(clip, changes):
+    """changes, with region ends moved before their starts where needed"""
+    values = dict(changes)
+    for end, start in _REGION_PAIRS:
+        if end in values and start in values and values[start] >= getattr(clip, end):
+            changes = [c for c in changes if c[0] != end]
+            changes.insert([c[0] for c in changes].index(start), (end, values[end]))
+    return changes
+
+
+class ClipsBulkMixin:
+    def _select_clips(self, selector):
+        """[(track_index, clip_index, clip)] matching selector, in track then scene order"""
+        unknown = sorted(set(selector) - set(SELECTOR_KEYS))
+        if unknown:
+            raise ValueError(
+                "Unknown selector key(s): "
+                + ", ".join(map(str, unknown))
+                + ". Valid: "
+                + ", ".join(SELECTOR_KEYS)
+            )
+        if not selector:
+            raise ValueError("selector must not be empty")
+        tracks = self.song.tracks
+
+        if "slots" in selector:
+            if "track_index" in selector or "scene_index" in selector:
+                raise ValueError("slots cannot be combined with track_index or scene_index")
+            candidates = [(int(t), int(s)) for t, s in selector["slots"]]
+        else:
+            track_ids = range(len(tracks))
+            if "track_index" in selector:
+                track_ids = [int(selector["track_index"])]
+            candidates = []
+            for t in track_ids:
+                if t < 0 or t >= len(tracks):
+                    raise ValueError("Invalid track index: " + str(t))
+                scene_ids = range(len(tracks[t].clip_slots))
+                if "scene_index" in selector:
+                    scene_ids = [int(selector["scene_index"])]
+                candidates.extend((t, s) for s in scene_ids)
+
+        pattern = selector.get("name")
+        pattern = None if pattern is None else str(pattern).lower()
+        selected, seen = [], set()
+        for t, s in candidates:
+            if (t, s) in seen:
+                continue
+            seen.add((t, s))
+            if t < 0 or t >= len(tracks):
+                raise ValueError("Invalid track index: " + str(t))
+            clip_slots = tracks[t].clip_slots
+            if s < 0 or s >= len(clip_slots):
+                raise ValueError("Invalid scene index: " + str(s))
+            if not clip_slots[s].has_clip:
+                continue
+            clip = clip_slots[s].clip
+            if pattern is None or fnmatch.fnmatchcase(str(clip.name).lower(), pattern):
+                selected.append((t, s, clip))
+        return selected
+
+    def set_clip_properties_bulk(self, selector, properties):
+        """
+        Set properties on every clip matching a selector
+
+        Args:
+            selector: Clips to change, by slots, track_index, scene_index and/or name (glob)
+            properties: Values to set on each clip, e.g. {"muted": true, "gain": 0.5}
+        """
+        try:
+            if not properties:
+                return {"ok": False, "error": "properties must not be empty"}
+            try:
+                changes = _coerce_properties(properties)
+                selected = self._select_clips(selector)
+            except (TypeError, ValueError) as e:
+                return {"ok": False, "error": str(e)}
+
+            def apply(item):
+                t, s, clip = item
+                result = {"track_index": t, "clip_index": s, "ok": True}
+                try:
+                    for prop, value in _ordered(clip, changes):
+                        if not hasattr(clip, prop):
+                            raise AttributeError("Clip does not support " + prop)
+                        setattr(clip, prop, value)
+                except Exception as e:
+                    result["ok"] = False
+                    result["error"] = str(e)
+                return result
+
+            def finish(results):
+                updated = sum(1 for result in results if result["ok"])
+                return {
+                    "ok": True,
+                    "properties": dict(changes),
+                    "selected": len(results),
+                    "updated": updated,
+                    "failed": len(results) - updated,
+                    "results": results,
+                }
+
+            return run_chunked(selected, apply, finish)
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
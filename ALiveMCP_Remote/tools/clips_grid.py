@@ -0,0 +1,94 @@
+"""
+Clip grid: the state of a whole block of clip slots in one call.
+"""
+
+# Per-slot fields get_clip_grid can return, and how each is read. A cell is
+# a list of the requested fields in this order unless fields= reorders them.
+GRID_FIELDS = ("has_clip", "is_playing", "is_triggered", "is_recording", "color", "name")
+
+_READERS = {
+    "has_clip": lambda slot, clip: clip is not None,
+    "is_playing": lambda slot, clip: bool(clip.is_playing) if clip is not None else False,
+    "is_triggered": lambda slot, clip: bool((slot if clip is None else clip).is_triggered),
+    "is_recording": lambda slot, clip: bool(clip.is_recording) if clip is not None else False,
+    "color": lambda slot, clip: clip.color if clip is not None else None,
+    "name": lambda slot, clip: str(clip.name) if clip is not None else None,
+}
+
+
+def _span(pair, size, label):
+    """(start, stop) from an optional [start, stop) pair, with stop clipped to size"""
+    if pair is None:
+        return 0, size
+    if len(pair) != 2:
+        raise ValueError(label + " must be [start, stop]")
+    start, stop = int(pair[0]), min(int(pair[1]), size)
+    if start < 0 or start > stop:
+        raise ValueError("Invalid " + label + ": " + str(list(pair)))
+    return start, stop
+
+
+def grid_version(rows, spans, fields):
+    """Tag that changes whenever the grid does (stable for the life of the script)"""
+    return format(hash((spans, tuple(fields), rows)) & 0xFFFFFFFFFFFFFFFF, "016x")
+
+
+class ClipGridMixin:
+    def get_clip_grid(self, track_range=None, scene_range=None, fields=None, version=None):
+        """
+        Get the state of every clip slot in a block of tracks and scenes
+
+        Args:
+            track_range: [start, stop) track indices (default: all tracks)
+            scene_range: [start, stop) scene indices (default: all scenes)
+            fields: Slot fields per cell, in order (default: all)
+            version: Version from an earlier reply; returns not_modified if unchanged
+        """
+        try:
+            fields = list(GRID_FIELDS) if fields is None else list(fields)
+            unknown = [f for f in fields if f not in _READERS]
+            if unknown or not fields:
+                return {
+                    "ok": False,
+                    "error": "Unknown field(s): " + ", ".join(map(str, unknown))
+                    if unknown
+                    else "fields must not be empty",
+                    "valid_fields": list(GRID_FIELDS),
+                }
+
+            tracks = self.song.tracks
+            try:
+                t0, t1 = _span(track_range, len(tracks), "track_range")
+                s0, s1 = _span(scene_range, len(self.song.scenes), "scene_range")
+            except (TypeError, ValueError) as e:
+                return {"ok": False, "error": str(e)}
+
+            readers = [_READERS[f] for f in fields]
+            # Empty slots are null unless they are triggered (e.g. armed to record)
+            check_trigger = "is_triggered" in fields
+            rows = []
+            for t in range(t0, t1):
+                slots = tracks[t].clip_slots
+                row = []
+                for s in range(s0, min(s1, len(slots))):
+                    slot = slots[s]
+                    clip = slot.clip if slot.has_clip else None
+                    if clip is None and not (check_trigger and slot.is_triggered):
+                        row.append(None)
+                    else:
+                        row.append(tuple(read(slot, clip) for read in readers))
+                rows.append(tuple(row))
+
+            tag = grid_version(tuple(rows), (t0, t1, s0, s1), fields)
+            if version == tag:
+                return {"ok": True, "not_modified": True, "version": tag}
+            return {
+                "ok": True,
+                "fields": fields,
+                "track_range": [t0, t1],
+                "scene_range": [s0, s1],
+                "grid": rows,
+                "version": tag,
+            }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
@@ -0,0 +1,91 @@
+"""
+Launching and stopping a set of clip slots together.
+
+Each batch runs as one command, so every slot is fired (or stopped) within
+the same update_display() tick and lands on the same launch quantisation
+boundary, which separate launch_clip commands cannot guarantee.
+"""
+
+
+class ClipLaunchMixin:
+    def _resolve_slots(self, slots):
+        """
+        The clip slots for a list of [track_index, clip_index] pairs, in
+        order and without repeats. Raises ValueError naming the first bad pair,
+        so a batch is either fired as a whole or not at all.
+        """
+        tracks = self.song.tracks
+        resolved, seen = [], set()
+        for pair in slots:
+            if not isinstance(pair, (list, tuple)) or len(pair) != 2:
+                raise ValueError("Each slot must be [track_index, clip_index], got " + repr(pair))
+            t, s = int(pair[0]), int(pair[1])
+            if (t, s) in seen:
+                continue
+            if t < 0 or t >= len(tracks):
+                raise ValueError("Invalid track index in slot " + str([t, s]))
+            clip_slots = tracks[t].clip_slots
+            if s < 0 or s >= len(clip_slots):
+                raise ValueError("Invalid scene index in slot " + str([t, s]))
+            seen.add((t, s))
+            resolved.append(([t, s], clip_slots[s]))
+        return resolved
+
+    def launch_clips(self, slots, force_legato=False):
+        """
+        Launch the clips in several slots in the same tick
+
+        Args:
+            slots: List of [track_index, clip_index] pairs
+            force_legato: Start each clip at the play position of the clip it replaces
+        """
+        try:
+            if not slots:
+                return {"ok": False, "error": "slots must not be empty"}
+            try:
+                resolved = self._resolve_slots(slots)
+            except (TypeError, ValueError) as e:
+                return {"ok": False, "error": str(e)}
+            empty = [pair for pair, clip_slot in resolved if not clip_slot.has_clip]
+            if empty:
+                return {"ok": False, "error": "No clip in slot(s): " + str(empty)}
+
+            # Everything is checked before the first fire, so a bad pair
+            # never leaves half of the batch launched
+            for _, clip_slot in resolved:
+                if force_legato:
+                    clip_slot.fire(force_legato=True)
+                else:
+                    clip_slot.fire()
+            return {
+                "ok": True,
+                "message": "Clips launched",
+                "slots": [pair for pair, _ in resolved],
+            }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def stop_clips(self, slots):
+        """
+        Stop the clips in several slots in the same tick
+
+        Args:
+            slots: List of [track_index, clip_index] pairs
+        """
+        try:
+            if not slots:
+                return {"ok": False, "error": "slots must not be empty"}
+            try:
+                resolved = self._resolve_slots(slots)
+            except (TypeError, ValueError) as e:
+                return {"ok": False, "error": str(e)}
+
+            for _, clip_slot in resolved:
+                clip_slot.stop()
+            return {
+                "ok": True,
+                "message": "Clips stopped",
+                "slots": [pair for pair, _ in resolved],
+            }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
@@ -1,10 +1,14 @@
 """
-MIDI note operations, note selection, and CC/program change.
+MIDI note operations, note selection, note transforms, note diffs, multi-clip
+note queries and CC/program change.
 """
 
 from .midi_cc import MidiCCMixin
+from .midi_diff import MidiDiffMixin
+from .midi_multi import MidiMultiMixin
 from .midi_notes import MidiNotesMixin
+from .midi_transform import MidiTransformMixin
 
 
-class MidiMixin(MidiNotesMixin, MidiCCMixin):
+class MidiMixin(MidiNotesMixin, MidiTransformMixin, MidiDiffMixin, MidiMultiMixin, MidiCCMixin):
     pass
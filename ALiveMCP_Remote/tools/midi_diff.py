@@ -0,0 +1,160 @@
+"""
+Diff-based note editing with Live 11+ note IDs.
+
+apply_note_diff changes only the notes named in the diff: removals go to
+remove_notes_by_id, modifications to apply_note_modifications on the notes
+fetched by ID, and additions to add_new_notes. Its cost follows the size of
+the diff, not of the clip. Note IDs come from get_notes_extended.
+"""
+
+from .schemas import BEATS, BOOLEAN, INDEX, MIDI_VALUE, UNIT
+from .validators import compile_param
+
+# Note fields a diff may set: reply name -> (Live attribute, schema)
+NOTE_FIELDS = {
+    "pitch": ("pitch", MIDI_VALUE),
+    "start_time": ("start_time", BEATS),
+    "duration": ("duration", BEATS),
+    "velocity": ("velocity", {"type": "number", "minimum": 0.0, "maximum": 127.0}),
+    "muted": ("mute", BOOLEAN),
+    "probability": ("probability", UNIT),
+    "velocity_deviation": (
+        "velocity_deviation",
+        {"type": "number", "minimum": -127.0, "maximum": 127.0},
+    ),
+    "release_velocity": ("release_velocity", MIDI_VALUE),
+}
+
+_CHECKS = {name: compile_param(spec) for name, (_, spec) in NOTE_FIELDS.items()}
+_CHECK_ID = compile_param(INDEX)
+
+# Defaults for fields an added note leaves out; the others are required
+ADDED_DEFAULTS = {"velocity": 100.0, "muted": False}
+
+
+def _note_values(note, where, allowed):
+    """{field: value} for one note of the diff; raises ValueError naming where"""
+    if not isinstance(note, dict):
+        raise ValueError(where + ": expected an object, got " + repr(note))
+    unknown = sorted(set(note) - allowed)
+    if unknown:
+        raise ValueError(where + ": unexpected field(s): " + ", ".join(unknown))
+    values = {}
+    for name in NOTE_FIELDS:
+        if name in note:
+            try:
+                values[name] = _CHECKS[name](note[name])
+            except ValueError as e:
+                raise ValueError(where + ": invalid " + name + ": " + str(e))
+    if values.get("duration", 1.0) <= 0:
+        raise ValueError(where + ": invalid duration: must be greater than 0")
+    return values
+
+
+def compile_diff(added, modified, removed):
+    """(added, {note_id: values}, [note_id]) from a diff; raises ValueError on the first bad entry"""
+    fields = set(NOTE_FIELDS)
+    new_notes = []
+    for position, note in enumerate(added):
+        where = "added[" + str(position) + "]"
+        values = dict(ADDED_DEFAULTS, **_note_values(note, where, fields))
+        missing = [name for name in ("pitch", "start_time", "duration") if name not in values]
+        if missing:
+            raise ValueError(where + ": missing field(s): " + ", ".join(missing))
+        new_notes.append(values)
+
+    changes = {}
+    for position, note in enumerate(modified):
+        where = "modified[" + str(position) + "]"
+        values = _note_values(note, where, fields | {"note_id"})
+        if "note_id" not in note:
+            raise ValueError(where + ": missing field(s): note_id")
+        note_id = _CHECK_ID(note["note_id"])
+        if note_id in changes:
+            raise ValueError(where + ": note " + str(note_id) + " is modified twice")
+        changes[note_id] = values
+
+    removed_ids = []
+    for position, note_id in enumerate(removed):
+        try:
+            removed_ids.append(_CHECK_ID(note_id))
+        except ValueError as e:
+            raise ValueError("removed[" + str(position) + "]: " + str(e))
+    both = sorted(set(changes) & set(removed_ids))
+    if both:
+        raise ValueError("Note(s) both modified and removed: " + ", ".join(map(str, both)))
+    return new_notes, changes, sorted(set(removed_ids))
+
+
+class MidiDiffMixin:
+    def apply_note_diff(self, track_index, clip_index, added=None, modified=None, removed=None):
+        """
+        Add, modify and remove individual notes of a MIDI clip by note ID (Live 11+)
+
+        Args:
+            track_index: Track index
+            clip_index: Clip slot index
+            added: New notes: pitch, start_time, duration, and optionally velocity, muted
+            modified: Changed notes: note_id plus the fields to change
+            removed: IDs of notes to remove
+        """
+        try:
+            if track_index < 0 or track_index >= len(self.song.tracks):
+                return {"ok": False, "error": "Invalid track index"}
+
+            track = self.song.tracks[track_index]
+            if clip_index < 0 or clip_index >= len(track.clip_slots):
+                return {"ok": False, "error": "Invalid clip index"}
+
+            clip_slot = track.clip_slots[clip_index]
+            if not clip_slot.has_clip or not clip_slot.clip.is_midi_clip:
+                return {"ok": False, "error": "No MIDI clip in slot"}
+
+            clip = clip_slot.clip
+            if not hasattr(clip, "apply_note_modifications"):
+                return {"ok": False, "error": "Note IDs require Live 11 or later"}
+
+            try:
+                new_notes, changes, removed_ids = compile_diff(
+                    added or [], modified or [], removed or []
+                )
+            except (TypeError, ValueError) as e:
+                return {"ok": False, "error": str(e)}
+
+            # Every ID must exist before anything is changed
+            named = sorted(set(changes) | set(removed_ids))
+            notes = clip.get_notes_by_id(named) if named else ()
+            missing = sorted(set(named) - set(note.note_id for note in notes))
+            if missing:
+                return {"ok": False, "error": "Unknown note id(s): " + ", ".join(map(str, missing))}
+
+            if removed_ids:
+                clip.remove_notes_by_id(removed_ids)
+            edited = [note for note in notes if note.note_id in changes]
+            if edited:
+                for note in edited:
+                    for name, value in changes[note.note_id].items():
+                        setattr(note, NOTE_FIELDS[name][0], value)
+                clip.apply_note_modifications(edited)
+            added_ids = []
+            if new_notes:
+                import Live
+
+                spec = Live.Clip.MidiNoteSpecification
+                added_ids = clip.add_new_notes(
+                    tuple(
+                        spec(**{NOTE_FIELDS[name][0]: value for name, value in values.items()})
+                        for values in new_notes
+                    )
+                )
+
+            return {
+                "ok": True,
+                "track_index": track_index,
+                "clip_index": clip_index,
+                "added_ids": list(added_ids),
+                "modified": len(edited),
+                "removed": len(removed_ids),
+            }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
@@ -0,0 +1,93 @@
+"""
+Reading notes from many MIDI clips in one command.
+
+The clips are chosen with the same selector as set_clip_properties_bulk
+and read as a chunked job, so a selection covering a whole set is spread
+over several ticks instead of one long one.
+"""
+
+from ..jobs import run_chunked
+
+NOTE_FIELDS = ("pitch", "start_time", "duration", "velocity", "muted")
+
+# How the notes of each clip are encoded in the reply:
+#   objects  [{"pitch": 60, "start_time": 0.0, ...}, ...], as get_clip_notes
+#   columns  {"pitch": [60, ...], "start_time": [0.0, ...], ...}
+#   packed   [60, 0.0, 0.25, 100, 0, 62, ...]: NOTE_FIELDS repeated, muted as 0/1
+NOTE_FORMATS = ("objects", "columns", "packed")
+
+
+def _encode(notes, note_format):
+    if note_format == "objects":
+        return [dict(zip(NOTE_FIELDS, note)) for note in notes]
+    if note_format == "columns":
+        return dict(zip(NOTE_FIELDS, (list(column) for column in zip(*notes)))) or {
+            field: [] for field in NOTE_FIELDS
+        }
+    packed = []
+    for pitch, start, duration, velocity, muted in notes:
+        packed.extend((pitch, start, duration, velocity, 1 if muted else 0))
+    return packed
+
+
+def _window(pair, default, label):
+    """(start, span) from an optional [start, end) pair"""
+    if pair is None:
+        return default
+    if len(pair) != 2 or pair[1] < pair[0]:
+        raise ValueError("Invalid " + label + ": " + str(list(pair)))
+    return pair[0], pair[1] - pair[0]
+
+
+class MidiMultiMixin:
+    def get_notes_multi(self, selector, time_range=None, pitch_range=None, format="columns"):
+        """
+        Get the notes of every MIDI clip matching a selector
+
+        Args:
+            selector: Clips to read, by slots, track_index, scene_index and/or name (glob)
+            time_range: [start, end) in beats (default: each whole clip)
+            pitch_range: [low, high) pitches (default: all)
+            format: Note encoding: objects, columns or packed
+        """
+        try:
+            if format not in NOTE_FORMATS:
+                return {"ok": False, "error": "format must be one of: " + ", ".join(NOTE_FORMATS)}
+            try:
+                times = _window(time_range, None, "time_range")
+                from_pitch, pitch_span = _window(pitch_range, (0, 128), "pitch_range")
+                # _select_clips comes from ClipsBulkMixin
+                selected = self._select_clips(selector)
+            except (TypeError, ValueError) as e:
+                return {"ok": False, "error": str(e)}
+
+            def read(item):
+                t, s, clip = item
+                if not clip.is_midi_clip:
+                    return None
+                from_time, time_span = (0.0, clip.length) if times is None else times
+                notes = [
+                    (note[0], float(note[1]), float(note[2]), note[3], bool(note[4]))
+                    for note in clip.get_notes(from_time, from_pitch, time_span, pitch_span)
+                ]
+                return {
+                    "track_index": t,
+                    "clip_index": s,
+                    "count": len(notes),
+                    "notes": _encode(notes, format),
+                }
+
+            def finish(results):
+                clips = [result for result in results if result is not None]
+                return {
+                    "ok": True,
+                    "format": format,
+                    "fields": list(NOTE_FIELDS),
+                    "clips": clips,
+                    "clip_count": len(clips),
+                    "note_count": sum(clip["count"] for clip in clips),
+                }
+
+            return run_chunked(selected, read, finish)
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
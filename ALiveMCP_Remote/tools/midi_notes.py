@@ -3,6 +3,29 @@ MIDI note operations: add, get, remove, select, and extended note queries.
 """
 
 
+def note_dict(note):
+    """
+    Reply form of one note: a (pitch, start, duration, velocity, muted) tuple,
+    or a Live 11+ note object, which also carries its note_id
+    """
+    if hasattr(note, "note_id"):
+        return {
+            "note_id": note.note_id,
+            "pitch": note.pitch,
+            "start_time": float(note.start_time),
+            "duration": float(note.duration),
+            "velocity": note.velocity,
+            "muted": bool(note.mute),
+        }
+    return {
+        "pitch": note[0],
+        "start_time": float(note[1]),
+        "duration": float(note[2]),
+        "velocity": note[3],
+        "muted": note[4],
+    }
+
+
 class MidiNotesMixin:
     # ========================================================================
     # MIDI NOTE OPERATIONS
@@ -220,7 +243,7 @@ class MidiNotesMixin:
     def get_notes_extended(
         self, track_index, clip_index, start_time, time_span, start_pitch, pitch_span
     ):
-        """Get notes with extended filtering options"""
+        """Get notes with extended filtering options (with note IDs on Live 11+)"""
         try:
             if track_index < 0 or track_index >= len(self.song.tracks):
                 return {"ok": False, "error": "Invalid track index"}
@@ -241,18 +264,7 @@ class MidiNotesMixin:
                 pitch_span=int(pitch_span),
             )
 
-            notes = []
-            for note_tuple in notes_data:
-                notes.append(
-                    {
-                        "pitch": note_tuple[0],
-                        "start_time": float(note_tuple[1]),
-                        "duration": float(note_tuple[2]),
-                        "velocity": note_tuple[3],
-                        "muted": note_tuple[4],
-                    }
-                )
-
+            notes = [note_dict(note) for note in notes_data]
             return {"ok": True, "notes": notes, "count": len(notes)}
         except Exception as e:
             return {"ok": False, "error": str(e)}
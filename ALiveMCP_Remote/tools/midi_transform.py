@@ -0,0 +1,200 @@
+"""
+Server-side MIDI note transforms: a pipeline of operations applied to a
+clip's notes inside the script and committed in one write. On Live 11+ that
+write is apply_note_modifications, so note IDs, probability, velocity
+deviation and release velocity survive; older Live replaces the notes with
+remove_notes and set_notes.
+
+Notes are held as parallel columns (pitch, start, duration, velocity,
+muted) and each operation rewrites whole columns, so a pipeline costs one
+LOM read and one write however many notes or steps it has.
+"""
+
+import bisect
+import math
+import random
+
+from .schemas import BEATS, NUMBER, UNIT
+from .validators import compile_param
+
+_SEMITONES = {"type": "integer", "minimum": -127, "maximum": 127}
+_VELOCITY_OFFSET = {"type": "integer", "minimum": -127, "maximum": 127}
+_SEED = {"type": "integer"}
+
+# op name: {parameter: (schema, default)}; a default of None means required
+NOTE_OPERATIONS = {
+    "transpose": {"semitones": (_SEMITONES, None)},
+    "shift": {"beats": (NUMBER, None)},
+    "quantize": {"grid": (BEATS, None), "strength": (UNIT, 1.0)},
+    "velocity": {"scale": (BEATS, 1.0), "offset": (_VELOCITY_OFFSET, 0), "curve": (BEATS, 1.0)},
+    "legato": {},
+    "humanize": {"timing": (BEATS, 0.0), "velocity": (BEATS, 0.0), "seed": (_SEED, 0)},
+}
+
+_CHECKS = {
+    op: {name: compile_param(spec) for name, (spec, _) in params.items()}
+    for op, params in NOTE_OPERATIONS.items()
+}
+
+
+def compile_operations(operations):
+    """[(op, {param: value})] with defaults filled in; raises ValueError on the first bad step"""
+    steps = []
+    for position, step in enumerate(operations):
+        where = "operations[" + str(position) + "]"
+        if not isinstance(step, dict) or step.get("op") not in NOTE_OPERATIONS:
+            raise ValueError(where + ": op must be one of: " + ", ".join(NOTE_OPERATIONS))
+        op, declared = step["op"], NOTE_OPERATIONS[step["op"]]
+        unknown = sorted(set(step) - set(declared) - {"op"})
+        if unknown:
+            raise ValueError(
+                where + ": unexpected parameter(s) for " + op + ": " + ", ".join(unknown)
+            )
+        params = {}
+        for name, (_, default) in declared.items():
+            if name not in step:
+                if default is None:
+                    raise ValueError(where + ": " + op + " requires " + name)
+                params[name] = default
+                continue
+            try:
+                params[name] = _CHECKS[op][name](step[name])
+            except ValueError as e:
+                raise ValueError(where + ": invalid " + name + ": " + str(e))
+        if op == "quantize" and params["grid"] <= 0:
+            raise ValueError(where + ": invalid grid: must be greater than 0")
+        steps.append((op, params))
+    return steps
+
+
+def _clamp_velocity(value):
+    return max(1, min(127, int(round(value))))
+
+
+def _transpose(notes, semitones):
+    pitches = [p + semitones for p in notes["pitch"]]
+    outside = sum(1 for p in pitches if p < 0 or p > 127)
+    if outside:
+        raise ValueError("transpose moves " + str(outside) + " note(s) outside 0-127")
+    notes["pitch"] = pitches
+
+
+def _shift(notes, beats):
+    notes["start"] = [max(0.0, t + beats) for t in notes["start"]]
+
+
+def _quantize(notes, grid, strength):
+    notes["start"] = [
+        t + (math.floor(t / grid + 0.5) * grid - t) * strength for t in notes["start"]
+    ]
+
+
+def _velocity(notes, scale, offset, curve):
+    notes["velocity"] = [
+        _clamp_velocity(127.0 * (v / 127.0) ** curve * scale + offset) for v in notes["velocity"]
+    ]
+
+
+def _legato(notes):
+    # Each note lasts until the next later start; the last ones keep their length
+    starts = sorted(set(notes["start"]))
+    durations = []
+    for t, d in zip(notes["start"], notes["duration"]):
+        following = bisect.bisect_right(starts, t)
+        durations.append(starts[following] - t if following < len(starts) else d)
+    notes["duration"] = durations
+
+
+def _humanize(notes, timing, velocity, seed):
+    rng = random.Random(seed)
+    notes["start"] = [max(0.0, t + rng.uniform(-timing, timing)) for t in notes["start"]]
+    notes["velocity"] = [
+        _clamp_velocity(v + rng.uniform(-velocity, velocity)) for v in notes["velocity"]
+    ]
+
+
+_APPLY = {
+    "transpose": _transpose,
+    "shift": _shift,
+    "quantize": _quantize,
+    "velocity": _velocity,
+    "legato": _legato,
+    "humanize": _humanize,
+}
+
+
+def apply_operations(note_tuples, steps):
+    """New (pitch, start, duration, velocity, muted) tuples after running steps in order"""
+    columns = list(zip(*note_tuples)) or [()] * 5
+    notes = dict(zip(("pitch", "start", "duration", "velocity", "muted"), map(list, columns)))
+    for op, params in steps:
+        _APPLY[op](notes, **params)
+    return tuple(
+        zip(notes["pitch"], notes["start"], notes["duration"], notes["velocity"], notes["muted"])
+    )
+
+
+class MidiTransformMixin:
+    def transform_notes(self, track_index, clip_index, operations):
+        """
+        Apply a pipeline of note operations to every note in a MIDI clip
+
+        Args:
+            track_index: Track index
+            clip_index: Clip slot index
+            operations: Steps in order, e.g. [{"op": "transpose", "semitones": 12}]
+        """
+        try:
+            if track_index < 0 or track_index >= len(self.song.tracks):
+                return {"ok": False, "error": "Invalid track index"}
+
+            track = self.song.tracks[track_index]
+            if clip_index < 0 or clip_index >= len(track.clip_slots):
+                return {"ok": False, "error": "Invalid clip index"}
+
+            clip_slot = track.clip_slots[clip_index]
+            if not clip_slot.has_clip or not clip_slot.clip.is_midi_clip:
+                return {"ok": False, "error": "No MIDI clip in slot"}
+
+            try:
+                steps = compile_operations(operations)
+            except (TypeError, ValueError) as e:
+                return {"ok": False, "error": str(e)}
+
+            clip = clip_slot.clip
+            length = clip.length
+            by_id = hasattr(clip, "apply_note_modifications")
+            if by_id:
+                live_notes = clip.get_notes_extended(
+                    from_time=0.0, from_pitch=0, time_span=float(length), pitch_span=128
+                )
+                before = tuple(
+                    (n.pitch, n.start_time, n.duration, n.velocity, n.mute) for n in live_notes
+                )
+            else:
+                before = tuple(tuple(note) for note in clip.get_notes(0, 0, length, 128))
+            try:
+                after = apply_operations(before, steps)
+            except ValueError as e:
+                return {"ok": False, "error": str(e)}
+
+            changed = sum(1 for old, new in zip(before, after) if old != new)
+            if changed and by_id:
+                # Edit the notes in place so the fields the pipeline ignores are kept
+                for note, (pitch, start, duration, velocity, muted) in zip(live_notes, after):
+                    note.pitch, note.start_time, note.duration = pitch, start, duration
+                    note.velocity, note.mute = velocity, muted
+                clip.apply_note_modifications(live_notes)
+            elif changed:
+                clip.remove_notes(0, 0, length, 128)
+                clip.set_notes(after)
+            return {
+                "ok": True,
+                "track_index": track_index,
+                "clip_index": clip_index,
+                "operations": [op for op, _ in steps],
+                "note_count": len(after),
+                "changed": changed,
+            }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
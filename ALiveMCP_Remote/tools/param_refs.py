@@ -0,0 +1,117 @@
+"""
+Parameter references: slash-separated paths naming any automatable parameter.
+
+    track/<i>/volume                  mixer volume of song.tracks[i]
+    track/<i>/pan                     mixer panning ("panning" also accepted)
+    track/<i>/send/<n>                send n ("sends/<n>" also accepted)
+    track/<i>/device/<d>/param/<p>    devices[d].parameters[p]
+    return/<i>/...                    same paths on song.return_tracks[i]
+    master/...                        same paths on song.master_track
+    crossfader                        master crossfader ("master/crossfader")
+
+A leading slash is ignored, so OSC addresses can be used directly.
+Paths relative to one track ("volume", "sends/1", "device/0/param/3") are
+resolved with resolve_track_parameter(), and the parameters a clip envelope
+can automate with resolve_clip_parameter().
+"""
+
+
+def _index(value, length, what):
+    try:
+        index = int(value)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid " + what + " index: " + str(value)) from None
+    if index < 0 or index >= length:
+        raise ValueError("Invalid " + what + " index: " + str(value))
+    return index
+
+
+def split_ref(ref):
+    """Split a reference into its path segments, ignoring leading/trailing slashes"""
+    return [part for part in str(ref).strip("/").split("/") if part]
+
+
+def resolve_track_parameter(track, parts):
+    """
+    Resolve a track-relative path (list of segments or string) to a
+    DeviceParameter on track. Raises ValueError for unknown paths.
+    """
+    if isinstance(parts, str):
+        parts = split_ref(parts)
+    if not parts:
+        raise ValueError("Empty parameter reference")
+
+    head = parts[0]
+    mixer = track.mixer_device
+
+    if len(parts) == 1:
+        if head == "volume":
+            return mixer.volume
+        if head in ("pan", "panning"):
+            return mixer.panning
+        if head == "crossfader":
+            return mixer.crossfader
+    elif head in ("send", "sends") and len(parts) == 2:
+        sends = mixer.sends
+        return sends[_index(parts[1], len(sends), "send")]
+    elif head == "device" and len(parts) == 4 and parts[2] in ("param", "parameter"):
+        devices = track.devices
+        device = devices[_index(parts[1], len(devices), "device")]
+        params = device.parameters
+        return params[_index(parts[3], len(params), "parameter")]
+
+    raise ValueError("Unknown parameter reference: " + "/".join(parts))
+
+
+def resolve_parameter(song, ref):
+    """Resolve a song-level reference (see module docstring) to a DeviceParameter"""
+    parts = split_ref(ref)
+    if parts == ["crossfader"]:
+        return song.master_track.mixer_device.crossfader
+
+    if len(parts) >= 2 and parts[0] == "master":
+        return resolve_track_parameter(song.master_track, parts[1:])
+    if len(parts) >= 3 and parts[0] == "track":
+        tracks = song.tracks
+        return resolve_track_parameter(tracks[_index(parts[1], len(tracks), "track")], parts[2:])
+    if len(parts) >= 3 and parts[0] == "return":
+        returns = song.return_tracks
+        track = returns[_index(parts[1], len(returns), "return track")]
+        return resolve_track_parameter(track, parts[2:])
+
+    raise ValueError("Unknown parameter reference: " + str(ref))
+
+
+def resolve_clip_parameter(song, track_index, ref):
+    """
+    Resolve a reference for an envelope of a clip on song.tracks[track_index]:
+    a track-relative path, or a song-level one naming that same track. Clip
+    envelopes can only automate their own track, so other tracks, returns,
+    the master and the crossfader raise ValueError.
+    """
+    parts = split_ref(ref)
+    if parts and parts[0] in ("master", "return", "crossfader"):
+        raise ValueError(
+            "Clip envelopes can only automate their own track; "
+            + str(ref)
+            + " is on the master or a return track, which have no clips"
+        )
+    if parts and parts[0] == "track":
+        if len(parts) < 3 or parts[1] != str(track_index):
+            raise ValueError(
+                "Clip envelopes can only automate their own track; the clip is on track/"
+                + str(track_index)
+                + ", not "
+                + str(ref)
+            )
+        parts = parts[2:]
+    return resolve_track_parameter(song.tracks[track_index], parts)
+
+
+def set_parameter_clamped(param, value):
+    """Set param.value, clamped to the parameter's min/max range; returns the new value"""
+    value = float(value)
+    if hasattr(param, "min") and hasattr(param, "max"):
+        value = max(float(param.min), min(float(param.max), value))
+    param.value = value
+    return value
@@ -5,6 +5,10 @@ Registry of all available tool names exposed by LiveAPITools.
 AVAILABLE_TOOLS = [
     "ping",
     "health_check",
+    "get_tool_schemas",
+    "profile_start",
+    "profile_stop",
+    "get_recent_traces",
     # Session control (14 tools)
     "start_playback",
     "stop_playback",
@@ -65,6 +69,11 @@ AVAILABLE_TOOLS = [
     "stop_all_clips",
     "get_clip_info",
     "set_clip_name",
+    # Clip grid and batch operations (4 tools)
+    "get_clip_grid",
+    "launch_clips",
+    "stop_clips",
+    "set_clip_properties_bulk",
     # Clip extras (10 tools)
     "set_clip_looping",
     "set_clip_loop_start",
@@ -80,11 +89,14 @@ AVAILABLE_TOOLS = [
     "add_notes",
     "get_clip_notes",
     "remove_notes",
-    # MIDI extras (4 tools)
+    # MIDI extras (7 tools)
     "select_all_notes",
     "deselect_all_notes",
     "replace_selected_notes",
     "get_notes_extended",
+    "transform_notes",
+    "apply_note_diff",
+    "get_notes_multi",
     # Devices (3 tools)
     "add_device",
     "get_track_devices",
@@ -193,13 +205,14 @@ AVAILABLE_TOOLS = [
     "get_chain_devices",
     "set_chain_mute",
     "set_chain_solo",
-    # Clip Automation Envelopes (6 tools)
+    # Clip Automation Envelopes (7 tools)
     "get_clip_automation_envelope",
     "create_automation_envelope",
     "clear_automation_envelope",
     "insert_automation_step",
     "remove_automation_step",
     "get_automation_envelope_values",
+    "write_automation_curve",
     # Track Freeze/Flatten (3 tools)
     "freeze_track",
     "unfreeze_track",
@@ -221,8 +234,9 @@ AVAILABLE_TOOLS = [
     # Track Delay Compensation (2 tools)
     "get_track_delay",
     "set_track_delay",
-    # Arrangement View Clips (3 tools)
+    # Arrangement View Clips (4 tools)
     "get_arrangement_clips",
+    "query_arrangement",
     "duplicate_to_arrangement",
     "consolidate_clip",
     # Plugin Window Control (2 tools)
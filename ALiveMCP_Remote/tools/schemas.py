@@ -0,0 +1,155 @@
+"""
+Parameter schemas for every registered tool.
+
+Types and ranges are declared once per parameter name in PARAM_SCHEMAS
+(track_index means the same thing for every tool that takes it), with
+per-tool refinements in TOOL_PARAM_SCHEMAS. tool_schema() combines them
+with the handler's signature - which parameters exist, which are required
+and their defaults - into a JSON Schema object. validators.py compiles that
+into the function the socket thread runs before a command is queued.
+
+tool_description() renders the same schema in the shape MCP uses to
+describe tools (name, description, inputSchema).
+"""
+
+import inspect
+
+INDEX = {"type": "integer", "minimum": 0}
+MIDI_VALUE = {"type": "integer", "minimum": 0, "maximum": 127}
+UNIT = {"type": "number", "minimum": 0.0, "maximum": 1.0}
+NUMBER = {"type": "number"}
+# Also used for other non-negative quantities (quantize_to, interval_ms)
+BEATS = {"type": "number", "minimum": 0.0}
+BOOLEAN = {"type": "boolean"}
+STRING = {"type": "string"}
+# Pair of indices: [start, stop) for ranges, [track_index, clip_index] for slots
+PAIR = {"type": "array", "items": {"type": "integer", "minimum": 0}, "minItems": 2, "maxItems": 2}
+
+# By parameter name, for every tool. Names ending in _index that are not
+# listed here are INDEX.
+PARAM_SCHEMAS = {
+    "color_index": {"type": "integer", "minimum": 0, "maximum": 69},
+    "bpm": {"type": "number", "minimum": 20, "maximum": 999},
+    "numerator": {"type": "integer", "minimum": 1, "maximum": 99},
+    "denominator": {"type": "integer", "enum": [1, 2, 4, 8, 16]},
+    "pan": {"type": "number", "minimum": -1.0, "maximum": 1.0},
+    "pitch_span": {"type": "integer", "minimum": 1, "maximum": 128},
+    "channel": {"type": "integer", "minimum": 0, "maximum": 15},
+    "semitones": {"type": "integer", "minimum": -48, "maximum": 48},
+    "action_A": {"type": "integer", "minimum": 0, "maximum": 8},
+    "action_B": {"type": "integer", "minimum": 0, "maximum": 8},
+    "assignment": {"type": "integer", "minimum": 0, "maximum": 2},
+    "state": {"type": "integer", "minimum": 0, "maximum": 2},
+    **dict.fromkeys(
+        ("notes", "operations", "added", "modified"), {"type": "array", "items": {"type": "object"}}),
+    **dict.fromkeys(("removed", "tracks"), {"type": "array", "items": INDEX}),
+    "names": {"type": "array", "items": {"type": "string"}},
+    "fields": {"type": "array", "items": {"type": "string"}},
+    "version": STRING,
+    "max_points": {"type": "integer", "minimum": 2, "maximum": 4096},
+    "times": {"type": "array", "items": BEATS},
+    "values": {"type": "array", "items": NUMBER},
+    **dict.fromkeys(("track_range", "scene_range", "pitch_range"), PAIR),
+    "time_range": {"type": "array", "items": BEATS, "minItems": 2, "maxItems": 2},
+    "slots": {"type": "array", "items": PAIR},
+    **dict.fromkeys(("selector", "properties", "shape"), {"type": "object"}),
+    **dict.fromkeys(("volume", "chance_A"), UNIT),
+    **dict.fromkeys(("routing_channel", "warp_mode", "limit"), INDEX),
+    **dict.fromkeys(
+        ("cc_number", "cc_value", "program_number", "pitch", "pitch_from", "pitch_to",
+         "start_pitch"), MIDI_VALUE),
+    **dict.fromkeys(
+        ("value", "gain", "amount", "amount_in_beats", "delay_samples", "cents", "loop_start",
+         "loop_end", "start_marker", "end_marker"), NUMBER),
+    **dict.fromkeys(
+        ("length", "position", "start_time", "end_time", "time", "time_in_beats",
+         "time_in_bars", "time_from", "time_to", "time_span", "fade_time", "quantize_to",
+         "interval_ms", "resolution"), BEATS),
+    **dict.fromkeys(
+        ("enabled", "folded", "looping", "muted", "mute", "solo", "armed", "warping",
+         "ram_mode", "slow_only", "force_legato", "hold", "refresh"), BOOLEAN),
+    **dict.fromkeys(
+        ("name", "device_name", "param_name", "annotation_text", "message", "title",
+         "category", "plugin_type", "routing_type_name", "sub_routing", "action_filter",
+         "param_ref"),
+        STRING),
+}  # fmt: skip
+
+# Type of an undeclared parameter, from its default value
+DEFAULT_TYPES = {bool: "boolean", int: "integer", float: "number", str: "string"}
+
+# Where one tool uses a name differently from the rest
+TOOL_PARAM_SCHEMAS = {
+    "profile_start": {"mode": {"type": "string", "enum": ["cprofile", "sampling"]}},
+    "set_record_mode": {"mode": INDEX},
+    "set_sample_playback_mode": {"mode": INDEX},
+    "get_notes_multi": {"format": {"type": "string", "enum": ["objects", "columns", "packed"]}},
+    "get_automation_envelope_values": {
+        "mode": {"type": "string", "enum": ["samples", "breakpoints"]}
+    },
+}
+
+
+def param_schema(tool, name):
+    """The declared schema for one parameter of tool ({} when undeclared)"""
+    overrides = TOOL_PARAM_SCHEMAS.get(tool)
+    if overrides and name in overrides:
+        return overrides[name]
+    if name in PARAM_SCHEMAS:
+        return PARAM_SCHEMAS[name]
+    if name.endswith("_index"):
+        return INDEX
+    return {}
+
+
+def arg_descriptions(doc):
+    """{name: text} from the 'Args:' section of a docstring"""
+    descriptions, in_args = {}, False
+    for line in (doc or "").splitlines():
+        stripped = line.strip()
+        if stripped == "Args:":
+            in_args = True
+        elif in_args and ":" in stripped and not stripped.endswith(":"):
+            name, text = stripped.split(":", 1)
+            if name.isidentifier():
+                descriptions[name] = text.strip()
+        elif in_args and stripped:
+            in_args = False
+    return descriptions
+
+
+def tool_schema(tool, handler):
+    """JSON Schema (an 'object') for the keyword arguments handler accepts"""
+    properties, required, open_ended = {}, [], False
+    descriptions = arg_descriptions(inspect.getdoc(handler))
+    for param in inspect.signature(handler).parameters.values():
+        if param.kind in (param.VAR_KEYWORD, param.VAR_POSITIONAL):
+            open_ended = True
+            continue
+        spec = dict(param_schema(tool, param.name))
+        if param.name in descriptions:
+            spec["description"] = descriptions[param.name]
+        if param.default is param.empty:
+            required.append(param.name)
+        else:
+            spec["default"] = param.default
+            if "type" not in spec and type(param.default) in DEFAULT_TYPES:
+                spec["type"] = DEFAULT_TYPES[type(param.default)]
+            if param.default is None and "type" in spec:
+                spec["type"] = [spec["type"], "null"]
+        properties[param.name] = spec
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": required,
+        "additionalProperties": open_ended,
+    }
+
+
+def tool_description(tool, handler, schema, aliases=None):
+    """MCP-style description of one tool"""
+    summary = (inspect.getdoc(handler) or tool).splitlines()[0].strip()
+    description = {"name": tool, "description": summary, "inputSchema": schema}
+    if aliases:
+        description["aliases"] = dict(aliases)
+    return description
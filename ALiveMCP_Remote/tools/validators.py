@@ -0,0 +1,174 @@
+"""
+Validators compiled from the JSON Schemas in schemas.py.
+
+compile_validator() turns a tool's schema into a function the socket thread
+runs before a command is queued, so a malformed request is answered without
+taking a main-thread slot. compile_param() does the same for one value and
+is reused by tools that check nested structures (note dicts, curve points).
+Every keyword the schemas use is enforced: type, minimum/maximum, enum and,
+for arrays, items/minItems/maxItems.
+"""
+
+import math
+
+
+def _describe(value):
+    text = repr(value)
+    return text if len(text) <= 40 else text[:37] + "..."
+
+
+def _to_integer(value):
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            pass
+    raise ValueError("expected an integer, got " + _describe(value))
+
+
+def _to_number(value):
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        number = float(value)
+    elif isinstance(value, str):
+        try:
+            number = float(value.strip())
+        except ValueError:
+            raise ValueError("expected a number, got " + _describe(value))
+    else:
+        raise ValueError("expected a number, got " + _describe(value))
+    if not math.isfinite(number):
+        raise ValueError("expected a finite number, got " + _describe(value))
+    return number
+
+
+def _to_boolean(value):
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    raise ValueError("expected true or false, got " + _describe(value))
+
+
+def _expect(kind, name):
+    def check(value):
+        if isinstance(value, kind):
+            return value
+        raise ValueError("expected " + name + ", got " + _describe(value))
+
+    return check
+
+
+COERCIONS = {
+    "integer": _to_integer,
+    "number": _to_number,
+    "boolean": _to_boolean,
+    "string": _expect(str, "a string"),
+    "array": _expect(list, "a list"),
+    "object": _expect(dict, "an object"),
+}
+
+
+def _range_error(low, high):
+    if low is not None and high is not None:
+        return "must be between " + str(low) + " and " + str(high)
+    if low is not None:
+        return "must be at least " + str(low)
+    return "must be at most " + str(high)
+
+
+def _length_error(low, high):
+    if low == high:
+        return "must have exactly " + str(low) + " items"
+    if low is not None and high is not None:
+        return "must have between " + str(low) + " and " + str(high) + " items"
+    if low is not None:
+        return "must have at least " + str(low) + " items"
+    return "must have at most " + str(high) + " items"
+
+
+def compile_param(spec):
+    """A function that coerces one value to spec, raising ValueError; None if spec is empty"""
+    kind = spec.get("type")
+    if isinstance(kind, list):
+        nullable, kind = "null" in kind, kind[0]
+    else:
+        nullable = False
+    coerce = COERCIONS.get(kind)
+    low, high, choices = spec.get("minimum"), spec.get("maximum"), spec.get("enum")
+    if coerce is None and choices is None:
+        return None
+    out_of_range = _range_error(low, high) if low is not None or high is not None else ""
+    # Arrays: item schema and length bounds
+    check_item = compile_param(spec["items"]) if "items" in spec else None
+    fewest, most = spec.get("minItems"), spec.get("maxItems")
+    bad_length = _length_error(fewest, most) if fewest is not None or most is not None else ""
+
+    def check_items(value):
+        if (fewest is not None and len(value) < fewest) or (most is not None and len(value) > most):
+            raise ValueError(bad_length + ", got " + str(len(value)))
+        if check_item is None:
+            return value
+        items = []
+        for i, item in enumerate(value):
+            try:
+                items.append(check_item(item))
+            except ValueError as e:
+                raise ValueError("item " + str(i) + ": " + str(e))
+        return items
+
+    def check(value):
+        if value is None and nullable:
+            return None
+        if coerce is not None:
+            value = coerce(value)
+        if kind == "array":
+            return check_items(value)
+        if (low is not None and value < low) or (high is not None and value > high):
+            raise ValueError(out_of_range)
+        if choices is not None and value not in choices:
+            raise ValueError("must be one of: " + ", ".join(str(c) for c in choices))
+        return value
+
+    return check
+
+
+def compile_validator(tool, schema, aliases=None):
+    """
+    validate(params) for one tool: applies aliases and coerces values in
+    params in place, ignoring its 'action' key. Returns None when params are
+    acceptable, otherwise an error message naming the offending parameter.
+    """
+    aliases = tuple((aliases or {}).items())
+    properties = schema["properties"]
+    accepted = frozenset(properties) | {"action"}
+    required = tuple(schema["required"])
+    open_ended = schema["additionalProperties"]
+    checks = tuple(
+        (name, check)
+        for name, check in ((n, compile_param(spec)) for n, spec in properties.items())
+        if check is not None
+    )
+
+    def validate(params):
+        for legacy, canonical in aliases:
+            if legacy in params:
+                params[canonical] = params.pop(legacy)
+        if not open_ended and not params.keys() <= accepted:
+            unexpected = sorted(params.keys() - accepted)
+            return "Unexpected parameter(s) for " + tool + ": " + ", ".join(unexpected)
+        missing = [name for name in required if name not in params]
+        if missing:
+            return "Missing required parameter(s) for " + tool + ": " + ", ".join(missing)
+        for name, check in checks:
+            if name in params:
+                try:
+                    params[name] = check(params[name])
+                except ValueError as e:
+                    return "Invalid " + name + " for " + tool + ": " + str(e)
+        return None
+
+    return validate
@@ -0,0 +1,250 @@
+"""
+Structured per-command trace records and the slow-command log.
+
+A trace is assembled from three events, each posted with a single
+SimpleQueue.put by the thread that sees it:
+
+  submitted   socket thread: action, parameters, time the command was queued
+  executed    main thread:   when update_display() started and finished it
+  sent        writer thread: client, response, encoded size
+
+A background tracer thread, started when the first client connects, joins
+them by request ID. It keeps the last
+TRACE_BUFFER_SIZE records in a ring buffer for get_recent_traces, and
+appends commands whose main-thread execution took SLOW_COMMAND_THRESHOLD_MS
+or longer to SLOW_COMMAND_LOG_PATH as JSON lines. The main thread never
+formats, sizes or writes anything.
+"""
+
+import collections
+import json
+import os
+import threading
+import time
+
+try:
+    import Queue as queue  # Python 2
+except ImportError:
+    import queue  # Python 3
+
+from .constants import (
+    SLOW_COMMAND_LOG_MAX_BYTES,
+    SLOW_COMMAND_LOG_PATH,
+    SLOW_COMMAND_THRESHOLD_MS,
+    TRACE_BUFFER_SIZE,
+)
+
+TRACING_ACTIONS = ("get_recent_traces",)
+
+_SUBMITTED, _EXECUTED, _SENT, _FLUSH = range(4)
+
+# Partial records waiting for their remaining events. Answers that arrive
+# after a timeout leave one behind, so the oldest are dropped past this.
+MAX_PENDING_TRACES = 4096
+
+TIMEOUT_ERROR_PREFIX = "Command processing timeout"
+
+
+def summarize_params(command, max_chars=40):
+    """Parameters of a command, with lists, dicts and long strings abbreviated"""
+    summary = {}
+    for key, value in command.items():
+        if key == "action":
+            continue
+        if isinstance(value, (list, tuple)):
+            value = "[" + str(len(value)) + " items]"
+        elif isinstance(value, dict):
+            value = "{" + str(len(value)) + " keys}"
+        elif isinstance(value, str) and len(value) > max_chars:
+            value = value[: max_chars - 3] + "..."
+        summary[key] = value
+    return summary
+
+
+def outcome_of(response):
+    """'ok', 'overloaded', 'timeout' or 'error'"""
+    if response.get("ok"):
+        return "ok"
+    error = str(response.get("error", ""))
+    if error == "overloaded":
+        return "overloaded"
+    if error.startswith(TIMEOUT_ERROR_PREFIX):
+        return "timeout"
+    return "error"
+
+
+def client_label(sink):
+    """'host:port' for TCP clients, otherwise the transport name"""
+    label = getattr(sink, "trace_label", None)
+    if isinstance(label, str):
+        return label
+    try:
+        peer = sink.getpeername()
+    except Exception:
+        return type(sink).__name__
+    if isinstance(peer, tuple):
+        return str(peer[0]) + ":" + str(peer[1])
+    return "unix"
+
+
+def _ms(start, end):
+    if start is None or end is None:
+        return None
+    return round((end - start) * 1000.0, 3)
+
+
+class Tracer:
+    """Collects trace events from every thread and turns them into records"""
+
+    def __init__(
+        self,
+        buffer_size=TRACE_BUFFER_SIZE,
+        slow_threshold_ms=SLOW_COMMAND_THRESHOLD_MS,
+        slow_log_path=SLOW_COMMAND_LOG_PATH,
+    ):
+        self.events = queue.SimpleQueue()
+        self.records = collections.deque(maxlen=buffer_size)
+        self.lock = threading.Lock()
+        self.slow_threshold_ms = slow_threshold_ms
+        self.slow_log_path = slow_log_path
+        self.slow_logged = 0
+        self.log_errors = 0
+        self.pending = collections.OrderedDict()
+        self.thread = None
+
+    # -- producers: one put per event, safe from any thread -----------------
+
+    def submitted(self, request_id, command, queued_at):
+        self.events.put((_SUBMITTED, request_id, command, queued_at))
+
+    def executed(self, request_id, started, finished):
+        self.events.put((_EXECUTED, request_id, started, finished))
+
+    def sent(self, request_id, client, response, size):
+        self.events.put((_SENT, request_id, client, response, size, time.perf_counter()))
+
+    # -- tracer thread ---------------------------------------------------------
+
+    def ensure_started(self):
+        """Start the tracer thread if it is not running (called per connection)"""
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name="alivemcp-tracer", daemon=True)
+                self.thread.start()
+
+    def stop(self):
+        with self.lock:
+            thread, self.thread = self.thread, None
+        if thread is not None:
+            self.events.put(None)
+            thread.join(1.0)
+
+    def flush(self, timeout=1.0):
+        """Wait until every event posted so far has been processed"""
+        done = threading.Event()
+        self.events.put((_FLUSH, done))
+        return done.wait(timeout)
+
+    def run(self):
+        while True:
+            event = self.events.get()
+            if event is None:
+                break
+            try:
+                self._handle(event)
+            except Exception:
+                self.log_errors += 1
+
+    def _handle(self, event):
+        kind = event[0]
+        if kind == _FLUSH:
+            event[1].set()
+            return
+        if kind == _SENT:
+            _, request_id, client, response, size, sent_at = event
+            partial = self.pending.pop(request_id, {}) if request_id is not None else {}
+            self._finish(partial, request_id, client, response, size, sent_at)
+            return
+
+        partial = self.pending.get(event[1])
+        if partial is None:
+            partial = self.pending[event[1]] = {}
+            if len(self.pending) > MAX_PENDING_TRACES:
+                self.pending.popitem(last=False)
+        if kind == _SUBMITTED:
+            partial["command"], partial["queued_at"] = event[2], event[3]
+        else:
+            partial["started"], partial["finished"] = event[2], event[3]
+
+    def _finish(self, partial, request_id, client, response, size, sent_at):
+        command = partial.get("command") or {}
+        started, finished = partial.get("started"), partial.get("finished")
+        record = {
+            "time": round(time.time(), 3),
+            "request_id": request_id,
+            "client": client,
+            "action": command.get("action"),
+            "params": summarize_params(command),
+            "queue_wait_ms": _ms(partial.get("queued_at"), started),
+            "exec_ms": _ms(started, finished),
+            "total_ms": _ms(partial.get("queued_at"), sent_at),
+            "response_bytes": size,
+            "outcome": outcome_of(response),
+        }
+        if record["outcome"] != "ok":
+            record["error"] = str(response.get("error", ""))[:200]
+
+        with self.lock:
+            self.records.append(record)
+        if record["exec_ms"] is not None and record["exec_ms"] >= self.slow_threshold_ms:
+            self._log_slow(record)
+
+    def _log_slow(self, record):
+        path = self.slow_log_path
+        try:
+            if os.path.exists(path) and os.path.getsize(path) > SLOW_COMMAND_LOG_MAX_BYTES:
+                os.replace(path, path + ".1")
+            with open(path, "a") as f:
+                f.write(json.dumps(record) + "\n")
+            self.slow_logged += 1
+        except (OSError, TypeError, ValueError):
+            self.log_errors += 1
+
+    # -- readers ---------------------------------------------------------------
+
+    def recent(self, limit=50, slow_only=False, action_filter=None):
+        with self.lock:
+            records = list(self.records)
+        if slow_only:
+            records = [
+                r
+                for r in records
+                if r["exec_ms"] is not None and r["exec_ms"] >= self.slow_threshold_ms
+            ]
+        if action_filter:
+            records = [r for r in records if r["action"] == action_filter]
+        return records[-limit:] if limit > 0 else []
+
+
+class TracingMixin:
+    """
+    get_recent_traces action. The tracer itself lives in self.tracer and is
+    fed by update_display(), _submit_message() and _client_writer().
+    """
+
+    def init_tracing(self):
+        self.tracer = Tracer()
+
+    def get_recent_traces(self, limit=50, slow_only=False, action_filter=None):
+        """Get the most recent command trace records, oldest first"""
+        try:
+            tracer = self.tracer
+            return {
+                "ok": True,
+                "traces": tracer.recent(int(limit), bool(slow_only), action_filter),
+                "slow_threshold_ms": tracer.slow_threshold_ms,
+                "slow_log": tracer.slow_log_path,
+                "slow_logged": tracer.slow_logged,
+            }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
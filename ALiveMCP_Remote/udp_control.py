@@ -0,0 +1,130 @@
+"""
+Optional fire-and-forget UDP ingress for continuous controls.
+
+Faders, macro knobs and crossfader sweeps only care about the latest value,
+so they skip the request/response queue entirely: the UDP thread records
+target → value in a dict (later values overwrite earlier ones) and
+update_display() applies whatever is pending once per tick.
+
+Accepted datagrams:
+    JSON  {"t": "track/0/volume", "v": 0.8}
+          {"set": {"track/0/volume": 0.8, "master/pan": -0.2}}
+    OSC   /track/0/volume ,f 0.8     (messages or bundles)
+
+Targets use the parameter reference syntax from tools/param_refs.py.
+Nothing is sent back; check health_check's udp_control counters instead.
+"""
+
+import json
+import socket
+import threading
+import traceback
+
+from .osc import parse_osc_packet
+from .tools.param_refs import resolve_parameter, set_parameter_clamped, split_ref
+
+
+def parse_control_datagram(data):
+    """Decode one datagram into a list of (target, value) pairs"""
+    if data[:1] == b"{":
+        message = json.loads(data.decode("utf-8"))
+        if "set" in message:
+            return list(message["set"].items())
+        target = message.get("t", message.get("target"))
+        value = message.get("v", message.get("value"))
+        return [(target, value)]
+
+    return [(address, args[0]) for address, args in parse_osc_packet(data) if args]
+
+
+class UdpControlMixin:
+    """
+    Receives control datagrams and applies the latest value per target once
+    per tick. Subclasses must provide self.song, self.running and self.log().
+    """
+
+    udp_socket = None
+
+    def init_udp_control(self):
+        self.pending_controls = {}
+        self.pending_controls_lock = threading.Lock()
+        self.udp_stats = {"received": 0, "coalesced": 0, "applied": 0, "rejected": 0}
+
+    def start_udp_control(self, port):
+        """Listen for control datagrams on 127.0.0.1:port in a background thread"""
+        try:
+            self.udp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self.udp_socket.bind(("127.0.0.1", port))
+
+            thread = threading.Thread(target=self._udp_listener)
+            thread.daemon = True
+            thread.start()
+
+            self.log("UDP control stream listening on port " + str(port))
+        except Exception as e:
+            self.log("ERROR starting UDP control stream: " + str(e))
+            self.log(traceback.format_exc())
+
+    def stop_udp_control(self):
+        if self.udp_socket is not None:
+            try:
+                self.udp_socket.close()
+            except Exception:
+                pass
+            self.udp_socket = None
+
+    def _udp_listener(self):
+        """Background thread: decode datagrams into pending_controls"""
+        while self.running:
+            try:
+                data, _ = self.udp_socket.recvfrom(65535)
+            except Exception as e:
+                if self.running and self.udp_socket is not None:
+                    self.log("UDP control receive error: " + str(e))
+                    continue
+                break
+
+            try:
+                controls = parse_control_datagram(data)
+            except Exception:
+                with self.pending_controls_lock:
+                    self.udp_stats["rejected"] += 1
+                continue
+            self.queue_controls(controls)
+
+    def queue_controls(self, controls):
+        """
+        Record (target, value) pairs, keeping only the latest value per target.
+        Targets are normalised first, so "/track/0/volume" and "track/0/volume"
+        coalesce.
+        """
+        with self.pending_controls_lock:
+            for target, value in controls:
+                target = "/".join(split_ref(target))
+                self.udp_stats["received"] += 1
+                if target in self.pending_controls:
+                    self.udp_stats["coalesced"] += 1
+                self.pending_controls[target] = value
+
+    def apply_pending_controls(self):
+        """
+        Apply every pending control value (main thread, once per tick).
+        Bad targets or values are counted and dropped.
+        """
+        if not self.pending_controls:
+            return
+
+        with self.pending_controls_lock:
+            pending, self.pending_controls = self.pending_controls, {}
+
+        applied = rejected = 0
+        for target, value in pending.items():
+            try:
+                set_parameter_clamped(resolve_parameter(self.song, target), value)
+                applied += 1
+            except Exception:
+                rejected += 1
+
+        with self.pending_controls_lock:
+            self.udp_stats["applied"] += applied
+            self.udp_stats["rejected"] += rejected
@@ -0,0 +1,34 @@
+"""
+Python client for the ALiveMCP Remote Script.
+
+    from alivemcp_client import AliveMCPClient
+
+    with AliveMCPClient() as live:
+        live.set_tempo(bpm=124)
+        replies = live.batch([("get_track_info", {"track_index": i}) for i in range(8)])
+
+AsyncAliveMCPClient offers the same methods as coroutines. Both keep a
+persistent connection, pipeline requests, reconnect after a dropped
+connection and retry "overloaded" replies. The per-tool methods are
+generated into tools.py by scripts/generate_client_stubs.py.
+"""
+
+from .aio import AsyncAliveMCPClient
+from .client import AliveMCPClient
+from .protocol import (
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    AliveMCPConnectionError,
+    AliveMCPError,
+    AliveMCPTimeout,
+)
+
+__all__ = [
+    "DEFAULT_HOST",
+    "DEFAULT_PORT",
+    "AliveMCPClient",
+    "AliveMCPConnectionError",
+    "AliveMCPError",
+    "AliveMCPTimeout",
+    "AsyncAliveMCPClient",
+]
@@ -0,0 +1,182 @@
+"""
+asyncio client with one persistent, pipelined connection.
+
+Replies are matched to a FIFO of asyncio futures by a reader task, so any
+number of coroutines can await calls on the same client concurrently. The
+connection is opened on first use and re-opened after it drops.
+"""
+
+import asyncio
+import collections
+import socket
+
+from .protocol import (
+    CALL_TIMEOUT,
+    CONNECT_TIMEOUT,
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    OVERLOAD_RETRIES,
+    AliveMCPConnectionError,
+    AliveMCPTimeout,
+    LineDecoder,
+    encode_command,
+    make_command,
+    normalize_batch,
+    overload_delay,
+)
+from .tools import ToolMethods
+
+
+class AsyncAliveMCPClient(ToolMethods):
+    """
+    asyncio counterpart of AliveMCPClient: tool methods are coroutines
+    (await client.set_tempo(bpm=120)). Errors and overload retries behave
+    the same way as in the blocking client.
+    """
+
+    def __init__(
+        self,
+        host=DEFAULT_HOST,
+        port=DEFAULT_PORT,
+        unix_path=None,
+        timeout=CALL_TIMEOUT,
+        connect_timeout=CONNECT_TIMEOUT,
+        overload_retries=OVERLOAD_RETRIES,
+    ):
+        self.host = host
+        self.port = port
+        self.unix_path = unix_path
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.overload_retries = overload_retries
+        self._writer = None
+        self._reader_task = None
+        self._pending = collections.deque()
+        self._connect_lock = None
+
+    @property
+    def connected(self):
+        return self._writer is not None
+
+    async def connect(self):
+        """Open the connection if it is not already open"""
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self._writer is not None:
+                return
+            try:
+                if self.unix_path:
+                    opening = asyncio.open_unix_connection(self.unix_path)
+                else:
+                    opening = asyncio.open_connection(self.host, self.port)
+                reader, writer = await asyncio.wait_for(opening, self.connect_timeout)
+            except (OSError, asyncio.TimeoutError) as e:
+                raise AliveMCPConnectionError("Cannot connect to ALiveMCP: " + str(e)) from e
+
+            sock = writer.get_extra_info("socket")
+            if sock is not None and sock.family in (socket.AF_INET, socket.AF_INET6):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._writer = writer
+            self._reader_task = asyncio.ensure_future(self._read_loop(reader, writer))
+
+    async def _read_loop(self, reader, writer):
+        decoder = LineDecoder()
+        error = None
+        try:
+            while True:
+                chunk = await reader.read(65536)
+                if not chunk:
+                    raise ConnectionError("Connection closed by ALiveMCP")
+                for reply in decoder.feed(chunk):
+                    if self._pending:
+                        future = self._pending.popleft()
+                        if not future.done():
+                            future.set_result(reply)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            error = e
+        finally:
+            self._drop(writer, error)
+
+    def _drop(self, writer, error):
+        """Forget a dead connection and fail everything still waiting on it"""
+        if self._writer is not writer:
+            return
+        self._writer = None
+        writer.close()
+        reason = "Connection closed" if error is None else "Connection lost: " + str(error)
+        while self._pending:
+            future = self._pending.popleft()
+            if not future.done():
+                future.set_exception(AliveMCPConnectionError(reason))
+
+    async def _submit(self, command):
+        if self._writer is None:
+            await self.connect()
+        writer = self._writer
+        if writer is None:
+            raise AliveMCPConnectionError("Connection lost while connecting")
+        future = asyncio.get_running_loop().create_future()
+        # No await between enqueueing and writing, so replies stay in order
+        self._pending.append(future)
+        writer.write(encode_command(command))
+        try:
+            await writer.drain()
+        except OSError as e:
+            raise AliveMCPConnectionError("Send failed: " + str(e)) from e
+        return future
+
+    async def submit(self, action, **params):
+        """Send a command without waiting for its reply; returns an asyncio future"""
+        return await self._submit(make_command(action, params))
+
+    async def _wait(self, future, command):
+        attempts = 0
+        while True:
+            try:
+                reply = await asyncio.wait_for(asyncio.shield(future), self.timeout)
+            except asyncio.TimeoutError:
+                raise AliveMCPTimeout(
+                    "No reply to " + str(command.get("action")) + " within " + str(self.timeout)
+                ) from None
+            delay = overload_delay(reply)
+            if delay is None or attempts >= self.overload_retries:
+                return reply
+            attempts += 1
+            await asyncio.sleep(delay)
+            future = await self._submit(command)
+
+    async def call(self, action, **params):
+        """Send a command and await its reply"""
+        command = make_command(action, params)
+        return await self._wait(await self._submit(command), command)
+
+    def _call(self, action, params):
+        return self.call(action, **params)
+
+    async def batch(self, commands):
+        """Pipeline several commands (see AliveMCPClient.batch) and return replies in order"""
+        commands = normalize_batch(commands)
+        futures = [await self._submit(command) for command in commands]
+        return [await self._wait(future, command) for future, command in zip(futures, commands)]
+
+    async def close(self):
+        writer, task = self._writer, self._reader_task
+        if writer is not None:
+            self._drop(writer, None)
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._reader_task = None
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
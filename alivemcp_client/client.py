@@ -0,0 +1,224 @@
+"""
+Blocking client with persistent, pipelined connections.
+
+Each connection owns a reader thread that resolves a FIFO of
+concurrent.futures.Future objects as replies arrive, so any number of
+threads can share one client and many commands can be in flight at once.
+Connections are opened lazily, and a connection that drops is replaced on
+the next call.
+"""
+
+import collections
+import socket
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeout
+
+from .protocol import (
+    CALL_TIMEOUT,
+    CONNECT_TIMEOUT,
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    OVERLOAD_RETRIES,
+    AliveMCPConnectionError,
+    AliveMCPTimeout,
+    LineDecoder,
+    encode_command,
+    make_command,
+    normalize_batch,
+    overload_delay,
+)
+from .tools import ToolMethods
+
+
+def open_socket(host, port, unix_path, connect_timeout):
+    """Connect over TCP (with Nagle disabled) or, if unix_path is set, a Unix socket"""
+    try:
+        if unix_path:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(connect_timeout)
+            sock.connect(unix_path)
+        else:
+            sock = socket.create_connection((host, port), timeout=connect_timeout)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except OSError as e:
+        raise AliveMCPConnectionError("Cannot connect to ALiveMCP: " + str(e)) from e
+    sock.settimeout(None)
+    return sock
+
+
+class Connection:
+    """One socket plus the futures waiting for its replies, oldest first."""
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.pending = collections.deque()
+        self.lock = threading.Lock()
+        self.send_lock = threading.Lock()
+        self.closed = False
+        self.reader = threading.Thread(target=self._read_loop, daemon=True)
+        self.reader.start()
+
+    def submit(self, command):
+        future = Future()
+        data = encode_command(command)
+        # send_lock keeps the queue in send order; self.lock is only held
+        # briefly, so the reader can keep draining replies while sendall()
+        # waits for the server to read
+        with self.send_lock:
+            with self.lock:
+                if self.closed:
+                    raise AliveMCPConnectionError("Connection is closed")
+                # Enqueue before sending so the reply can never beat its future
+                self.pending.append(future)
+            try:
+                self.sock.sendall(data)
+            except OSError as e:
+                with self.lock:
+                    self._fail_locked(e)
+                raise AliveMCPConnectionError("Send failed: " + str(e)) from e
+        return future
+
+    def close(self):
+        with self.lock:
+            self._fail_locked(None)
+
+    def _read_loop(self):
+        decoder = LineDecoder()
+        while True:
+            try:
+                chunk = self.sock.recv(65536)
+                if not chunk:
+                    raise ConnectionError("Connection closed by ALiveMCP")
+                replies = decoder.feed(chunk)
+            except Exception as e:
+                with self.lock:
+                    self._fail_locked(e)
+                return
+
+            for reply in replies:
+                with self.lock:
+                    future = self.pending.popleft() if self.pending else None
+                if future is not None and not future.done():
+                    future.set_result(reply)
+
+    def _fail_locked(self, error):
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+        reason = "Connection closed" if error is None else "Connection lost: " + str(error)
+        while self.pending:
+            future = self.pending.popleft()
+            if not future.done():
+                future.set_exception(AliveMCPConnectionError(reason))
+
+
+class AliveMCPClient(ToolMethods):
+    """
+    Thread-safe client for the ALiveMCP Remote Script.
+
+    Every tool is available as a method (client.set_tempo(bpm=120)) and
+    returns the tool's response dict. Tool failures are returned as
+    {"ok": False, ...}; transport failures raise AliveMCPConnectionError or
+    AliveMCPTimeout. "overloaded" replies are retried after the server's
+    retry_after_ms hint, up to overload_retries times.
+
+    pool_size > 1 spreads concurrent callers across several connections;
+    a single connection already pipelines, so 1 is right for most uses.
+    """
+
+    def __init__(
+        self,
+        host=DEFAULT_HOST,
+        port=DEFAULT_PORT,
+        unix_path=None,
+        pool_size=1,
+        timeout=CALL_TIMEOUT,
+        connect_timeout=CONNECT_TIMEOUT,
+        overload_retries=OVERLOAD_RETRIES,
+    ):
+        self.host = host
+        self.port = port
+        self.unix_path = unix_path
+        self.pool_size = max(1, int(pool_size))
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.overload_retries = overload_retries
+        self._pool = []
+        self._pool_lock = threading.Lock()
+
+    def _connection(self):
+        """Return the least-busy live connection, opening or replacing one if needed"""
+        with self._pool_lock:
+            self._pool = [conn for conn in self._pool if not conn.closed]
+            idle = [conn for conn in self._pool if not conn.pending]
+            if idle:
+                return idle[0]
+            if len(self._pool) < self.pool_size:
+                sock = open_socket(self.host, self.port, self.unix_path, self.connect_timeout)
+                conn = Connection(sock)
+                self._pool.append(conn)
+                return conn
+            return min(self._pool, key=lambda conn: len(conn.pending))
+
+    def _submit(self, command):
+        try:
+            return self._connection().submit(command)
+        except AliveMCPConnectionError:
+            # The pooled connection died since its last use; retry once on a new one
+            return self._connection().submit(command)
+
+    def submit(self, action, **params):
+        """Send a command without waiting; returns a Future for the reply"""
+        return self._submit(make_command(action, params))
+
+    def _wait(self, future, command):
+        attempts = 0
+        while True:
+            try:
+                reply = future.result(self.timeout)
+            except FutureTimeout:
+                raise AliveMCPTimeout(
+                    "No reply to " + str(command.get("action")) + " within " + str(self.timeout)
+                ) from None
+            delay = overload_delay(reply)
+            if delay is None or attempts >= self.overload_retries:
+                return reply
+            attempts += 1
+            time.sleep(delay)
+            future = self._submit(command)
+
+    def call(self, action, **params):
+        """Send a command and block until its reply arrives"""
+        command = make_command(action, params)
+        return self._wait(self._submit(command), command)
+
+    def _call(self, action, params):
+        return self.call(action, **params)
+
+    def batch(self, commands):
+        """
+        Pipeline several commands and return their replies in order.
+        Commands may be dicts with an "action" key, (action, params) tuples
+        or bare action names.
+        """
+        commands = normalize_batch(commands)
+        futures = [self._submit(command) for command in commands]
+        return [self._wait(future, command) for future, command in zip(futures, commands)]
+
+    def close(self):
+        with self._pool_lock:
+            pool, self._pool = self._pool, []
+        for conn in pool:
+            conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
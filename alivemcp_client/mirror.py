@@ -0,0 +1,211 @@
+"""
+Shared, push-based mirror of session state.
+
+SessionMirror reads get_session_info once per interval; the Remote Script
+answers it from its property mirror, off Live's main thread. Per-track
+state is opt-in: with grid_interval set, the clip grid of every track is
+read with one get_clip_grid call, at most once per grid_interval (and never
+more often than MIN_GRID_POLL_INTERVAL). The mirror diffs the result
+against the previous state and pushes the changes to every subscriber as
+JSON Patch (RFC 6902) operations. The cost on Live is the same whether one
+viewer is watching or a hundred, and polling stops while nobody is
+subscribed.
+
+Subscriber messages:
+    {"event": "snapshot", "version": n, "state": {...}}   on subscribe / resync
+    {"event": "patch", "version": n, "ops": [...]}        after each change
+"""
+
+import asyncio
+import copy
+import time
+
+from .protocol import AliveMCPError
+
+STATE_POLL_INTERVAL = 0.25
+# get_clip_grid walks every clip slot on Live's main thread, so it is rate-limited
+MIN_GRID_POLL_INTERVAL = 1.0
+# A subscriber this far behind is sent a fresh snapshot instead of the backlog
+MAX_SUBSCRIBER_BACKLOG = 64
+
+
+def _escape(key):
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token):
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def diff(old, new, path=""):
+    """Return JSON Patch operations that turn old into new"""
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = [{"op": "remove", "path": path + "/" + _escape(k)} for k in old if k not in new]
+        for key, value in new.items():
+            child = path + "/" + _escape(key)
+            if key in old:
+                ops.extend(diff(old[key], value, child))
+            else:
+                ops.append({"op": "add", "path": child, "value": value})
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list):
+        common = min(len(old), len(new))
+        ops = []
+        for i in range(common):
+            ops.extend(diff(old[i], new[i], path + "/" + str(i)))
+        for i in range(common, len(new)):
+            ops.append({"op": "add", "path": path + "/" + str(i), "value": new[i]})
+        for i in reversed(range(common, len(old))):
+            ops.append({"op": "remove", "path": path + "/" + str(i)})
+        return ops
+
+    if old == new and type(old) is type(new):
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_patch(document, ops):
+    """Apply add/remove/replace operations in place; returns the (possibly new) root"""
+    for op in ops:
+        if op["path"] == "":
+            document = op["value"]
+            continue
+        tokens = [_unescape(t) for t in op["path"][1:].split("/")]
+        parent = document
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        last = tokens[-1]
+        if isinstance(parent, list):
+            index = int(last)
+            if op["op"] == "add":
+                parent.insert(index, op["value"])
+            elif op["op"] == "remove":
+                del parent[index]
+            else:
+                parent[index] = op["value"]
+        elif op["op"] == "remove":
+            del parent[last]
+        else:
+            parent[last] = op["value"]
+    return document
+
+
+def _strip_ok(reply):
+    return {k: v for k, v in reply.items() if k != "ok"}
+
+
+class SessionMirror:
+    """
+    Canonical session state kept up to date for any number of subscribers.
+    client is an AsyncAliveMCPClient (or anything with an async call).
+    grid_interval (seconds) adds the clip grid as state["clip_grid"]; None
+    leaves per-track state out.
+    """
+
+    def __init__(self, client, interval=STATE_POLL_INTERVAL, grid_interval=None):
+        self.client = client
+        self.interval = interval
+        self.grid_interval = (
+            None if grid_interval is None else max(grid_interval, MIN_GRID_POLL_INTERVAL)
+        )
+        self._grid = None
+        self._grid_version = None
+        self._grid_read_at = 0.0
+        self.state = None
+        self.version = 0
+        self._subscribers = set()
+        self._task = None
+        self._wake = None
+
+    async def read_state(self):
+        """One read of everything the mirror tracks"""
+        session = await self.client.call("get_session_info")
+        if not session.get("ok"):
+            raise AliveMCPError(session.get("error", "get_session_info failed"))
+        state = {"connected": True, "session": _strip_ok(session)}
+        if self.grid_interval is not None:
+            state["clip_grid"] = await self._read_grid()
+        return state
+
+    async def _read_grid(self):
+        """The clip grid, re-read only once grid_interval has passed"""
+        now = time.monotonic()
+        if self._grid is not None and now - self._grid_read_at < self.grid_interval:
+            return self._grid
+        reply = await self.client.call("get_clip_grid", version=self._grid_version)
+        if not reply.get("ok"):
+            raise AliveMCPError(reply.get("error", "get_clip_grid failed"))
+        self._grid_read_at = now
+        if not reply.get("not_modified"):
+            self._grid_version = reply["version"]
+            self._grid = {k: v for k, v in reply.items() if k not in ("ok", "version")}
+        return self._grid
+
+    def snapshot_message(self):
+        state = copy.deepcopy(self.state)
+        return {"event": "snapshot", "version": self.version, "state": state}
+
+    def subscribe(self):
+        """Register a subscriber; returns an asyncio.Queue of snapshot/patch messages"""
+        queue = asyncio.Queue()
+        if self.state is not None:
+            queue.put_nowait(self.snapshot_message())
+        self._subscribers.add(queue)
+        if self._task is None or self._task.done():
+            self._wake = asyncio.Event()
+            self._task = asyncio.ensure_future(self._run())
+        return queue
+
+    def unsubscribe(self, queue):
+        self._subscribers.discard(queue)
+
+    def refresh_soon(self):
+        """Poll now instead of waiting out the interval (e.g. after a write)"""
+        if self._wake is not None:
+            self._wake.set()
+
+    async def stop(self):
+        self._subscribers.clear()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while self._subscribers:
+            try:
+                state = await self.read_state()
+            except (AliveMCPError, ConnectionError, KeyError, TypeError):
+                state = dict(self.state or {}, connected=False)
+            self.publish(state)
+
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    def publish(self, state):
+        """Diff state against the current state and push any changes to subscribers"""
+        if self.state is None:
+            ops = [{"op": "replace", "path": "", "value": state}]
+        else:
+            ops = diff(self.state, state)
+        if not ops:
+            return
+        self.state = state
+        self.version += 1
+
+        # Copied so a subscriber applying patches in place can't alias the mirror's state
+        message = {"event": "patch", "version": self.version, "ops": copy.deepcopy(ops)}
+        for queue in self._subscribers:
+            if queue.qsize() >= MAX_SUBSCRIBER_BACKLOG:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(self.snapshot_message())
+            else:
+                queue.put_nowait(message)
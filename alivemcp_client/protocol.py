@@ -0,0 +1,77 @@
+"""
+Wire protocol shared by the sync and asyncio clients.
+
+Commands are JSON objects terminated by "\n". The Remote Script answers the
+commands on one connection in the order they were received, so a client can
+pipeline requests and match each reply to the oldest pending future.
+"""
+
+import json
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 9004
+CONNECT_TIMEOUT = 5.0
+# The server times a command out after 25s; wait a little longer than that
+CALL_TIMEOUT = 30.0
+OVERLOAD_RETRIES = 3
+
+
+class AliveMCPError(Exception):
+    """Base class for client-side failures (not tool errors, which come back as dicts)"""
+
+
+class AliveMCPConnectionError(AliveMCPError, ConnectionError):
+    """The connection could not be opened or was lost while a call was pending"""
+
+
+class AliveMCPTimeout(AliveMCPError, TimeoutError):
+    """No reply arrived within the call timeout"""
+
+
+def make_command(action, params):
+    command = dict(params)
+    command["action"] = action
+    return command
+
+
+def encode_command(command):
+    return (json.dumps(command) + "\n").encode("utf-8")
+
+
+def normalize_batch(commands):
+    """
+    Accept a batch as command dicts ({"action": ..., ...}), (action, params)
+    tuples or bare action names, and return a list of command dicts.
+    """
+    normalized = []
+    for command in commands:
+        if isinstance(command, str):
+            command = {"action": command}
+        elif isinstance(command, (tuple, list)):
+            action, params = command
+            command = make_command(action, params)
+        elif "action" not in command:
+            raise ValueError("Batch command is missing 'action': " + repr(command))
+        normalized.append(command)
+    return normalized
+
+
+def overload_delay(response):
+    """Seconds to wait before retrying an overloaded reply, or None for any other reply"""
+    if isinstance(response, dict) and response.get("error") == "overloaded":
+        return response.get("retry_after_ms", 20) / 1000.0
+    return None
+
+
+class LineDecoder:
+    """Incrementally split a byte stream into decoded JSON replies"""
+
+    def __init__(self):
+        self.buffer = b""
+
+    def feed(self, data):
+        self.buffer += data
+        if b"\n" not in data:
+            return []
+        *lines, self.buffer = self.buffer.split(b"\n")
+        return [json.loads(line.decode("utf-8")) for line in lines if line.strip()]
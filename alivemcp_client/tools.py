@@ -0,0 +1,1519 @@
+"""
+Typed wrappers for every ALiveMCP tool.
+
+GENERATED by scripts/generate_client_stubs.py from AVAILABLE_TOOLS — do not
+edit by hand. Run the script again after adding or changing a tool.
+"""
+
+
+class ToolMethods:
+    """
+    One method per tool. Subclasses implement _call(action, params); the
+    blocking client returns the reply dict, the asyncio client a coroutine.
+    """
+
+    def _call(self, action, params):
+        raise NotImplementedError
+
+    def ping(self):
+        """Check that the Remote Script is reachable"""
+        return self._call("ping", {})
+
+    def health_check(self):
+        """Report script status, queue depth and transport counters"""
+        return self._call("health_check", {})
+
+    def get_tool_schemas(self, names=None):
+        """Get parameter schemas as MCP tool descriptions"""
+        return self._call("get_tool_schemas", {"names": names})
+
+    def profile_start(self, mode: str = "sampling", interval_ms: float = 5.0):
+        """Start profiling the main thread (mode: 'sampling' or 'cprofile')"""
+        return self._call("profile_start", {"mode": mode, "interval_ms": interval_ms})
+
+    def profile_stop(self):
+        """Stop profiling and write the .pstats / .collapsed file"""
+        return self._call("profile_stop", {})
+
+    def get_recent_traces(self, limit: int = 50, slow_only: bool = False, action_filter=None):
+        """Get the most recent command trace records, oldest first"""
+        return self._call(
+            "get_recent_traces",
+            {"limit": limit, "slow_only": slow_only, "action_filter": action_filter},
+        )
+
+    def start_playback(self):
+        """Start Ableton playback"""
+        return self._call("start_playback", {})
+
+    def stop_playback(self):
+        """Stop Ableton playback"""
+        return self._call("stop_playback", {})
+
+    def start_recording(self):
+        """Start recording"""
+        return self._call("start_recording", {})
+
+    def stop_recording(self):
+        """Stop recording"""
+        return self._call("stop_recording", {})
+
+    def continue_playing(self):
+        """Continue playback from current position"""
+        return self._call("continue_playing", {})
+
+    def get_session_info(self):
+        """Get current session state information"""
+        return self._call("get_session_info", {})
+
+    def set_tempo(self, bpm: float):
+        """Set session tempo"""
+        return self._call("set_tempo", {"bpm": bpm})
+
+    def set_time_signature(self, numerator: int, denominator: int):
+        """Set time signature"""
+        return self._call(
+            "set_time_signature",
+            {"numerator": numerator, "denominator": denominator},
+        )
+
+    def set_loop_start(self, position: float):
+        """Set loop start position in beats"""
+        return self._call("set_loop_start", {"position": position})
+
+    def set_loop_length(self, length: float):
+        """Set loop length in beats"""
+        return self._call("set_loop_length", {"length": length})
+
+    def set_metronome(self, enabled: bool):
+        """Enable or disable metronome"""
+        return self._call("set_metronome", {"enabled": enabled})
+
+    def tap_tempo(self):
+        """Tap tempo"""
+        return self._call("tap_tempo", {})
+
+    def undo(self):
+        """Undo last action"""
+        return self._call("undo", {})
+
+    def redo(self):
+        """Redo last undone action"""
+        return self._call("redo", {})
+
+    def jump_to_time(self, time_in_beats: float):
+        """Jump playback to specific time in beats"""
+        return self._call("jump_to_time", {"time_in_beats": time_in_beats})
+
+    def get_current_time(self):
+        """Get current playback position in beats"""
+        return self._call("get_current_time", {})
+
+    def set_arrangement_overdub(self, enabled: bool):
+        """Enable/disable arrangement overdub"""
+        return self._call("set_arrangement_overdub", {"enabled": enabled})
+
+    def set_back_to_arranger(self, enabled: bool):
+        """Enable/disable back to arrangement"""
+        return self._call("set_back_to_arranger", {"enabled": enabled})
+
+    def set_punch_in(self, enabled: bool):
+        """Enable/disable punch in recording"""
+        return self._call("set_punch_in", {"enabled": enabled})
+
+    def set_punch_out(self, enabled: bool):
+        """Enable/disable punch out recording"""
+        return self._call("set_punch_out", {"enabled": enabled})
+
+    def nudge_up(self):
+        """Nudge playback position up"""
+        return self._call("nudge_up", {})
+
+    def nudge_down(self):
+        """Nudge playback position down"""
+        return self._call("nudge_down", {})
+
+    def re_enable_automation(self):
+        """Re-enable all automation"""
+        return self._call("re_enable_automation", {})
+
+    def get_session_automation_record(self):
+        """Get session automation recording state"""
+        return self._call("get_session_automation_record", {})
+
+    def set_session_automation_record(self, enabled: bool):
+        """Enable/disable session automation recording"""
+        return self._call("set_session_automation_record", {"enabled": enabled})
+
+    def get_session_record(self):
+        """Get session record state"""
+        return self._call("get_session_record", {})
+
+    def set_session_record(self, enabled: bool):
+        """Enable/disable session recording"""
+        return self._call("set_session_record", {"enabled": enabled})
+
+    def capture_midi(self):
+        """Capture MIDI from the last played notes"""
+        return self._call("capture_midi", {})
+
+    def create_midi_track(self, name=None):
+        """Create a new MIDI track"""
+        return self._call("create_midi_track", {"name": name})
+
+    def create_audio_track(self, name=None):
+        """Create a new audio track"""
+        return self._call("create_audio_track", {"name": name})
+
+    def create_return_track(self):
+        """Create a new return track"""
+        return self._call("create_return_track", {})
+
+    def delete_track(self, track_index: int):
+        """Delete track by index"""
+        return self._call("delete_track", {"track_index": track_index})
+
+    def duplicate_track(self, track_index: int):
+        """Duplicate track"""
+        return self._call("duplicate_track", {"track_index": track_index})
+
+    def rename_track(self, track_index: int, name: str):
+        """Rename track"""
+        return self._call("rename_track", {"track_index": track_index, "name": name})
+
+    def set_track_volume(self, track_index: int, volume: float):
+        """Set track volume (0.0 to 1.0)"""
+        return self._call("set_track_volume", {"track_index": track_index, "volume": volume})
+
+    def set_track_pan(self, track_index: int, pan: float):
+        """Set track pan (-1.0 to 1.0)"""
+        return self._call("set_track_pan", {"track_index": track_index, "pan": pan})
+
+    def arm_track(self, track_index: int, armed: bool = True):
+        """Arm or disarm track for recording"""
+        return self._call("arm_track", {"track_index": track_index, "armed": armed})
+
+    def solo_track(self, track_index: int, solo: bool = True):
+        """Solo or unsolo track"""
+        return self._call("solo_track", {"track_index": track_index, "solo": solo})
+
+    def mute_track(self, track_index: int, mute: bool = True):
+        """Mute or unmute track"""
+        return self._call("mute_track", {"track_index": track_index, "mute": mute})
+
+    def get_track_info(self, track_index: int):
+        """Get detailed track information"""
+        return self._call("get_track_info", {"track_index": track_index})
+
+    def set_track_color(self, track_index: int, color_index: int):
+        """Set track color"""
+        return self._call(
+            "set_track_color",
+            {"track_index": track_index, "color_index": color_index},
+        )
+
+    def set_track_fold_state(self, track_index: int, folded: bool):
+        """Fold or unfold a group track"""
+        return self._call("set_track_fold_state", {"track_index": track_index, "folded": folded})
+
+    def set_track_input_routing(
+        self,
+        track_index: int,
+        routing_type_name: str,
+        routing_channel: int = 0,
+    ):
+        """Set track input routing"""
+        return self._call(
+            "set_track_input_routing",
+            {
+                "track_index": track_index,
+                "routing_type_name": routing_type_name,
+                "routing_channel": routing_channel,
+            },
+        )
+
+    def set_track_output_routing(self, track_index: int, routing_type_name: str):
+        """Set track output routing"""
+        return self._call(
+            "set_track_output_routing",
+            {"track_index": track_index, "routing_type_name": routing_type_name},
+        )
+
+    def set_track_send(self, track_index: int, send_index: int, value: float):
+        """Set track send level"""
+        return self._call(
+            "set_track_send",
+            {"track_index": track_index, "send_index": send_index, "value": value},
+        )
+
+    def get_track_sends(self, track_index: int):
+        """Get all send levels for track"""
+        return self._call("get_track_sends", {"track_index": track_index})
+
+    def create_midi_clip(self, track_index: int, clip_index: int, length: float = 4.0):
+        """Create a new MIDI clip"""
+        return self._call(
+            "create_midi_clip",
+            {"track_index": track_index, "clip_index": clip_index, "length": length},
+        )
+
+    def delete_clip(self, track_index: int, clip_index: int):
+        """Delete clip"""
+        return self._call("delete_clip", {"track_index": track_index, "clip_index": clip_index})
+
+    def duplicate_clip(self, track_index: int, clip_index: int):
+        """Duplicate clip to the next empty slot on the same track"""
+        return self._call("duplicate_clip", {"track_index": track_index, "clip_index": clip_index})
+
+    def launch_clip(self, track_index: int, clip_index: int):
+        """Launch clip"""
+        return self._call("launch_clip", {"track_index": track_index, "clip_index": clip_index})
+
+    def stop_clip(self, track_index: int, clip_index: int):
+        """Stop the clip in the specific slot"""
+        return self._call("stop_clip", {"track_index": track_index, "clip_index": clip_index})
+
+    def stop_all_clips(self):
+        """Stop all playing clips"""
+        return self._call("stop_all_clips", {})
+
+    def get_clip_info(self, track_index: int, clip_index: int):
+        """Get clip information"""
+        return self._call("get_clip_info", {"track_index": track_index, "clip_index": clip_index})
+
+    def set_clip_name(self, track_index: int, clip_index: int, name: str):
+        """Set clip name"""
+        return self._call(
+            "set_clip_name",
+            {"track_index": track_index, "clip_index": clip_index, "name": name},
+        )
+
+    def get_clip_grid(self, track_range=None, scene_range=None, fields=None, version=None):
+        """Get the state of every clip slot in a block of tracks and scenes"""
+        return self._call(
+            "get_clip_grid",
+            {
+                "track_range": track_range,
+                "scene_range": scene_range,
+                "fields": fields,
+                "version": version,
+            },
+        )
+
+    def launch_clips(self, slots: list, force_legato: bool = False):
+        """Launch the clips in several slots in the same tick"""
+        return self._call("launch_clips", {"slots": slots, "force_legato": force_legato})
+
+    def stop_clips(self, slots: list):
+        """Stop the clips in several slots in the same tick"""
+        return self._call("stop_clips", {"slots": slots})
+
+    def set_clip_properties_bulk(self, selector: dict, properties: dict):
+        """Set properties on every clip matching a selector"""
+        return self._call(
+            "set_clip_properties_bulk",
+            {"selector": selector, "properties": properties},
+        )
+
+    def set_clip_looping(self, track_index: int, clip_index: int, looping: bool):
+        """Enable/disable clip looping"""
+        return self._call(
+            "set_clip_looping",
+            {"track_index": track_index, "clip_index": clip_index, "looping": looping},
+        )
+
+    def set_clip_loop_start(self, track_index: int, clip_index: int, loop_start: float):
+        """Set clip loop start position"""
+        return self._call(
+            "set_clip_loop_start",
+            {"track_index": track_index, "clip_index": clip_index, "loop_start": loop_start},
+        )
+
+    def set_clip_loop_end(self, track_index: int, clip_index: int, loop_end: float):
+        """Set clip loop end position"""
+        return self._call(
+            "set_clip_loop_end",
+            {"track_index": track_index, "clip_index": clip_index, "loop_end": loop_end},
+        )
+
+    def set_clip_start_marker(self, track_index: int, clip_index: int, start_marker: float):
+        """Set clip start marker"""
+        return self._call(
+            "set_clip_start_marker",
+            {"track_index": track_index, "clip_index": clip_index, "start_marker": start_marker},
+        )
+
+    def set_clip_end_marker(self, track_index: int, clip_index: int, end_marker: float):
+        """Set clip end marker"""
+        return self._call(
+            "set_clip_end_marker",
+            {"track_index": track_index, "clip_index": clip_index, "end_marker": end_marker},
+        )
+
+    def set_clip_muted(self, track_index: int, clip_index: int, muted: bool):
+        """Mute or unmute clip"""
+        return self._call(
+            "set_clip_muted",
+            {"track_index": track_index, "clip_index": clip_index, "muted": muted},
+        )
+
+    def set_clip_gain(self, track_index: int, clip_index: int, gain: float):
+        """Set clip gain/volume"""
+        return self._call(
+            "set_clip_gain",
+            {"track_index": track_index, "clip_index": clip_index, "gain": gain},
+        )
+
+    def set_clip_pitch_coarse(self, track_index: int, clip_index: int, semitones: int):
+        """Transpose clip by semitones"""
+        return self._call(
+            "set_clip_pitch_coarse",
+            {"track_index": track_index, "clip_index": clip_index, "semitones": semitones},
+        )
+
+    def set_clip_pitch_fine(self, track_index: int, clip_index: int, cents: float):
+        """Fine-tune clip pitch in cents"""
+        return self._call(
+            "set_clip_pitch_fine",
+            {"track_index": track_index, "clip_index": clip_index, "cents": cents},
+        )
+
+    def set_clip_signature_numerator(self, track_index: int, clip_index: int, numerator: int):
+        """Set clip time signature numerator"""
+        return self._call(
+            "set_clip_signature_numerator",
+            {"track_index": track_index, "clip_index": clip_index, "numerator": numerator},
+        )
+
+    def add_notes(self, track_index: int, clip_index: int, notes: list):
+        """Add MIDI notes to a clip"""
+        return self._call(
+            "add_notes",
+            {"track_index": track_index, "clip_index": clip_index, "notes": notes},
+        )
+
+    def get_clip_notes(self, track_index: int, clip_index: int):
+        """Get all MIDI notes from a clip"""
+        return self._call("get_clip_notes", {"track_index": track_index, "clip_index": clip_index})
+
+    def remove_notes(
+        self,
+        track_index: int,
+        clip_index: int,
+        pitch_from: int = 0,
+        pitch_to: int = 127,
+        time_from: float = 0.0,
+        time_to: float = 999.0,
+    ):
+        """Remove MIDI notes from clip"""
+        return self._call(
+            "remove_notes",
+            {
+                "track_index": track_index,
+                "clip_index": clip_index,
+                "pitch_from": pitch_from,
+                "pitch_to": pitch_to,
+                "time_from": time_from,
+                "time_to": time_to,
+            },
+        )
+
+    def select_all_notes(self, track_index: int, clip_index: int):
+        """Select all notes in clip"""
+        return self._call(
+            "select_all_notes",
+            {"track_index": track_index, "clip_index": clip_index},
+        )
+
+    def deselect_all_notes(self, track_index: int, clip_index: int):
+        """Deselect all notes in clip"""
+        return self._call(
+            "deselect_all_notes",
+            {"track_index": track_index, "clip_index": clip_index},
+        )
+
+    def replace_selected_notes(self, track_index: int, clip_index: int, notes: list):
+        """Replace selected notes with new notes"""
+        return self._call(
+            "replace_selected_notes",
+            {"track_index": track_index, "clip_index": clip_index, "notes": notes},
+        )
+
+    def get_notes_extended(
+        self,
+        track_index: int,
+        clip_index: int,
+        start_time: float,
+        time_span: float,
+        start_pitch: int,
+        pitch_span: int,
+    ):
+        """Get notes with extended filtering options (with note IDs on Live 11+)"""
+        return self._call(
+            "get_notes_extended",
+            {
+                "track_index": track_index,
+                "clip_index": clip_index,
+                "start_time": start_time,
+                "time_span": time_span,
+                "start_pitch": start_pitch,
+                "pitch_span": pitch_span,
+            },
+        )
+
+    def transform_notes(self, track_index: int, clip_index: int, operations: list):
+        """Apply a pipeline of note operations to every note in a MIDI clip"""
+        return self._call(
+            "transform_notes",
+            {"track_index": track_index, "clip_index": clip_index, "operations": operations},
+        )
+
+    def apply_note_diff(
+        self,
+        track_index: int,
+        clip_index: int,
+        added=None,
+        modified=None,
+        removed=None,
+    ):
+        """Add, modify and remove individual notes of a MIDI clip by note ID (Live 11+)"""
+        return self._call(
+            "apply_note_diff",
+            {
+                "track_index": track_index,
+                "clip_index": clip_index,
+                "added": added,
+                "modified": modified,
+                "removed": removed,
+            },
+        )
+
+    def get_notes_multi(
+        self,
+        selector: dict,
+        time_range=None,
+        pitch_range=None,
+        format: str = "columns",
+    ):
+        """Get the notes of every MIDI clip matching a selector"""
+        return self._call(
+            "get_notes_multi",
+            {
+                "selector": selector,
+                "time_range": time_range,
+                "pitch_range": pitch_range,
+                "format": format,
+            },
+        )
+
+    def add_device(self, track_index: int, device_name: str):
+        """Add device to track"""
+        return self._call("add_device", {"track_index": track_index, "device_name": device_name})
+
+    def get_track_devices(self, track_index: int):
+        """Get all devices on track"""
+        return self._call("get_track_devices", {"track_index": track_index})
+
+    def set_device_param(self, track_index: int, device_index: int, param_index: int, value: float):
+        """Set device parameter value"""
+        return self._call(
+            "set_device_param",
+            {
+                "track_index": track_index,
+                "device_index": device_index,
+                "param_index": param_index,
+                "value": value,
+            },
+        )
+
+    def set_device_on_off(self, track_index: int, device_index: int, enabled: bool):
+        """Turn device on or off"""
+        return self._call(
+            "set_device_on_off",
+            {"track_index": track_index, "device_index": device_index, "enabled": enabled},
+        )
+
+    def get_device_parameters(self, track_index: int, device_index: int):
+        """Get all parameters for a device"""
+        return self._call(
+            "get_device_parameters",
+            {"track_index": track_index, "device_index": device_index},
+        )
+
+    def get_device_parameter_by_name(self, track_index: int, device_index: int, param_name: str):
+        """Get device parameter by name"""
+        return self._call(
+            "get_device_parameter_by_name",
+            {"track_index": track_index, "device_index": device_index, "param_name": param_name},
+        )
+
+    def set_device_parameter_by_name(
+        self,
+        track_index: int,
+        device_index: int,
+        param_name: str,
+        value: float,
+    ):
+        """Set device parameter by name"""
+        return self._call(
+            "set_device_parameter_by_name",
+            {
+                "track_index": track_index,
+                "device_index": device_index,
+                "param_name": param_name,
+                "value": value,
+            },
+        )
+
+    def delete_device(self, track_index: int, device_index: int):
+        """Delete device from track"""
+        return self._call(
+            "delete_device",
+            {"track_index": track_index, "device_index": device_index},
+        )
+
+    def get_device_presets(self, track_index: int, device_index: int):
+        """Get available presets for device"""
+        return self._call(
+            "get_device_presets",
+            {"track_index": track_index, "device_index": device_index},
+        )
+
+    def set_device_preset(self, track_index: int, device_index: int, preset_index: int):
+        """Load preset for device"""
+        return self._call(
+            "set_device_preset",
+            {
+                "track_index": track_index,
+                "device_index": device_index,
+                "preset_index": preset_index,
+            },
+        )
+
+    def randomize_device_parameters(self, track_index: int, device_index: int):
+        """Randomize all device parameters (delegates to randomize_device)"""
+        return self._call(
+            "randomize_device_parameters",
+            {"track_index": track_index, "device_index": device_index},
+        )
+
+    def create_scene(self, name=None):
+        """Create a new scene"""
+        return self._call("create_scene", {"name": name})
+
+    def delete_scene(self, scene_index: int):
+        """Delete scene by index"""
+        return self._call("delete_scene", {"scene_index": scene_index})
+
+    def duplicate_scene(self, scene_index: int):
+        """Duplicate scene"""
+        return self._call("duplicate_scene", {"scene_index": scene_index})
+
+    def launch_scene(self, scene_index: int):
+        """Launch a scene"""
+        return self._call("launch_scene", {"scene_index": scene_index})
+
+    def rename_scene(self, scene_index: int, name: str):
+        """Rename scene"""
+        return self._call("rename_scene", {"scene_index": scene_index, "name": name})
+
+    def get_scene_info(self, scene_index: int):
+        """Get scene information"""
+        return self._call("get_scene_info", {"scene_index": scene_index})
+
+    def set_clip_groove_amount(self, track_index: int, clip_index: int, amount: float):
+        """Set clip groove amount (0.0-1.0)"""
+        return self._call(
+            "set_clip_groove_amount",
+            {"track_index": track_index, "clip_index": clip_index, "amount": amount},
+        )
+
+    def quantize_clip(self, track_index: int, clip_index: int, quantize_to: float):
+        """Quantize MIDI clip to grid"""
+        return self._call(
+            "quantize_clip",
+            {"track_index": track_index, "clip_index": clip_index, "quantize_to": quantize_to},
+        )
+
+    def quantize_clip_pitch(self, track_index: int, clip_index: int, pitch: int = 60):
+        """Quantize MIDI clip pitch"""
+        return self._call(
+            "quantize_clip_pitch",
+            {"track_index": track_index, "clip_index": clip_index, "pitch": pitch},
+        )
+
+    def get_groove_amount(self):
+        """Get song groove amount"""
+        return self._call("get_groove_amount", {})
+
+    def set_groove_amount(self, amount: float):
+        """Set song groove amount (0.0-1.0)"""
+        return self._call("set_groove_amount", {"amount": amount})
+
+    def set_track_current_monitoring_state(self, track_index: int, state: int):
+        """Set track monitoring state (0=In, 1=Auto, 2=Off)"""
+        return self._call(
+            "set_track_current_monitoring_state",
+            {"track_index": track_index, "state": state},
+        )
+
+    def get_track_available_input_routing_types(self, track_index: int):
+        """Get available input routing types for track"""
+        return self._call("get_track_available_input_routing_types", {"track_index": track_index})
+
+    def get_track_available_output_routing_types(self, track_index: int):
+        """Get available output routing types for track"""
+        return self._call("get_track_available_output_routing_types", {"track_index": track_index})
+
+    def get_track_input_routing_type(self, track_index: int):
+        """Get current input routing type for track"""
+        return self._call("get_track_input_routing_type", {"track_index": track_index})
+
+    def get_project_root_folder(self):
+        """Get project root folder path"""
+        return self._call("get_project_root_folder", {})
+
+    def trigger_session_record(self, length=None):
+        """Trigger session record with optional fixed length"""
+        return self._call("trigger_session_record", {"length": length})
+
+    def get_can_jump_to_next_cue(self):
+        """Check if can jump to next cue point"""
+        return self._call("get_can_jump_to_next_cue", {})
+
+    def get_can_jump_to_prev_cue(self):
+        """Check if can jump to previous cue point"""
+        return self._call("get_can_jump_to_prev_cue", {})
+
+    def jump_to_next_cue(self):
+        """Jump to next cue point"""
+        return self._call("jump_to_next_cue", {})
+
+    def jump_to_prev_cue(self):
+        """Jump to previous cue point"""
+        return self._call("jump_to_prev_cue", {})
+
+    def browse_devices(self):
+        """Get list of available devices from browser"""
+        return self._call("browse_devices", {})
+
+    def browse_plugins(self, plugin_type: str = "vst"):
+        """Browse available plugins (VST, AU, etc.)"""
+        return self._call("browse_plugins", {"plugin_type": plugin_type})
+
+    def load_device_from_browser(self, track_index: int, device_name: str):
+        """Load a device from browser onto track (alias for add_device)"""
+        return self._call(
+            "load_device_from_browser",
+            {"track_index": track_index, "device_name": device_name},
+        )
+
+    def get_browser_items(self, category: str = "devices"):
+        """Get browser items by category"""
+        return self._call("get_browser_items", {"category": category})
+
+    def set_loop_enabled(self, enabled: bool):
+        """Enable or disable song loop"""
+        return self._call("set_loop_enabled", {"enabled": enabled})
+
+    def get_loop_enabled(self):
+        """Get current loop enabled state"""
+        return self._call("get_loop_enabled", {})
+
+    def create_locator(self, time_in_beats: float, name: str = "Locator"):
+        """Create a locator/cue point at specified time"""
+        return self._call("create_locator", {"time_in_beats": time_in_beats, "name": name})
+
+    def delete_locator(self, locator_index: int):
+        """Delete a locator/cue point"""
+        return self._call("delete_locator", {"locator_index": locator_index})
+
+    def get_locators(self):
+        """Get all locators/cue points"""
+        return self._call("get_locators", {})
+
+    def jump_by_amount(self, amount_in_beats: float):
+        """Jump playback position by specified amount (positive or negative)"""
+        return self._call("jump_by_amount", {"amount_in_beats": amount_in_beats})
+
+    def set_clip_color(self, track_index: int, clip_index: int, color_index: int):
+        """Set clip color"""
+        return self._call(
+            "set_clip_color",
+            {"track_index": track_index, "clip_index": clip_index, "color_index": color_index},
+        )
+
+    def get_track_output_routing(self, track_index: int):
+        """Get track output routing configuration"""
+        return self._call("get_track_output_routing", {"track_index": track_index})
+
+    def set_track_input_sub_routing(self, track_index: int, sub_routing: str):
+        """Set track input sub-routing"""
+        return self._call(
+            "set_track_input_sub_routing",
+            {"track_index": track_index, "sub_routing": sub_routing},
+        )
+
+    def set_track_output_sub_routing(self, track_index: int, sub_routing: str):
+        """Set track output sub-routing"""
+        return self._call(
+            "set_track_output_sub_routing",
+            {"track_index": track_index, "sub_routing": sub_routing},
+        )
+
+    def randomize_device(self, track_index: int, device_index: int):
+        """Randomize all parameters of a device"""
+        return self._call(
+            "randomize_device",
+            {"track_index": track_index, "device_index": device_index},
+        )
+
+    def is_max_device(self, track_index: int, device_index: int):
+        """Check if device is a Max for Live device"""
+        return self._call(
+            "is_max_device",
+            {"track_index": track_index, "device_index": device_index},
+        )
+
+    def get_m4l_devices(self, track_index: int):
+        """Get all Max for Live devices on track"""
+        return self._call("get_m4l_devices", {"track_index": track_index})
+
+    def set_device_param_by_name(
+        self,
+        track_index: int,
+        device_index: int,
+        param_name: str,
+        value: float,
+    ):
+        """Set device parameter by name (delegates to set_device_parameter_by_name)"""
+        return self._call(
+            "set_device_param_by_name",
+            {
+                "track_index": track_index,
+                "device_index": device_index,
+                "param_name": param_name,
+                "value": value,
+            },
+        )
+
+    def get_m4l_param_by_name(self, track_index: int, device_index: int, param_name: str):
+        """Get M4L device parameter value by name"""
+        return self._call(
+            "get_m4l_param_by_name",
+            {"track_index": track_index, "device_index": device_index, "param_name": param_name},
+        )
+
+    def get_cv_tools_devices(self, track_index: int):
+        """Get all CV Tools devices on track (subset of M4L devices)"""
+        return self._call("get_cv_tools_devices", {"track_index": track_index})
+
+    def get_master_track_info(self):
+        """Get master track information"""
+        return self._call("get_master_track_info", {})
+
+    def set_master_volume(self, volume: float):
+        """Set master track volume (0.0 to 1.0)"""
+        return self._call("set_master_volume", {"volume": volume})
+
+    def set_master_pan(self, pan: float):
+        """Set master track pan (-1.0 to 1.0)"""
+        return self._call("set_master_pan", {"pan": pan})
+
+    def get_master_devices(self):
+        """Get all devices on master track"""
+        return self._call("get_master_devices", {})
+
+    def get_return_track_count(self):
+        """Get number of return tracks"""
+        return self._call("get_return_track_count", {})
+
+    def get_return_track_info(self, return_index: int):
+        """Get return track information"""
+        return self._call("get_return_track_info", {"return_index": return_index})
+
+    def set_return_track_volume(self, return_index: int, volume: float):
+        """Set return track volume"""
+        return self._call(
+            "set_return_track_volume",
+            {"return_index": return_index, "volume": volume},
+        )
+
+    def get_clip_warp_mode(self, track_index: int, clip_index: int):
+        """Get audio clip warp mode"""
+        return self._call(
+            "get_clip_warp_mode",
+            {"track_index": track_index, "clip_index": clip_index},
+        )
+
+    def set_clip_warp_mode(self, track_index: int, clip_index: int, warp_mode: int):
+        """Set audio clip warp mode (0-5: Beats, Tones, Texture, Re-Pitch, Complex, Complex Pro)"""
+        return self._call(
+            "set_clip_warp_mode",
+            {"track_index": track_index, "clip_index": clip_index, "warp_mode": warp_mode},
+        )
+
+    def get_clip_file_path(self, track_index: int, clip_index: int):
+        """Get audio clip file path"""
+        return self._call(
+            "get_clip_file_path",
+            {"track_index": track_index, "clip_index": clip_index},
+        )
+
+    def set_clip_warping(self, track_index: int, clip_index: int, warping: bool):
+        """Enable/disable warping for audio clip"""
+        return self._call(
+            "set_clip_warping",
+            {"track_index": track_index, "clip_index": clip_index, "warping": warping},
+        )
+
+    def get_warp_markers(self, track_index: int, clip_index: int):
+        """Get warp markers from audio clip"""
+        return self._call(
+            "get_warp_markers",
+            {"track_index": track_index, "clip_index": clip_index},
+        )
+
+    def get_clip_follow_action(self, track_index: int, clip_index: int):
+        """Get clip follow action settings"""
+        return self._call(
+            "get_clip_follow_action",
+            {"track_index": track_index, "clip_index": clip_index},
+        )
+
+    def set_clip_follow_action(
+        self,
+        track_index: int,
+        clip_index: int,
+        action_A: int,
+        action_B: int,
+        chance_A: float = 1.0,
+    ):
+        """Set clip follow action (0-8: Stop, Play Again, Previous, Next, First, Last, Any, Other, Jump)"""
+        return self._call(
+            "set_clip_follow_action",
+            {
+                "track_index": track_index,
+                "clip_index": clip_index,
+                "action_A": action_A,
+                "action_B": action_B,
+                "chance_A": chance_A,
+            },
+        )
+
+    def set_follow_action_time(self, track_index: int, clip_index: int, time_in_bars: float):
+        """Set follow action time in bars"""
+        return self._call(
+            "set_follow_action_time",
+            {"track_index": track_index, "clip_index": clip_index, "time_in_bars": time_in_bars},
+        )
+
+    def get_crossfader_assignment(self, track_index: int):
+        """Get track crossfader assignment (0=None, 1=A, 2=B)"""
+        return self._call("get_crossfader_assignment", {"track_index": track_index})
+
+    def set_crossfader_assignment(self, track_index: int, assignment: int):
+        """Set track crossfader assignment (0=None, 1=A, 2=B)"""
+        return self._call(
+            "set_crossfader_assignment",
+            {"track_index": track_index, "assignment": assignment},
+        )
+
+    def get_crossfader_position(self):
+        """Get master crossfader position (-1.0 to 1.0)"""
+        return self._call("get_crossfader_position", {})
+
+    def create_group_track(self, name=None):
+        """Create a new group track"""
+        return self._call("create_group_track", {"name": name})
+
+    def group_tracks(self, start_index: int, end_index: int):
+        """Group tracks from start_index to end_index (inclusive)"""
+        return self._call("group_tracks", {"start_index": start_index, "end_index": end_index})
+
+    def get_track_is_grouped(self, track_index: int):
+        """Check if track is part of a group"""
+        return self._call("get_track_is_grouped", {"track_index": track_index})
+
+    def ungroup_track(self, group_track_index: int):
+        """Ungroup a group track"""
+        return self._call("ungroup_track", {"group_track_index": group_track_index})
+
+    def show_clip_view(self):
+        """Show clip/session view"""
+        return self._call("show_clip_view", {})
+
+    def show_arrangement_view(self):
+        """Show arrangement view"""
+        return self._call("show_arrangement_view", {})
+
+    def focus_track(self, track_index: int):
+        """Focus/highlight a specific track in the view"""
+        return self._call("focus_track", {"track_index": track_index})
+
+    def scroll_view_to_time(self, time_in_beats: float):
+        """Scroll arrangement view to specific time"""
+        return self._call("scroll_view_to_time", {"time_in_beats": time_in_beats})
+
+    def get_clip_color(self, track_index: int, clip_index: int):
+        """Get clip color"""
+        return self._call("get_clip_color", {"track_index": track_index, "clip_index": clip_index})
+
+    def get_track_color(self, track_index: int):
+        """Get track color"""
+        return self._call("get_track_color", {"track_index": track_index})
+
+    def get_groove_pool_grooves(self):
+        """Get list of grooves in groove pool"""
+        return self._call("get_groove_pool_grooves", {})
+
+    def set_clip_groove(self, track_index: int, clip_index: int, groove_index: int):
+        """Set groove for clip"""
+        return self._call(
+            "set_clip_groove",
+            {"track_index": track_index, "clip_index": clip_index, "groove_index": groove_index},
+        )
+
+    def get_device_chains(self, track_index: int, device_index: int):
+        """Get chains from a rack device"""
+        return self._call(
+            "get_device_chains",
+            {"track_index": track_index, "device_index": device_index},
+        )
+
+    def get_chain_devices(self, track_index: int, device_index: int, chain_index: int):
+        """Get devices in a specific chain"""
+        return self._call(
+            "get_chain_devices",
+            {"track_index": track_index, "device_index": device_index, "chain_index": chain_index},
+        )
+
+    def set_chain_mute(self, track_index: int, device_index: int, chain_index: int, mute: bool):
+        """Mute/unmute a chain in a rack"""
+        return self._call(
+            "set_chain_mute",
+            {
+                "track_index": track_index,
+                "device_index": device_index,
+                "chain_index": chain_index,
+                "mute": mute,
+            },
+        )
+
+    def set_chain_solo(self, track_index: int, device_index: int, chain_index: int, solo: bool):
+        """Solo/unsolo a chain in a rack"""
+        return self._call(
+            "set_chain_solo",
+            {
+                "track_index": track_index,
+                "device_index": device_index,
+                "chain_index": chain_index,
+                "solo": solo,
+            },
+        )
+
+    def get_clip_automation_envelope(
+        self,
+        track_index: int,
+        clip_index: int,
+        device_index=None,
+        param_index=None,
+        param_ref=None,
+    ):
+        """Get automation envelope for a device or mixer parameter in a clip"""
+        return self._call(
+            "get_clip_automation_envelope",
+            {
+                "track_index": track_index,
+                "clip_index": clip_index,
+                "device_index": device_index,
+                "param_index": param_index,
+                "param_ref": param_ref,
+            },
+        )
+
+    def create_automation_envelope(
+        self,
+        track_index: int,
+        clip_index: int,
+        device_index=None,
+        param_index=None,
+        param_ref=None,
+    ):
+        """Create automation envelope for a device or mixer parameter"""
+        return self._call(
+            "create_automation_envelope",
+            {
+                "track_index": track_index,
+                "clip_index": clip_index,
+                "device_index": device_index,
+                "param_index": param_index,
+                "param_ref": param_ref,
+            },
+        )
+
+    def clear_automation_envelope(
+        self,
+        track_index: int,
+        clip_index: int,
+        device_index=None,
+        param_index=None,
+        param_ref=None,
+    ):
+        """Clear automation envelope for a device or mixer parameter"""
+        return self._call(
+            "clear_automation_envelope",
+            {
+                "track_index": track_index,
+                "clip_index": clip_index,
+                "device_index": device_index,
+                "param_index": param_index,
+                "param_ref": param_ref,
+            },
+        )
+
+    def insert_automation_step(
+        self,
+        track_index: int,
+        clip_index: int,
+        time: float,
+        value: float,
+        device_index=None,
+        param_index=None,
+        param_ref=None,
+        length: float = 0.0,
+    ):
+        """Insert automation step/breakpoint at specific time"""
+        return self._call(
+            "insert_automation_step",
+            {
+                "track_index": track_index,
+                "clip_index": clip_index,
+                "time": time,
+                "value": value,
+                "device_index": device_index,
+                "param_index": param_index,
+                "param_ref": param_ref,
+                "length": length,
+            },
+        )
+
+    def remove_automation_step(
+        self,
+        track_index: int,
+        clip_index: int,
+        time: float,
+        device_index=None,
+        param_index=None,
+        param_ref=None,
+    ):
+        """Remove automation step/breakpoint at specific time"""
+        return self._call(
+            "remove_automation_step",
+            {
+                "track_index": track_index,
+                "clip_index": clip_index,
+                "time": time,
+                "device_index": device_index,
+                "param_index": param_index,
+                "param_ref": param_ref,
+            },
+        )
+
+    def get_automation_envelope_values(
+        self,
+        track_index: int,
+        clip_index: int,
+        device_index=None,
+        param_index=None,
+        param_ref=None,
+        mode: str = "samples",
+        time_range=None,
+        resolution=None,
+        max_points: int = 256,
+    ):
+        """Get a clip automation envelope as time/value arrays"""
+        return self._call(
+            "get_automation_envelope_values",
+            {
+                "track_index": track_index,
+                "clip_index": clip_index,
+                "device_index": device_index,
+                "param_index": param_index,
+                "param_ref": param_ref,
+                "mode": mode,
+                "time_range": time_range,
+                "resolution": resolution,
+                "max_points": max_points,
+            },
+        )
+
+    def write_automation_curve(
+        self,
+        track_index: int,
+        clip_index: int,
+        device_index=None,
+        param_index=None,
+        param_ref=None,
+        times=None,
+        values=None,
+        shape=None,
+        time_range=None,
+        resolution=None,
+        hold: bool = False,
+    ):
+        """Write a whole automation curve to a clip envelope, replacing the target range"""
+        return self._call(
+            "write_automation_curve",
+            {
+                "track_index": track_index,
+                "clip_index": clip_index,
+                "device_index": device_index,
+                "param_index": param_index,
+                "param_ref": param_ref,
+                "times": times,
+                "values": values,
+                "shape": shape,
+                "time_range": time_range,
+                "resolution": resolution,
+                "hold": hold,
+            },
+        )
+
+    def freeze_track(self, track_index: int):
+        """Freeze a track to reduce CPU usage"""
+        return self._call("freeze_track", {"track_index": track_index})
+
+    def unfreeze_track(self, track_index: int):
+        """Unfreeze a frozen track"""
+        return self._call("unfreeze_track", {"track_index": track_index})
+
+    def flatten_track(self, track_index: int):
+        """Flatten a frozen track (converts to audio)"""
+        return self._call("flatten_track", {"track_index": track_index})
+
+    def get_clip_fade_in(self, track_index: int, clip_index: int):
+        """Get clip fade in time"""
+        return self._call(
+            "get_clip_fade_in",
+            {"track_index": track_index, "clip_index": clip_index},
+        )
+
+    def set_clip_fade_in(self, track_index: int, clip_index: int, fade_time: float):
+        """Set clip fade in time"""
+        return self._call(
+            "set_clip_fade_in",
+            {"track_index": track_index, "clip_index": clip_index, "fade_time": fade_time},
+        )
+
+    def get_clip_fade_out(self, track_index: int, clip_index: int):
+        """Get clip fade out time"""
+        return self._call(
+            "get_clip_fade_out",
+            {"track_index": track_index, "clip_index": clip_index},
+        )
+
+    def set_clip_fade_out(self, track_index: int, clip_index: int, fade_time: float):
+        """Set clip fade out time"""
+        return self._call(
+            "set_clip_fade_out",
+            {"track_index": track_index, "clip_index": clip_index, "fade_time": fade_time},
+        )
+
+    def get_scene_color(self, scene_index: int):
+        """Get scene color index"""
+        return self._call("get_scene_color", {"scene_index": scene_index})
+
+    def set_scene_color(self, scene_index: int, color_index: int):
+        """Set scene color index"""
+        return self._call(
+            "set_scene_color",
+            {"scene_index": scene_index, "color_index": color_index},
+        )
+
+    def get_track_annotation(self, track_index: int):
+        """Get track annotation text"""
+        return self._call("get_track_annotation", {"track_index": track_index})
+
+    def set_track_annotation(self, track_index: int, annotation_text: str):
+        """Set track annotation text"""
+        return self._call(
+            "set_track_annotation",
+            {"track_index": track_index, "annotation_text": annotation_text},
+        )
+
+    def get_clip_annotation(self, track_index: int, clip_index: int):
+        """Get clip annotation text"""
+        return self._call(
+            "get_clip_annotation",
+            {"track_index": track_index, "clip_index": clip_index},
+        )
+
+    def set_clip_annotation(self, track_index: int, clip_index: int, annotation_text: str):
+        """Set clip annotation text"""
+        return self._call(
+            "set_clip_annotation",
+            {
+                "track_index": track_index,
+                "clip_index": clip_index,
+                "annotation_text": annotation_text,
+            },
+        )
+
+    def get_track_delay(self, track_index: int):
+        """Get track delay compensation in samples"""
+        return self._call("get_track_delay", {"track_index": track_index})
+
+    def set_track_delay(self, track_index: int, delay_samples: float):
+        """Set track delay compensation in samples"""
+        return self._call(
+            "set_track_delay",
+            {"track_index": track_index, "delay_samples": delay_samples},
+        )
+
+    def get_arrangement_clips(self, track_index: int):
+        """Get list of clips in arrangement view for a track"""
+        return self._call("get_arrangement_clips", {"track_index": track_index})
+
+    def query_arrangement(
+        self,
+        time_from: float,
+        time_to: float,
+        tracks=None,
+        refresh: bool = False,
+    ):
+        """Get the arrangement clips and locators overlapping a time window"""
+        return self._call(
+            "query_arrangement",
+            {"time_from": time_from, "time_to": time_to, "tracks": tracks, "refresh": refresh},
+        )
+
+    def duplicate_to_arrangement(self, track_index: int, clip_index: int):
+        """Duplicate session clip to arrangement view"""
+        return self._call(
+            "duplicate_to_arrangement",
+            {"track_index": track_index, "clip_index": clip_index},
+        )
+
+    def consolidate_clip(self, track_index: int, start_time: float, end_time: float):
+        """Consolidate arrangement clips in time range"""
+        return self._call(
+            "consolidate_clip",
+            {"track_index": track_index, "start_time": start_time, "end_time": end_time},
+        )
+
+    def show_plugin_window(self, track_index: int, device_index: int):
+        """Show device/plugin window"""
+        return self._call(
+            "show_plugin_window",
+            {"track_index": track_index, "device_index": device_index},
+        )
+
+    def hide_plugin_window(self, track_index: int, device_index: int):
+        """Hide device/plugin window"""
+        return self._call(
+            "hide_plugin_window",
+            {"track_index": track_index, "device_index": device_index},
+        )
+
+    def get_metronome_volume(self):
+        """Get metronome volume"""
+        return self._call("get_metronome_volume", {})
+
+    def set_metronome_volume(self, volume: float):
+        """Set metronome volume (0.0 to 1.0)"""
+        return self._call("set_metronome_volume", {"volume": volume})
+
+    def send_midi_cc(self, track_index: int, cc_number: int, cc_value: int, channel: int = 0):
+        """Send MIDI CC message to a track"""
+        return self._call(
+            "send_midi_cc",
+            {
+                "track_index": track_index,
+                "cc_number": cc_number,
+                "cc_value": cc_value,
+                "channel": channel,
+            },
+        )
+
+    def send_program_change(self, track_index: int, program_number: int, channel: int = 0):
+        """Send MIDI Program Change message to a track"""
+        return self._call(
+            "send_program_change",
+            {"track_index": track_index, "program_number": program_number, "channel": channel},
+        )
+
+    def get_sample_length(self, track_index: int, clip_index: int):
+        """Get audio sample length for a clip"""
+        return self._call(
+            "get_sample_length",
+            {"track_index": track_index, "clip_index": clip_index},
+        )
+
+    def get_sample_playback_mode(self, track_index: int, device_index: int):
+        """Get Simpler/Sampler playback mode"""
+        return self._call(
+            "get_sample_playback_mode",
+            {"track_index": track_index, "device_index": device_index},
+        )
+
+    def set_sample_playback_mode(self, track_index: int, device_index: int, mode: int):
+        """Set Simpler/Sampler playback mode"""
+        return self._call(
+            "set_sample_playback_mode",
+            {"track_index": track_index, "device_index": device_index, "mode": mode},
+        )
+
+    def get_clip_ram_mode(self, track_index: int, clip_index: int):
+        """Get clip RAM mode setting"""
+        return self._call(
+            "get_clip_ram_mode",
+            {"track_index": track_index, "clip_index": clip_index},
+        )
+
+    def set_clip_ram_mode(self, track_index: int, clip_index: int, ram_mode: bool):
+        """Set clip RAM mode (load into RAM vs stream from disk)"""
+        return self._call(
+            "set_clip_ram_mode",
+            {"track_index": track_index, "clip_index": clip_index, "ram_mode": ram_mode},
+        )
+
+    def get_device_class_name(self, track_index: int, device_index: int):
+        """Get device class name (e.g., 'OriginalSimpler', 'Compressor2')"""
+        return self._call(
+            "get_device_class_name",
+            {"track_index": track_index, "device_index": device_index},
+        )
+
+    def get_device_type(self, track_index: int, device_index: int):
+        """Get device type (audio_effect, instrument, midi_effect)"""
+        return self._call(
+            "get_device_type",
+            {"track_index": track_index, "device_index": device_index},
+        )
+
+    def get_take_lanes(self, track_index: int):
+        """Get all take lanes for a track (Live 12+)"""
+        return self._call("get_take_lanes", {"track_index": track_index})
+
+    def create_take_lane(self, track_index: int, name=None):
+        """Create new take lane on a track (Live 12+)"""
+        return self._call("create_take_lane", {"track_index": track_index, "name": name})
+
+    def get_take_lane_name(self, track_index: int, lane_index: int):
+        """Get take lane name (Live 12+)"""
+        return self._call(
+            "get_take_lane_name",
+            {"track_index": track_index, "lane_index": lane_index},
+        )
+
+    def set_take_lane_name(self, track_index: int, lane_index: int, name: str):
+        """Set take lane name (Live 12+)"""
+        return self._call(
+            "set_take_lane_name",
+            {"track_index": track_index, "lane_index": lane_index, "name": name},
+        )
+
+    def create_audio_clip_in_lane(self, track_index: int, lane_index: int, length: float = 4.0):
+        """Create audio clip in take lane (Live 12+)"""
+        return self._call(
+            "create_audio_clip_in_lane",
+            {"track_index": track_index, "lane_index": lane_index, "length": length},
+        )
+
+    def create_midi_clip_in_lane(self, track_index: int, lane_index: int, length: float = 4.0):
+        """Create MIDI clip in take lane (Live 12+)"""
+        return self._call(
+            "create_midi_clip_in_lane",
+            {"track_index": track_index, "lane_index": lane_index, "length": length},
+        )
+
+    def get_clips_in_take_lane(self, track_index: int, lane_index: int):
+        """Get all clips in a take lane (Live 12+)"""
+        return self._call(
+            "get_clips_in_take_lane",
+            {"track_index": track_index, "lane_index": lane_index},
+        )
+
+    def delete_take_lane(self, track_index: int, lane_index: int):
+        """Delete a take lane (Live 12+)"""
+        return self._call(
+            "delete_take_lane",
+            {"track_index": track_index, "lane_index": lane_index},
+        )
+
+    def get_build_id(self):
+        """Get Ableton Live build identifier (Live 12+)"""
+        return self._call("get_build_id", {})
+
+    def get_variant(self):
+        """Get Ableton Live variant (Suite, Standard, Intro) (Live 12+)"""
+        return self._call("get_variant", {})
+
+    def show_message_box(self, message: str, title: str = "Message"):
+        """Show message box dialog to user (Live 12+)"""
+        return self._call("show_message_box", {"message": message, "title": title})
+
+    def get_application_version(self):
+        """Get full Ableton Live version information"""
+        return self._call("get_application_version", {})
+
+    def get_device_param_display_value(self, track_index: int, device_index: int, param_index: int):
+        """Get device parameter value as displayed in UI (Live 12+)"""
+        return self._call(
+            "get_device_param_display_value",
+            {"track_index": track_index, "device_index": device_index, "param_index": param_index},
+        )
+
+    def get_all_param_display_values(self, track_index: int, device_index: int):
+        """Get all device parameter display values (Live 12+)"""
+        return self._call(
+            "get_all_param_display_values",
+            {"track_index": track_index, "device_index": device_index},
+        )
+
+    def get_clip_start_time(self, track_index: int, clip_index: int):
+        """Get clip start time (observable in Live 12+)"""
+        return self._call(
+            "get_clip_start_time",
+            {"track_index": track_index, "clip_index": clip_index},
+        )
+
+    def set_clip_start_time(self, track_index: int, clip_index: int, start_time: float):
+        """Set clip start time"""
+        return self._call(
+            "set_clip_start_time",
+            {"track_index": track_index, "clip_index": clip_index, "start_time": start_time},
+        )
+
+    def get_track_is_foldable(self, track_index: int):
+        """Check if track can be folded (group tracks)"""
+        return self._call("get_track_is_foldable", {"track_index": track_index})
+
+    def get_track_is_frozen(self, track_index: int):
+        """Check if track is currently frozen"""
+        return self._call("get_track_is_frozen", {"track_index": track_index})
+
+    def get_scene_is_empty(self, scene_index: int):
+        """Check if scene has no clips"""
+        return self._call("get_scene_is_empty", {"scene_index": scene_index})
+
+    def get_scene_tempo(self, scene_index: int):
+        """Get scene tempo override (if set)"""
+        return self._call("get_scene_tempo", {"scene_index": scene_index})
+
+    def get_arrangement_overdub(self):
+        """Get arrangement overdub state"""
+        return self._call("get_arrangement_overdub", {})
+
+    def set_record_mode(self, mode: int):
+        """Set session/arrangement record mode (0=session, 1=arrangement)"""
+        return self._call("set_record_mode", {"mode": mode})
+
+    def get_signature_numerator(self):
+        """Get global time signature numerator"""
+        return self._call("get_signature_numerator", {})
+
+    def get_signature_denominator(self):
+        """Get global time signature denominator"""
+        return self._call("get_signature_denominator", {})
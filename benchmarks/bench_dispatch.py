@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: per-command dispatch overhead in _process_command.
+
+Compares the original getattr-based dispatch (getattr over the LiveAPITools
+MRO, the params and alias dicts rebuilt per command, the full tool list in
+every unknown-action reply) with the dispatch table built at startup.
+
+Each command is timed three ways on the real ALiveMCP, with the tools
+replaced by no-op stubs that keep the real signatures and MRO depth, so the
+numbers are dispatch cost alone:
+  direct   the stub's bound method called with ready-made kwargs
+  legacy   the pre-table _process_command
+  table    the current _process_command
+Overhead is each dispatcher's time minus the direct call. Unknown actions
+are no longer dispatched on the main thread at all (the socket thread
+rejects them), so they are not timed here.
+
+Usage:
+    python benchmarks/bench_dispatch.py [--iterations N] [--json]
+"""
+
+import argparse
+import functools
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.mock_live import MockControlSurface, build_song, make_live_module  # noqa: E402
+
+sys.modules.setdefault("Live", make_live_module())
+
+from ALiveMCP_Remote import PARAM_ALIASES, SCRIPT_ACTIONS  # noqa: E402
+from benchmarks.mock_live.harness import _script_class  # noqa: E402
+
+COMMANDS = [
+    {"action": "ping"},
+    {"action": "get_current_time"},
+    {"action": "set_tempo", "bpm": 128.0},
+    {"action": "get_clip_info", "track_index": 0, "scene_index": 0},
+    {"action": "set_device_param", "track_index": 1, "device_index": 0, "param_index": 2,
+     "value": 0.5},
+]  # fmt: skip
+
+
+def legacy_process_command(script, command):
+    """_process_command as it was before the dispatch table (pre user-038)"""
+    action = command.get("action", "")
+    if action == "ping":
+        return script.ping()
+    if action in SCRIPT_ACTIONS:
+        params = {k: v for k, v in command.items() if k != "action"}
+        return getattr(script, action)(**params)
+
+    method = getattr(script.tools, action, None)
+    if method is None:
+        return {
+            "ok": False,
+            "error": "Unknown action: " + action,
+            "available_actions": script.tools.get_available_tools(),
+        }
+
+    params = {k: v for k, v in command.items() if k != "action"}
+    action_aliases = PARAM_ALIASES.get(action, {})
+    params = {action_aliases.get(k, k): v for k, v in params.items()}
+    return method(**params)
+
+
+def _stub_tools(script):
+    """Swap the tools' class for a subclass whose benchmarked methods do nothing"""
+    tools_class = type(script.tools)
+    stubs = {}
+    for command in COMMANDS:
+        action = command["action"]
+        real = getattr(tools_class, action, None)
+        if real is not None:
+            stubs[action] = functools.wraps(real)(lambda self, *args, **kwargs: {"ok": True})
+    script.tools.__class__ = type("StubTools", (tools_class,), stubs)
+    script.rebuild_dispatch_table()
+
+
+def _direct_call(script, command):
+    """The tool call alone, with the handler and kwargs resolved up front"""
+    entry = script.dispatch_table.get(command["action"])
+    if entry is None:
+        return lambda: None
+    params = {k: v for k, v in command.items() if k != "action"}
+    for legacy, canonical in entry.aliases.items():
+        if legacy in params:
+            params[canonical] = params.pop(legacy)
+    handler = entry.handler
+    return lambda: handler(**params)
+
+
+def _time(func, iterations):
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / iterations * 1e9
+
+
+def run(iterations):
+    song = build_song(tracks=2, scenes=1)
+    script = _script_class(0)(MockControlSurface(song))
+    _stub_tools(script)
+    results = []
+    try:
+        for command in COMMANDS:
+            direct = _time(_direct_call(script, command), iterations)
+            legacy = _time(lambda c=command: legacy_process_command(script, c), iterations)
+            table = _time(lambda c=command: script._process_command(c), iterations)
+            results.append(
+                {
+                    "action": command["action"],
+                    "direct_ns": round(direct),
+                    "legacy_overhead_ns": round(legacy - direct),
+                    "table_overhead_ns": round(table - direct),
+                }
+            )
+    finally:
+        script.disconnect()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = run(args.iterations)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"{'action':<20} {'direct ns':>10} {'legacy +ns':>11} {'table +ns':>10} {'saved':>7}")
+    for r in results:
+        legacy, table = r["legacy_overhead_ns"], r["table_overhead_ns"]
+        saved = f"{1 - table / legacy:>6.0%}" if legacy > 0 else "     -"
+        print(f"{r['action']:<20} {r['direct_ns']:>10} {legacy:>11} {table:>10} {saved:>7}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
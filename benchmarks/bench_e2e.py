@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+End-to-end throughput and latency benchmark.
+
+Runs the real ALiveMCP socket server and update_display() loop over the
+mock Live engine (benchmarks/mock_live) and drives it with representative
+workloads through alivemcp_client:
+
+  read_polling        pipelined get_session_info / get_track_info polling
+  fader_streams       rapid set_track_volume / set_device_param writes
+  bulk_notes          add_notes with 128 notes per call
+  session_snapshot    session info + every track's info as one batch
+  concurrent_clients  8 clients making blocking calls in parallel
+
+Each workload reports ops/sec and p50/p95/p99/max latency. Results can be
+written as JSON and compared against a previous run:
+
+    python benchmarks/bench_e2e.py --output results/HEAD.json
+    python benchmarks/bench_e2e.py --compare results/main.json --max-regression 0.1
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from alivemcp_client import AliveMCPClient  # noqa: E402
+from benchmarks.mock_live import LiveHarness  # noqa: E402
+from benchmarks.workloads import WORKLOADS  # noqa: E402
+
+
+def _git(*args):
+    try:
+        out = subprocess.run(
+            ["git", *args], cwd=ROOT, capture_output=True, text=True, timeout=10, check=True
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _shed_count(live):
+    client = AliveMCPClient(port=live.port)
+    try:
+        return client.call("health_check")["backpressure"]["shed_overloaded"]
+    finally:
+        client.close()
+
+
+def run(args):
+    set_shape = {
+        "tracks": args.tracks,
+        "scenes": args.scenes,
+        "devices_per_track": args.devices,
+        "params_per_device": args.params,
+        "clip_fill": 1.0,
+        "notes_per_clip": args.notes,
+        "latency_us": args.latency_us,
+    }
+    meta = {
+        "commit": _git("rev-parse", "HEAD"),
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scale": args.scale,
+        "tick_hz": args.tick_hz,
+        "set": set_shape,
+    }
+
+    results = {}
+    with LiveHarness(tick_hz=args.tick_hz, **set_shape) as live:
+        # Importable only once the harness has installed the Live stub
+        from ALiveMCP_Remote.constants import MAX_COMMANDS_PER_TICK
+
+        meta["max_commands_per_tick"] = MAX_COMMANDS_PER_TICK
+        for name, (workload, base_ops) in WORKLOADS.items():
+            if args.only and name not in args.only:
+                continue
+            overruns, shed = live.tick_overruns, _shed_count(live)
+            summary = workload(live, max(1, int(base_ops * args.scale)))
+            summary["tick_overruns"] = live.tick_overruns - overruns
+            summary["shed_overloaded"] = _shed_count(live) - shed
+            results[name] = summary
+            if not args.quiet:
+                _print_row(name, summary)
+    return {"meta": meta, "workloads": results}
+
+
+def _print_row(name, s):
+    print(
+        f"{name:<20} {s['ops']:>6} ops {s['ops_per_sec']:>9.1f}/s  "
+        f"p50 {s['p50_ms']:>8.2f}  p95 {s['p95_ms']:>8.2f}  p99 {s['p99_ms']:>8.2f} ms"
+        f"  errors {s['errors']}"
+    )
+
+
+def compare(current, baseline, max_regression):
+    """Print per-workload deltas; returns the names that regressed beyond max_regression"""
+    regressed = []
+    print(f"\n{'workload':<20} {'ops/s':>10} {'base':>10} {'Δ':>8}   {'p95 ms':>8} {'base':>8}")
+    for name, now in current["workloads"].items():
+        before = baseline.get("workloads", {}).get(name)
+        if not before or not before["ops_per_sec"]:
+            continue
+        change = now["ops_per_sec"] / before["ops_per_sec"] - 1
+        print(
+            f"{name:<20} {now['ops_per_sec']:>10.1f} {before['ops_per_sec']:>10.1f} "
+            f"{change:>+7.1%}   {now['p95_ms']:>8.2f} {before['p95_ms']:>8.2f}"
+        )
+        if max_regression is not None and change < -max_regression:
+            regressed.append(name)
+    return regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="End-to-end ALiveMCP benchmark")
+    parser.add_argument("--tracks", type=int, default=100)
+    parser.add_argument("--scenes", type=int, default=16)
+    parser.add_argument("--devices", type=int, default=3, help="devices per track")
+    parser.add_argument("--params", type=int, default=16, help="parameters per device")
+    parser.add_argument("--notes", type=int, default=16, help="notes per pre-filled clip")
+    parser.add_argument("--latency-us", type=float, default=0.0, help="cost of each LOM call")
+    parser.add_argument("--tick-hz", type=float, default=60.0)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply operation counts")
+    parser.add_argument("--only", nargs="*", choices=sorted(WORKLOADS), help="run these only")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--compare", help="baseline JSON to compare against")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=None,
+        help="exit 1 if any workload's ops/sec drops by more than this fraction",
+    )
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = run(args)
+
+    if args.output:
+        path = Path(args.output)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        if not args.quiet:
+            print(f"Wrote {path}")
+    elif args.quiet:
+        print(json.dumps(results, indent=2))
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        regressed = compare(results, baseline, args.max_regression)
+        if regressed:
+            print("Regressed: " + ", ".join(regressed))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: socket-thread ↔ main-thread response handoff.
+
+Compares the original scheme (a fresh queue.Queue per request, registered in a
+shared dict under a lock, with a locked integer counter for request IDs) with
+the current one (one SimpleQueue response channel per connection and
+itertools.count for request IDs).
+
+Two measurements are taken for each scheme:
+  inline     – both halves of the handoff on one thread (pure bookkeeping cost)
+  threaded   – a consumer thread plays the part of update_display()
+
+Usage:
+    python benchmarks/bench_handoff.py [--requests N] [--json]
+"""
+
+import argparse
+import itertools
+import json
+import queue
+import threading
+import time
+
+
+class LegacyHandoff:
+    """Per-request Queue + shared dict + request_lock (pre user-027)."""
+
+    def __init__(self):
+        self.command_queue = queue.Queue()
+        self.response_queues = {}
+        self.request_counter = 0
+        self.request_lock = threading.Lock()
+
+    def submit(self, command):
+        with self.request_lock:
+            request_id = self.request_counter
+            self.request_counter += 1
+            self.response_queues[request_id] = queue.Queue()
+        self.command_queue.put((request_id, command))
+        return request_id
+
+    def serve_one(self):
+        request_id, command = self.command_queue.get()
+        if request_id in self.response_queues:
+            self.response_queues[request_id].put(command)
+
+    def wait(self, request_id):
+        response = self.response_queues[request_id].get(timeout=5.0)
+        with self.request_lock:
+            if request_id in self.response_queues:
+                del self.response_queues[request_id]
+        return response
+
+
+class ChannelHandoff:
+    """One SimpleQueue per connection + itertools.count (current)."""
+
+    def __init__(self):
+        self.command_queue = queue.Queue()
+        self.request_ids = itertools.count()
+        self.channel = queue.SimpleQueue()
+
+    def submit(self, command):
+        request_id = next(self.request_ids)
+        self.command_queue.put((request_id, command, self.channel))
+        return request_id
+
+    def serve_one(self):
+        request_id, command, channel = self.command_queue.get()
+        channel.put((request_id, command))
+
+    def wait(self, request_id):
+        while True:
+            answered_id, response = self.channel.get(timeout=5.0)
+            if answered_id == request_id:
+                return response
+
+
+def bench_inline(handoff_cls, requests):
+    handoff = handoff_cls()
+    command = {"action": "ping"}
+    start = time.perf_counter()
+    for _ in range(requests):
+        request_id = handoff.submit(command)
+        handoff.serve_one()
+        handoff.wait(request_id)
+    return time.perf_counter() - start
+
+
+def bench_threaded(handoff_cls, requests):
+    handoff = handoff_cls()
+    command = {"action": "ping"}
+
+    def consumer():
+        for _ in range(requests):
+            handoff.serve_one()
+
+    worker = threading.Thread(target=consumer, daemon=True)
+    worker.start()
+    start = time.perf_counter()
+    for _ in range(requests):
+        handoff.wait(handoff.submit(command))
+    elapsed = time.perf_counter() - start
+    worker.join()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--requests", type=int, default=50000)
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args()
+
+    results = {}
+    for mode, fn in (("inline", bench_inline), ("threaded", bench_threaded)):
+        for name, cls in (("legacy", LegacyHandoff), ("channel", ChannelHandoff)):
+            elapsed = fn(cls, args.requests)
+            results[mode + "/" + name] = {
+                "requests": args.requests,
+                "seconds": elapsed,
+                "us_per_request": elapsed / args.requests * 1e6,
+            }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'handoff':<20} {'µs/request':>14}")
+    for key, row in results.items():
+        print(f"{key:<20} {row['us_per_request']:>14.2f}")
+    for mode in ("inline", "threaded"):
+        legacy = results[mode + "/legacy"]["us_per_request"]
+        channel = results[mode + "/channel"]["us_per_request"]
+        print(f"{mode} speed-up: {legacy / channel:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+"""
+Scalable mock of Ableton Live for load tests and benchmarks.
+
+    lom.py        fake LOM classes with per-call latency injection and call counting
+    notes.py      clip note storage, including the Live 11+ note-ID API
+    envelopes.py  clip automation envelopes
+    listeners.py  add_/remove_<prop>_listener for tracks, cue points and arrangement clips
+    song.py       build_song(): a Song of any size; make_live_module(): `Live` stub
+    harness.py    LiveHarness: the real ALiveMCP over a mock Song, ticked at 60 Hz
+"""
+
+from .harness import LiveHarness, MockControlSurface
+from .lom import LomCost
+from .song import build_song, make_live_module
+
+__all__ = ["LiveHarness", "LomCost", "MockControlSurface", "build_song", "make_live_module"]
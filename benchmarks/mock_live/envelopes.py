@@ -0,0 +1,70 @@
+"""
+Clip automation envelopes for the mock Clip, modelled on Live's
+AutomationEnvelope: breakpoints joined by straight lines, read back with
+value_at_time() and written with insert_step(time, length, value).
+"""
+
+import bisect
+
+
+class AutomationEnvelope:
+    def __init__(self, value):
+        # Breakpoints in time order, as parallel lists; an envelope starts flat at
+        # value. Two points at the same time are a vertical jump: the first is the
+        # value just before it, the last the value from then on.
+        self._times = [0.0]
+        self._values = [float(value)]
+
+    def value_at_time(self, time):
+        times, values = self._times, self._values
+        index = bisect.bisect_right(times, time)
+        if index == 0:
+            return values[0]
+        if index == len(times):
+            return values[-1]
+        t0, t1 = times[index - 1], times[index]
+        v0, v1 = values[index - 1], values[index]
+        return v0 + (v1 - v0) * (time - t0) / (t1 - t0)
+
+    def insert_step(self, time, length, value):
+        """
+        Hold value from time to time + length, replacing the breakpoints in
+        between. The values just before and just after the step are kept, so
+        adjacent steps meet with a jump. A zero-length step is a breakpoint.
+        """
+        end = time + length
+        times, values = self._times, self._values
+        first = bisect.bisect_left(times, time)
+        last = bisect.bisect_right(times, end)
+        if length > 0:
+            # Keep the values leading into and out of the step
+            keep_before = first + 1 if first < last and times[first] == time else first
+            keep_after = last - 1 if last > keep_before and times[last - 1] == end else last
+            inserted = [(time, value), (end, value)]
+        else:
+            # Replace the value from time on, keeping the one before a jump there
+            keep_before = first + 1 if last - first > 1 else first
+            keep_after, inserted = last, [(time, value)]
+        self._times = times[:keep_before] + [t for t, _ in inserted] + times[keep_after:]
+        self._values = values[:keep_before] + [float(v) for _, v in inserted] + values[keep_after:]
+
+
+class EnvelopeStore:
+    """Envelope methods of Clip, one envelope per DeviceParameter"""
+
+    def init_envelopes(self):
+        self._envelopes = {}
+
+    def automation_envelope(self, parameter):
+        return self._envelopes.get(id(parameter))
+
+    def create_automation_envelope(self, parameter):
+        envelope = AutomationEnvelope(object.__getattribute__(parameter, "value"))
+        self._envelopes[id(parameter)] = envelope
+        return envelope
+
+    def clear_envelope(self, parameter):
+        self._envelopes.pop(id(parameter), None)
+
+    def clear_all_envelopes(self):
+        self._envelopes.clear()
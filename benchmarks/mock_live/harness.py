@@ -0,0 +1,160 @@
+"""
+Run the real ALiveMCP Remote Script in-process against the mock LOM.
+
+LiveHarness installs a `Live` stub, builds a mock Song and creates ALiveMCP
+listening on a TCP port of your choice (0 picks a free one). A tick thread
+then plays the part of Live's main thread, calling update_display() at
+60 Hz. Clients connect exactly as they would to Live:
+
+    with LiveHarness(tracks=100, scenes=16, latency_us=20) as live:
+        client = AliveMCPClient(port=live.port)
+
+It can also stand in for Live as a long-running mock server:
+
+    python -m benchmarks.mock_live --tracks 100 --scenes 16 --port 9004
+"""
+
+import argparse
+import sys
+import threading
+import time
+
+from .song import build_song, make_live_module
+
+TICK_HZ = 60.0
+
+
+class MockControlSurface:
+    """The c_instance object Live hands to create_instance()"""
+
+    def __init__(self, song, verbose=False):
+        self._song = song
+        self.verbose = verbose
+        self.messages = []
+
+    def song(self):
+        return self._song
+
+    def log_message(self, message):
+        self.messages.append(message)
+        if self.verbose:
+            print(message)
+
+    def show_message(self, message):
+        pass
+
+
+def _script_class(port):
+    from ALiveMCP_Remote import ALiveMCP
+
+    class HarnessedALiveMCP(ALiveMCP):
+        def start_socket_server(self, port=port):
+            super().start_socket_server(port)
+
+    return HarnessedALiveMCP
+
+
+class LiveHarness:
+    """ALiveMCP + mock Song + a 60 Hz tick thread standing in for Live's main thread"""
+
+    def __init__(self, port=0, tick_hz=TICK_HZ, verbose=False, **song_options):
+        self.song = build_song(**song_options)
+        self.cost = self.song._cost
+        self.requested_port = port
+        self.tick_interval = 1.0 / tick_hz
+        self.verbose = verbose
+        self.script = None
+        self.port = None
+        self.ticks = 0
+        self.tick_overruns = 0
+        self._stop = threading.Event()
+        self._ticker = None
+
+    def start(self):
+        if "Live" not in sys.modules:
+            sys.modules["Live"] = make_live_module()
+
+        surface = MockControlSurface(self.song, self.verbose)
+        self.script = _script_class(self.requested_port)(surface)
+        self.port = self.script.socket_server.getsockname()[1]
+        if not self.port:
+            self.script.disconnect()
+            raise RuntimeError("ALiveMCP failed to start: " + " | ".join(surface.messages))
+
+        self._stop.clear()
+        self._ticker = threading.Thread(target=self._tick_loop, name="mock-live-main", daemon=True)
+        self._ticker.start()
+        return self
+
+    def _tick_loop(self):
+        """Call update_display() on a fixed schedule, like Live's UI timer"""
+        next_tick = time.perf_counter()
+        while not self._stop.is_set():
+            self.script.update_display()
+            self.ticks += 1
+            next_tick += self.tick_interval
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                self._stop.wait(delay)
+            else:
+                # The tick ran past its slot; skip ahead rather than bursting to catch up
+                self.tick_overruns += 1
+                next_tick = time.perf_counter()
+
+    def stop(self):
+        self._stop.set()
+        if self._ticker is not None:
+            self._ticker.join()
+            self._ticker = None
+        if self.script is not None:
+            self.script.disconnect()
+            self.script = None
+
+    def stats(self):
+        return {
+            "ticks": self.ticks,
+            "tick_overruns": self.tick_overruns,
+            "lom_calls": sum(self.cost.calls.values()),
+        }
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve ALiveMCP over a mock Live set")
+    parser.add_argument("--port", type=int, default=9004)
+    parser.add_argument("--tracks", type=int, default=100)
+    parser.add_argument("--scenes", type=int, default=16)
+    parser.add_argument("--devices", type=int, default=3, help="devices per track")
+    parser.add_argument("--params", type=int, default=16, help="parameters per device")
+    parser.add_argument("--clip-fill", type=float, default=0.5)
+    parser.add_argument("--notes", type=int, default=32, help="notes per clip")
+    parser.add_argument("--latency-us", type=float, default=0.0, help="cost of each LOM call")
+    parser.add_argument("--tick-hz", type=float, default=TICK_HZ)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    harness = LiveHarness(
+        port=args.port,
+        tick_hz=args.tick_hz,
+        verbose=args.verbose,
+        tracks=args.tracks,
+        scenes=args.scenes,
+        devices_per_track=args.devices,
+        params_per_device=args.params,
+        clip_fill=args.clip_fill,
+        notes_per_clip=args.notes,
+        latency_us=args.latency_us,
+    )
+    with harness:
+        print(f"Mock Live ({args.tracks} tracks x {args.scenes} scenes) on port {harness.port}")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+        print(harness.stats())
@@ -0,0 +1,34 @@
+"""
+LOM-style property listeners for the mock objects:
+add_<prop>_listener, remove_<prop>_listener and <prop>_has_listener.
+"""
+
+import collections
+
+
+class ListenerStore:
+    """Listener registry of one object; _notify(prop) calls that property's listeners"""
+
+    def init_listeners(self):
+        self._listeners = collections.defaultdict(list)
+
+    def _notify(self, prop):
+        for callback in list(self._listeners[prop]):
+            callback()
+
+
+def listener_methods(prop):
+    """The (add, remove, has) listener methods for prop, to assign in a class body"""
+
+    def add(self, callback):
+        if callback in self._listeners[prop]:
+            raise RuntimeError("Listener already connected")
+        self._listeners[prop].append(callback)
+
+    def remove(self, callback):
+        self._listeners[prop].remove(callback)
+
+    def has(self, callback):
+        return callback in self._listeners[prop]
+
+    return add, remove, has
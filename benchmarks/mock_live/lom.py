@@ -0,0 +1,244 @@
+"""
+In-process stand-in for Live's object model (LOM), sized like a real set.
+
+The classes here are plain Python objects that behave like the LOM for the
+calls LiveAPITools makes; song.py assembles them into a Song of any size. Every public attribute read
+or write and every method lookup goes through a shared LomCost, which can:
+
+  * inject a fixed per-call latency (busy-wait, so microseconds are honoured)
+    to model the cost of crossing into Live's C++ object model, and
+  * count calls per "Class.attribute" for profiling.
+
+Unsupported LOM features simply raise AttributeError, which the tools
+already turn into {"ok": False, ...} replies.
+"""
+
+import collections
+import time
+
+from .envelopes import EnvelopeStore
+from .listeners import ListenerStore, listener_methods
+from .notes import NoteStore
+
+
+class LomCost:
+    """Per-call cost model and call counter shared by every object of one Song"""
+
+    def __init__(self, latency_us=0.0):
+        self.latency = latency_us / 1e6
+        self.counting = False
+        self.calls = collections.Counter()
+
+    def charge(self, owner, name):
+        if self.counting:
+            self.calls[type(owner).__name__ + "." + name] += 1
+        if self.latency:
+            deadline = time.perf_counter() + self.latency
+            while time.perf_counter() < deadline:
+                pass
+
+
+class LomObject:
+    """Base class: routes public attribute access through the cost model"""
+
+    def __init__(self, cost, **attrs):
+        object.__setattr__(self, "_cost", cost)
+        for name, value in attrs.items():
+            object.__setattr__(self, name, value)
+
+    def __getattribute__(self, name):
+        if name[0] != "_":
+            object.__getattribute__(self, "_cost").charge(self, name)
+        return object.__getattribute__(self, name)
+
+    def __setattr__(self, name, value):
+        if name[0] != "_":
+            self._cost.charge(self, name)
+        object.__setattr__(self, name, value)
+
+    def _set(self, name, value):
+        """Internal write that is not charged as a LOM call"""
+        object.__setattr__(self, name, value)
+
+
+class DeviceParameter(LomObject):
+    def __init__(self, cost, name, value=0.0, minimum=0.0, maximum=1.0, quantized=False):
+        super().__init__(
+            cost,
+            name=name,
+            value=value,
+            min=minimum,
+            max=maximum,
+            is_quantized=quantized,
+            is_enabled=True,
+            automation_state=0,
+        )
+
+    def __str__(self):
+        return f"{object.__getattribute__(self, 'value'):.2f}"
+
+
+class Device(LomObject):
+    def __init__(self, cost, name, num_params):
+        params = [DeviceParameter(cost, "Device On", 1.0, quantized=True)]
+        params += [DeviceParameter(cost, "Param " + str(i + 1)) for i in range(num_params - 1)]
+        super().__init__(
+            cost,
+            name=name,
+            class_name="MockDevice",
+            class_display_name="Mock Device",
+            type=1,
+            is_active=True,
+            can_have_chains=False,
+            chains=[],
+            parameters=params,
+        )
+
+
+class MixerDevice(LomObject):
+    def __init__(self, cost, num_sends):
+        super().__init__(
+            cost,
+            volume=DeviceParameter(cost, "Track Volume", 0.85),
+            panning=DeviceParameter(cost, "Track Panning", 0.0, -1.0, 1.0),
+            crossfader=DeviceParameter(cost, "Crossfader", 0.0, -1.0, 1.0),
+            sends=[DeviceParameter(cost, "Send " + chr(65 + i)) for i in range(num_sends)],
+            crossfade_assign=1,
+        )
+
+
+class Clip(NoteStore, EnvelopeStore, LomObject):
+    def __init__(self, cost, length=4.0, is_midi=True, name=""):
+        super().__init__(
+            cost,
+            name=name,
+            length=float(length),
+            is_midi_clip=is_midi,
+            is_audio_clip=not is_midi,
+            looping=True,
+            loop_start=0.0,
+            loop_end=float(length),
+            start_marker=0.0,
+            end_marker=float(length),
+            start_time=0.0,
+            end_time=float(length),
+            color=0,
+            color_index=0,
+            muted=False,
+            is_playing=False,
+            is_triggered=False,
+            is_recording=False,
+            signature_numerator=4,
+            signature_denominator=4,
+            groove=None,
+        )
+        self.init_notes()
+        self.init_envelopes()
+
+    def fire(self):
+        self._set("is_triggered", True)
+
+    def stop(self):
+        self._set("is_playing", False)
+
+
+class ClipSlot(LomObject):
+    def __init__(self, cost, track):
+        super().__init__(cost, clip=None, has_clip=False, is_playing=False, is_triggered=False)
+        self._track = track
+        self._set("has_stop_button", True)
+
+    def create_clip(self, length):
+        if self._has_clip_internal():
+            raise RuntimeError("Clip slot already has a clip")
+        self._set("clip", Clip(self._cost, length, is_midi=True))
+        self._set("has_clip", True)
+
+    def delete_clip(self):
+        self._set("clip", None)
+        self._set("has_clip", False)
+
+    def duplicate_clip_to(self, target):
+        source = object.__getattribute__(self, "clip")
+        copy = Clip(self._cost, object.__getattribute__(source, "length"))
+        copy.set_notes(source._notes)
+        target._set("clip", copy)
+        target._set("has_clip", True)
+
+    def fire(self, record_length=None, launch_quantization=None, force_legato=False):
+        self._set("is_triggered", True)
+        if self._has_clip_internal():
+            object.__getattribute__(self, "clip").fire()
+
+    def stop(self):
+        self._set("is_triggered", False)
+        if self._has_clip_internal():
+            object.__getattribute__(self, "clip").stop()
+
+    def _has_clip_internal(self):
+        return object.__getattribute__(self, "has_clip")
+
+
+class Track(ListenerStore, LomObject):
+    (
+        add_arrangement_clips_listener,
+        remove_arrangement_clips_listener,
+        arrangement_clips_has_listener,
+    ) = listener_methods("arrangement_clips")
+
+    def __init__(self, cost, name, num_scenes, num_devices, num_params, num_sends, is_midi=True):
+        super().__init__(
+            cost,
+            name=name,
+            color=0,
+            color_index=0,
+            mute=False,
+            solo=False,
+            arm=False,
+            can_be_armed=True,
+            has_midi_input=is_midi,
+            has_audio_input=not is_midi,
+            is_foldable=False,
+            fold_state=False,
+            is_frozen=False,
+            can_be_frozen=True,
+            current_monitoring_state=1,
+            playing_slot_index=-1,
+            fired_slot_index=-1,
+            output_meter_level=0.0,
+            group_track=None,
+            arrangement_clips=[],
+            devices=[Device(cost, "Device " + str(d + 1), num_params) for d in range(num_devices)],
+            mixer_device=MixerDevice(cost, num_sends),
+        )
+        self._set("clip_slots", [ClipSlot(cost, self) for _ in range(num_scenes)])
+        self.init_listeners()
+
+    def create_midi_clip(self, start_time, length):
+        """Add an arrangement clip; arrangement_clips stays in start time order"""
+        clip = Clip(self._cost, length)
+        clip._set("start_time", float(start_time))
+        clip._set("end_time", float(start_time) + float(length))
+        clips = object.__getattribute__(self, "arrangement_clips")
+        clips.append(clip)
+        clips.sort(key=lambda c: object.__getattribute__(c, "start_time"))
+        self._notify("arrangement_clips")
+        return clip
+
+    def delete_clip(self, clip):
+        object.__getattribute__(self, "arrangement_clips").remove(clip)
+        self._notify("arrangement_clips")
+
+    def delete_device(self, index):
+        del object.__getattribute__(self, "devices")[index]
+
+    def stop_all_clips(self):
+        pass
+
+
+class Scene(LomObject):
+    def __init__(self, cost, name):
+        super().__init__(cost, name=name, tempo=-1.0, color=0, is_empty=False, is_triggered=False)
+
+    def fire(self):
+        self._set("is_triggered", True)
@@ -0,0 +1,120 @@
+"""
+Note storage for the mock Clip: the tuple-based note API and the Live 11+
+note-ID API (get_notes_extended, add_new_notes, apply_note_modifications,
+remove_notes_by_id) over the same notes.
+"""
+
+
+def _in_range(note, from_time, from_pitch, time_span, pitch_span):
+    pitch, start = note[0], note[1]
+    return (
+        from_pitch <= pitch < from_pitch + pitch_span and from_time <= start < from_time + time_span
+    )
+
+
+class MidiNoteSpecification:
+    """Live.Clip.MidiNoteSpecification: a note to add with Clip.add_new_notes()"""
+
+    def __init__(self, pitch, start_time, duration, velocity=100, mute=False, **extra):
+        self.pitch, self.start_time, self.duration = pitch, start_time, duration
+        self.velocity, self.mute = velocity, mute
+
+
+# Live 11+ note fields the tuple API cannot see, with their defaults
+EXTRA_FIELDS = {"probability": 1.0, "velocity_deviation": 0.0, "release_velocity": 64}
+
+
+class MidiNote:
+    """Live 11+ note with an ID, as returned by get_notes_extended() and get_notes_by_id()"""
+
+    def __init__(self, note_id, note, extra=None):
+        self.note_id = note_id
+        self.pitch, self.start_time, self.duration, self.velocity, self.mute = note
+        for name, default in EXTRA_FIELDS.items():
+            setattr(self, name, (extra or {}).get(name, default))
+
+    def as_tuple(self):
+        return (self.pitch, self.start_time, self.duration, self.velocity, self.mute)
+
+    def extra(self):
+        return {name: getattr(self, name) for name in EXTRA_FIELDS}
+
+
+class NoteStore:
+    """
+    Note methods of Clip; notes are tuples, each with an ID at the same
+    position in _ids. Fields set through apply_note_modifications that the
+    tuples lack (probability, ...) are kept in _extras by ID.
+    """
+
+    def init_notes(self):
+        self._notes = []
+        self._ids = []
+        self._extras = {}
+        self._next_id = 1
+        self._selected = []
+
+    def _keep(self, keep):
+        """Drop every note for which keep(note_id, note) is false"""
+        kept = [(i, n) for i, n in zip(self._ids, self._notes) if keep(i, n)]
+        self._set("_ids", [i for i, _ in kept])
+        self._set("_notes", [n for _, n in kept])
+
+    def _add(self, notes):
+        ids = list(range(self._next_id, self._next_id + len(notes)))
+        self._set("_next_id", self._next_id + len(notes))
+        self._ids.extend(ids)
+        self._notes.extend(tuple(n) for n in notes)
+        return ids
+
+    def get_notes(self, from_time, from_pitch, time_span, pitch_span):
+        return tuple(
+            n for n in self._notes if _in_range(n, from_time, from_pitch, time_span, pitch_span)
+        )
+
+    def get_notes_extended(self, from_pitch, pitch_span, from_time, time_span):
+        return tuple(
+            MidiNote(i, n, self._extras.get(i))
+            for i, n in zip(self._ids, self._notes)
+            if _in_range(n, from_time, from_pitch, time_span, pitch_span)
+        )
+
+    def get_notes_by_id(self, note_ids):
+        wanted = set(note_ids)
+        return tuple(
+            MidiNote(i, n, self._extras.get(i))
+            for i, n in zip(self._ids, self._notes)
+            if i in wanted
+        )
+
+    def set_notes(self, notes):
+        self._add(list(notes))
+
+    def add_new_notes(self, specs):
+        return tuple(
+            self._add([(s.pitch, s.start_time, s.duration, s.velocity, s.mute) for s in specs])
+        )
+
+    def apply_note_modifications(self, notes):
+        changed = {note.note_id: note.as_tuple() for note in notes}
+        self._set("_notes", [changed.get(i, n) for i, n in zip(self._ids, self._notes)])
+        self._extras.update((note.note_id, note.extra()) for note in notes)
+
+    def remove_notes(self, from_time, from_pitch, time_span, pitch_span):
+        self._keep(lambda i, n: not _in_range(n, from_time, from_pitch, time_span, pitch_span))
+
+    def remove_notes_by_id(self, note_ids):
+        removed = set(note_ids)
+        self._keep(lambda i, n: i not in removed)
+
+    def select_all_notes(self):
+        self._set("_selected", list(self._notes))
+
+    def deselect_all_notes(self):
+        self._set("_selected", [])
+
+    def replace_selected_notes(self, notes):
+        selected = self._selected
+        self._keep(lambda i, n: n not in selected)
+        self._add([tuple(n) for n in notes])
+        self._set("_selected", [])
@@ -0,0 +1,165 @@
+"""
+Song assembly for the mock LOM: build_song() sizes a set like a real one,
+make_live_module() replaces the `Live` module Ableton injects at runtime.
+"""
+
+import random
+import types
+
+from .listeners import ListenerStore, listener_methods
+from .lom import ClipSlot, LomCost, LomObject, Scene, Track
+from .notes import MidiNoteSpecification
+
+
+class CuePoint(LomObject):
+    def __init__(self, cost, song, name, time):
+        super().__init__(cost, name=name, time=float(time))
+        self._song = song
+
+    def jump(self):
+        self._song._set("current_song_time", object.__getattribute__(self, "time"))
+
+
+class Song(ListenerStore, LomObject):
+    """The root object; see build_song() for the knobs"""
+
+    add_tracks_listener, remove_tracks_listener, tracks_has_listener = listener_methods("tracks")
+    add_cue_points_listener, remove_cue_points_listener, cue_points_has_listener = listener_methods(
+        "cue_points"
+    )
+
+    def _add_track(self, index, is_midi):
+        tracks = object.__getattribute__(self, "tracks")
+        shape = self._shape
+        track = Track(
+            self._cost, str(len(tracks) + 1) + " " + ("MIDI" if is_midi else "Audio"),
+            len(object.__getattribute__(self, "scenes")), shape["devices"], shape["params"],
+            len(object.__getattribute__(self, "return_tracks")), is_midi,
+        )  # fmt: skip
+        tracks.insert(len(tracks) if index < 0 else index, track)
+        self._notify("tracks")
+        return track
+
+    def create_midi_track(self, index=-1):
+        return self._add_track(index, True)
+
+    def create_audio_track(self, index=-1):
+        return self._add_track(index, False)
+
+    def delete_track(self, index):
+        del object.__getattribute__(self, "tracks")[index]
+        self._notify("tracks")
+
+    def set_or_delete_cue(self):
+        """Toggle a cue point at the current song time"""
+        cues = object.__getattribute__(self, "cue_points")
+        now = object.__getattribute__(self, "current_song_time")
+        existing = [cue for cue in cues if object.__getattribute__(cue, "time") == now]
+        if existing:
+            cues.remove(existing[0])
+        else:
+            cues.append(CuePoint(self._cost, self, str(len(cues) + 1), now))
+            cues.sort(key=lambda cue: object.__getattribute__(cue, "time"))
+        self._notify("cue_points")
+
+    def create_scene(self, index=-1):
+        scenes = object.__getattribute__(self, "scenes")
+        scene = Scene(self._cost, "Scene " + str(len(scenes) + 1))
+        position = len(scenes) if index < 0 else index
+        scenes.insert(position, scene)
+        for track in object.__getattribute__(self, "tracks"):
+            object.__getattribute__(track, "clip_slots").insert(
+                position, ClipSlot(self._cost, track)
+            )
+        return scene
+
+    def start_playing(self):
+        self._set("is_playing", True)
+
+    def stop_playing(self):
+        self._set("is_playing", False)
+
+    def continue_playing(self):
+        self._set("is_playing", True)
+
+    def stop_all_clips(self, quantized=True):
+        pass
+
+    def tap_tempo(self):
+        pass
+
+    def undo(self):
+        pass
+
+    def redo(self):
+        pass
+
+
+def build_song(
+    tracks=8,
+    scenes=8,
+    devices_per_track=2,
+    params_per_device=16,
+    returns=2,
+    clip_fill=0.5,
+    notes_per_clip=16,
+    latency_us=0.0,
+    seed=1,
+):
+    """Build a Song of the given size; every 4th track is an audio track"""
+    cost = LomCost(latency_us)
+    rng = random.Random(seed)
+    song = Song(
+        cost,
+        tempo=120.0, is_playing=False, signature_numerator=4, signature_denominator=4,
+        current_song_time=0.0, loop=False, loop_start=0.0, loop_length=16.0, metronome=False,
+        record_mode=False, session_record=False, session_automation_record=False,
+        arrangement_overdub=False, back_to_arranger=False, punch_in=False, punch_out=False,
+        nudge_up=False, nudge_down=False, groove_amount=1.0, cue_points=[],
+        can_jump_to_next_cue=False, can_jump_to_prev_cue=False, tracks=[], scenes=[],
+        return_tracks=[],
+    )  # fmt: skip
+    song.init_listeners()
+    song._set("_shape", {"devices": devices_per_track, "params": params_per_device})
+    song._set("master_track", Track(cost, "Master", 0, 1, params_per_device, 0, False))
+    song._set("view", types.SimpleNamespace(selected_track=None, selected_scene=None))
+
+    for r in range(returns):
+        ret = Track(cost, chr(65 + r) + " Return", 0, 1, params_per_device, returns, False)
+        object.__getattribute__(song, "return_tracks").append(ret)
+    for s in range(scenes):
+        object.__getattribute__(song, "scenes").append(Scene(cost, "Scene " + str(s + 1)))
+
+    for t in range(tracks):
+        track = song._add_track(-1, t % 4 != 3)
+        if t % 4 == 3:
+            continue
+        for slot in object.__getattribute__(track, "clip_slots"):
+            if rng.random() < clip_fill:
+                slot.create_clip(4.0)
+                notes = [
+                    (
+                        rng.randint(36, 84),
+                        i * 4.0 / notes_per_clip,
+                        0.25,
+                        rng.randint(60, 127),
+                        False,
+                    )
+                    for i in range(notes_per_clip)
+                ]
+                object.__getattribute__(slot, "clip").set_notes(notes)
+    return song
+
+
+def make_live_module(major_version=12):
+    """A minimal replacement for the `Live` module Ableton injects at runtime"""
+    app = types.SimpleNamespace(
+        get_major_version=lambda: major_version,
+        get_minor_version=lambda: 0,
+        get_bugfix_version=lambda: 0,
+        view=types.SimpleNamespace(show_view=lambda name: None),
+    )
+    live = types.ModuleType("Live")
+    live.Application = types.SimpleNamespace(get_application=lambda: app)
+    live.Clip = types.SimpleNamespace(MidiNoteSpecification=MidiNoteSpecification)
+    return live
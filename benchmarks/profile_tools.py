@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Per-tool main-thread cost profiler.
+
+Calls every registered tool once against a fresh mock song (benchmarks/
+mock_live) and counts the LOM property reads, writes and method lookups it
+makes. Each tool is also rerun with the track count, then the scene count,
+doubled and quadrupled. How the count grows shows how its cost scales:
+
+    O(1)               same number of LOM calls whatever the set size
+    O(tracks)          grows with the track count (e.g. name scans)
+    O(scenes)          grows with the scene count (e.g. walking clip slots)
+    O(tracks×scenes)   grows with both: the whole clip grid
+
+The table lists LOM calls at each size, the wall time at the base size
+(set --latency-us to model the real cost of crossing into Live) and the
+attributes hit most often. --output writes the same data as JSON, one
+entry per tool. That is a per-call cost model for scheduling and review.
+
+    python benchmarks/profile_tools.py
+    python benchmarks/profile_tools.py --only get_track_info get_scene_is_empty
+    python benchmarks/profile_tools.py --latency-us 20 --sort ms --output costs.json
+"""
+
+import argparse
+import inspect
+import json
+import math
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.mock_live import MockControlSurface, build_song, make_live_module  # noqa: E402
+
+sys.modules.setdefault("Live", make_live_module())
+
+from ALiveMCP_Remote.liveapi_tools import LiveAPITools  # noqa: E402
+from ALiveMCP_Remote.tools.registry import AVAILABLE_TOOLS  # noqa: E402
+
+# Answered by ALiveMCP itself rather than LiveAPITools
+BUILTIN_ACTIONS = (
+    "ping", "health_check", "get_tool_schemas", "profile_start", "profile_stop",
+    "get_recent_traces",
+)  # fmt: skip
+
+_NOTES = [{"pitch": 60 + i, "start": i * 0.5, "duration": 0.25, "velocity": 100} for i in range(8)]
+
+# Values for required parameters, by name. Indices point at the first track,
+# scene, device and parameter, which build_song always fills with a MIDI clip.
+SAMPLE_ARGS = {
+    "track_index": 0, "clip_index": 0, "scene_index": 0, "device_index": 0,
+    "param_index": 1, "lane_index": 0, "chain_index": 0, "return_index": 0,
+    "send_index": 0, "locator_index": 0, "group_track_index": 1, "groove_index": 0,
+    "start_index": 0, "end_index": 1, "preset_index": 0, "color_index": 5,
+    "enabled": True, "value": 0.5, "volume": 0.7, "pan": 0.0, "amount": 0.5,
+    "gain": 0.5, "name": "Profile", "param_name": "Param 2", "device_name": "Device 1",
+    "annotation_text": "profile", "message": "profile", "bpm": 128.0, "numerator": 4,
+    "denominator": 4, "time": 1.0, "time_in_beats": 1.0, "time_in_bars": 1,
+    "start_time": 0.0, "end_time": 4.0, "fade_time": 0.1, "position": 1.0, "length": 4.0,
+    "loop_start": 0.0, "loop_end": 4.0, "start_marker": 0.0, "end_marker": 4.0,
+    "amount_in_beats": 1.0, "time_span": 4.0, "start_pitch": 0, "pitch_span": 128,
+    "notes": _NOTES, "folded": True, "looping": True, "muted": False, "mute": False,
+    "solo": False, "warping": True, "ram_mode": False, "semitones": 0, "cents": 0,
+    "quantize_to": 5, "state": 1, "mode": 0, "warp_mode": 0, "assignment": 0,
+    "action_A": 0, "action_B": 0, "delay_samples": 0, "cc_number": 1, "cc_value": 64,
+    "program_number": 0, "routing_type_name": "Ext. In", "sub_routing": "1",
+    "slots": [[0, 0], [1, 0]], "selector": {"scene_index": 0}, "properties": {"muted": True},
+    "operations": [{"op": "transpose", "semitones": 1}], "time_from": 0.0, "time_to": 16.0,
+}  # fmt: skip
+
+# Optional parameters a tool cannot run without: the envelope tools need a
+# target (device/param or param_ref) and write_automation_curve needs points
+_ENVELOPE_TARGET = {"param_ref": "volume"}
+TOOL_SAMPLE_ARGS = {
+    **dict.fromkeys(
+        ("get_clip_automation_envelope", "create_automation_envelope",
+         "clear_automation_envelope", "insert_automation_step", "remove_automation_step",
+         "get_automation_envelope_values"), _ENVELOPE_TARGET),
+    "write_automation_curve": dict(_ENVELOPE_TARGET, times=[0.0, 2.0], values=[0.0, 1.0]),
+}  # fmt: skip
+
+
+def _volume_envelope(song):
+    clip = song.tracks[0].clip_slots[0].clip
+    clip.create_automation_envelope(song.tracks[0].mixer_device.volume)
+
+
+# Run on the fresh song before the tool; not counted
+SETUP = {"insert_automation_step": _volume_envelope, "remove_automation_step": _volume_envelope}
+
+COMPLEXITY_DIMENSIONS = ("tracks", "scenes")
+# Each dimension is measured at 1x, 2x and 4x its base size
+GROWTH = (1, 2, 4)
+
+
+def sample_args(method):
+    """Keyword arguments for one call of method; KeyError names an unknown parameter"""
+    kwargs = {}
+    for param in list(inspect.signature(method).parameters.values()):
+        if param.default is param.empty:
+            kwargs[param.name] = SAMPLE_ARGS[param.name]
+    kwargs.update(TOOL_SAMPLE_ARGS.get(method.__name__, {}))
+    return kwargs
+
+
+def measure(action, song_options):
+    """
+    Run one tool once on a freshly built song.
+
+    Returns (reply, lom_calls Counter, elapsed seconds). Only the tool call
+    itself is counted and timed, not building the song.
+    """
+    song = build_song(**song_options)
+    if action in SETUP:
+        SETUP[action](song)
+    tools = LiveAPITools(song, MockControlSurface(song))
+    method = getattr(tools, action)
+    kwargs = sample_args(method)
+    cost = song._cost
+
+    cost.calls.clear()
+    cost.counting = True
+    started = time.perf_counter()
+    try:
+        reply = method(**kwargs)
+    except Exception as e:
+        reply = {"ok": False, "error": str(e)}
+    elapsed = time.perf_counter() - started
+    cost.counting = False
+    return reply, cost.calls.copy(), elapsed
+
+
+def growth_exponent(counts):
+    """
+    Exponent k of cost = a + b·size^k, from counts at size n, 2n and 4n.
+
+    Fixed per-call overhead (a) cancels out in the differences, so a tool
+    doing 20 lookups plus one per scene still reads as linear in scenes.
+    """
+    first, second = counts[1] - counts[0], counts[2] - counts[1]
+    if first <= 0 or second <= 0:
+        return 0.0
+    return math.log(second / first, 2)
+
+
+def classify(exponents):
+    """'tracks×scenes', 'tracks', '1', ... from {dimension: exponent}"""
+    terms = []
+    for dimension in COMPLEXITY_DIMENSIONS:
+        power = round(exponents.get(dimension, 0.0))
+        if power == 1:
+            terms.append(dimension)
+        elif power > 1:
+            terms.append(dimension + "^" + str(power))
+    return "×".join(terms) or "1"
+
+
+def profile_tool(action, song_options):
+    """Profile one tool at the base size and with tracks / scenes scaled up"""
+    reply, calls, elapsed = measure(action, song_options)
+    counts = {"base": sum(calls.values())}
+    exponents = {}
+    for dimension in COMPLEXITY_DIMENSIONS:
+        series = [counts["base"]]
+        for factor in GROWTH[1:]:
+            options = dict(song_options, **{dimension: song_options[dimension] * factor})
+            series.append(sum(measure(action, options)[1].values()))
+        counts[dimension] = series[-1]
+        exponents[dimension] = growth_exponent(series)
+
+    ok = isinstance(reply, dict) and bool(reply.get("ok"))
+    return {
+        "ok": ok,
+        "error": None if ok else str(reply.get("error") if isinstance(reply, dict) else reply),
+        "lom_calls": counts,
+        "ms": round(elapsed * 1000, 3),
+        "complexity": classify(exponents),
+        "exponents": {k: round(v, 2) for k, v in exponents.items()},
+        "hottest": calls.most_common(3),
+    }
+
+
+def profile_all(actions, song_options, skipped):
+    results = {}
+    for action in actions:
+        try:
+            results[action] = profile_tool(action, song_options)
+        except KeyError as e:
+            skipped[action] = "no sample value for parameter " + str(e)
+    return results
+
+
+def _print_table(results, song_options, sort):
+    tracks, scenes = song_options["tracks"], song_options["scenes"]
+    grow = GROWTH[-1]
+    head_tracks = f"{tracks * grow}x{scenes}"
+    head_scenes = f"{tracks}x{scenes * grow}"
+    print(
+        f"{'tool':<36} {'ok':<3} {f'{tracks}x{scenes}':>8} {head_tracks:>8} {head_scenes:>8}"
+        f" {'ms':>8}  {'complexity':<16} hottest"
+    )
+    key = {
+        "calls": lambda item: -item[1]["lom_calls"]["base"],
+        "ms": lambda item: -item[1]["ms"],
+        "growth": lambda item: -sum(item[1]["exponents"].values()),
+        "name": lambda item: item[0],
+    }[sort]
+    for name, r in sorted(results.items(), key=key):
+        c = r["lom_calls"]
+        hottest = ", ".join(f"{attr}×{n}" for attr, n in r["hottest"])
+        print(
+            f"{name:<36} {'y' if r['ok'] else 'n':<3} {c['base']:>8} {c['tracks']:>8}"
+            f" {c['scenes']:>8} {r['ms']:>8.3f}  {r['complexity']:<16} {hottest}"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile LOM cost per ALiveMCP tool")
+    parser.add_argument("--tracks", type=int, default=16)
+    parser.add_argument("--scenes", type=int, default=8)
+    parser.add_argument("--devices", type=int, default=3, help="devices per track")
+    parser.add_argument("--params", type=int, default=16, help="parameters per device")
+    parser.add_argument("--notes", type=int, default=16, help="notes per clip")
+    parser.add_argument("--latency-us", type=float, default=0.0, help="cost of each LOM call")
+    parser.add_argument("--only", nargs="*", help="profile these tools only")
+    parser.add_argument("--sort", choices=("calls", "ms", "growth", "name"), default="calls")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    song_options = {
+        "tracks": args.tracks,
+        "scenes": args.scenes,
+        "devices_per_track": args.devices,
+        "params_per_device": args.params,
+        "notes_per_clip": args.notes,
+        "clip_fill": 1.0,
+        "latency_us": args.latency_us,
+    }
+    actions = [a for a in AVAILABLE_TOOLS if a not in BUILTIN_ACTIONS]
+    if args.only:
+        unknown = sorted(set(args.only) - set(actions))
+        if unknown:
+            parser.error("unknown tools: " + ", ".join(unknown))
+        actions = [a for a in actions if a in args.only]
+
+    skipped = {}
+    results = profile_all(actions, song_options, skipped)
+    _print_table(results, song_options, args.sort)
+    for action, reason in sorted(skipped.items()):
+        print(f"skipped {action}: {reason}")
+
+    if args.output:
+        path = Path(args.output)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        document = {"set": song_options, "growth": GROWTH, "tools": results, "skipped": skipped}
+        path.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+        print(f"Wrote {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
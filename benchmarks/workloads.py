@@ -0,0 +1,201 @@
+"""
+Workloads for the end-to-end benchmark (bench_e2e.py).
+
+Each workload drives a running LiveHarness through alivemcp_client and
+returns a summary dict: operation count, errors, ops/sec and latency
+percentiles. Latency is measured from submit to reply on the client side,
+so it includes the socket hop, queueing and the wait for the next tick.
+"""
+
+import math
+import threading
+import time
+
+from alivemcp_client import AliveMCPClient
+
+# Requests kept in flight per client; matches the server's MAX_PENDING_PER_CLIENT
+WINDOW = 16
+
+
+def percentile(sorted_samples, q):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(q / 100.0 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def summarize(latencies, errors, seconds, ops, **extra):
+    latencies = sorted(latencies)
+    summary = {
+        "ops": ops,
+        "errors": errors,
+        "seconds": round(seconds, 4),
+        "ops_per_sec": round(ops / seconds, 2) if seconds else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+    }
+    summary.update(extra)
+    return summary
+
+
+class Recorder:
+    """Collects per-request latencies from futures, keeping at most `window` in flight"""
+
+    def __init__(self, window=WINDOW):
+        self.latencies = []
+        self.errors = 0
+        self.lock = threading.Lock()
+        self.slots = threading.BoundedSemaphore(window)
+        self.outstanding = 0
+        self.idle = threading.Condition(self.lock)
+
+    def submit(self, client, action, params):
+        self.slots.acquire()
+        with self.lock:
+            self.outstanding += 1
+        started = time.perf_counter()
+        try:
+            future = client.submit(action, **params)
+        except Exception:
+            with self.lock:
+                self.errors += 1
+                self.outstanding -= 1
+            self.slots.release()
+            return
+        future.add_done_callback(lambda f: self._done(f, started))
+
+    def _done(self, future, started):
+        elapsed = time.perf_counter() - started
+        failed = future.exception() is not None or not future.result().get("ok")
+        with self.lock:
+            self.latencies.append(elapsed)
+            self.errors += failed
+            self.outstanding -= 1
+            self.idle.notify_all()
+        self.slots.release()
+
+    def wait(self):
+        with self.lock:
+            while self.outstanding:
+                self.idle.wait()
+
+
+def _pipelined(live, commands, **extra):
+    client = AliveMCPClient(port=live.port)
+    recorder = Recorder()
+    started = time.perf_counter()
+    for action, params in commands:
+        recorder.submit(client, action, params)
+    recorder.wait()
+    seconds = time.perf_counter() - started
+    client.close()
+    return summarize(recorder.latencies, recorder.errors, seconds, len(commands), **extra)
+
+
+def _midi_slots(live):
+    """(track, slot) pairs holding a MIDI clip, read straight from the mock song"""
+    return [
+        (t, s)
+        for t, track in enumerate(live.song.tracks)
+        if track.has_midi_input
+        for s, slot in enumerate(track.clip_slots)
+        if slot.has_clip
+    ]
+
+
+def read_polling(live, ops):
+    """Dashboard-style polling: session info and per-track reads, pipelined"""
+    tracks = len(live.song.tracks)
+    commands = [
+        ("get_session_info", {}) if i % 4 == 0 else ("get_track_info", {"track_index": i % tracks})
+        for i in range(ops)
+    ]
+    return _pipelined(live, commands)
+
+
+def fader_streams(live, ops):
+    """A controller sweeping volume faders and device knobs as fast as it can"""
+    tracks = len(live.song.tracks)
+    commands = []
+    for i in range(ops):
+        value = 0.5 + 0.5 * math.sin(i / 10.0)
+        if i % 2:
+            commands.append(("set_track_volume", {"track_index": i % tracks, "volume": value}))
+        else:
+            params = {"track_index": i % tracks, "device_index": 0, "param_index": 1}
+            commands.append(("set_device_param", dict(params, value=value)))
+    return _pipelined(live, commands)
+
+
+def bulk_notes(live, ops, notes_per_call=128):
+    """Write large note batches into existing MIDI clips"""
+    slots = _midi_slots(live)
+    notes = [
+        {"pitch": 36 + n % 48, "start": n * 0.125, "duration": 0.1, "velocity": 100}
+        for n in range(notes_per_call)
+    ]
+    commands = []
+    for i in range(ops):
+        track, slot = slots[i % len(slots)]
+        commands.append(("add_notes", {"track_index": track, "clip_index": slot, "notes": notes}))
+    summary = _pipelined(live, commands, notes_per_call=notes_per_call)
+    summary["notes_per_sec"] = round(summary["ops_per_sec"] * notes_per_call, 1)
+    return summary
+
+
+def session_snapshot(live, ops):
+    """Full session reads: get_session_info plus every track, as one pipelined batch"""
+    client = AliveMCPClient(port=live.port)
+    latencies, errors = [], 0
+    started = time.perf_counter()
+    for _ in range(ops):
+        begun = time.perf_counter()
+        info = client.call("get_session_info")
+        batch = [("get_track_info", {"track_index": i}) for i in range(info.get("num_tracks", 0))]
+        replies = client.batch(batch)
+        latencies.append(time.perf_counter() - begun)
+        errors += sum(1 for r in [info] + replies if not r.get("ok"))
+    seconds = time.perf_counter() - started
+    client.close()
+    commands = ops * (1 + len(live.song.tracks))
+    return summarize(latencies, errors, seconds, ops, commands_per_sec=round(commands / seconds, 2))
+
+
+def concurrent_clients(live, ops, clients=8):
+    """Many independent clients, each making blocking calls one at a time"""
+    latencies, errors = [], [0]
+    lock = threading.Lock()
+    tracks = len(live.song.tracks)
+
+    def worker(offset):
+        client = AliveMCPClient(port=live.port)
+        for i in range(offset, ops, clients):
+            begun = time.perf_counter()
+            reply = client.call("get_track_info", track_index=i % tracks)
+            elapsed = time.perf_counter() - begun
+            with lock:
+                latencies.append(elapsed)
+                errors[0] += not reply.get("ok")
+        client.close()
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(clients)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - started
+    return summarize(latencies, errors[0], seconds, ops, clients=clients)
+
+
+# name -> (function, operations at scale 1.0)
+WORKLOADS = {
+    "read_polling": (read_polling, 600),
+    "fader_streams": (fader_streams, 600),
+    "bulk_notes": (bulk_notes, 120),
+    "session_snapshot": (session_snapshot, 5),
+    "concurrent_clients": (concurrent_clients, 480),
+}
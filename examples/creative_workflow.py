@@ -4,31 +4,22 @@ Creative workflow example - Generative music composition
 Demonstrates algorithmic music creation using ALiveMCP Remote Script
 """
 
-import json
 import random
-import socket
+import sys
 import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from alivemcp_client import AliveMCPClient  # noqa: E402
+
+# One persistent connection shared by every command in this script
+client = AliveMCPClient()
 
 
 def send_command(action, **params):
     """Send command to ALiveMCP Remote Script"""
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.settimeout(10)
-    sock.connect(("127.0.0.1", 9004))
-
-    command = {"action": action, **params}
-    message = json.dumps(command) + "\n"
-    sock.sendall(message.encode("utf-8"))
-
-    response = b""
-    while b"\n" not in response:
-        chunk = sock.recv(4096)
-        if not chunk:
-            break
-        response += chunk
-
-    sock.close()
-    return json.loads(response.decode("utf-8"))
+    return client.call(action, **params)
 
 
 def create_generative_bass(track_idx, scene_idx, scale_notes):
@@ -14,35 +14,25 @@ Requirements:
 - At least one track with a CV Tools device (e.g., CV LFO)
 """
 
-import json
-import socket
+import sys
 import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from alivemcp_client import AliveMCPClient  # noqa: E402
 
 
 class AbletonM4LController:
     """Helper class for controlling Max for Live and CV Tools devices"""
 
     def __init__(self, host="localhost", port=9004):
-        self.host = host
-        self.port = port
+        self.client = AliveMCPClient(host=host, port=port)
 
     def send(self, command):
-        """Send command to Ableton via TCP socket"""
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.connect((self.host, self.port))
-        sock.sendall(json.dumps(command).encode() + b"\n")
-
-        response = b""
-        while True:
-            chunk = sock.recv(4096)
-            if not chunk:
-                break
-            response += chunk
-            if b"\n" in chunk:
-                break
-
-        sock.close()
-        return json.loads(response.decode())
+        """Send command to Ableton over the client's persistent connection"""
+        params = dict(command)
+        return self.client.call(params.pop("action"), **params)
 
     def get_m4l_devices(self, track_index):
         """Get all Max for Live devices on track"""
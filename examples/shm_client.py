@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Same-host transports for ALiveMCP: Unix domain socket and shared memory.
+
+Both are disabled by default. Enable them in ALiveMCP_Remote/constants.py
+(UNIX_SOCKET_ENABLED / SHM_TRANSPORT_ENABLED) and restart Live.
+
+The Unix socket speaks the same newline-delimited JSON as TCP port 9004.
+The shared-memory transport uses the ring layout documented in
+ALiveMCP_Remote/shm_ring.py; ShmClient below is the client half of it.
+Only one shared-memory client may be attached at a time.
+
+Usage:
+    python examples/shm_client.py unix   # ping over the Unix socket
+    python examples/shm_client.py shm    # stream 1000 tempo reads over shared memory
+"""
+
+import json
+import mmap
+import os
+import socket
+import struct
+import sys
+import tempfile
+import time
+
+UNIX_SOCKET_PATH = os.path.join(tempfile.gettempdir(), "alivemcp.sock")
+SHM_PATH = os.path.join(tempfile.gettempdir(), "alivemcp.shm")
+
+MAGIC = b"AMCPSHM1"
+FILE_HEADER_BYTES = 64
+RING_HEADER_BYTES = 128
+LENGTH_PREFIX = struct.Struct("<I")
+COUNTER = struct.Struct("<Q")
+HEADER = struct.Struct("<8sII")
+
+
+def unix_send_command(action, **params):
+    """Send one command over the Unix domain socket"""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(5)
+    sock.connect(UNIX_SOCKET_PATH)
+    sock.sendall((json.dumps({"action": action, **params}) + "\n").encode("utf-8"))
+
+    response = b""
+    while b"\n" not in response:
+        chunk = sock.recv(4096)
+        if not chunk:
+            break
+        response += chunk
+
+    sock.close()
+    return json.loads(response.decode("utf-8"))
+
+
+class Ring:
+    """Client view of one ring (see ALiveMCP_Remote/shm_ring.py)."""
+
+    def __init__(self, buf, offset, capacity):
+        self.buf = buf
+        self.head_at = offset
+        self.tail_at = offset + 64
+        self.data_at = offset + RING_HEADER_BYTES
+        self.capacity = capacity
+
+    def _get(self, at):
+        return COUNTER.unpack_from(self.buf, at)[0]
+
+    def _copy_in(self, position, data):
+        start = position % self.capacity
+        first = min(len(data), self.capacity - start)
+        self.buf[self.data_at + start : self.data_at + start + first] = data[:first]
+        if first < len(data):
+            self.buf[self.data_at : self.data_at + len(data) - first] = data[first:]
+
+    def _copy_out(self, position, size):
+        start = position % self.capacity
+        first = min(size, self.capacity - start)
+        data = self.buf[self.data_at + start : self.data_at + start + first]
+        if first < size:
+            data += self.buf[self.data_at : self.data_at + size - first]
+        return data
+
+    def write(self, payload):
+        head = self._get(self.head_at)
+        needed = LENGTH_PREFIX.size + len(payload)
+        if needed > self.capacity - (head - self._get(self.tail_at)):
+            return False
+        self._copy_in(head, LENGTH_PREFIX.pack(len(payload)))
+        self._copy_in(head + LENGTH_PREFIX.size, payload)
+        COUNTER.pack_into(self.buf, self.head_at, head + needed)
+        return True
+
+    def read(self):
+        tail = self._get(self.tail_at)
+        head = self._get(self.head_at)
+        if tail == head:
+            return None
+        (size,) = LENGTH_PREFIX.unpack(self._copy_out(tail, LENGTH_PREFIX.size))
+        if size > self.capacity - LENGTH_PREFIX.size or LENGTH_PREFIX.size + size > head - tail:
+            COUNTER.pack_into(self.buf, self.tail_at, head)
+            raise ValueError("corrupt record length " + str(size) + "; ring discarded")
+        payload = self._copy_out(tail + LENGTH_PREFIX.size, size)
+        COUNTER.pack_into(self.buf, self.tail_at, tail + LENGTH_PREFIX.size + size)
+        return payload
+
+    def skip_all(self):
+        """Discard anything left over from a previous client"""
+        COUNTER.pack_into(self.buf, self.tail_at, self._get(self.head_at))
+
+
+class ShmClient:
+    """Pipelining client for the shared-memory transport."""
+
+    def __init__(self, path=SHM_PATH):
+        with open(path, "r+b") as f:
+            self.buf = mmap.mmap(f.fileno(), 0)
+        magic, _version, ring_bytes = HEADER.unpack_from(self.buf, 0)
+        if magic != MAGIC:
+            raise RuntimeError("Not an ALiveMCP shared-memory file: " + path)
+        self.requests = Ring(self.buf, FILE_HEADER_BYTES, ring_bytes)
+        self.responses = Ring(
+            self.buf, FILE_HEADER_BYTES + RING_HEADER_BYTES + ring_bytes, ring_bytes
+        )
+        self.responses.skip_all()
+
+    def send(self, action, **params):
+        """Queue a command without waiting for its reply"""
+        payload = json.dumps({"action": action, **params}).encode("utf-8")
+        while not self.requests.write(payload):
+            time.sleep(0.0005)
+
+    def receive(self, timeout=5.0):
+        """Wait for the next reply (replies arrive in request order)"""
+        deadline = time.monotonic() + timeout
+        while True:
+            record = self.responses.read()
+            if record is not None:
+                return json.loads(record.decode("utf-8"))
+            if time.monotonic() > deadline:
+                return {"ok": False, "error": "Timed out waiting for shared-memory reply"}
+            time.sleep(0.0005)
+
+    def call(self, action, **params):
+        self.send(action, **params)
+        return self.receive()
+
+    def close(self):
+        self.buf.close()
+
+
+def main():
+    mode = sys.argv[1] if len(sys.argv) > 1 else "unix"
+
+    if mode == "unix":
+        print(unix_send_command("ping"))
+        return
+
+    client = ShmClient()
+    count = 1000
+    start = time.perf_counter()
+    for _ in range(count):
+        client.send("get_signature_numerator")
+    replies = [client.receive() for _ in range(count)]
+    elapsed = time.perf_counter() - start
+    ok = sum(1 for r in replies if r.get("ok"))
+    print(f"{ok}/{count} replies in {elapsed:.3f}s ({count / elapsed:.0f} ops/s)")
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
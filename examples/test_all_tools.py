@@ -4,38 +4,23 @@ Comprehensive test of all 220 LiveAPI tools in ALiveMCP Python backend
 Tests organized by category with proper timeout handling
 """
 
-import json
-import socket
+import sys
 import time
+from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-def send_command(action, timeout=10, **params):
-    """Send command to Python Remote Script on port 9004 with configurable timeout"""
-    try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
-        sock.connect(("127.0.0.1", 9004))
+from alivemcp_client import AliveMCPClient  # noqa: E402
 
-        command = {"action": action, **params}
-        message = json.dumps(command) + "\n"
-        sock.sendall(message.encode("utf-8"))
+client = AliveMCPClient()
 
-        response = b""
-        while b"\n" not in response:
-            chunk = sock.recv(4096)
-            if not chunk:
-                break
-            response += chunk
-
-        sock.close()
-
-        if response:
-            return json.loads(response.decode("utf-8"))
-        else:
-            return {"ok": False, "error": "No response"}
 
+def send_command(action, timeout=10, **params):
+    """Send command to Python Remote Script on port 9004 with configurable timeout"""
+    try:
+        return client.submit(action, **params).result(timeout)
     except Exception as e:
-        return {"ok": False, "error": str(e)}
+        return {"ok": False, "error": str(e) or type(e).__name__}
 
 
 def main():
@@ -3,7 +3,16 @@
 Web dashboard bridge for ALiveMCP Remote Script.
 
 Serves index.html and proxies WebSocket messages to the Ableton TCP socket
-on 127.0.0.1:9004.
+on 127.0.0.1:9004. Every browser tab shares one persistent, pipelined
+upstream connection (alivemcp_client.AsyncAliveMCPClient); if it drops, the
+next command re-opens it.
+
+A message may carry an "id"; it is stripped before forwarding and echoed in
+the reply so a tab can match replies to requests.
+
+Session state is not polled per tab. One SessionMirror reads Live on behalf
+of every viewer and pushes {"event": "snapshot"|"patch"} messages (JSON
+Patch) to each WebSocket, so extra viewers add no load on Live.
 
 Usage:
     pip install -r requirements.txt
@@ -13,17 +22,39 @@ Usage:
 
 import asyncio
 import json
-import socket
+import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.responses import HTMLResponse
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from alivemcp_client import (  # noqa: E402
+    AliveMCPConnectionError,
+    AliveMCPTimeout,
+    AsyncAliveMCPClient,
+)
+from alivemcp_client.mirror import SessionMirror  # noqa: E402
+
 ABLETON_HOST = "127.0.0.1"
 ABLETON_PORT = 9004
 ABLETON_TIMEOUT = 5.0
+STATE_POLL_INTERVAL = 0.25
+
+upstream = AsyncAliveMCPClient(host=ABLETON_HOST, port=ABLETON_PORT, timeout=ABLETON_TIMEOUT)
+mirror = SessionMirror(upstream, interval=STATE_POLL_INTERVAL)
 
-app = FastAPI(title="ALiveMCP Web Dashboard")
+
+@asynccontextmanager
+async def lifespan(app):
+    yield
+    await mirror.stop()
+    await upstream.close()
+
+
+app = FastAPI(title="ALiveMCP Web Dashboard", lifespan=lifespan)
 
 _html_path = Path(__file__).parent / "index.html"
 
@@ -33,59 +64,90 @@ async def serve_ui():
     return _html_path.read_text(encoding="utf-8")
 
 
-def _send_to_ableton(command: dict) -> dict:
-    """
-    Open a TCP connection to Ableton, send one JSON command, return the response.
-    Runs in a thread pool executor so it does not block the event loop.
-    """
-    try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(ABLETON_TIMEOUT)
-        sock.connect((ABLETON_HOST, ABLETON_PORT))
-
-        message = json.dumps(command) + "\n"
-        sock.sendall(message.encode("utf-8"))
+def _is_read_only(action):
+    """Reads can be resent safely if the connection drops before their reply"""
+    return action in ("ping", "health_check") or action.startswith("get_")
 
-        response = b""
-        while b"\n" not in response:
-            chunk = sock.recv(4096)
-            if not chunk:
-                break
-            response += chunk
 
-        sock.close()
+async def _send_to_ableton(command: dict) -> dict:
+    """
+    Forward one command over the shared upstream connection and return the
+    response. Transport failures are turned into error responses.
+    """
+    params = dict(command)
+    action = params.pop("action", None)
+    if not action:
+        return {"ok": False, "error": "Missing 'action'"}
+
+    for attempt in range(2):
+        was_connected = upstream.connected
+        try:
+            return await upstream.call(action, **params)
+        except AliveMCPTimeout:
+            return {"ok": False, "error": "Timed out waiting for Ableton — is Live busy?"}
+        except AliveMCPConnectionError:
+            if not was_connected:
+                return {
+                    "ok": False,
+                    "error": "Cannot reach ALiveMCP — is the Remote Script loaded?",
+                }
+            # The connection dropped under us; reads are retried on a fresh one
+            if attempt == 0 and _is_read_only(action):
+                continue
+            return {
+                "ok": False,
+                "error": "Connection to Ableton was lost; the command may not have been applied",
+            }
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
 
-        if response:
-            return json.loads(response.decode("utf-8"))
-        return {"ok": False, "error": "Empty response from Ableton"}
 
-    except socket.timeout:
-        return {"ok": False, "error": "Connection timed out — is Ableton running?"}
-    except ConnectionRefusedError:
-        return {"ok": False, "error": "Connection refused — is ALiveMCP Remote Script loaded?"}
-    except Exception as e:
-        return {"ok": False, "error": str(e)}
+async def _handle_message(websocket: WebSocket, send_lock: asyncio.Lock, raw: str):
+    try:
+        command = json.loads(raw)
+        if not isinstance(command, dict):
+            raise ValueError("expected a JSON object")
+    except ValueError as e:
+        response, request_id = {"ok": False, "error": "Invalid JSON: " + str(e)}, None
+    else:
+        request_id = command.pop("id", None)
+        response = await _send_to_ableton(command)
+        if response.get("ok") and not _is_read_only(command.get("action", "")):
+            # Let every viewer see the effect of a write without waiting for the next poll
+            mirror.refresh_soon()
+
+    if request_id is not None:
+        response = dict(response, id=request_id)
+    async with send_lock:
+        await websocket.send_text(json.dumps(response))
+
+
+async def _push_state(websocket: WebSocket, send_lock: asyncio.Lock, updates: asyncio.Queue):
+    """Forward mirror snapshots/patches to one browser"""
+    while True:
+        message = await updates.get()
+        async with send_lock:
+            await websocket.send_text(json.dumps(message))
 
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     await websocket.accept()
-    loop = asyncio.get_event_loop()
+    send_lock = asyncio.Lock()
+    updates = mirror.subscribe()
+    pusher = asyncio.ensure_future(_push_state(websocket, send_lock, updates))
+    tasks = {pusher}
     try:
         while True:
             raw = await websocket.receive_text()
-
-            try:
-                command = json.loads(raw)
-            except json.JSONDecodeError as e:
-                await websocket.send_text(
-                    json.dumps({"ok": False, "error": "Invalid JSON: " + str(e)})
-                )
-                continue
-
-            # Proxy to Ableton in the thread pool so the event loop stays free
-            response = await loop.run_in_executor(None, _send_to_ableton, command)
-            await websocket.send_text(json.dumps(response))
+            # Handle each message concurrently so one slow command doesn't stall the tab
+            task = asyncio.ensure_future(_handle_message(websocket, send_lock, raw))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
 
     except WebSocketDisconnect:
         pass
+    finally:
+        mirror.unsubscribe(updates)
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Regenerate alivemcp_client/tools.py from the Remote Script's AVAILABLE_TOOLS.
+
+Signatures and summaries are read from the LiveAPITools methods and
+annotations from the parameter schemas (ALiveMCP_Remote/tools/schemas.py),
+so the client always matches the server it ships with:
+
+    python scripts/generate_client_stubs.py          # rewrite the file
+    python scripts/generate_client_stubs.py --check  # exit 1 if it is out of date
+"""
+
+import inspect
+import json
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+ROOT = Path(__file__).resolve().parent.parent
+OUTPUT = ROOT / "alivemcp_client" / "tools.py"
+LINE_LENGTH = 100
+
+# Python annotation for each JSON Schema type in tools/schemas.py
+ANNOTATIONS = {
+    "integer": "int",
+    "number": "float",
+    "boolean": "bool",
+    "string": "str",
+    "array": "list",
+    "object": "dict",
+}
+
+HEADER = '''"""
+Typed wrappers for every ALiveMCP tool.
+
+GENERATED by scripts/generate_client_stubs.py from AVAILABLE_TOOLS — do not
+edit by hand. Run the script again after adding or changing a tool.
+"""
+
+
+class ToolMethods:
+    """
+    One method per tool. Subclasses implement _call(action, params); the
+    blocking client returns the reply dict, the asyncio client a coroutine.
+    """
+
+    def _call(self, action, params):
+        raise NotImplementedError
+'''
+
+
+def load_tools():
+    """Import LiveAPITools with the Live module stubbed (it only exists inside Ableton)"""
+    sys.path.insert(0, str(ROOT))
+    sys.modules.setdefault("Live", MagicMock())
+    from ALiveMCP_Remote.liveapi_tools import LiveAPITools
+    from ALiveMCP_Remote.tools.registry import AVAILABLE_TOOLS
+
+    return LiveAPITools, AVAILABLE_TOOLS
+
+
+def _script_method(name):
+    """A built-in action implemented on the ALiveMCP script class itself"""
+    from ALiveMCP_Remote import ALiveMCP
+
+    return getattr(ALiveMCP, name)
+
+
+def _annotation(tool, name, default):
+    """Annotation from the parameter's schema; none for parameters that default to None"""
+    from ALiveMCP_Remote.tools.schemas import DEFAULT_TYPES, param_schema
+
+    if default is None:
+        return None
+    kind = param_schema(tool, name).get("type")
+    if kind is None and default is not inspect.Parameter.empty:
+        kind = DEFAULT_TYPES.get(type(default))
+    return ANNOTATIONS.get(kind)
+
+
+def _param_source(tool, param):
+    source = param.name
+    annotation = _annotation(tool, param.name, param.default)
+    if annotation:
+        source += ": " + annotation
+    if param.default is not inspect.Parameter.empty:
+        default = param.default
+        literal = json.dumps(default) if isinstance(default, str) else repr(default)
+        source += (" = " if annotation else "=") + literal
+    return source
+
+
+def _bracketed(opening, items, closing, indent):
+    """Render items on one line if it fits, otherwise one per line with a trailing comma"""
+    flat = opening + ", ".join(items) + closing
+    if len(indent) + len(flat) <= LINE_LENGTH:
+        return [indent + flat]
+    inner = indent + "    "
+    return [indent + opening] + [inner + item + "," for item in items] + [indent + closing]
+
+
+def render_method(name, params, summary):
+    names = [p.name for p in params]
+    lines = _bracketed(
+        "def " + name + "(", ["self"] + [_param_source(name, p) for p in params], "):", "    "
+    )
+    lines.append('        """' + summary + '"""')
+
+    args = "{" + ", ".join('"' + n + '": ' + n for n in names) + "}"
+    call = 'return self._call("' + name + '", ' + args + ")"
+    if len("        " + call) <= LINE_LENGTH:
+        lines.append("        " + call)
+    else:
+        entries = ['"' + n + '": ' + n for n in names]
+        lines.append("        return self._call(")
+        lines.append('            "' + name + '",')
+        lines.extend(_bracketed("{", entries, "},", "            "))
+        lines.append("        )")
+    return lines
+
+
+def render(tools_class, tool_names):
+    lines = [HEADER.rstrip("\n")]
+    for name in tool_names:
+        method = getattr(tools_class, name, None) or _script_method(name)
+        params = list(inspect.signature(method).parameters.values())[1:]
+        summary = (inspect.getdoc(method) or name).splitlines()[0].strip()
+        lines.append("")
+        lines.extend(render_method(name, params, summary.replace('"""', "'''")))
+    return "\n".join(lines) + "\n"
+
+
+def main(argv):
+    source = render(*load_tools())
+    if "--check" in argv:
+        current = OUTPUT.read_text(encoding="utf-8") if OUTPUT.exists() else ""
+        if current != source:
+            print(f"{OUTPUT.relative_to(ROOT)} is out of date; run {Path(__file__).name}")
+            return 1
+        return 0
+    OUTPUT.write_text(source, encoding="utf-8")
+    print(f"Wrote {OUTPUT.relative_to(ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -45,3 +45,24 @@ def tools(song, c_instance):
     from ALiveMCP_Remote.liveapi_tools import LiveAPITools
 
     return LiveAPITools(song, c_instance)
+
+
+@pytest.fixture
+def mock_song():
+    """
+    Factory for songs on the mock Live object model (benchmarks/mock_live):
+    mock_song(tracks=4, scenes=3, clip_fill=1.0) takes build_song()'s sizes.
+    Every 4th track (index 3, 7, ...) is an audio track without clips.
+    """
+    from benchmarks.mock_live import build_song
+
+    return build_song
+
+
+@pytest.fixture
+def mock_tools(song):
+    """LiveAPITools over the test module's `song`, which must come from mock_song"""
+    from ALiveMCP_Remote.liveapi_tools import LiveAPITools
+    from benchmarks.mock_live import MockControlSurface
+
+    return LiveAPITools(song, MockControlSurface(song))
@@ -5,11 +5,12 @@ lifecycle stubs, and the create_instance factory.
 
 import json
 import queue
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 
 from ALiveMCP_Remote import ALiveMCP, __version__, create_instance
+from ALiveMCP_Remote.constants import MAX_PENDING_PER_CLIENT, MAX_QUEUED_COMMANDS
 
 # ---------------------------------------------------------------------------
 # Fixture: a ALiveMCP instance with socket and thread mocked out
@@ -43,8 +44,9 @@ def test_init_creates_tools(mcp):
 
 def test_init_creates_queues(mcp):
     assert isinstance(mcp.command_queue, queue.Queue)
-    assert isinstance(mcp.response_queues, dict)
-    assert mcp.request_counter == 0
+    assert mcp.command_queue.maxsize == MAX_QUEUED_COMMANDS
+    assert next(mcp.request_ids) == 0
+    assert next(mcp.request_ids) == 1
 
 
 def test_init_starts_socket_server(c_instance):
@@ -103,23 +105,57 @@ def test_process_command_health_check(mcp):
     assert "tool_count" in result
     assert "queue_size" in result
     assert "ableton_version" in result
+    assert result["backpressure"]["max_queued_commands"] == MAX_QUEUED_COMMANDS
+    assert result["backpressure"]["shed_overloaded"] == 0
 
 
 def test_process_command_unknown_action(mcp):
     result = mcp._process_command({"action": "nonexistent_action"})
     assert result["ok"] is False
     assert "Unknown action" in result["error"]
-    assert isinstance(result["available_actions"], list)
+    assert result["did_you_mean"] == []
+    assert result["tool_count"] == len(mcp.dispatch_table)
+
+
+def test_process_command_unknown_action_suggests_close_matches(mcp):
+    result = mcp._process_command({"action": "set_temp"})
+    assert result["did_you_mean"][0] == "set_tempo"
+    assert len(result["did_you_mean"]) <= 3
+
+
+def test_process_command_rejects_unregistered_tool_attributes(mcp):
+    for action in ("log", "get_available_tools", "__init__", "song"):
+        result = mcp._process_command({"action": action})
+        assert "Unknown action" in result["error"]
+
+
+def test_process_command_reports_bad_parameters_by_name(mcp):
+    result = mcp._process_command({"action": "set_tempo", "tempo": 120})
+    assert result["ok"] is False
+    assert result["error"] == "Unexpected parameter(s) for set_tempo: tempo"
+    assert result["parameters"] == ["bpm"]
+
+    result = mcp._process_command({"action": "set_tempo"})
+    assert result["error"] == "Missing required parameter(s) for set_tempo: bpm"
+
+
+def test_process_command_applies_param_aliases(mcp):
+    mcp.tools.get_clip_info = MagicMock(return_value={"ok": True})
+    mcp.rebuild_dispatch_table()
+    mcp._process_command({"action": "get_clip_info", "track_index": 0, "scene_index": 2})
+    mcp.tools.get_clip_info.assert_called_once_with(track_index=0, clip_index=2)
 
 
 def test_process_command_dispatches_to_tools(mcp):
     mcp.tools.ping = MagicMock(return_value={"ok": True, "custom": "value"})
+    mcp.rebuild_dispatch_table()
     result = mcp._process_command({"action": "ping"})
-    # ping is handled before getattr dispatch - ensure built-in takes priority
+    # ping is a script built-in - ensure it takes priority over a tool of the same name
     assert result["ok"] is True
 
     # Test a real tool dispatch
     mcp.tools.start_playback = MagicMock(return_value={"ok": True, "dispatched": True})
+    mcp.rebuild_dispatch_table()
     result = mcp._process_command({"action": "start_playback"})
     mcp.tools.start_playback.assert_called_once_with()
     assert result["dispatched"] is True
@@ -127,12 +163,14 @@ def test_process_command_dispatches_to_tools(mcp):
 
 def test_process_command_passes_params_to_tool(mcp):
     mcp.tools.set_tempo = MagicMock(return_value={"ok": True})
+    mcp.rebuild_dispatch_table()
     mcp._process_command({"action": "set_tempo", "bpm": 120})
     mcp.tools.set_tempo.assert_called_once_with(bpm=120)
 
 
 def test_process_command_exception_returns_error_with_traceback(mcp):
     mcp.tools.start_playback = MagicMock(side_effect=RuntimeError("boom"))
+    mcp.rebuild_dispatch_table()
     result = mcp._process_command({"action": "start_playback"})
     assert result["ok"] is False
     assert "boom" in result["error"]
@@ -144,10 +182,12 @@ def test_process_command_exception_returns_error_with_traceback(mcp):
 # ---------------------------------------------------------------------------
 
 
-def _put_command(mcp, request_id, command):
-    """Helper: register a response queue and enqueue a command."""
-    mcp.response_queues[request_id] = queue.Queue()
-    mcp.command_queue.put((request_id, command))
+def _put_command(mcp, request_id, command, channel=None):
+    """Helper: enqueue a command answered on channel; returns the channel."""
+    if channel is None:
+        channel = queue.SimpleQueue()
+    mcp.command_queue.put((request_id, command, channel))
+    return channel
 
 
 def test_update_display_empty_queue_is_noop(mcp):
@@ -155,18 +195,19 @@ def test_update_display_empty_queue_is_noop(mcp):
 
 
 def test_update_display_processes_single_command(mcp):
-    _put_command(mcp, 0, {"action": "ping"})
+    channel = _put_command(mcp, 0, {"action": "ping"})
     mcp.update_display()
-    response = mcp.response_queues[0].get_nowait()
+    request_id, response = channel.get_nowait()
+    assert request_id == 0
     assert response["ok"] is True
 
 
-def test_update_display_puts_response_in_correct_queue(mcp):
-    _put_command(mcp, 7, {"action": "ping"})
-    _put_command(mcp, 8, {"action": "ping"})
+def test_update_display_puts_response_in_correct_channel(mcp):
+    first = _put_command(mcp, 7, {"action": "ping"})
+    second = _put_command(mcp, 8, {"action": "ping"})
     mcp.update_display()
-    assert not mcp.response_queues[7].empty()
-    assert not mcp.response_queues[8].empty()
+    assert first.get_nowait()[0] == 7
+    assert second.get_nowait()[0] == 8
 
 
 def test_update_display_caps_at_five_commands_per_tick(mcp):
@@ -176,11 +217,11 @@ def test_update_display_caps_at_five_commands_per_tick(mcp):
     assert mcp.command_queue.qsize() == 1
 
 
-def test_update_display_skips_missing_response_queue(mcp):
-    """Command whose response queue was already cleaned up should not raise."""
-    mcp.command_queue.put((999, {"action": "ping"}))
-    # No entry in response_queues for id 999 - should not blow up
+def test_update_display_skips_command_without_channel(mcp):
+    """A command queued without a response channel is executed but not answered."""
+    mcp.command_queue.put((999, {"action": "ping"}, None))
     mcp.update_display()
+    assert mcp.command_queue.empty()
 
 
 def test_update_display_handles_exception_in_processing(mcp):
@@ -305,15 +346,13 @@ def test_socket_listener_logs_error_when_running(mcp):
 
 
 def _make_intercept(mcp):
-    """Intercept command_queue.put and immediately fulfil the response queue."""
-    original_put = mcp.command_queue.put
+    """Intercept command_queue.put_nowait and immediately answer on the response channel."""
+    original_put = mcp.command_queue.put_nowait
 
     def intercept(item):
-        request_id, command = item
+        request_id, command, channel = item
         original_put(item)
-        response = mcp._process_command(command)
-        if request_id in mcp.response_queues:
-            mcp.response_queues[request_id].put(response)
+        channel.put((request_id, mcp._process_command(command)))
 
     return intercept
 
@@ -322,7 +361,7 @@ def test_handle_client_success(mcp):
     mock_client = MagicMock()
     json_message = json.dumps({"action": "ping"}) + "\n"
     mock_client.recv.side_effect = [json_message.encode(), b""]
-    mcp.command_queue.put = _make_intercept(mcp)
+    mcp.command_queue.put_nowait = _make_intercept(mcp)
 
     mcp._handle_client(mock_client)
 
@@ -351,8 +390,8 @@ def test_handle_client_response_timeout(mcp):
     json_message = json.dumps({"action": "ping"}) + "\n"
     mock_client.recv.side_effect = [json_message.encode(), b""]
 
-    # Patch the response queue's get() to immediately raise queue.Empty
-    with patch("ALiveMCP_Remote.queue.Queue.get", side_effect=queue.Empty):
+    # Nothing drains command_queue, so the writer gives up after the timeout
+    with patch("ALiveMCP_Remote.socket_server.RESPONSE_TIMEOUT_SECONDS", 0.01):
         mcp._handle_client(mock_client)
 
     mock_client.sendall.assert_called_once()
@@ -394,8 +433,141 @@ def test_handle_client_multiple_messages_in_buffer(mcp):
     msg2 = json.dumps({"action": "ping"})
     payload = (msg1 + "\n" + msg2 + "\n").encode()
     mock_client.recv.side_effect = [payload, b""]
-    mcp.command_queue.put = _make_intercept(mcp)
+    mcp.command_queue.put_nowait = _make_intercept(mcp)
 
     mcp._handle_client(mock_client)
 
     assert mock_client.sendall.call_count == 2
+
+
+def test_handle_client_pipelined_responses_keep_request_order(mcp):
+    mock_client = MagicMock()
+    payload = "".join(
+        json.dumps({"action": "set_tempo", "bpm": bpm}) + "\n" for bpm in (100, 110, 120)
+    )
+    mock_client.recv.side_effect = [payload.encode(), b""]
+    mcp.tools.set_tempo = MagicMock(side_effect=lambda bpm: {"ok": True, "bpm": bpm})
+    mcp.rebuild_dispatch_table()
+    mcp.command_queue.put_nowait = _make_intercept(mcp)
+
+    mcp._handle_client(mock_client)
+
+    sent = [json.loads(c[0][0].decode()) for c in mock_client.sendall.call_args_list]
+    assert [r["bpm"] for r in sent] == [100, 110, 120]
+
+
+# ---------------------------------------------------------------------------
+# Backpressure
+# ---------------------------------------------------------------------------
+
+
+def test_submit_message_rejects_when_queue_full(mcp):
+    mcp.command_queue = queue.Queue(maxsize=1)
+    mcp.command_queue.put_nowait((0, {"action": "ping"}, None))
+    mcp.tracer.submitted = MagicMock()
+
+    request_id, response = mcp._submit_message(json.dumps({"action": "ping"}), None)
+
+    assert request_id is not None
+    assert response["ok"] is False
+    assert response["error"] == "overloaded"
+    assert response["retry_after_ms"] > 0
+    assert mcp.backpressure.snapshot()["shed_overloaded"] == 1
+    # Traced like any other reply, so the record keeps its action
+    mcp.tracer.submitted.assert_called_once_with(request_id, {"action": "ping"}, ANY)
+
+
+def test_submit_message_answers_unknown_action_without_queueing(mcp):
+    request_id, response = mcp._submit_message(json.dumps({"action": "set_temp"}), None)
+
+    assert request_id is not None
+    assert response["error"] == "Unknown action: set_temp"
+    assert "set_tempo" in response["did_you_mean"]
+    assert mcp.command_queue.empty()
+
+
+def test_submit_message_rejects_invalid_parameters_without_queueing(mcp):
+    request_id, response = mcp._submit_message(json.dumps({"action": "set_tempo", "bpm": 5}), None)
+
+    assert request_id is not None
+    assert response["error"] == "Invalid bpm for set_tempo: must be between 20 and 999"
+    assert response["parameters"] == ["bpm"]
+    assert mcp.command_queue.empty()
+
+
+def test_submit_message_queues_coerced_parameters(mcp):
+    mcp._submit_message(json.dumps({"action": "get_clip_info", "track_index": "1",
+                                    "scene_index": 2.0}), None)  # fmt: skip
+
+    _, command, _ = mcp.command_queue.get_nowait()
+    assert command == {"action": "get_clip_info", "track_index": 1, "clip_index": 2}
+
+
+def test_submit_message_records_peak_queue_size(mcp):
+    mcp._submit_message(json.dumps({"action": "ping"}), None)
+    mcp._submit_message(json.dumps({"action": "ping"}), None)
+    assert mcp.backpressure.snapshot()["peak_queue_size"] == 2
+
+
+def test_handle_client_overloaded_response_is_sent(mcp):
+    mock_client = MagicMock()
+    mock_client.recv.side_effect = [(json.dumps({"action": "ping"}) + "\n").encode(), b""]
+    mcp.command_queue.put_nowait = MagicMock(side_effect=queue.Full)
+
+    mcp._handle_client(mock_client)
+
+    response = json.loads(mock_client.sendall.call_args[0][0].decode())
+    assert response["error"] == "overloaded"
+
+
+def test_acquire_slot_pauses_reads_when_over_quota(mcp):
+    slots = MagicMock()
+    slots.acquire.side_effect = [False, True]
+    assert mcp._acquire_slot(slots) is True
+    assert mcp.backpressure.snapshot()["paused_reads"] == 1
+
+
+def test_acquire_slot_gives_up_when_server_stops(mcp):
+    slots = MagicMock()
+    slots.acquire.return_value = False
+    mcp.running = False
+    assert mcp._acquire_slot(slots) is False
+
+
+def test_handle_client_never_exceeds_pending_quota(mcp):
+    """The reader blocks on its quota until the writer sends a response."""
+    mock_client = MagicMock()
+    count = MAX_PENDING_PER_CLIENT + 3
+    payload = "".join(json.dumps({"action": "ping"}) + "\n" for _ in range(count))
+    mock_client.recv.side_effect = [payload.encode(), b""]
+    mcp.command_queue.put_nowait = _make_intercept(mcp)
+
+    mcp._handle_client(mock_client)
+
+    assert mock_client.sendall.call_count == count
+    assert mcp.backpressure.snapshot()["active_clients"] == 0
+
+
+def test_await_response_discards_stale_answers(mcp):
+    channel = queue.SimpleQueue()
+    channel.put((3, {"ok": True, "late": True}))
+    channel.put((4, {"ok": True, "late": False}))
+    assert mcp._await_response(4, channel, {}) == {"ok": True, "late": False}
+
+
+def test_await_response_keeps_answers_that_arrive_early(mcp):
+    channel = queue.SimpleQueue()
+    early = {}
+    channel.put((6, {"ok": True, "n": 6}))
+    channel.put((5, {"ok": True, "n": 5}))
+    assert mcp._await_response(5, channel, early) == {"ok": True, "n": 5}
+    assert mcp._await_response(6, channel, early) == {"ok": True, "n": 6}
+    assert early == {}
+
+
+def test_backpressure_retry_after_scales_with_queue_depth():
+    from ALiveMCP_Remote.backpressure import Backpressure
+
+    bp = Backpressure()
+    assert bp.retry_after_ms(0) == bp.retry_after_ms(1)
+    assert bp.retry_after_ms(100) > bp.retry_after_ms(5)
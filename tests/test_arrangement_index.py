@@ -0,0 +1,114 @@
+"""
+Tests for the arrangement timeline index and query_arrangement
+(ALiveMCP_Remote/tools/arrangement_index.py), run against the mock Live
+object model.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from ALiveMCP_Remote.dispatch import action_flags
+
+
+@pytest.fixture
+def song(mock_song):
+    song = mock_song(tracks=3, scenes=1, clip_fill=0.0)
+    # Track 0: back-to-back clips plus one long one; track 1: sparse; track 2: empty
+    for start, length in [(0.0, 4.0), (4.0, 4.0), (8.0, 4.0), (16.0, 64.0)]:
+        song.tracks[0].create_midi_clip(start, length)
+    song.tracks[1].create_midi_clip(100.0, 8.0)
+    for time in (0.0, 32.0, 96.0):
+        song._set("current_song_time", time)
+        song.set_or_delete_cue()
+    return song
+
+
+def _spans(reply):
+    return [(c["track_index"], c["start_time"], c["end_time"]) for c in reply["clips"]]
+
+
+def test_window_returns_only_overlapping_clips_and_locators(mock_tools):
+    reply = mock_tools.query_arrangement(6.0, 40.0)
+
+    assert reply["ok"] is True
+    # The clip ending exactly at 6.0 is outside; the long clip starting at 16 is in
+    assert _spans(reply) == [(0, 4.0, 8.0), (0, 8.0, 12.0), (0, 16.0, 80.0)]
+    assert [loc["time"] for loc in reply["locators"]] == [32.0]
+    assert reply["clips"][0]["clip_index"] == 1
+    assert reply["listening"] is True
+
+
+def test_long_clips_are_found_from_inside(mock_tools):
+    assert _spans(mock_tools.query_arrangement(60.0, 61.0)) == [(0, 16.0, 80.0)]
+    assert _spans(mock_tools.query_arrangement(80.0, 100.0)) == []
+
+
+def test_tracks_filter(mock_tools):
+    reply = mock_tools.query_arrangement(0.0, 200.0, tracks=[1])
+    assert _spans(reply) == [(1, 100.0, 108.0)]
+    assert reply["clips"][0]["is_midi_clip"] is True
+
+
+def test_listeners_rebuild_only_what_changed(mock_tools, song):
+    assert mock_tools.query_arrangement(0.0, 1.0)["rebuilt_tracks"] == 3
+    assert mock_tools.query_arrangement(0.0, 1.0)["rebuilt_tracks"] == 0
+
+    added = song.tracks[2].create_midi_clip(2.0, 1.0)
+    reply = mock_tools.query_arrangement(0.0, 4.0, tracks=[2])
+    assert (reply["rebuilt_tracks"], _spans(reply)) == (1, [(2, 2.0, 3.0)])
+
+    song.tracks[2].delete_clip(added)
+    song._set("current_song_time", 2.0)
+    song.set_or_delete_cue()
+    reply = mock_tools.query_arrangement(0.0, 4.0, tracks=[2])
+    assert (reply["rebuilt_tracks"], reply["clips"]) == (1, [])
+    assert [loc["time"] for loc in reply["locators"]] == [0.0, 2.0]
+
+    song.create_midi_track(0)
+    reply = mock_tools.query_arrangement(100.0, 101.0)
+    assert (reply["rebuilt_tracks"], _spans(reply)) == (4, [(2, 100.0, 108.0)])
+
+
+def test_refresh_picks_up_edits_listeners_do_not_report(mock_tools, song):
+    mock_tools.query_arrangement(0.0, 1.0)
+    clip = song.tracks[1].arrangement_clips[0]
+    clip._set("start_time", 0.0)
+    clip._set("end_time", 8.0)
+    assert mock_tools.query_arrangement(0.0, 1.0, tracks=[1])["clips"] == []
+    assert _spans(mock_tools.query_arrangement(0.0, 1.0, tracks=[1], refresh=True)) == [
+        (1, 0.0, 8.0)
+    ]
+
+
+def test_tracks_without_listeners_are_rebuilt_every_query(mock_tools, song):
+    group = MagicMock(spec=["arrangement_clips"])
+    group.arrangement_clips = []
+    song.tracks.append(group)
+    song._notify("tracks")
+    mock_tools.query_arrangement(0.0, 1.0)
+    reply = mock_tools.query_arrangement(0.0, 1.0)
+    assert (reply["rebuilt_tracks"], reply["listening"]) == (1, False)
+
+
+def test_close_removes_every_listener(mock_tools, song):
+    mock_tools.query_arrangement(0.0, 1.0)
+    mock_tools.close_arrangement_index()
+    assert not any(song._listeners.values())
+    assert not any(track._listeners["arrangement_clips"] for track in song.tracks)
+
+
+@pytest.mark.parametrize(
+    "args, kwargs, error",
+    [
+        ((4.0, 4.0), {}, "time_to must be greater than time_from"),
+        ((0.0, 4.0), {"tracks": [0, 7]}, "Invalid track index(es): [7]"),
+        ((0.0, 4.0), {"tracks": [True, 1]}, "Invalid track index(es): [True]"),
+    ],
+)
+def test_invalid_queries(mock_tools, args, kwargs, error):
+    assert mock_tools.query_arrangement(*args, **kwargs) == {"ok": False, "error": error}
+
+
+def test_query_is_a_read():
+    assert action_flags("query_arrangement")[0] is True
@@ -140,15 +140,15 @@ def test_insert_automation_step_with_insert_step(tools, song):
     clip, param, device = _setup_song_with_clip_and_device(song)
     envelope = MagicMock()
     clip.automation_envelope.return_value = envelope
-    result = tools.insert_automation_step(0, 0, 0, 0, 1.0, 0.5)
+    result = tools.insert_automation_step(0, 0, 1.0, 0.5, device_index=0, param_index=0)
     assert result["ok"] is True
-    envelope.insert_step.assert_called_once_with(1.0, 0.5)
+    envelope.insert_step.assert_called_once_with(1.0, 0.0, 0.5)
 
 
 def test_insert_automation_step_no_envelope(tools, song):
     clip, param, device = _setup_song_with_clip_and_device(song)
     clip.automation_envelope.return_value = None
-    result = tools.insert_automation_step(0, 0, 0, 0, 1.0, 0.5)
+    result = tools.insert_automation_step(0, 0, 1.0, 0.5, device_index=0, param_index=0)
     assert result["ok"] is False
 
 
@@ -157,26 +157,26 @@ def test_insert_automation_step_no_insert_step_method(tools, song):
     envelope = MagicMock()
     del envelope.insert_step
     clip.automation_envelope.return_value = envelope
-    result = tools.insert_automation_step(0, 0, 0, 0, 1.0, 0.5)
+    result = tools.insert_automation_step(0, 0, 1.0, 0.5, device_index=0, param_index=0)
     assert result["ok"] is False
 
 
 def test_insert_automation_step_no_automation_envelope_attr(tools, song):
     clip, param, device = _setup_song_with_clip_and_device(song)
     del clip.automation_envelope
-    result = tools.insert_automation_step(0, 0, 0, 0, 1.0, 0.5)
+    result = tools.insert_automation_step(0, 0, 1.0, 0.5, device_index=0, param_index=0)
     assert result["ok"] is False
 
 
 def test_insert_automation_step_no_clip(tools, song):
     song.tracks[0].clip_slots[0].has_clip = False
-    result = tools.insert_automation_step(0, 0, 0, 0, 1.0, 0.5)
+    result = tools.insert_automation_step(0, 0, 1.0, 0.5, device_index=0, param_index=0)
     assert result["ok"] is False
 
 
 def test_insert_automation_step_exception(tools, song):
     song.tracks = None  # None[0] → TypeError → ok=False
-    result = tools.insert_automation_step(0, 0, 0, 0, 1.0, 0.5)
+    result = tools.insert_automation_step(0, 0, 1.0, 0.5, device_index=0, param_index=0)
     assert result["ok"] is False
 
 
@@ -189,7 +189,7 @@ def test_remove_automation_step_with_remove_step(tools, song):
     clip, param, device = _setup_song_with_clip_and_device(song)
     envelope = MagicMock()
     clip.automation_envelope.return_value = envelope
-    result = tools.remove_automation_step(0, 0, 0, 0, 2.0)
+    result = tools.remove_automation_step(0, 0, 2.0, device_index=0, param_index=0)
     assert result["ok"] is True
     envelope.remove_step.assert_called_once_with(2.0)
 
@@ -197,7 +197,7 @@ def test_remove_automation_step_with_remove_step(tools, song):
 def test_remove_automation_step_no_envelope(tools, song):
     clip, param, device = _setup_song_with_clip_and_device(song)
     clip.automation_envelope.return_value = None
-    result = tools.remove_automation_step(0, 0, 0, 0, 2.0)
+    result = tools.remove_automation_step(0, 0, 2.0, device_index=0, param_index=0)
     assert result["ok"] is False
 
 
@@ -206,26 +206,26 @@ def test_remove_automation_step_no_remove_step_method(tools, song):
     envelope = MagicMock()
     del envelope.remove_step
     clip.automation_envelope.return_value = envelope
-    result = tools.remove_automation_step(0, 0, 0, 0, 2.0)
+    result = tools.remove_automation_step(0, 0, 2.0, device_index=0, param_index=0)
     assert result["ok"] is False
 
 
 def test_remove_automation_step_no_automation_envelope_attr(tools, song):
     clip, param, device = _setup_song_with_clip_and_device(song)
     del clip.automation_envelope
-    result = tools.remove_automation_step(0, 0, 0, 0, 2.0)
+    result = tools.remove_automation_step(0, 0, 2.0, device_index=0, param_index=0)
     assert result["ok"] is False
 
 
 def test_remove_automation_step_no_clip(tools, song):
     song.tracks[0].clip_slots[0].has_clip = False
-    result = tools.remove_automation_step(0, 0, 0, 0, 2.0)
+    result = tools.remove_automation_step(0, 0, 2.0, device_index=0, param_index=0)
     assert result["ok"] is False
 
 
 def test_remove_automation_step_exception(tools, song):
     song.tracks = None  # None[0] → TypeError → ok=False
-    result = tools.remove_automation_step(0, 0, 0, 0, 2.0)
+    result = tools.remove_automation_step(0, 0, 2.0, device_index=0, param_index=0)
     assert result["ok"] is False
 
 
@@ -0,0 +1,129 @@
+"""
+Tests for get_automation_envelope_values (ALiveMCP_Remote/tools/automation_curves.py)
+and param_ref targets in the clip envelope tools, run against the mock Live
+object model.
+"""
+
+import pytest
+
+from ALiveMCP_Remote.tools.automation_curves import breakpoints, sample_times
+from ALiveMCP_Remote.tools.schemas import tool_schema
+
+
+@pytest.fixture
+def song(mock_song):
+    return mock_song(tracks=1, scenes=1, clip_fill=1.0, notes_per_clip=0)
+
+
+def _envelope(song, param):
+    return song.tracks[0].clip_slots[0].clip.create_automation_envelope(param)
+
+
+def test_samples_follow_the_envelope(mock_tools, song):
+    param = song.tracks[0].devices[0].parameters[0]
+    envelope = _envelope(song, param)
+    envelope.insert_step(0.0, 0.0, 0.0)
+    envelope.insert_step(2.0, 0.0, 1.0)
+
+    reply = mock_tools.get_automation_envelope_values(
+        0, 0, 0, 0, time_range=[0.0, 4.0], resolution=0.5
+    )
+
+    assert reply["ok"] is True
+    assert (reply["has_envelope"], reply["mode"], reply["resolution"]) == (True, "samples", 0.5)
+    assert reply["times"] == [0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0]
+    assert reply["values"] == [0.0, 0.25, 0.5, 0.75, 1.0, 1.0, 1.0, 1.0, 1.0]
+    assert reply["point_count"] == 9
+
+
+def test_breakpoints_keep_only_the_corners(mock_tools, song):
+    param = song.tracks[0].devices[0].parameters[0]
+    envelope = _envelope(song, param)
+    envelope.insert_step(0.0, 0.0, 0.0)
+    envelope.insert_step(2.0, 0.0, 1.0)
+
+    reply = mock_tools.get_automation_envelope_values(
+        0, 0, 0, 0, mode="breakpoints", time_range=[0.0, 4.0], resolution=0.25
+    )
+
+    assert (reply["times"], reply["values"]) == ([0.0, 2.0, 4.0], [0.0, 1.0, 1.0])
+    assert reply["resolution"] is None
+
+
+def test_param_ref_reads_mixer_envelopes(mock_tools, song):
+    _envelope(song, song.tracks[0].mixer_device.volume).insert_step(1.0, 1.0, 0.2)
+
+    reply = mock_tools.get_automation_envelope_values(0, 0, param_ref="volume", max_points=3)
+    assert reply["parameter_name"] == "Track Volume"
+    assert reply["time_range"] == [0.0, float(song.tracks[0].clip_slots[0].clip.length)]
+    assert reply["point_count"] == 3
+
+
+def test_missing_envelope_is_not_an_error(mock_tools):
+    reply = mock_tools.get_automation_envelope_values(0, 0, param_ref="pan")
+    assert (reply["ok"], reply["has_envelope"]) == (True, False)
+
+
+@pytest.mark.parametrize(
+    "kwargs, error",
+    [
+        ({"mode": "steps"}, "mode must be one of: samples, breakpoints"),
+        ({"resolution": 0}, "resolution must be greater than 0"),
+        ({}, "Give device_index and param_index, or param_ref"),
+        ({"param_ref": "sends/9"}, "Invalid send index: 9"),
+    ],
+)
+def test_invalid_requests(mock_tools, kwargs, error):
+    assert mock_tools.get_automation_envelope_values(0, 0, **kwargs) == {
+        "ok": False,
+        "error": error,
+    }
+
+
+def test_sample_times_respects_the_point_budget():
+    assert sample_times(0.0, 4.0, 0.001, 5) == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert len(sample_times(0.0, 64.0, None, 100000)) == 4096
+    assert sample_times(2.0, 2.0, None, 10) == [2.0]
+
+
+def test_breakpoints_of_short_curves_are_unchanged():
+    assert breakpoints([0.0, 1.0], [0.5, 0.5]) == ([0.0, 1.0], [0.5, 0.5])
+
+
+@pytest.mark.parametrize("ref", ["track/0/sends/0", "/track/0/volume", "pan"])
+def test_envelope_tools_accept_mixer_targets(mock_tools, song, ref):
+    assert mock_tools.create_automation_envelope(0, 0, param_ref=ref)["device_name"] is None
+    reply = mock_tools.insert_automation_step(0, 0, time=1.0, value=0.5, length=1.0, param_ref=ref)
+    assert reply["ok"] is True
+    assert mock_tools.get_automation_envelope_values(
+        0, 0, param_ref=ref, time_range=[1.0, 2.0], resolution=1.0
+    )["values"] == [0.5, 0.5]
+    assert mock_tools.clear_automation_envelope(0, 0, param_ref=ref)["ok"] is True
+    assert mock_tools.get_clip_automation_envelope(0, 0, param_ref=ref)["has_envelope"] is False
+
+
+@pytest.mark.parametrize(
+    "tool, required",
+    [
+        ("insert_automation_step", ["track_index", "clip_index", "time", "value"]),
+        ("remove_automation_step", ["track_index", "clip_index", "time"]),
+    ],
+)
+def test_step_times_and_values_stay_required(mock_tools, tool, required):
+    assert tool_schema(tool, getattr(mock_tools, tool))["required"] == required
+
+
+@pytest.mark.parametrize(
+    "ref, error",
+    [
+        ("master/volume", "Clip envelopes can only automate their own track; master/volume is"),
+        ("return/0/pan", "Clip envelopes can only automate their own track; return/0/pan is"),
+        ("crossfader", "Clip envelopes can only automate their own track; crossfader is"),
+        ("track/1/volume", "Clip envelopes can only automate their own track; the clip is on"),
+        ("mixer/volume", "Unknown parameter reference: mixer/volume"),
+    ],
+)
+def test_targets_off_the_clip_track_are_rejected(mock_tools, ref, error):
+    reply = mock_tools.get_clip_automation_envelope(0, 0, param_ref=ref)
+    assert reply["ok"] is False
+    assert reply["error"].startswith(error)
@@ -0,0 +1,101 @@
+"""
+Tests for write_automation_curve (ALiveMCP_Remote/tools/automation_write.py),
+run against the mock Live object model.
+"""
+
+import pytest
+
+from ALiveMCP_Remote.jobs import ChunkedJob
+
+
+@pytest.fixture
+def song(mock_song):
+    return mock_song(tracks=1, scenes=1, clip_fill=1.0, notes_per_clip=0)
+
+
+def _read(mock_tools, times):
+    return mock_tools.get_automation_envelope_values(
+        0, 0, 0, 0, time_range=[times[0], times[-1]], resolution=times[1] - times[0]
+    )["values"]
+
+
+def test_points_are_written_as_a_linear_curve(mock_tools):
+    reply = mock_tools.write_automation_curve(0, 0, 0, 0, times=[0.0, 2.0], values=[0.0, 1.0])
+
+    assert reply == {
+        "ok": True,
+        "parameter_name": "Device On",
+        "created_envelope": True,
+        "time_range": [0.0, 2.0],
+        "hold": False,
+        "point_count": 2,
+    }
+    assert _read(mock_tools, [0.0, 0.5, 1.0, 1.5, 2.0]) == [0.0, 0.25, 0.5, 0.75, 1.0]
+
+
+def test_hold_writes_a_staircase(mock_tools):
+    mock_tools.write_automation_curve(0, 0, 0, 0, times=[0.0, 1.0], values=[0.2, 0.8], hold=True)
+    assert _read(mock_tools, [0.0, 0.5, 1.0, 1.5]) == [0.2, 0.2, 0.8, 0.8]
+
+
+def test_rewriting_replaces_the_range(mock_tools):
+    mock_tools.write_automation_curve(0, 0, 0, 0, times=[0.0, 1.0, 2.0], values=[0.0, 1.0, 0.0])
+    reply = mock_tools.write_automation_curve(0, 0, 0, 0, times=[0.0, 2.0], values=[0.5, 0.5])
+    assert reply["created_envelope"] is False
+    assert _read(mock_tools, [0.0, 1.0, 2.0]) == [0.5, 0.5, 0.5]
+
+
+@pytest.mark.parametrize(
+    "shape, expected",
+    [
+        ({"type": "ramp", "start_value": 1.0, "end_value": 0.0}, [1.0, 0.75, 0.5, 0.25, 0.0]),
+        ({"type": "sine", "cycles": 1, "phase": 0.25}, [1.0, 0.5, 0.0, 0.5, 1.0]),
+        ({"type": "steps", "levels": [0.1, 0.9]}, [0.1, 0.1, 0.9, 0.9, 0.9]),
+    ],
+)
+def test_shapes(mock_tools, shape, expected):
+    reply = mock_tools.write_automation_curve(
+        0, 0, param_ref="device/0/param/0", shape=shape, time_range=[0.0, 4.0], resolution=1.0
+    )
+    assert reply["ok"] is True
+    values = _read(mock_tools, [0.0, 1.0, 2.0, 3.0, 4.0])
+    assert values == pytest.approx(expected)
+
+
+def test_random_shape_is_repeatable_with_a_seed(mock_tools):
+    shape = {"type": "random", "low": 0.25, "high": 0.75, "seed": 7}
+    mock_tools.write_automation_curve(0, 0, 0, 0, shape=shape, time_range=[0.0, 4.0])
+    first = _read(mock_tools, [0.0, 0.25, 0.5])
+    mock_tools.write_automation_curve(0, 0, 0, 0, shape=shape, time_range=[0.0, 4.0])
+    assert _read(mock_tools, [0.0, 0.25, 0.5]) == first
+    assert all(0.25 <= v <= 0.75 for v in first)
+
+
+def test_large_curves_are_chunked(mock_tools):
+    job = mock_tools.write_automation_curve(
+        0, 0, 0, 0, shape={"type": "ramp"}, time_range=[0.0, 64.0], resolution=0.0625
+    )
+    assert isinstance(job, ChunkedJob)
+    assert job.run()["point_count"] == 1025
+    assert _read(mock_tools, [32.0, 48.0]) == [0.5, 0.75]
+
+
+@pytest.mark.parametrize(
+    "kwargs, error",
+    [
+        ({}, "Give either times and values, or shape"),
+        ({"times": [0.0], "values": [0.0], "shape": {"type": "ramp"}}, "Give either times"),
+        ({"times": [0.0, 1.0], "values": [0.0]}, "times and values must be non-empty"),
+        ({"times": [1.0, 0.0], "values": [0.0, 0.0]}, "Invalid time_range: [1.0, 0.0]"),
+        ({"times": [0.0, 1.0], "values": [0.0, 2.0]}, "values[1] = 2.0 is outside"),
+        ({"shape": {"type": "saw"}}, "shape type must be one of: sine, ramp, steps, random"),
+        ({"shape": {"type": "steps"}}, "steps shape requires levels"),
+        ({"shape": {"type": "sine", "depth": 1}}, "unexpected parameter(s) for sine: depth"),
+    ],
+)
+def test_invalid_curves_write_nothing(mock_tools, song, kwargs, error):
+    reply = mock_tools.write_automation_curve(0, 0, 0, 0, **kwargs)
+    assert reply["ok"] is False
+    assert reply["error"].startswith(error)
+    param = song.tracks[0].devices[0].parameters[0]
+    assert song.tracks[0].clip_slots[0].clip.automation_envelope(param) is None
@@ -0,0 +1,62 @@
+"""
+Tests for the end-to-end benchmark: statistics helpers, baseline comparison
+and a short smoke run against the mock Live engine.
+"""
+
+import json
+
+from benchmarks.bench_e2e import compare, main
+from benchmarks.workloads import percentile, summarize
+
+
+def test_percentile_nearest_rank():
+    samples = [float(n) for n in range(1, 101)]
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile(samples, 100) == 100.0
+    assert percentile([], 95) == 0.0
+
+
+def test_summarize_reports_rate_and_percentiles():
+    summary = summarize([0.001, 0.002, 0.003, 0.004], errors=1, seconds=2.0, ops=4, clients=2)
+    assert summary["ops_per_sec"] == 2.0
+    assert summary["p50_ms"] == 2.0
+    assert summary["max_ms"] == 4.0
+    assert summary["errors"] == 1
+    assert summary["clients"] == 2
+
+
+def test_compare_flags_only_regressions_beyond_threshold(capsys):
+    baseline = {
+        "workloads": {
+            "a": {"ops_per_sec": 100, "p95_ms": 1},
+            "b": {"ops_per_sec": 100, "p95_ms": 1},
+        }
+    }
+    current = {
+        "workloads": {
+            "a": {"ops_per_sec": 95, "p95_ms": 1},
+            "b": {"ops_per_sec": 80, "p95_ms": 1},
+            "new": {"ops_per_sec": 10, "p95_ms": 1},
+        }
+    }
+    assert compare(current, baseline, max_regression=0.1) == ["b"]
+    assert compare(current, baseline, max_regression=None) == []
+    assert "new" not in capsys.readouterr().out
+
+
+def test_smoke_run_writes_results(tmp_path):
+    output = tmp_path / "run.json"
+    argv = ["--tracks", "8", "--scenes", "4", "--scale", "0.05", "--quiet"]
+    argv += ["--only", "read_polling", "fader_streams", "--output", str(output)]
+    assert main(argv) == 0
+
+    results = json.loads(output.read_text())
+    assert set(results["workloads"]) == {"read_polling", "fader_streams"}
+    assert results["meta"]["set"]["tracks"] == 8
+    for summary in results["workloads"].values():
+        assert summary["errors"] == 0
+        assert summary["ops_per_sec"] > 0
+
+    # The same run compared against itself never regresses
+    assert main(argv + ["--compare", str(output), "--max-regression", "0.99"]) == 0
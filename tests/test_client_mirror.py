@@ -0,0 +1,228 @@
+"""
+Tests for alivemcp_client.mirror: JSON Patch diffing and the shared
+SessionMirror fan-out.
+"""
+
+import asyncio
+import copy
+
+import pytest
+
+from alivemcp_client.mirror import (
+    MAX_SUBSCRIBER_BACKLOG,
+    MIN_GRID_POLL_INTERVAL,
+    SessionMirror,
+    apply_patch,
+    diff,
+)
+from alivemcp_client.protocol import AliveMCPConnectionError
+
+
+class FakeLive:
+    """Async stand-in for AsyncAliveMCPClient serving a mutable session dict."""
+
+    def __init__(self):
+        self.tempo = 120.0
+        self.grid = [[None, ["Bass"]]]
+        self.reads = []
+        self.fail = False
+
+    async def call(self, action, **params):
+        if self.fail:
+            raise AliveMCPConnectionError("gone")
+        self.reads.append(action)
+        if action == "get_clip_grid":
+            version = str(self.grid)
+            if params["version"] == version:
+                return {"ok": True, "not_modified": True, "version": version}
+            return {"ok": True, "grid": copy.deepcopy(self.grid), "version": version}
+        return {"ok": True, "tempo": self.tempo, "num_tracks": len(self.grid)}
+
+
+def _roundtrip(old, new):
+    return apply_patch(copy.deepcopy(old), diff(old, new))
+
+
+# ---------------------------------------------------------------------------
+# diff / apply_patch
+# ---------------------------------------------------------------------------
+
+
+def test_diff_of_equal_documents_is_empty():
+    assert diff({"a": [1, {"b": 2}]}, {"a": [1, {"b": 2}]}) == []
+
+
+def test_diff_replaces_changed_leaf_only():
+    ops = diff(
+        {"session": {"tempo": 120, "playing": False}}, {"session": {"tempo": 128, "playing": False}}
+    )
+    assert ops == [{"op": "replace", "path": "/session/tempo", "value": 128}]
+
+
+def test_diff_treats_bool_and_int_as_different():
+    assert diff({"v": 1}, {"v": True}) == [{"op": "replace", "path": "/v", "value": True}]
+
+
+@pytest.mark.parametrize(
+    "old, new",
+    [
+        ({"a": 1}, {"b": 2}),
+        ({"tracks": [1, 2, 3]}, {"tracks": [1]}),
+        ({"tracks": [1]}, {"tracks": [1, 2, 3]}),
+        ({"t": [{"m": False}]}, {"t": [{"m": True}, {"m": False}]}),
+        ({"a/b": 1, "c~d": 2}, {"a/b": 3, "c~d": 4}),
+        ({"x": [1]}, {"x": {"y": 1}}),
+    ],
+)
+def test_apply_patch_roundtrips(old, new):
+    assert _roundtrip(old, new) == new
+
+
+def test_apply_patch_root_replace():
+    assert apply_patch(None, [{"op": "replace", "path": "", "value": {"a": 1}}]) == {"a": 1}
+
+
+# ---------------------------------------------------------------------------
+# SessionMirror
+# ---------------------------------------------------------------------------
+
+
+async def _next(queue):
+    return await asyncio.wait_for(queue.get(), 1)
+
+
+def test_subscribers_share_one_poll_and_receive_patches():
+    async def scenario():
+        live = FakeLive()
+        mirror = SessionMirror(live, interval=10)
+        first = mirror.subscribe()
+        initial = await _next(first)
+        second = mirror.subscribe()
+        snapshot = await _next(second)
+        reads_after_first_poll = list(live.reads)
+
+        live.tempo = 128.0
+        mirror.refresh_soon()
+        patch_a, patch_b = await _next(first), await _next(second)
+        await mirror.stop()
+        return initial, snapshot, patch_a, patch_b, reads_after_first_poll
+
+    initial, snapshot, patch_a, patch_b, reads = asyncio.run(scenario())
+    assert initial["event"] == "patch"
+    assert initial["ops"][0]["path"] == ""
+    assert snapshot["event"] == "snapshot"
+    assert snapshot["state"] == {"connected": True, "session": {"tempo": 120.0, "num_tracks": 1}}
+    assert reads == ["get_session_info"]
+    assert patch_a == patch_b
+    assert patch_a["ops"] == [{"op": "replace", "path": "/session/tempo", "value": 128.0}]
+    assert patch_a["version"] == 2
+
+
+def test_clip_grid_is_opt_in_and_rate_limited(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr("alivemcp_client.mirror.time.monotonic", lambda: clock[0])
+
+    async def scenario():
+        live = FakeLive()
+        mirror = SessionMirror(live, interval=10, grid_interval=0.1)
+        updates = mirror.subscribe()
+        initial = await _next(updates)
+
+        # Inside the grid interval only the session is read again
+        live.grid[0][0] = ["Drums"]
+        live.tempo = 128.0
+        mirror.refresh_soon()
+        tempo_patch = await _next(updates)
+
+        clock[0] += 1.0
+        mirror.refresh_soon()
+        grid_patch = await _next(updates)
+        await mirror.stop()
+        return live.reads, initial, tempo_patch, grid_patch
+
+    reads, initial, tempo_patch, grid_patch = asyncio.run(scenario())
+    assert initial["ops"][0]["value"]["clip_grid"] == {"grid": [[None, ["Bass"]]]}
+    assert reads == [
+        "get_session_info",
+        "get_clip_grid",
+        "get_session_info",
+        "get_session_info",
+        "get_clip_grid",
+    ]
+    assert tempo_patch["ops"] == [{"op": "replace", "path": "/session/tempo", "value": 128.0}]
+    assert grid_patch["ops"] == [
+        {"op": "replace", "path": "/clip_grid/grid/0/0", "value": ["Drums"]}
+    ]
+
+
+def test_unchanged_clip_grid_is_not_resent():
+    async def scenario():
+        live = FakeLive()
+        mirror = SessionMirror(live, grid_interval=0)
+        first = await mirror._read_grid()
+        mirror._grid_read_at -= mirror.grid_interval
+        second = await mirror._read_grid()
+        return live.reads, mirror.grid_interval, first, second
+
+    reads, grid_interval, first, second = asyncio.run(scenario())
+    assert reads == ["get_clip_grid", "get_clip_grid"]
+    assert grid_interval == MIN_GRID_POLL_INTERVAL
+    assert second is first
+
+
+def test_unchanged_state_publishes_nothing():
+    mirror = SessionMirror(FakeLive())
+    state = {"connected": True, "session": {}}
+    mirror.publish(state)
+    version = mirror.version
+    mirror.publish(copy.deepcopy(state))
+    assert mirror.version == version
+
+
+def test_connection_failure_marks_state_disconnected():
+    async def scenario():
+        live = FakeLive()
+        mirror = SessionMirror(live, interval=10)
+        updates = mirror.subscribe()
+        await _next(updates)
+        live.fail = True
+        mirror.refresh_soon()
+        patch = await _next(updates)
+        await mirror.stop()
+        return patch
+
+    patch = asyncio.run(scenario())
+    assert patch["ops"] == [{"op": "replace", "path": "/connected", "value": False}]
+
+
+def test_polling_stops_without_subscribers():
+    async def scenario():
+        live = FakeLive()
+        mirror = SessionMirror(live, interval=0.01)
+        updates = mirror.subscribe()
+        await _next(updates)
+        mirror.unsubscribe(updates)
+        await asyncio.sleep(0.05)
+        reads = len(live.reads)
+        await asyncio.sleep(0.05)
+        return reads, len(live.reads), mirror._task.done()
+
+    before, after, done = asyncio.run(scenario())
+    assert before == after
+    assert done
+
+
+def test_lagging_subscriber_gets_snapshot_instead_of_backlog():
+    async def scenario():
+        mirror = SessionMirror(FakeLive())
+        queue = asyncio.Queue()
+        mirror._subscribers.add(queue)
+        for n in range(MAX_SUBSCRIBER_BACKLOG + 1):
+            mirror.publish({"n": n})
+        return queue
+
+    queue = asyncio.run(scenario())
+    assert queue.qsize() == 1
+    message = queue.get_nowait()
+    assert message["event"] == "snapshot"
+    assert message["state"] == {"n": MAX_SUBSCRIBER_BACKLOG}
@@ -0,0 +1,334 @@
+"""
+Tests for the alivemcp_client package against an in-process fake server
+that speaks the newline-delimited JSON protocol.
+"""
+
+import asyncio
+import collections
+import importlib.util
+import json
+import socket
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from alivemcp_client import (
+    AliveMCPClient,
+    AliveMCPConnectionError,
+    AliveMCPTimeout,
+    AsyncAliveMCPClient,
+)
+from alivemcp_client.client import Connection
+from alivemcp_client.protocol import LineDecoder, normalize_batch
+
+
+class FakeServer:
+    """
+    Answers each command in order with {"ok": True, "command": <command>}.
+    Behaviour can be tweaked per action: "silent" never answers, "drop"
+    closes the connection, and overload_first makes the first N commands
+    return an overloaded reply.
+    """
+
+    def __init__(self, overload_first=0):
+        self.overload_first = overload_first
+        self.connections = 0
+        self.received = []
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.listener.bind(("127.0.0.1", 0))
+        self.listener.listen(8)
+        self.port = self.listener.getsockname()[1]
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self.listener.accept()
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn):
+        decoder = LineDecoder()
+        with conn:
+            while True:
+                try:
+                    chunk = conn.recv(4096)
+                except OSError:
+                    return
+                if not chunk:
+                    return
+                for command in decoder.feed(chunk):
+                    self.received.append(command)
+                    action = command["action"]
+                    if action == "drop":
+                        return
+                    if action == "silent":
+                        continue
+                    if self.overload_first > 0:
+                        self.overload_first -= 1
+                        reply = {"ok": False, "error": "overloaded", "retry_after_ms": 1}
+                    else:
+                        reply = {"ok": True, "command": command}
+                    conn.sendall((json.dumps(reply) + "\n").encode("utf-8"))
+
+    def close(self):
+        self.listener.close()
+
+
+class PendingLimitSocket:
+    """
+    Socket stand-in for a slow server at its pending limit: sendall() blocks
+    while `limit` replies are unread, and a reply only counts as read once
+    the client comes back to recv() the next one.
+    """
+
+    def __init__(self, limit=16, delay=0.001):
+        self.limit = limit
+        self.delay = delay
+        self.decoder = LineDecoder()
+        self.replies = collections.deque()
+        self.unread = 0
+        self.handed_out = 0
+        self.closed = False
+        self.cond = threading.Condition()
+
+    def sendall(self, data):
+        with self.cond:
+            while self.unread >= self.limit and not self.closed:
+                self.cond.wait()
+            if self.closed:
+                raise OSError("closed")
+            for command in self.decoder.feed(data):
+                self.replies.append({"ok": True, "command": command})
+                self.unread += 1
+            self.cond.notify_all()
+
+    def recv(self, size):
+        with self.cond:
+            self.unread -= self.handed_out
+            self.handed_out = 0
+            self.cond.notify_all()
+            while not self.replies and not self.closed:
+                self.cond.wait()
+            if self.closed:
+                return b""
+            reply = self.replies.popleft()
+            self.handed_out = 1
+        time.sleep(self.delay)
+        return (json.dumps(reply) + "\n").encode("utf-8")
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+
+
+@pytest.fixture
+def server():
+    fake = FakeServer()
+    yield fake
+    fake.close()
+
+
+@pytest.fixture
+def client(server):
+    live = AliveMCPClient(port=server.port, timeout=2)
+    yield live
+    live.close()
+
+
+# ---------------------------------------------------------------------------
+# Protocol helpers
+# ---------------------------------------------------------------------------
+
+
+def test_line_decoder_handles_split_and_joined_lines():
+    decoder = LineDecoder()
+    assert decoder.feed(b'{"a": 1}\n{"b"') == [{"a": 1}]
+    assert decoder.feed(b": 2}") == []
+    assert decoder.feed(b"\n") == [{"b": 2}]
+
+
+def test_normalize_batch_accepts_dicts_tuples_and_names():
+    assert normalize_batch([{"action": "a"}, ("b", {"x": 1}), "c"]) == [
+        {"action": "a"},
+        {"x": 1, "action": "b"},
+        {"action": "c"},
+    ]
+    with pytest.raises(ValueError):
+        normalize_batch([{"bpm": 120}])
+
+
+# ---------------------------------------------------------------------------
+# Blocking client
+# ---------------------------------------------------------------------------
+
+
+def test_call_reuses_one_connection(client, server):
+    for _ in range(5):
+        assert client.call("ping")["ok"] is True
+    assert server.connections == 1
+
+
+def test_generated_method_sends_action_and_params(client):
+    reply = client.set_tempo(bpm=128)
+    assert reply["command"] == {"action": "set_tempo", "bpm": 128}
+
+    reply = client.create_midi_track()
+    assert reply["command"] == {"action": "create_midi_track", "name": None}
+
+
+def test_submit_pipelines_and_matches_replies_in_order(client):
+    futures = [client.submit("get_track_info", track_index=i) for i in range(50)]
+    indexes = [f.result(2)["command"]["track_index"] for f in futures]
+    assert indexes == list(range(50))
+
+
+def test_batch_returns_replies_in_order(client):
+    replies = client.batch([("set_tempo", {"bpm": 90}), "ping", {"action": "undo"}])
+    assert [r["command"]["action"] for r in replies] == ["set_tempo", "ping", "undo"]
+
+
+def test_pipelining_past_the_server_pending_limit_does_not_deadlock():
+    sock = PendingLimitSocket(limit=16)
+    conn = Connection(sock)
+    futures = []
+    worker = threading.Thread(
+        target=lambda: futures.extend(conn.submit({"action": "echo", "n": n}) for n in range(64)),
+        daemon=True,
+    )
+    worker.start()
+    worker.join(5)
+    assert not worker.is_alive(), "submit() deadlocked against the reader"
+    assert [f.result(5)["command"]["n"] for f in futures] == list(range(64))
+    conn.close()
+
+
+def test_concurrent_threads_share_the_client(client):
+    results = {}
+
+    def worker(n):
+        results[n] = client.call("echo", n=n)["command"]["n"]
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == {n: n for n in range(16)}
+
+
+def test_overloaded_reply_is_retried():
+    fake = FakeServer(overload_first=2)
+    with AliveMCPClient(port=fake.port, timeout=2) as live:
+        assert live.call("ping")["ok"] is True
+    assert len(fake.received) == 3
+    fake.close()
+
+
+def test_overloaded_reply_returned_after_retries_exhausted():
+    fake = FakeServer(overload_first=5)
+    with AliveMCPClient(port=fake.port, timeout=2, overload_retries=1) as live:
+        assert live.call("ping")["error"] == "overloaded"
+    fake.close()
+
+
+def test_dropped_connection_fails_pending_and_reconnects(client, server):
+    assert client.call("ping")["ok"] is True
+    with pytest.raises(AliveMCPConnectionError):
+        client.call("drop")
+    assert client.call("ping")["ok"] is True
+    assert server.connections == 2
+
+
+def test_timeout_raises(server):
+    with AliveMCPClient(port=server.port, timeout=0.05) as live:
+        with pytest.raises(AliveMCPTimeout):
+            live.call("silent")
+
+
+def test_connection_refused_raises():
+    probe = socket.socket()
+    probe.bind(("127.0.0.1", 0))
+    port = probe.getsockname()[1]
+    probe.close()
+    with pytest.raises(AliveMCPConnectionError):
+        AliveMCPClient(port=port, connect_timeout=0.5).call("ping")
+
+
+def test_pool_spreads_busy_callers(server):
+    with AliveMCPClient(port=server.port, pool_size=2, timeout=0.2) as live:
+        live.submit("silent")
+        assert live.call("ping")["ok"] is True
+    assert server.connections == 2
+
+
+# ---------------------------------------------------------------------------
+# asyncio client
+# ---------------------------------------------------------------------------
+
+
+def test_async_call_and_batch(server):
+    async def scenario():
+        async with AsyncAliveMCPClient(port=server.port, timeout=2) as live:
+            tempo = await live.set_tempo(bpm=100)
+            gathered = await asyncio.gather(*(live.call("echo", n=n) for n in range(20)))
+            batch = await live.batch(["ping", ("undo", {})])
+            return tempo, gathered, batch
+
+    tempo, gathered, batch = asyncio.run(scenario())
+    assert tempo["command"]["bpm"] == 100
+    assert [r["command"]["n"] for r in gathered] == list(range(20))
+    assert [r["command"]["action"] for r in batch] == ["ping", "undo"]
+    assert server.connections == 1
+
+
+def test_async_reconnects_after_drop(server):
+    async def scenario():
+        live = AsyncAliveMCPClient(port=server.port, timeout=2)
+        with pytest.raises(AliveMCPConnectionError):
+            await live.call("drop")
+        reply = await live.call("ping")
+        await live.close()
+        return reply
+
+    assert asyncio.run(scenario())["ok"] is True
+    assert server.connections == 2
+
+
+def test_async_timeout_raises(server):
+    async def scenario():
+        async with AsyncAliveMCPClient(port=server.port, timeout=0.05) as live:
+            await live.call("silent")
+
+    with pytest.raises(AliveMCPTimeout):
+        asyncio.run(scenario())
+
+
+# ---------------------------------------------------------------------------
+# Generated stubs
+# ---------------------------------------------------------------------------
+
+
+def _load_generator():
+    path = Path(__file__).resolve().parent.parent / "scripts" / "generate_client_stubs.py"
+    spec = importlib.util.spec_from_file_location("generate_client_stubs", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_generated_stubs_are_up_to_date():
+    generator = _load_generator()
+    expected = generator.render(*generator.load_tools())
+    assert generator.OUTPUT.read_text(encoding="utf-8") == expected
+
+
+def test_every_tool_has_a_client_method():
+    from ALiveMCP_Remote.tools.registry import AVAILABLE_TOOLS
+
+    assert all(callable(getattr(AliveMCPClient, name, None)) for name in AVAILABLE_TOOLS)
@@ -0,0 +1,74 @@
+"""
+Tests for get_clip_grid (ALiveMCP_Remote/tools/clips_grid.py), run against
+the mock Live object model.
+"""
+
+import json
+
+import pytest
+
+from ALiveMCP_Remote.tools.clips_grid import GRID_FIELDS
+
+
+def _grid(reply):
+    """The grid as a client receives it"""
+    return json.loads(json.dumps(reply["grid"]))
+
+
+@pytest.fixture
+def song(mock_song):
+    return mock_song(tracks=4, scenes=3, clip_fill=1.0)
+
+
+def test_full_grid_has_one_row_per_track(mock_tools, song):
+    song.tracks[0].clip_slots[1].clip.name = "Bass"
+    song.tracks[0].clip_slots[1].clip.is_playing = True
+
+    reply = mock_tools.get_clip_grid()
+
+    assert reply["ok"] is True
+    assert reply["fields"] == list(GRID_FIELDS)
+    assert reply["track_range"] == [0, 4] and reply["scene_range"] == [0, 3]
+    grid = _grid(reply)
+    assert [len(row) for row in grid] == [3, 3, 3, 3]
+    assert grid[0][1] == [True, True, False, False, 0, "Bass"]
+    assert grid[3] == [None, None, None]
+
+
+def test_ranges_and_fields_select_a_block(mock_tools):
+    reply = mock_tools.get_clip_grid(track_range=[1, 9], scene_range=[2, 3], fields=["name"])
+    assert reply["track_range"] == [1, 4]
+    assert _grid(reply) == [[[""]], [[""]], [None]]
+
+
+def test_triggered_empty_slot_is_not_compacted(mock_tools, song):
+    slot = song.tracks[3].clip_slots[0]
+    slot.fire()
+    reply = mock_tools.get_clip_grid(track_range=[3, 4], fields=["has_clip", "is_triggered"])
+    assert _grid(reply) == [[[False, True], None, None]]
+
+
+def test_unchanged_grid_is_not_modified(mock_tools, song):
+    first = mock_tools.get_clip_grid(scene_range=[0, 2])
+    again = mock_tools.get_clip_grid(scene_range=[0, 2], version=first["version"])
+    assert again == {"ok": True, "not_modified": True, "version": first["version"]}
+
+    song.tracks[1].clip_slots[0].clip.fire()
+    changed = mock_tools.get_clip_grid(scene_range=[0, 2], version=first["version"])
+    assert changed["version"] != first["version"]
+    assert _grid(changed)[1][0][2] is True
+
+
+@pytest.mark.parametrize(
+    "kwargs, error",
+    [
+        ({"fields": ["has_clip", "tempo"]}, "Unknown field(s): tempo"),
+        ({"fields": []}, "fields must not be empty"),
+        ({"track_range": [3, 1]}, "Invalid track_range: [3, 1]"),
+        ({"scene_range": [0]}, "scene_range must be [start, stop]"),
+    ],
+)
+def test_invalid_requests(mock_tools, kwargs, error):
+    reply = mock_tools.get_clip_grid(**kwargs)
+    assert reply["ok"] is False
+    assert reply["error"] == error
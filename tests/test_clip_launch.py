@@ -0,0 +1,98 @@
+"""
+Tests for launch_clips / stop_clips (ALiveMCP_Remote/tools/clips_launch.py),
+run against the mock Live object model.
+"""
+
+import queue
+from unittest.mock import patch
+
+import pytest
+
+from ALiveMCP_Remote import ALiveMCP
+from benchmarks.mock_live import MockControlSurface
+
+SLOTS = [[t, s] for t in range(3) for s in range(4)]
+
+
+@pytest.fixture
+def song(mock_song):
+    return mock_song(tracks=4, scenes=4, clip_fill=1.0)
+
+
+def _triggered(song):
+    return sorted(
+        [t, s]
+        for t, track in enumerate(song.tracks)
+        for s, slot in enumerate(track.clip_slots)
+        if slot.is_triggered
+    )
+
+
+def test_launch_clips_fires_every_slot(mock_tools, song):
+    reply = mock_tools.launch_clips(SLOTS)
+    assert reply["ok"] is True
+    assert reply["slots"] == SLOTS
+    assert _triggered(song) == SLOTS
+    assert song.tracks[2].clip_slots[3].clip.is_triggered is True
+
+
+def test_repeated_slots_fire_once(mock_tools, song):
+    with patch.object(song.tracks[0].clip_slots[0], "fire") as fire:
+        reply = mock_tools.launch_clips([[0, 0], (0, 0)])
+    assert reply["slots"] == [[0, 0]]
+    fire.assert_called_once_with()
+
+
+def test_force_legato_is_passed_to_fire(mock_tools, song):
+    with patch.object(song.tracks[1].clip_slots[2], "fire") as fire:
+        mock_tools.launch_clips([[1, 2]], force_legato=True)
+    fire.assert_called_once_with(force_legato=True)
+
+
+@pytest.mark.parametrize(
+    "slots, error",
+    [
+        ([], "slots must not be empty"),
+        ([[0, 0], [9, 0]], "Invalid track index in slot [9, 0]"),
+        ([[0, 0], [1, 9]], "Invalid scene index in slot [1, 9]"),
+        ([[0, 0], [1]], "Each slot must be [track_index, clip_index], got [1]"),
+        ([[0, 0], [3, 1]], "No clip in slot(s): [[3, 1]]"),
+    ],
+)
+def test_a_bad_slot_rejects_the_whole_batch(mock_tools, song, slots, error):
+    reply = mock_tools.launch_clips(slots)
+    assert reply == {"ok": False, "error": error}
+    assert _triggered(song) == []
+
+
+def test_stop_clips_stops_every_slot(mock_tools, song):
+    mock_tools.launch_clips(SLOTS)
+    reply = mock_tools.stop_clips([[0, 0], [3, 1]])
+    assert reply["ok"] is True
+    assert [0, 0] not in _triggered(song)
+    assert len(_triggered(song)) == len(SLOTS) - 1
+    assert mock_tools.stop_clips([[5, 0]])["ok"] is False
+
+
+def test_one_command_launches_in_a_single_tick(song):
+    with patch("ALiveMCP_Remote.socket.socket"), patch("ALiveMCP_Remote.threading.Thread"):
+        mcp = ALiveMCP(MockControlSurface(song))
+    channel = queue.Queue()
+
+    # Separate launch_clip commands spread over several ticks...
+    for request_id, (t, s) in enumerate(SLOTS):
+        mcp.command_queue.put(
+            (request_id, {"action": "launch_clip", "track_index": t, "clip_index": s}, channel)
+        )
+    mcp.update_display()
+    assert 0 < len(_triggered(song)) < len(SLOTS)
+
+    # ...while launch_clips fires all of them in one
+    for track in song.tracks:
+        for slot in track.clip_slots:
+            slot.stop()
+    while not mcp.command_queue.empty():
+        mcp.command_queue.get()
+    mcp.command_queue.put((99, {"action": "launch_clips", "slots": SLOTS}, channel))
+    mcp.update_display()
+    assert _triggered(song) == SLOTS
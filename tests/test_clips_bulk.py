@@ -0,0 +1,94 @@
+"""
+Tests for set_clip_properties_bulk (ALiveMCP_Remote/tools/clips_bulk.py),
+run against the mock Live object model.
+"""
+
+import pytest
+
+from ALiveMCP_Remote.jobs import ChunkedJob
+from ALiveMCP_Remote.liveapi_tools import LiveAPITools
+from benchmarks.mock_live import MockControlSurface
+
+
+@pytest.fixture
+def song(mock_song):
+    return mock_song(tracks=4, scenes=3, clip_fill=1.0)
+
+
+def _clip(song, t, s):
+    return song.tracks[t].clip_slots[s].clip
+
+
+def test_whole_track_is_updated_in_one_reply(mock_tools, song):
+    reply = mock_tools.set_clip_properties_bulk(
+        {"track_index": 1}, {"muted": True, "signature_numerator": "3"}
+    )
+    assert reply["ok"] is True
+    assert reply["properties"] == {"muted": True, "signature_numerator": 3}
+    assert (reply["selected"], reply["updated"], reply["failed"]) == (3, 3, 0)
+    assert [r["clip_index"] for r in reply["results"]] == [0, 1, 2]
+    assert all(_clip(song, 1, s).muted for s in range(3))
+    assert not _clip(song, 0, 0).muted
+
+
+def test_scene_and_name_selectors_intersect(mock_tools, song):
+    _clip(song, 0, 2).name = "Bass Line"
+    _clip(song, 2, 2).name = "bass 2"
+    _clip(song, 2, 1).name = "Bass"
+    reply = mock_tools.set_clip_properties_bulk(
+        {"scene_index": 2, "name": "BASS*"}, {"color_index": 5}
+    )
+    assert [(r["track_index"], r["clip_index"]) for r in reply["results"]] == [(0, 2), (2, 2)]
+
+
+def test_explicit_slots_skip_empty_ones(mock_tools, song):
+    reply = mock_tools.set_clip_properties_bulk({"slots": [[0, 0], [3, 0], [0, 0]]}, {"looping": 0})
+    assert reply["selected"] == 1
+    assert _clip(song, 0, 0).looping is False
+
+
+def test_unsupported_properties_fail_per_clip(mock_tools):
+    reply = mock_tools.set_clip_properties_bulk({"track_index": 0}, {"gain": 0.5})
+    assert reply["ok"] is True
+    assert reply["failed"] == 3
+    assert reply["results"][0]["error"] == "Clip does not support gain"
+
+
+def test_loop_moved_past_its_end_sets_the_end_first(mock_tools, song):
+    reply = mock_tools.set_clip_properties_bulk(
+        {"slots": [[0, 0]]}, {"loop_start": 8.0, "loop_end": 12.0}
+    )
+    assert reply["updated"] == 1
+    assert (_clip(song, 0, 0).loop_start, _clip(song, 0, 0).loop_end) == (8.0, 12.0)
+
+
+@pytest.mark.parametrize(
+    "selector, properties, error",
+    [
+        ({}, {"muted": True}, "selector must not be empty"),
+        ({"track_index": 0}, {}, "properties must not be empty"),
+        ({"track": 0}, {"muted": True}, "Unknown selector key(s): track."),
+        ({"track_index": 9}, {"muted": True}, "Invalid track index: 9"),
+        ({"slots": [[0, 7]]}, {"muted": True}, "Invalid scene index: 7"),
+        ({"track_index": 0}, {"tempo": 1}, "Unknown clip propert(ies): tempo."),
+        ({"track_index": 0}, {"pitch_coarse": 60}, "Invalid pitch_coarse: must be between"),
+    ],
+)
+def test_invalid_requests_change_nothing(mock_tools, song, selector, properties, error):
+    reply = mock_tools.set_clip_properties_bulk(selector, properties)
+    assert reply["ok"] is False
+    assert reply["error"].startswith(error)
+    assert not _clip(song, 0, 0).muted
+
+
+def test_large_selections_return_a_chunked_job(mock_song):
+    song = mock_song(tracks=12, scenes=8, clip_fill=1.0)
+    tools = LiveAPITools(song, MockControlSurface(song))
+
+    job = tools.set_clip_properties_bulk({"name": "*"}, {"muted": True})
+
+    assert isinstance(job, ChunkedJob)
+    assert job.step() is None
+    assert job.position == job.chunk_size
+    reply = job.run()
+    assert reply["selected"] == reply["updated"] == 72
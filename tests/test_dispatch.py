@@ -0,0 +1,112 @@
+"""
+Tests for ALiveMCP_Remote/dispatch.py - the action table built at startup.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ALiveMCP_Remote import ALiveMCP
+from ALiveMCP_Remote.dispatch import (
+    PRIORITY_READ,
+    PRIORITY_TRANSPORT,
+    PRIORITY_WRITE,
+    DispatchEntry,
+    action_flags,
+    build_dispatch_table,
+    unknown_action_response,
+)
+from ALiveMCP_Remote.tools.registry import AVAILABLE_TOOLS
+
+
+@pytest.fixture
+def mcp(c_instance):
+    with patch("ALiveMCP_Remote.socket.socket"), patch("ALiveMCP_Remote.threading.Thread"):
+        instance = ALiveMCP(c_instance)
+    return instance
+
+
+def _tool(track_index, volume, ramp=False):
+    return {"ok": True, "track_index": track_index, "volume": volume, "ramp": ramp}
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("get_track_info", (True, True, PRIORITY_READ)),
+        ("ping", (True, True, PRIORITY_READ)),
+        ("set_tempo", (False, True, PRIORITY_WRITE)),
+        ("create_midi_track", (False, False, PRIORITY_WRITE)),
+        ("launch_clip", (False, False, PRIORITY_TRANSPORT)),
+        ("stop_playback", (False, True, PRIORITY_TRANSPORT)),
+        ("start_playback", (False, True, PRIORITY_TRANSPORT)),
+    ],
+)
+def test_action_flags(name, expected):
+    assert action_flags(name) == expected
+
+
+def test_entry_schema_and_validation():
+    entry = DispatchEntry("set_track_volume", _tool)
+    assert entry.accepted == ["ramp", "track_index", "volume"]
+    assert entry.schema["required"] == ["track_index", "volume"]
+    assert entry.check({"action": "set_track_volume", "track_index": 0, "volume": 0.5}) is None
+    assert entry.check({"track_index": 0})["error"] == (
+        "Missing required parameter(s) for set_track_volume: volume"
+    )
+    assert entry.check({"track_index": 0, "volume": 1, "gain": 2})["error"] == (
+        "Unexpected parameter(s) for set_track_volume: gain"
+    )
+    assert entry.check({"track_index": 0, "volume": 1.5})["error"] == (
+        "Invalid volume for set_track_volume: must be between 0.0 and 1.0"
+    )
+
+
+def test_entry_call_applies_aliases_and_reports_bad_params():
+    entry = DispatchEntry("set_track_volume", _tool, {"level": "volume"})
+    assert entry.call({"track_index": 1, "level": 0.3})["volume"] == 0.3
+
+    result = entry.call({"track_index": 1})
+    assert result["ok"] is False
+    assert result["parameters"] == ["ramp", "track_index", "volume"]
+
+
+def test_entry_call_reraises_type_errors_from_the_tool_body():
+    def broken(track_index):
+        return len(track_index)
+
+    with pytest.raises(TypeError):
+        DispatchEntry("get_track_info", broken).call({"track_index": 3})
+
+
+def test_open_ended_handlers_accept_anything():
+    entry = DispatchEntry("custom", lambda **kwargs: kwargs)
+    assert entry.schema["additionalProperties"] is True
+    assert entry.check({"anything": 1}) is None
+
+
+def test_build_table_logs_and_skips_missing_handlers():
+    script, tools = MagicMock(), MagicMock(spec=["get_track_info"])
+    tools.get_track_info = lambda track_index: {"ok": True}
+    script.ping = lambda: {"ok": True}
+
+    table = build_dispatch_table(script, tools, ["ping", "get_track_info", "gone"], ("ping",), {})
+
+    assert sorted(table) == ["get_track_info", "ping"]
+    assert table["ping"].handler is script.ping
+    script.log.assert_called_once_with("No handler for registered action: gone")
+
+
+def test_unknown_action_response_suggests_close_matches():
+    table = dict.fromkeys(["set_tempo", "get_tempo", "undo"])
+    response = unknown_action_response("set_tmpo", table)
+    assert response["did_you_mean"][0] == "set_tempo"
+    assert response["tool_count"] == 3
+    assert unknown_action_response("zzz", table)["did_you_mean"] == []
+
+
+def test_every_registered_tool_has_a_handler(mcp):
+    assert sorted(mcp.dispatch_table) == sorted(AVAILABLE_TOOLS)
+    mcp.log = MagicMock()
+    mcp.rebuild_dispatch_table()
+    mcp.log.assert_not_called()
@@ -0,0 +1,100 @@
+"""
+Tests for chunked jobs (ALiveMCP_Remote/jobs.py) and how update_display()
+runs them.
+"""
+
+import json
+import queue
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ALiveMCP_Remote import ALiveMCP
+from ALiveMCP_Remote.constants import JOB_ITEMS_PER_TICK
+from ALiveMCP_Remote.jobs import ChunkedJob, run_chunked
+from benchmarks.mock_live import MockControlSurface
+
+
+def _squares(items, chunk_size):
+    return run_chunked(
+        items, lambda n: n * n, lambda results: {"ok": True, "sum": sum(results)}, chunk_size
+    )
+
+
+def test_small_batches_are_answered_at_once():
+    assert _squares([1, 2, 3], 3) == {"ok": True, "sum": 14}
+    assert _squares([], 3) == {"ok": True, "sum": 0}
+
+
+def test_large_batches_are_processed_a_chunk_at_a_time():
+    job = _squares(list(range(10)), 4)
+    assert isinstance(job, ChunkedJob)
+    assert job.step() is None and job.results == [0, 1, 4, 9]
+    assert job.step() is None
+    assert job.step() == {"ok": True, "sum": 285}
+
+
+@pytest.fixture
+def song(mock_song):
+    return mock_song(tracks=12, scenes=8, clip_fill=1.0)
+
+
+@pytest.fixture
+def mcp(song):
+    with patch("ALiveMCP_Remote.socket.socket"), patch("ALiveMCP_Remote.threading.Thread"):
+        return ALiveMCP(MockControlSurface(song))
+
+
+def test_update_display_runs_a_chunk_per_tick_and_replies_when_done(mcp, song):
+    channel = queue.Queue()
+    command = {
+        "action": "set_clip_properties_bulk",
+        "selector": {"name": "*"},
+        "properties": {"muted": True},
+    }
+    mcp.command_queue.put((7, command, channel))
+    mcp.command_queue.put((8, {"action": "ping"}, channel))
+
+    mcp.update_display()
+    # The first chunk ran, and later commands were not held up
+    assert len(mcp.jobs) == 1
+    assert mcp.jobs[0][1].position == JOB_ITEMS_PER_TICK
+    assert channel.get_nowait()[0] == 8
+    assert mcp.health_check()["jobs"] == 1
+
+    mcp.update_display()
+    request_id, reply = channel.get_nowait()
+    assert request_id == 7
+    assert reply["updated"] == 72
+    assert mcp.jobs == []
+
+
+def test_commands_pipelined_after_a_job_are_answered_in_order(mcp):
+    client = MagicMock()
+    bulk = {"action": "set_clip_properties_bulk", "selector": {"name": "*"},
+            "properties": {"muted": True}}  # fmt: skip
+    payload = json.dumps(bulk) + "\n" + json.dumps({"action": "ping"}) + "\n"
+    client.recv.side_effect = [payload.encode(), b""]
+
+    with patch("ALiveMCP_Remote.socket_server.RESPONSE_TIMEOUT_SECONDS", 2.0):
+        handler = threading.Thread(target=mcp._handle_client, args=(client,), daemon=True)
+        handler.start()
+        deadline = time.monotonic() + 5.0
+        while handler.is_alive() and time.monotonic() < deadline:
+            mcp.update_display()
+            time.sleep(0.001)
+
+    sent = [json.loads(c[0][0].decode()) for c in client.sendall.call_args_list]
+    assert [reply.get("updated") for reply in sent] == [72, None]
+    assert sent[1]["message"].startswith("pong")
+
+
+def test_a_failing_job_is_answered_with_an_error(mcp):
+    channel = queue.Queue()
+    job = ChunkedJob([1, 2], lambda n: 1 / 0, dict, chunk_size=1)
+    mcp.start_job(3, job, channel)
+    mcp.update_display()
+    assert channel.get_nowait() == (3, {"ok": False, "error": "division by zero"})
+    assert mcp.jobs == []
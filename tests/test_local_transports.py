@@ -0,0 +1,250 @@
+"""
+Tests for the optional same-host transports: the shared-memory ring buffer,
+the AF_UNIX listener and the shared-memory poller.
+"""
+
+import json
+import mmap
+import os
+import socket
+import stat
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ALiveMCP_Remote import ALiveMCP
+from ALiveMCP_Remote.local_transports import _RingSink
+from ALiveMCP_Remote.shm_ring import HEADER, LENGTH_PREFIX, MAGIC, ShmRing, create_shm_file
+
+
+@pytest.fixture
+def mcp(c_instance):
+    with patch("ALiveMCP_Remote.socket.socket"), patch("ALiveMCP_Remote.threading.Thread"):
+        instance = ALiveMCP(c_instance)
+    yield instance
+    instance.disconnect()
+
+
+def _ring(capacity):
+    buf = mmap.mmap(-1, 128 + capacity)
+    return ShmRing(buf, 0, capacity)
+
+
+def _pump_until(mcp, predicate, timeout=5.0):
+    """Run update_display() like Live's tick until predicate() returns a value."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        mcp.update_display()
+        result = predicate()
+        if result is not None:
+            return result
+        time.sleep(0.001)
+    raise AssertionError("timed out")
+
+
+# ---------------------------------------------------------------------------
+# ShmRing
+# ---------------------------------------------------------------------------
+
+
+def test_ring_read_empty_returns_none():
+    assert _ring(64).read() is None
+
+
+def test_ring_round_trip_preserves_order():
+    ring = _ring(64)
+    assert ring.write(b"one")
+    assert ring.write(b"two")
+    assert ring.read() == b"one"
+    assert ring.read() == b"two"
+    assert ring.read() is None
+
+
+def test_ring_write_returns_false_when_full():
+    ring = _ring(16)
+    assert ring.write(b"12345678")
+    assert ring.write(b"1234") is False
+
+
+def test_ring_records_wrap_around_the_end():
+    ring = _ring(16)
+    for payload in (b"abcdefgh", b"ijklmnop", b"qrstuvwx"):
+        assert ring.write(payload)
+        assert ring.read() == payload
+
+
+def test_ring_rejects_record_larger_than_capacity():
+    with pytest.raises(ValueError):
+        _ring(16).write(b"x" * 13)
+
+
+@pytest.mark.parametrize("size", [13, 9])
+def test_ring_rejects_impossible_length_prefix(size):
+    # 13 cannot fit a 16-byte ring; 9 is more than the 8 bytes published
+    ring = _ring(16)
+    ring.write(b"1234")
+    LENGTH_PREFIX.pack_into(ring.buf, ring.data_at, size)
+    with pytest.raises(ValueError):
+        ring.read()
+    # The corrupt contents are discarded, and the ring keeps working
+    assert ring.read() is None
+    assert ring.write(b"ok") and ring.read() == b"ok"
+
+
+def test_create_shm_file_writes_header(tmp_path):
+    path = str(tmp_path / "alivemcp.shm")
+    buf, requests, responses = create_shm_file(path, 256)
+    magic, _version, ring_bytes = HEADER.unpack_from(buf, 0)
+    assert magic == MAGIC
+    assert ring_bytes == 256
+    assert requests.write(b"req") and responses.read() is None
+    buf.close()
+
+
+def test_create_shm_file_is_owner_only(tmp_path):
+    path = str(tmp_path / "alivemcp.shm")
+    old_umask = os.umask(0)
+    try:
+        buf, _, _ = create_shm_file(path, 256)
+    finally:
+        os.umask(old_umask)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    buf.close()
+
+
+def test_create_shm_file_replaces_existing_file(tmp_path):
+    path = tmp_path / "alivemcp.shm"
+    path.write_bytes(b"stale")
+    buf, _, _ = create_shm_file(str(path), 256)
+    assert HEADER.unpack_from(buf, 0)[0] == MAGIC
+    buf.close()
+
+
+# ---------------------------------------------------------------------------
+# _RingSink
+# ---------------------------------------------------------------------------
+
+
+def test_ring_sink_strips_newline(mcp):
+    ring = _ring(64)
+    _RingSink(mcp, ring, threading.Event()).sendall(b'{"ok": true}\n')
+    assert ring.read() == b'{"ok": true}'
+
+
+def test_ring_sink_replaces_oversized_response(mcp):
+    ring = _ring(96)
+    _RingSink(mcp, ring, threading.Event()).sendall(b"x" * 200)
+    assert json.loads(ring.read())["ok"] is False
+
+
+def test_ring_sink_raises_when_client_stops_reading(mcp):
+    ring = _ring(16)
+    ring.write(b"12345678")
+    mcp.running = False
+    with pytest.raises(OSError):
+        _RingSink(mcp, ring, threading.Event()).sendall(b"12345678")
+
+
+# ---------------------------------------------------------------------------
+# Transport startup and round trips
+# ---------------------------------------------------------------------------
+
+
+def test_start_local_transports_disabled_by_default(mcp):
+    assert mcp.unix_server is None
+    assert mcp.shm_buffer is None
+
+
+def test_start_unix_server_cleans_up_on_bind_error(mcp, tmp_path):
+    with patch("ALiveMCP_Remote.local_transports.socket.socket") as mock_sock_cls:
+        mock_sock_cls.return_value.bind.side_effect = OSError("denied")
+        mcp.start_unix_server(str(tmp_path / "alivemcp.sock"))
+    assert mcp.unix_server is None
+    mock_sock_cls.return_value.close.assert_called_once()
+
+
+def test_start_unix_server_unsupported_platform(mcp, tmp_path):
+    with patch("ALiveMCP_Remote.local_transports.socket", MagicMock(spec=[])):
+        mcp.start_unix_server(str(tmp_path / "alivemcp.sock"))
+    assert mcp.unix_server is None
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="AF_UNIX not available")
+def test_unix_socket_round_trip(mcp, tmp_path):
+    path = str(tmp_path / "alivemcp.sock")
+    mcp.start_unix_server(path)
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(5)
+    client.connect(path)
+    client.sendall(b'{"action": "ping"}\n')
+    client.setblocking(False)
+
+    def read_line():
+        try:
+            data = client.recv(4096)
+        except BlockingIOError:
+            return None
+        return json.loads(data.decode())
+
+    response = _pump_until(mcp, read_line)
+    client.close()
+    assert response["ok"] is True
+    assert response["message"].startswith("pong")
+
+
+def test_shm_round_trip(mcp, tmp_path):
+    path = str(tmp_path / "alivemcp.shm")
+    mcp.start_shm_transport(path, 4096)
+
+    with open(path, "r+b") as f:
+        buf = mmap.mmap(f.fileno(), 0)
+    requests = ShmRing(buf, 64, 4096)
+    responses = ShmRing(buf, 64 + 128 + 4096, 4096)
+
+    for _ in range(3):
+        requests.write(b'{"action": "ping"}')
+    replies = [_pump_until(mcp, responses.read) for _ in range(3)]
+    buf.close()
+
+    assert all(json.loads(r)["ok"] for r in replies)
+
+
+def test_shm_invalid_utf8_record_is_answered_and_polling_continues(mcp, tmp_path):
+    path = str(tmp_path / "alivemcp.shm")
+    mcp.start_shm_transport(path, 4096)
+
+    with open(path, "r+b") as f:
+        buf = mmap.mmap(f.fileno(), 0)
+    requests = ShmRing(buf, 64, 4096)
+    responses = ShmRing(buf, 64 + 128 + 4096, 4096)
+
+    requests.write(b"\xff\xfe")
+    requests.write(b'{"action": "ping"}')
+    error, pong = (json.loads(_pump_until(mcp, responses.read)) for _ in range(2))
+    buf.close()
+
+    assert error["ok"] is False and "utf-8" in error["error"]
+    assert pong["ok"] is True
+    assert mcp.shm_thread.is_alive()
+
+
+def test_stop_local_transports_stops_the_ring_thread_first(mcp, tmp_path):
+    # Still running: only the stop event ends the poller
+    mcp.running = True
+    mcp.start_shm_transport(str(tmp_path / "alivemcp.shm"), 256)
+    thread = mcp.shm_thread
+    mcp.stop_local_transports()
+    assert not thread.is_alive()
+    assert mcp.shm_buffer is None
+
+
+def test_stop_local_transports_removes_files(mcp, tmp_path):
+    path = tmp_path / "alivemcp.shm"
+    mcp.start_shm_transport(str(path), 256)
+    mcp.running = False
+    mcp.stop_local_transports()
+    assert not path.exists()
+    assert mcp.shm_buffer is None
@@ -0,0 +1,82 @@
+"""
+Tests for apply_note_diff (ALiveMCP_Remote/tools/midi_diff.py) and note IDs
+from get_notes_extended, run against the mock Live object model.
+"""
+
+import sys
+
+import pytest
+
+from benchmarks.mock_live import make_live_module
+from benchmarks.mock_live.notes import NoteStore
+
+NOTES = [(60, 0.0, 1.0, 100, False), (62, 1.0, 1.0, 90, False), (64, 2.0, 1.0, 80, False)]
+
+
+@pytest.fixture
+def song(monkeypatch, mock_song):
+    monkeypatch.setitem(sys.modules, "Live", make_live_module())
+    song = mock_song(tracks=1, scenes=1, clip_fill=1.0, notes_per_clip=0)
+    song.tracks[0].clip_slots[0].clip.set_notes(NOTES)
+    return song
+
+
+def _notes(mock_tools):
+    reply = mock_tools.get_notes_extended(0, 0, 0.0, 16.0, 0, 128)
+    return {note["note_id"]: note for note in reply["notes"]}
+
+
+def test_get_notes_extended_exposes_note_ids(mock_tools):
+    notes = _notes(mock_tools)
+    assert sorted(notes) == [1, 2, 3]
+    assert notes[2] == {
+        "note_id": 2,
+        "pitch": 62,
+        "start_time": 1.0,
+        "duration": 1.0,
+        "velocity": 90,
+        "muted": False,
+    }
+
+
+def test_diff_touches_only_the_named_notes(mock_tools, song):
+    reply = mock_tools.apply_note_diff(
+        0,
+        0,
+        added=[{"pitch": 67, "start_time": 3.0, "duration": 0.5}],
+        modified=[{"note_id": 2, "velocity": 40, "muted": True}],
+        removed=[3],
+    )
+
+    assert reply["ok"] is True
+    assert (reply["modified"], reply["removed"]) == (1, 1)
+    notes = _notes(mock_tools)
+    assert sorted(notes) == [1, 2] + reply["added_ids"]
+    assert (notes[2]["velocity"], notes[2]["muted"]) == (40.0, True)
+    assert notes[reply["added_ids"][0]]["pitch"] == 67
+    assert notes[1]["velocity"] == 100
+
+
+@pytest.mark.parametrize(
+    "diff, error",
+    [
+        ({"removed": [3, 9]}, "Unknown note id(s): 9"),
+        ({"modified": [{"velocity": 1}]}, "modified[0]: missing field(s): note_id"),
+        ({"modified": [{"note_id": 1, "pitch": 200}]}, "modified[0]: invalid pitch: must be"),
+        ({"modified": [{"note_id": 1}], "removed": [1]}, "Note(s) both modified and removed: 1"),
+        ({"added": [{"pitch": 60, "duration": 1.0}]}, "added[0]: missing field(s): start_time"),
+        ({"added": [{"pitch": 60, "start_time": 0, "duration": 0}]}, "added[0]: invalid duration"),
+        ({"added": [{"pitch": 60, "start": 0, "duration": 1}]}, "added[0]: unexpected field(s)"),
+    ],
+)
+def test_invalid_diffs_change_nothing(mock_tools, song, diff, error):
+    reply = mock_tools.apply_note_diff(0, 0, **diff)
+    assert reply["ok"] is False
+    assert reply["error"].startswith(error)
+    assert song.tracks[0].clip_slots[0].clip._notes == NOTES
+
+
+def test_older_live_versions_are_reported(mock_tools, song, monkeypatch):
+    monkeypatch.delattr(NoteStore, "apply_note_modifications")
+    reply = mock_tools.apply_note_diff(0, 0, removed=[1])
+    assert reply == {"ok": False, "error": "Note IDs require Live 11 or later"}
@@ -0,0 +1,88 @@
+"""
+Tests for get_notes_multi (ALiveMCP_Remote/tools/midi_multi.py), run
+against the mock Live object model.
+"""
+
+import json
+
+import pytest
+
+from ALiveMCP_Remote.jobs import ChunkedJob
+from ALiveMCP_Remote.liveapi_tools import LiveAPITools
+from benchmarks.mock_live import MockControlSurface
+
+NOTES = [(60, 0.0, 1.0, 100, False), (72, 2.5, 0.5, 64, True)]
+
+
+@pytest.fixture
+def song(mock_song):
+    song = mock_song(tracks=4, scenes=2, clip_fill=1.0, notes_per_clip=0)
+    song.tracks[1].clip_slots[0].clip.set_notes(NOTES)
+    return song
+
+
+def test_scene_selector_reads_every_midi_clip(mock_tools):
+    reply = mock_tools.get_notes_multi({"scene_index": 0})
+    assert reply["ok"] is True
+    assert reply["format"] == "columns"
+    assert [(c["track_index"], c["count"]) for c in reply["clips"]] == [(0, 0), (1, 2), (2, 0)]
+    assert reply["clips"][1]["notes"] == {
+        "pitch": [60, 72],
+        "start_time": [0.0, 2.5],
+        "duration": [1.0, 0.5],
+        "velocity": [100, 64],
+        "muted": [False, True],
+    }
+    assert reply["clips"][0]["notes"]["pitch"] == []
+    assert (reply["clip_count"], reply["note_count"]) == (3, 2)
+
+
+@pytest.mark.parametrize(
+    "note_format, encoded",
+    [
+        (
+            "objects",
+            [
+                {"pitch": 60, "start_time": 0.0, "duration": 1.0, "velocity": 100, "muted": False},
+                {"pitch": 72, "start_time": 2.5, "duration": 0.5, "velocity": 64, "muted": True},
+            ],
+        ),
+        ("packed", [60, 0.0, 1.0, 100, 0, 72, 2.5, 0.5, 64, 1]),
+    ],
+)
+def test_formats(mock_tools, note_format, encoded):
+    reply = mock_tools.get_notes_multi({"slots": [[1, 0]]}, format=note_format)
+    assert reply["fields"] == ["pitch", "start_time", "duration", "velocity", "muted"]
+    assert json.loads(json.dumps(reply["clips"][0]["notes"])) == encoded
+
+
+def test_time_and_pitch_ranges_filter_notes(mock_tools):
+    reply = mock_tools.get_notes_multi(
+        {"track_index": 1}, time_range=[2.0, 4.0], pitch_range=[64, 128], format="packed"
+    )
+    assert [c["notes"] for c in reply["clips"]] == [[72, 2.5, 0.5, 64, 1], []]
+    assert mock_tools.get_notes_multi({"track_index": 1}, pitch_range=[0, 60])["note_count"] == 0
+
+
+@pytest.mark.parametrize(
+    "kwargs, error",
+    [
+        ({"format": "csv"}, "format must be one of: objects, columns, packed"),
+        ({"time_range": [4.0, 2.0]}, "Invalid time_range: [4.0, 2.0]"),
+        ({"pitch_range": [0]}, "Invalid pitch_range: [0]"),
+    ],
+)
+def test_invalid_requests(mock_tools, kwargs, error):
+    assert mock_tools.get_notes_multi({"track_index": 0}, **kwargs) == {
+        "ok": False,
+        "error": error,
+    }
+
+
+def test_whole_set_reads_are_chunked(mock_song):
+    song = mock_song(tracks=12, scenes=8, clip_fill=1.0, notes_per_clip=4)
+    tools = LiveAPITools(song, MockControlSurface(song))
+    job = tools.get_notes_multi({"name": "*"}, format="packed")
+    assert isinstance(job, ChunkedJob)
+    reply = job.run()
+    assert (reply["clip_count"], reply["note_count"]) == (72, 288)
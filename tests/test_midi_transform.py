@@ -0,0 +1,112 @@
+"""
+Tests for transform_notes (ALiveMCP_Remote/tools/midi_transform.py), run
+against the mock Live object model.
+"""
+
+import pytest
+
+from ALiveMCP_Remote.tools.midi_transform import apply_operations, compile_operations
+from benchmarks.mock_live.notes import NoteStore
+
+NOTES = (
+    (60, 0.1, 0.5, 100, False),
+    (64, 0.9, 0.5, 64, False),
+    (67, 2.0, 1.0, 20, True),
+)
+
+
+def _run(*operations):
+    return apply_operations(NOTES, compile_operations(operations))
+
+
+@pytest.fixture
+def song(mock_song):
+    song = mock_song(tracks=1, scenes=1, clip_fill=1.0, notes_per_clip=0)
+    song.tracks[0].clip_slots[0].clip.set_notes(NOTES)
+    return song
+
+
+def test_transpose_and_shift():
+    notes = _run({"op": "transpose", "semitones": -12}, {"op": "shift", "beats": -0.5})
+    assert [n[0] for n in notes] == [48, 52, 55]
+    assert [n[1] for n in notes] == [0.0, pytest.approx(0.4), 1.5]
+    assert [n[4] for n in notes] == [False, False, True]
+
+
+def test_quantize_with_strength():
+    assert [n[1] for n in _run({"op": "quantize", "grid": 1.0})] == [0.0, 1.0, 2.0]
+    half = _run({"op": "quantize", "grid": 1.0, "strength": 0.5})
+    assert [n[1] for n in half] == pytest.approx([0.05, 0.95, 2.0])
+
+
+def test_velocity_curve_scale_and_offset_are_clamped():
+    notes = _run({"op": "velocity", "scale": 2.0, "offset": -10})
+    assert [n[3] for n in notes] == [127, 118, 30]
+    assert [n[3] for n in _run({"op": "velocity", "curve": 2.0})][2] == 3
+
+
+def test_legato_extends_notes_to_the_next_start():
+    assert [n[2] for n in _run({"op": "legato"})] == pytest.approx([0.8, 1.1, 1.0])
+
+
+def test_humanize_is_repeatable_with_a_seed():
+    step = {"op": "humanize", "timing": 0.05, "velocity": 10, "seed": 7}
+    first, again = _run(step), _run(step)
+    assert first == again
+    assert first != _run(dict(step, seed=8))
+    assert all(abs(new[1] - old[1]) <= 0.05 for new, old in zip(first, NOTES))
+
+
+def test_transform_notes_commits_the_pipeline(mock_tools, song):
+    clip = song.tracks[0].clip_slots[0].clip
+    reply = mock_tools.transform_notes(
+        0, 0, [{"op": "transpose", "semitones": 2}, {"op": "quantize", "grid": 0.5}]
+    )
+    assert reply["ok"] is True
+    assert reply["operations"] == ["transpose", "quantize"]
+    assert (reply["note_count"], reply["changed"]) == (3, 3)
+    assert sorted(clip.get_notes(0, 0, clip.length, 128)) == [
+        (62, 0.0, 0.5, 100, False),
+        (66, 1.0, 0.5, 64, False),
+        (69, 2.0, 1.0, 20, True),
+    ]
+
+
+def test_note_ids_and_extended_fields_survive_on_live_11(mock_tools, song):
+    clip = song.tracks[0].clip_slots[0].clip
+    notes = clip.get_notes_by_id([1, 2, 3])
+    for note in notes:
+        note.probability, note.release_velocity = 0.5, 10
+    clip.apply_note_modifications(notes)
+
+    reply = mock_tools.transform_notes(0, 0, [{"op": "transpose", "semitones": 1}])
+    assert (reply["ok"], reply["changed"]) == (True, 3)
+    after = clip.get_notes_by_id([1, 2, 3])
+    assert [n.pitch for n in after] == [61, 65, 68]
+    assert {(n.probability, n.release_velocity) for n in after} == {(0.5, 10)}
+
+
+def test_older_live_versions_rewrite_the_notes(mock_tools, song, monkeypatch):
+    monkeypatch.delattr(NoteStore, "apply_note_modifications")
+    clip = song.tracks[0].clip_slots[0].clip
+    reply = mock_tools.transform_notes(0, 0, [{"op": "shift", "beats": 1.0}])
+    assert (reply["ok"], reply["changed"]) == (True, 3)
+    assert [n[1] for n in clip.get_notes(0, 0, clip.length, 128)] == [1.1, 1.9, 3.0]
+    assert clip._ids == [4, 5, 6]
+
+
+@pytest.mark.parametrize(
+    "operations, error",
+    [
+        ([{"op": "reverse"}], "operations[0]: op must be one of: transpose, shift,"),
+        ([{"op": "legato"}, {"op": "shift"}], "operations[1]: shift requires beats"),
+        ([{"op": "quantize", "grid": 0}], "operations[0]: invalid grid: must be greater than 0"),
+        ([{"op": "legato", "amount": 1}], "operations[0]: unexpected parameter(s) for legato"),
+        ([{"op": "transpose", "semitones": 61}], "transpose moves 1 note(s) outside 0-127"),
+    ],
+)
+def test_invalid_pipelines_leave_the_clip_unchanged(mock_tools, song, operations, error):
+    reply = mock_tools.transform_notes(0, 0, operations)
+    assert reply["ok"] is False
+    assert reply["error"].startswith(error)
+    assert song.tracks[0].clip_slots[0].clip._notes == list(NOTES)
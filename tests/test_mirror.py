@@ -0,0 +1,95 @@
+"""
+Tests for the read-only fast path (ALiveMCP_Remote/mirror.py).
+"""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from alivemcp_client import AliveMCPClient
+from ALiveMCP_Remote.mirror import PropertyMirror
+from benchmarks.mock_live import LiveHarness
+
+
+def _table(**replies):
+    table = {}
+    for action, reply in replies.items():
+        table[action] = MagicMock()
+        table[action].handler.return_value = reply
+    return table
+
+
+@pytest.fixture
+def mirror():
+    return PropertyMirror(["get_a", "get_b"], ["get_a", "get_b", "get_other"])
+
+
+def test_cold_getters_are_queued_then_served_after_a_refresh(mirror):
+    table = _table(get_a={"ok": True, "a": 1}, get_b={"ok": True, "b": 2})
+    assert mirror.read("get_a") is None
+    assert mirror.read("get_other") is None
+
+    mirror.refresh(table)
+    reply = mirror.read("get_a")
+    assert reply["a"] == 1
+    assert 0 <= reply["mirror_age_ms"] < 100
+    # Only getters that were read are refreshed
+    assert mirror.read("get_b") is None
+    table["get_b"].handler.assert_not_called()
+
+
+def test_writes_bypass_the_mirror_until_the_next_refresh(mirror):
+    table = _table(get_a={"ok": True, "a": 1})
+    mirror.read("get_a")
+    mirror.refresh(table)
+
+    mirror.write_submitted("set_a")
+    assert mirror.read("get_a") is None
+    mirror.executed("set_a")
+    assert mirror.pending_writes == 0
+    assert mirror.read("get_a") is None
+
+    mirror.refresh(table)
+    assert mirror.read("get_a") is not None
+    # Read-only commands never block it
+    mirror.write_submitted("get_other")
+    assert mirror.read("get_a") is not None
+
+
+def test_withdrawn_and_uncounted_writes_keep_the_count_balanced(mirror):
+    mirror.write_submitted("set_a")
+    mirror.write_withdrawn("set_a")
+    mirror.executed("set_b")
+    assert mirror.pending_writes == 0
+
+
+def test_old_copies_and_errors_are_not_served():
+    mirror = PropertyMirror(["get_a", "get_b"], ["get_a", "get_b"], max_age_ms=1.0)
+    table = _table(get_a={"ok": True}, get_b={"ok": False, "error": "n/a"})
+    mirror.read("get_a")
+    mirror.read("get_b")
+    mirror.refresh(table)
+    assert mirror.read("get_b") is None
+    time.sleep(0.01)
+    assert mirror.read("get_a") is None
+    assert mirror.snapshot()["mirrored"] == ["get_a"]
+
+
+def test_mirrored_reads_over_tcp_skip_the_queue_and_see_own_writes():
+    with LiveHarness(tracks=2, scenes=1) as live:
+        client = AliveMCPClient(port=live.port, timeout=5)
+        try:
+            assert "mirror_age_ms" not in client.get_signature_numerator()
+            time.sleep(0.05)
+            assert client.get_signature_numerator()["mirror_age_ms"] < 100
+
+            client.submit("set_time_signature", numerator=3, denominator=4)
+            reply = client.get_signature_numerator()
+            health = client.health_check()
+        finally:
+            client.close()
+
+    assert reply["signature_numerator"] == 3
+    assert health["mirror"]["hits"] >= 1
+    assert health["mirror"]["pending_writes"] == 0
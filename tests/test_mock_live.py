@@ -0,0 +1,88 @@
+"""
+Integration tests: the real ALiveMCP + LiveAPITools served over TCP from the
+mock LOM in benchmarks/mock_live, driven by a simulated 60 Hz tick.
+"""
+
+import time
+
+import pytest
+
+from alivemcp_client import AliveMCPClient
+from ALiveMCP_Remote.constants import MAX_COMMANDS_PER_TICK
+from benchmarks.mock_live import LiveHarness, LomCost, build_song
+from benchmarks.mock_live.lom import DeviceParameter
+
+
+@pytest.fixture
+def live():
+    harness = LiveHarness(tracks=100, scenes=8, clip_fill=0.0).start()
+    yield harness
+    harness.stop()
+
+
+@pytest.fixture
+def client(live):
+    c = AliveMCPClient(port=live.port, timeout=5)
+    yield c
+    c.close()
+
+
+def test_build_song_sizes():
+    song = build_song(tracks=12, scenes=5, devices_per_track=3, params_per_device=8, returns=2)
+    assert len(song.tracks) == 12
+    assert len(song.tracks[0].clip_slots) == 5
+    assert len(song.tracks[0].devices[2].parameters) == 8
+    assert len(song.return_tracks) == 2
+    assert song.tracks[3].has_audio_input
+
+
+def test_lom_cost_counts_calls_and_injects_latency():
+    cost = LomCost(latency_us=2000)
+    param = DeviceParameter(cost, "Cutoff")
+    cost.counting = True
+    start = time.perf_counter()
+    param.value = param.value + 0.5
+    elapsed = time.perf_counter() - start
+    assert cost.calls == {"DeviceParameter.value": 2}
+    assert elapsed >= 0.004
+
+
+def test_session_reports_configured_size(client):
+    info = client.get_session_info()
+    assert info["ok"] is True
+    assert info["num_tracks"] == 100
+    assert info["num_scenes"] == 8
+
+
+def test_writes_are_visible_to_later_reads(client, live):
+    assert client.set_tempo(bpm=133)["bpm"] == 133.0
+    assert live.song.tempo == 133.0
+
+    assert client.create_midi_clip(track_index=0, clip_index=1, length=8.0)["ok"] is True
+    notes = [{"pitch": 60, "start": 0.0, "duration": 1.0, "velocity": 100}]
+    assert client.add_notes(track_index=0, clip_index=1, notes=notes)["ok"] is True
+    reply = client.get_clip_notes(track_index=0, clip_index=1)
+    assert [n["pitch"] for n in reply["notes"]] == [60]
+
+    reply = client.set_device_param(track_index=2, device_index=0, param_index=3, value=0.25)
+    assert reply["value"] == 0.25
+
+
+def test_main_thread_budget_limits_commands_per_tick(client, live):
+    ticks_before = live.ticks
+    replies = client.batch([("get_track_info", {"track_index": i}) for i in range(20)])
+    assert all(r["ok"] for r in replies)
+    assert live.ticks - ticks_before >= 20 // MAX_COMMANDS_PER_TICK - 1
+
+
+def test_tick_thread_runs_near_60hz(live):
+    start_ticks = live.ticks
+    time.sleep(0.25)
+    assert 5 <= live.ticks - start_ticks <= 25
+
+
+def test_stop_closes_server(live):
+    port = live.port
+    live.stop()
+    with pytest.raises(ConnectionError):
+        AliveMCPClient(port=port, connect_timeout=0.5).call("ping")
@@ -0,0 +1,83 @@
+"""
+Tests for the per-tool LOM cost profiler (benchmarks/profile_tools.py).
+"""
+
+import pytest
+
+from benchmarks.profile_tools import classify, growth_exponent, profile_tool, sample_args
+
+SMALL_SET = {"tracks": 4, "scenes": 4, "devices_per_track": 1, "params_per_device": 4}
+
+
+def test_growth_exponent_ignores_fixed_overhead():
+    assert growth_exponent([20, 20, 20]) == 0.0
+    assert growth_exponent([24, 28, 36]) == pytest.approx(1.0)
+    assert growth_exponent([5, 17, 65]) == pytest.approx(2.0)
+
+
+def test_classify_names_each_dimension():
+    assert classify({"tracks": 0.0, "scenes": 0.1}) == "1"
+    assert classify({"tracks": 1.0, "scenes": 0.0}) == "tracks"
+    assert classify({"tracks": 0.9, "scenes": 1.1}) == "tracks×scenes"
+    assert classify({"tracks": 2.0, "scenes": 0.0}) == "tracks^2"
+
+
+def test_sample_args_fills_required_parameters_only():
+    def tool(track_index, clip_index, quantized=True):
+        pass
+
+    assert sample_args(tool) == {"track_index": 0, "clip_index": 0}
+
+    def unknown(mystery):
+        pass
+
+    with pytest.raises(KeyError):
+        sample_args(unknown)
+
+
+def test_sample_args_adds_per_tool_optional_values():
+    def write_automation_curve(track_index, clip_index, param_ref=None, times=None, values=None):
+        pass
+
+    assert sample_args(write_automation_curve) == {
+        "track_index": 0,
+        "clip_index": 0,
+        "param_ref": "volume",
+        "times": [0.0, 2.0],
+        "values": [0.0, 1.0],
+    }
+
+
+@pytest.mark.parametrize(
+    "action",
+    [
+        "get_clip_automation_envelope",
+        "get_automation_envelope_values",
+        "write_automation_curve",
+        "insert_automation_step",
+        "launch_clips",
+        "stop_clips",
+        "set_clip_properties_bulk",
+        "transform_notes",
+        "get_notes_multi",
+        "query_arrangement",
+    ],
+)
+def test_tools_with_structured_or_optional_targets_profile_ok(action):
+    result = profile_tool(action, dict(SMALL_SET, clip_fill=1.0))
+    assert (result["ok"], result["error"]) == (True, None)
+
+
+def test_constant_cost_tool():
+    result = profile_tool("set_tempo", dict(SMALL_SET, clip_fill=1.0))
+    assert result["ok"] is True
+    assert result["complexity"] == "1"
+    assert result["lom_calls"]["base"] == result["lom_calls"]["tracks"] > 0
+
+
+def test_scan_over_clip_slots_is_reported_as_scene_linear():
+    result = profile_tool("get_track_info", dict(SMALL_SET, clip_fill=1.0))
+    assert result["ok"] is True
+    assert result["complexity"] == "scenes"
+    assert result["lom_calls"]["scenes"] > result["lom_calls"]["base"]
+    assert ("ClipSlot.has_clip", 4) in result["hottest"]
@@ -0,0 +1,110 @@
+"""
+Tests for the opt-in main-thread profiler (profile_start / profile_stop).
+"""
+
+import pstats
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+from ALiveMCP_Remote import ALiveMCP
+from ALiveMCP_Remote.profiling import collapse_stack
+
+
+@pytest.fixture
+def mcp(c_instance, tmp_path):
+    with patch("ALiveMCP_Remote.socket.socket"), patch("ALiveMCP_Remote.threading.Thread"):
+        instance = ALiveMCP(c_instance)
+    instance.song.project_root_folder = str(tmp_path)
+    yield instance
+    instance.stop_profiling()
+
+
+def _run(mcp, **command):
+    """Queue one command and run a tick, as the socket thread and Live would"""
+    channel = []
+
+    class Channel:
+        put = channel.append
+
+    mcp.command_queue.put((0, command, Channel))
+    mcp.update_display()
+    return channel[0][1]
+
+
+def test_collapse_stack_is_rooted_at_update_display():
+    def update_display():
+        return inner()
+
+    def inner():
+        return collapse_stack(sys._getframe())
+
+    stack = update_display()
+    assert stack.startswith("update_display (test_profiling.py:")
+    assert stack.split(";")[-1].startswith("inner ")
+    assert collapse_stack(sys._getframe()) is None
+
+
+def test_cprofile_session_writes_pstats(mcp, tmp_path):
+    started = _run(mcp, action="profile_start", mode="cprofile")
+    assert started["ok"] is True
+    assert started["output_dir"] == str(tmp_path / "alivemcp-profiles")
+
+    for _ in range(3):
+        assert _run(mcp, action="get_session_info")["ok"] is True
+
+    result = _run(mcp, action="profile_stop")
+    assert result["ok"] is True
+    assert result["mode"] == "cprofile"
+    assert result["commands"] == 3
+
+    (path,) = result["files"]
+    assert path.endswith(".pstats")
+    functions = {name for _, _, name in pstats.Stats(path).stats}
+    assert "get_session_info" in functions
+    assert "profile_stop" not in functions
+    assert result["top"]
+
+
+def test_sampling_session_writes_collapsed_stacks(mcp):
+    def slow_tool():
+        time.sleep(0.05)
+        return {"ok": True}
+
+    mcp.tools.get_session_info = slow_tool
+    mcp.rebuild_dispatch_table()
+    assert _run(mcp, action="profile_start", mode="sampling", interval_ms=1)["ok"] is True
+    _run(mcp, action="get_session_info")
+    result = _run(mcp, action="profile_stop")
+
+    assert result["ok"] is True
+    assert result["commands"] == 1
+    assert result["samples"] > 0
+    with open(result["files"][0]) as f:
+        lines = f.read().splitlines()
+    assert any("slow_tool" in line for line in lines)
+    assert all(line.startswith("update_display ") for line in lines)
+    assert result["top"][0]["function"].startswith("slow_tool ")
+
+
+def test_profile_errors(mcp):
+    assert _run(mcp, action="profile_stop") == {"ok": False, "error": "Profiling is not active"}
+    assert "mode must be" in _run(mcp, action="profile_start", mode="perf")["error"]
+
+    assert _run(mcp, action="profile_start", mode="cprofile")["ok"] is True
+    again = _run(mcp, action="profile_start")
+    assert again == {"ok": False, "error": "Profiling already active (cprofile)"}
+
+
+def test_unsaved_set_profiles_to_temp_dir(mcp, tmp_path, monkeypatch):
+    monkeypatch.setattr("tempfile.tempdir", str(tmp_path / "tmp"))
+    mcp.song.project_root_folder = None
+    assert mcp._profile_dir() == str(tmp_path / "tmp" / "alivemcp-profiles")
+
+
+def test_disconnect_discards_active_session(mcp):
+    assert _run(mcp, action="profile_start")["ok"] is True
+    mcp.disconnect()
+    assert mcp.profile_session is None
@@ -0,0 +1,140 @@
+"""
+Tests for ALiveMCP_Remote/tools/schemas.py - parameter schemas and the
+validators compiled from them.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from ALiveMCP_Remote import ALiveMCP
+from ALiveMCP_Remote.tools.schemas import (
+    INDEX,
+    PAIR,
+    PARAM_SCHEMAS,
+    arg_descriptions,
+    param_schema,
+    tool_schema,
+)
+from ALiveMCP_Remote.tools.validators import compile_param, compile_validator
+
+
+@pytest.fixture
+def mcp(c_instance):
+    with patch("ALiveMCP_Remote.socket.socket"), patch("ALiveMCP_Remote.threading.Thread"):
+        instance = ALiveMCP(c_instance)
+    return instance
+
+
+def set_clip_gain(track_index, clip_index, gain, label=None, fade=False):
+    """
+    Set clip gain
+
+    Args:
+        track_index: Track to change
+        gain: Linear gain
+    """
+
+
+def test_param_schema_lookup_order():
+    assert param_schema("anything", "scene_index") is INDEX
+    assert param_schema("set_tempo", "bpm")["maximum"] == 999
+    assert param_schema("profile_start", "mode")["type"] == "string"
+    assert param_schema("set_record_mode", "mode")["type"] == "integer"
+    assert param_schema("anything", "undeclared") == {}
+
+
+def test_tool_schema_from_signature_and_docstring():
+    schema = tool_schema("set_clip_gain", set_clip_gain)
+    assert schema["required"] == ["track_index", "clip_index", "gain"]
+    assert schema["additionalProperties"] is False
+    props = schema["properties"]
+    assert props["track_index"] == {
+        "type": "integer",
+        "minimum": 0,
+        "description": "Track to change",
+    }
+    assert props["fade"] == {"type": "boolean", "default": False}
+    assert props["label"] == {"default": None}
+    assert arg_descriptions(set_clip_gain.__doc__) == {
+        "track_index": "Track to change",
+        "gain": "Linear gain",
+    }
+
+
+@pytest.mark.parametrize(
+    "spec, value, expected",
+    [
+        ({"type": "integer"}, 3.0, 3),
+        ({"type": "integer"}, " 7", 7),
+        ({"type": "number"}, 120, 120.0),
+        ({"type": "number"}, "98.5", 98.5),
+        ({"type": "boolean"}, 1, True),
+        ({"type": ["string", "null"]}, None, None),
+        ({"type": "integer", "enum": [1, 2, 4]}, 4, 4),
+        (PAIR, ["1", 2.0], [1, 2]),
+        (PARAM_SCHEMAS["time_range"], [0, 4], [0.0, 4.0]),
+    ],
+)
+def test_compile_param_coerces(spec, value, expected):
+    result = compile_param(spec)(value)
+    assert result == expected and type(result) is type(expected)
+
+
+@pytest.mark.parametrize(
+    "spec, value, message",
+    [
+        ({"type": "integer"}, True, "expected an integer, got True"),
+        ({"type": "integer"}, 1.5, "expected an integer, got 1.5"),
+        ({"type": "number"}, float("nan"), "expected a finite number, got nan"),
+        ({"type": "boolean"}, "false", "expected true or false, got 'false'"),
+        ({"type": "string"}, None, "expected a string, got None"),
+        ({"type": "number", "minimum": 20, "maximum": 999}, 10, "must be between 20 and 999"),
+        ({"type": "integer", "minimum": 0}, -1, "must be at least 0"),
+        ({"type": "integer", "enum": [1, 2, 4]}, 3, "must be one of: 1, 2, 4"),
+        (PARAM_SCHEMAS["tracks"], [0, True], "item 1: expected an integer, got True"),
+        (PARAM_SCHEMAS["tracks"], [-1], "item 0: must be at least 0"),
+        (PARAM_SCHEMAS["slots"], [[0, 1], [2]], r"item 1: must have exactly 2 items, got 1"),
+        (PARAM_SCHEMAS["notes"], [[60, 0.0]], r"item 0: expected an object, got \[60, 0.0\]"),
+        ({"type": "array", "minItems": 1}, [], "must have at least 1 items, got 0"),
+        ({"type": "array", "minItems": 1, "maxItems": 3}, [1] * 4, "must have between 1 and 3"),
+    ],
+)
+def test_compile_param_rejects(spec, value, message):
+    with pytest.raises(ValueError, match=message):
+        compile_param(spec)(value)
+
+
+def test_validator_applies_aliases_coerces_and_names_the_bad_parameter():
+    validate = compile_validator(
+        "set_clip_gain", tool_schema("set_clip_gain", set_clip_gain), {"scene_index": "clip_index"}
+    )
+    params = {"action": "set_clip_gain", "track_index": "1", "scene_index": 2.0, "gain": 1}
+    assert validate(params) is None
+    assert params == {"action": "set_clip_gain", "track_index": 1, "clip_index": 2, "gain": 1.0}
+
+    error = validate({"track_index": -1, "clip_index": 0, "gain": 1})
+    assert error == "Invalid track_index for set_clip_gain: must be at least 0"
+
+
+def test_validator_checks_array_items(mcp):
+    validate = mcp.dispatch_table["query_arrangement"].check
+    params = {"time_from": 0, "time_to": 4, "tracks": ["1"]}
+    assert validate(params) is None and params["tracks"] == [1]
+    error = validate({"time_from": 0, "time_to": 4, "tracks": [False]})["error"]
+    assert error == "Invalid tracks for query_arrangement: item 0: expected an integer, got False"
+
+
+def test_every_registered_tool_has_a_json_schema(mcp):
+    reply = mcp.get_tool_schemas()
+    assert reply["ok"] is True and reply["unknown"] == []
+    assert len(reply["tools"]) == len(mcp.dispatch_table)
+    json.dumps(reply)
+
+    set_tempo = mcp.get_tool_schemas(names=["set_tempo", "nope"])
+    assert set_tempo["unknown"] == ["nope"]
+    (tool,) = set_tempo["tools"]
+    assert tool["inputSchema"]["properties"]["bpm"]["minimum"] == 20
+    clip = mcp.get_tool_schemas(names=["get_clip_info"])["tools"][0]
+    assert clip["aliases"] == {"scene_index": "clip_index"}
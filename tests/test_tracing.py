@@ -0,0 +1,133 @@
+"""
+Tests for command trace records, get_recent_traces and the slow-command log.
+"""
+
+import json
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from alivemcp_client import AliveMCPClient
+from ALiveMCP_Remote.tracing import Tracer, client_label, outcome_of, summarize_params
+from benchmarks.mock_live import LiveHarness
+
+
+@pytest.fixture
+def tracer(tmp_path):
+    t = Tracer(buffer_size=8, slow_threshold_ms=5.0, slow_log_path=str(tmp_path / "slow.jsonl"))
+    t.ensure_started()
+    yield t
+    t.stop()
+
+
+def test_summarize_params_abbreviates_bulky_values():
+    command = {
+        "action": "add_notes",
+        "track_index": 2,
+        "notes": [{"pitch": 60}] * 128,
+        "options": {"a": 1, "b": 2},
+        "name": "x" * 100,
+    }
+    summary = summarize_params(command)
+    assert summary["track_index"] == 2
+    assert summary["notes"] == "[128 items]"
+    assert summary["options"] == "{2 keys}"
+    assert len(summary["name"]) == 40 and summary["name"].endswith("...")
+    assert "action" not in summary
+
+
+def test_outcome_of_classifies_responses():
+    assert outcome_of({"ok": True}) == "ok"
+    assert outcome_of({"ok": False, "error": "overloaded"}) == "overloaded"
+    timeout = {"ok": False, "error": "Command processing timeout - main thread may be busy"}
+    assert outcome_of(timeout) == "timeout"
+    assert outcome_of({"ok": False, "error": "Invalid track index"}) == "error"
+
+
+def test_client_label():
+    tcp = MagicMock()
+    tcp.getpeername.return_value = ("127.0.0.1", 50123)
+    assert client_label(tcp) == "127.0.0.1:50123"
+
+    class RingSink:
+        trace_label = "shm"
+
+    assert client_label(RingSink()) == "shm"
+
+
+def test_events_from_three_threads_join_into_one_record(tracer):
+    # The main thread may report before the socket thread's event arrives
+    tracer.executed(7, 10.002, 10.003)
+    tracer.submitted(7, {"action": "get_track_info", "track_index": 3}, 10.0)
+    tracer.sent(7, "127.0.0.1:5000", {"ok": True}, 120)
+    assert tracer.flush()
+
+    (record,) = tracer.recent()
+    assert record["request_id"] == 7
+    assert record["client"] == "127.0.0.1:5000"
+    assert record["action"] == "get_track_info"
+    assert record["params"] == {"track_index": 3}
+    assert record["queue_wait_ms"] == pytest.approx(2.0)
+    assert record["exec_ms"] == pytest.approx(1.0)
+    assert record["response_bytes"] == 120
+    assert record["outcome"] == "ok"
+    assert tracer.pending == {}
+
+
+def test_rejected_command_is_traced_without_timings(tracer):
+    tracer.sent(None, "unix", {"ok": False, "error": "overloaded", "retry_after_ms": 17}, 60)
+    assert tracer.flush()
+    (record,) = tracer.recent()
+    assert record["outcome"] == "overloaded"
+    assert record["exec_ms"] is None
+    assert record["error"] == "overloaded"
+
+
+def test_slow_commands_are_appended_to_jsonl(tracer, tmp_path):
+    for request_id, exec_seconds in enumerate([0.001, 0.02, 0.03]):
+        tracer.submitted(request_id, {"action": "get_session_info"}, 0.0)
+        tracer.executed(request_id, 0.0, exec_seconds)
+        tracer.sent(request_id, "c", {"ok": True}, 10)
+    assert tracer.flush()
+
+    lines = (tmp_path / "slow.jsonl").read_text().splitlines()
+    assert [json.loads(line)["request_id"] for line in lines] == [1, 2]
+    assert tracer.slow_logged == 2
+    assert [r["request_id"] for r in tracer.recent(slow_only=True)] == [1, 2]
+
+
+def test_ring_buffer_keeps_the_latest_records(tracer):
+    for request_id in range(20):
+        tracer.submitted(request_id, {"action": "ping" if request_id % 2 else "undo"}, 0.0)
+        tracer.sent(request_id, "c", {"ok": True}, 10)
+    assert tracer.flush()
+
+    assert [r["request_id"] for r in tracer.recent()] == list(range(12, 20))
+    assert [r["request_id"] for r in tracer.recent(limit=2)] == [18, 19]
+    assert {r["action"] for r in tracer.recent(action_filter="undo")} == {"undo"}
+
+
+def test_get_recent_traces_over_tcp(tmp_path):
+    with LiveHarness(tracks=4, scenes=2) as live:
+        live.script.tracer.slow_log_path = str(tmp_path / "slow.jsonl")
+        client = AliveMCPClient(port=live.port, timeout=5)
+        try:
+            client.get_track_info(track_index=1)
+            client.call("no_such_action")
+            time.sleep(0.05)
+            reply = client.get_recent_traces(limit=10)
+        finally:
+            client.close()
+
+    assert reply["ok"] is True
+    first, second = reply["traces"][-2:]
+    assert first["action"] == "get_track_info"
+    assert first["params"] == {"track_index": 1}
+    assert first["client"].startswith("127.0.0.1:")
+    assert first["outcome"] == "ok"
+    assert first["queue_wait_ms"] >= 0 and first["exec_ms"] >= 0
+    assert first["total_ms"] >= first["exec_ms"]
+    assert first["response_bytes"] > 0
+    assert second["action"] == "no_such_action"
+    assert second["outcome"] == "error"
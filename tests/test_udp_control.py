@@ -0,0 +1,214 @@
+"""
+Tests for the UDP control stream: parameter references, OSC decoding,
+datagram parsing, latest-value coalescing and per-tick application.
+"""
+
+import socket
+import struct
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ALiveMCP_Remote import ALiveMCP
+from ALiveMCP_Remote.osc import parse_osc_message, parse_osc_packet
+from ALiveMCP_Remote.tools.param_refs import (
+    resolve_parameter,
+    resolve_track_parameter,
+    set_parameter_clamped,
+)
+from ALiveMCP_Remote.udp_control import parse_control_datagram
+
+
+@pytest.fixture
+def mcp(c_instance, song):
+    c_instance.song.return_value = song
+    with patch("ALiveMCP_Remote.socket.socket"), patch("ALiveMCP_Remote.threading.Thread"):
+        instance = ALiveMCP(c_instance)
+    yield instance
+    instance.disconnect()
+
+
+def _osc_string(text):
+    raw = text.encode() + b"\0"
+    return raw + b"\0" * (-len(raw) % 4)
+
+
+def _osc_message(address, *floats):
+    tags = "," + "f" * len(floats)
+    return _osc_string(address) + _osc_string(tags) + b"".join(struct.pack(">f", f) for f in floats)
+
+
+def _param(minimum=0.0, maximum=1.0):
+    param = MagicMock()
+    param.min = minimum
+    param.max = maximum
+    return param
+
+
+# ---------------------------------------------------------------------------
+# Parameter references
+# ---------------------------------------------------------------------------
+
+
+def test_resolve_track_volume_and_pan(song):
+    mixer = song.tracks[0].mixer_device
+    assert resolve_parameter(song, "track/0/volume") is mixer.volume
+    assert resolve_parameter(song, "/track/0/pan") is mixer.panning
+    assert resolve_parameter(song, "track/0/panning") is mixer.panning
+
+
+def test_resolve_track_send(song):
+    sends = [_param(), _param()]
+    song.tracks[0].mixer_device.sends = sends
+    assert resolve_parameter(song, "track/0/send/1") is sends[1]
+    assert resolve_parameter(song, "track/0/sends/0") is sends[0]
+
+
+def test_resolve_device_parameter(song):
+    param = _param()
+    song.tracks[0].devices[0].parameters = [_param(), param]
+    assert resolve_parameter(song, "track/0/device/0/param/1") is param
+
+
+def test_resolve_master_return_and_crossfader(song):
+    assert resolve_parameter(song, "master/volume") is song.master_track.mixer_device.volume
+    assert resolve_parameter(song, "crossfader") is song.master_track.mixer_device.crossfader
+    assert resolve_parameter(song, "return/0/pan") is song.return_tracks[0].mixer_device.panning
+
+
+@pytest.mark.parametrize(
+    "ref", ["track/5/volume", "track/x/volume", "track/0/bogus", "bogus", "track/0/send/3"]
+)
+def test_resolve_rejects_bad_references(song, ref):
+    song.tracks[0].mixer_device.sends = []
+    with pytest.raises(ValueError):
+        resolve_parameter(song, ref)
+
+
+def test_resolve_track_parameter_accepts_string(song):
+    track = song.tracks[0]
+    assert resolve_track_parameter(track, "volume") is track.mixer_device.volume
+
+
+def test_set_parameter_clamped():
+    param = _param(-1.0, 1.0)
+    assert set_parameter_clamped(param, 3) == 1.0
+    assert param.value == 1.0
+    assert set_parameter_clamped(param, -0.25) == -0.25
+
+
+# ---------------------------------------------------------------------------
+# OSC and datagram parsing
+# ---------------------------------------------------------------------------
+
+
+def test_parse_osc_message_float():
+    address, args = parse_osc_message(_osc_message("/track/0/volume", 0.5))
+    assert address == "/track/0/volume"
+    assert args == [0.5]
+
+
+def test_parse_osc_message_mixed_types():
+    data = (
+        _osc_string("/x")
+        + _osc_string(",idsT")
+        + struct.pack(">i", 7)
+        + struct.pack(">d", 0.25)
+        + _osc_string("hi")
+    )
+    assert parse_osc_message(data) == ("/x", [7, 0.25, "hi", True])
+
+
+def test_parse_osc_message_rejects_unknown_tag():
+    with pytest.raises(ValueError):
+        parse_osc_message(_osc_string("/x") + _osc_string(",b"))
+
+
+def test_parse_osc_bundle():
+    first = _osc_message("/master/volume", 0.5)
+    second = _osc_message("/crossfader", -1.0)
+    bundle = b"#bundle\0" + b"\0" * 8
+    for element in (first, second):
+        bundle += struct.pack(">i", len(element)) + element
+    assert parse_osc_packet(bundle) == [("/master/volume", [0.5]), ("/crossfader", [-1.0])]
+
+
+def test_parse_control_datagram_json_single_and_batch():
+    assert parse_control_datagram(b'{"t": "master/pan", "v": 0.1}') == [("master/pan", 0.1)]
+    assert parse_control_datagram(b'{"target": "crossfader", "value": 0}') == [("crossfader", 0)]
+    batch = parse_control_datagram(b'{"set": {"track/0/volume": 0.8, "crossfader": 0}}')
+    assert sorted(batch) == [("crossfader", 0), ("track/0/volume", 0.8)]
+
+
+def test_parse_control_datagram_osc_skips_messages_without_args():
+    assert parse_control_datagram(_osc_string("/ping")) == []
+
+
+# ---------------------------------------------------------------------------
+# Coalescing and application
+# ---------------------------------------------------------------------------
+
+
+def test_queue_controls_keeps_latest_value(mcp):
+    mcp.queue_controls([("track/0/volume", 0.1), ("track/0/volume", 0.7)])
+    assert mcp.pending_controls == {"track/0/volume": 0.7}
+    assert mcp.udp_stats["received"] == 2
+    assert mcp.udp_stats["coalesced"] == 1
+
+
+def test_queue_controls_coalesces_spellings_of_one_target(mcp):
+    mcp.queue_controls([("/track/0/volume", 0.1), ("track/0/volume/", 0.4)])
+    assert mcp.pending_controls == {"track/0/volume": 0.4}
+    assert mcp.udp_stats["coalesced"] == 1
+
+
+def test_update_display_applies_pending_controls_once(mcp, song):
+    volume = _param()
+    song.tracks[0].mixer_device.volume = volume
+    mcp.queue_controls([("track/0/volume", 0.6)])
+
+    mcp.update_display()
+
+    assert volume.value == 0.6
+    assert mcp.pending_controls == {}
+    assert mcp.udp_stats["applied"] == 1
+
+
+def test_apply_pending_controls_counts_rejected_targets(mcp):
+    mcp.queue_controls([("track/99/volume", 0.5)])
+    mcp.apply_pending_controls()
+    assert mcp.udp_stats["rejected"] == 1
+    assert mcp.udp_stats["applied"] == 0
+
+
+def test_health_check_reports_udp_counters(mcp):
+    result = mcp._process_command({"action": "health_check"})
+    assert result["udp_control"]["received"] == 0
+
+
+def test_udp_listener_round_trip(mcp):
+    mcp.start_udp_control(0)
+    port = mcp.udp_socket.getsockname()[1]
+
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sender.sendto(_osc_message("/master/volume", 0.25), ("127.0.0.1", port))
+    sender.sendto(b"not a control message", ("127.0.0.1", port))
+    sender.close()
+
+    deadline = time.monotonic() + 5
+    while mcp.udp_stats["rejected"] < 1 and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+    assert mcp.pending_controls == {"master/volume": 0.25}
+    assert mcp.udp_stats["rejected"] == 1
+    mcp.stop_udp_control()
+    assert mcp.udp_socket is None
+
+
+def test_start_udp_control_logs_bind_error(mcp):
+    with patch("ALiveMCP_Remote.udp_control.socket.socket") as mock_sock_cls:
+        mock_sock_cls.return_value.bind.side_effect = OSError("in use")
+        mcp.c_instance.log_message.reset_mock()
+        mcp.start_udp_control(9005)
+    assert "ERROR starting UDP control stream" in str(mcp.c_instance.log_message.call_args_list)